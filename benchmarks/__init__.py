@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks do Serum Preset Organizer
+====================================
+Gerador de bibliotecas sintéticas e medições de desempenho.
+
+USO:
+    python -m benchmarks.executar_benchmarks --arquivos 5000
+"""
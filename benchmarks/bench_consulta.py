@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Consulta - Serum Preset Organizer
+===============================================
+Monta um catálogo sintético (sem arquivos: só as linhas do SQLite) e mede
+o tempo das consultas do subcomando 'consultar': categorias (AND de bitmaps),
+trecho do nome (índice invertido), combinação dos dois e digest.
+
+USO:
+    python -m benchmarks.bench_consulta --presets 1000000
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import gerar_nome
+from src.catalogo import CatalogoBiblioteca
+from src.config import MAPA_CATEGORIAS
+
+
+def montar_catalogo(catalogo: CatalogoBiblioteca, quantidade: int, destino: str, semente: int = 42) -> float:
+    """Registra `quantidade` presets sintéticos e indexa; retorna o tempo em segundos."""
+    rng = random.Random(semente)
+    todas_categorias = list(MAPA_CATEGORIAS)
+    inicio = time.perf_counter()
+
+    catalogo.iniciar_execucao(["/origem"], destino, False)
+    for numero in range(quantidade):
+        nome = gerar_nome(rng, numero)
+        # Categorias sorteadas (~15% em duas): o benchmark mede o índice, não o categorizador
+        categorias = rng.sample(todas_categorias, 2 if rng.random() < 0.15 else 1)
+        colocacoes = [(categoria, Path(destino) / categoria / nome, False, False) for categoria in categorias]
+        digest = hashlib.md5(numero.to_bytes(8, "little")).digest()
+        catalogo.registrar_arquivo(Path("/origem") / nome, digest, 1024, colocacoes)
+    catalogo.finalizar_execucao({})
+
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das consultas ao catálogo")
+    parser.add_argument("--presets", type=int, default=200000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="serum_bench_consulta_") as pasta_temp:
+        with CatalogoBiblioteca.para_destino(pasta_temp, tamanho_lote=10000) as catalogo:
+            print(f"\n  🏗️  Catalogando {args.presets} presets sintéticos...")
+            tempo_montagem = montar_catalogo(catalogo, args.presets, pasta_temp)
+            digest = hashlib.md5((args.presets // 2).to_bytes(8, "little")).hexdigest()
+
+            print("  ⏱️  Medindo...\n")
+            resultados = {
+                "parametros": vars(args),
+                "montagem_s": round(tempo_montagem, 3),
+                "tamanho_catalogo_bytes": os.path.getsize(catalogo.caminho),
+                "categoria_unica": medir(lambda: catalogo.buscar(["Bass"]), args.repeticoes),
+                "categorias_and": medir(lambda: catalogo.buscar(["Bass", "Dubstep"]), args.repeticoes),
+                "nome_palavra": medir(lambda: catalogo.buscar(nome="growl"), args.repeticoes),
+                "nome_trecho": medir(lambda: catalogo.buscar(nome="grow"), args.repeticoes),
+                "nome_e_categoria": medir(lambda: catalogo.buscar(["Lead"], "supersaw"), args.repeticoes),
+                "digest": medir(lambda: catalogo.consultar_digest(digest), args.repeticoes),
+                "totais": {
+                    "Bass": catalogo.buscar(["Bass"], limite=0)["total"],
+                    "Bass+Dubstep": catalogo.buscar(["Bass", "Dubstep"], limite=0)["total"],
+                    "growl": catalogo.buscar(nome="growl", limite=0)["total"],
+                },
+            }
+
+    imprimir_resultados(resultados)
+    arquivo = salvar_resultado("consulta", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
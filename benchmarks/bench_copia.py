@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Cópia - Serum Preset Organizer
+===========================================
+Compara shutil.copy2 com o motor de cópia do organizador (copiar_conteudo),
+com e sem preservação de metadados, em milhares de presets pequenos.
+
+USO:
+    python -m benchmarks.bench_copia --arquivos 5000
+    python -m benchmarks.bench_copia --arquivos 2000 --distribuicao fixo --tamanho 4096
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import DISTRIBUICOES, gerar_biblioteca
+from src.manipulador_arquivos import buscar_presets_recursivo, copiar_conteudo
+
+
+def bench_copiar(arquivos: list, destino: Path, copiar, repeticoes: int) -> dict:
+    """
+    Mede a cópia de todos os arquivos para uma pasta limpa.
+
+    Args:
+        arquivos: Arquivos de origem
+        destino: Pasta de destino (recriada antes de cada repetição)
+        copiar: Função (origem, destino) que copia um arquivo
+        repeticoes: Número de repetições
+    """
+    # Nomes de destino fixos: colisões da biblioteca não entram na medição
+    destinos = [destino / f"{indice:06d}.fxp" for indice in range(len(arquivos))]
+
+    def preparar():
+        shutil.rmtree(destino, ignore_errors=True)
+        destino.mkdir(parents=True)
+
+    def executar():
+        for origem, caminho_destino in zip(arquivos, destinos):
+            copiar(origem, caminho_destino)
+
+    return medir(executar, repeticoes, itens=len(arquivos), preparar=preparar)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de cópia: copy2 x copiar_conteudo")
+    parser.add_argument("--arquivos", type=int, default=3000)
+    parser.add_argument("--distribuicao", choices=DISTRIBUICOES, default="preset")
+    parser.add_argument("--tamanho", type=int, default=20 * 1024, help="Tamanho em bytes (distribuição fixo)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="serum_bench_copia_") as pasta_temp:
+        pasta_trabalho = Path(pasta_temp)
+        print(f"\n  🏗️  Gerando {args.arquivos} presets ({args.distribuicao})...")
+        biblioteca = gerar_biblioteca(
+            str(pasta_trabalho / "origem"),
+            total_arquivos=args.arquivos,
+            distribuicao=args.distribuicao,
+            tamanho_fixo=args.tamanho,
+            proporcao_duplicatas=0,
+            proporcao_colisoes=0,
+        )
+        arquivos = list(buscar_presets_recursivo(str(pasta_trabalho / "origem")))
+        destino = pasta_trabalho / "destino"
+
+        # Método que o motor escolhe neste sistema de arquivos
+        destino.mkdir()
+        metodo = copiar_conteudo(arquivos[0], destino / "teste.fxp")
+
+        print(f"  ⏱️  Medindo (motor: {metodo})...\n")
+        resultados = {
+            "parametros": vars(args),
+            "biblioteca": biblioteca,
+            "metodo_motor": metodo,
+            "copy2": bench_copiar(arquivos, destino, shutil.copy2, args.repeticoes),
+            "copiar_conteudo": bench_copiar(arquivos, destino, copiar_conteudo, args.repeticoes),
+            "copiar_conteudo_sem_metadados": bench_copiar(
+                arquivos, destino,
+                lambda origem, caminho: copiar_conteudo(origem, caminho, preservar_metadados=False),
+                args.repeticoes,
+            ),
+        }
+
+    imprimir_resultados(resultados)
+    arquivo = salvar_resultado("copia", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark das Categorias Especiais - Serum Preset Organizer
+============================================================
+Custo por nome da detecção de categorias especiais (nome tipo hash,
+português, padrões customizados): a versão antiga (regex sem compilar e um
+`in` por palavra) x DetectorEspecial, e o efeito em determinar_categorias,
+que agora só consulta os detectores quando nenhuma keyword casa.
+
+Os nomes misturam o gerador de bibliotecas (quase todos com keyword) com
+uma fração de nomes sem keyword, onde os detectores de fato rodam.
+
+USO:
+    python -m benchmarks.bench_especiais --nomes 50000 --sem-keyword 0.2
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import gerar_nome
+from src.categorizador import determinar_categorias, identificar_categoria_especial, identificar_categorias
+from src.config import (
+    CATEGORIA_CORROMPIDOS,
+    CATEGORIA_CUSTOMIZADOS,
+    CATEGORIA_PADRAO,
+    PADRAO_HASH,
+    PADROES_CUSTOMIZADOS,
+    PALAVRAS_PORTUGUES,
+)
+
+
+def especial_sem_compilar(nome_arquivo: str):
+    """Detecção de categoria especial como era antes de DetectorEspecial."""
+    if re.match(PADRAO_HASH, nome_arquivo, re.IGNORECASE):
+        return CATEGORIA_CORROMPIDOS
+    nome_lower = nome_arquivo.lower()
+    if any(palavra in nome_lower for palavra in PALAVRAS_PORTUGUES):
+        return CATEGORIA_CUSTOMIZADOS
+    nome_sem_ext = Path(nome_arquivo).stem.lower()
+    if any(re.match(padrao, nome_sem_ext, re.IGNORECASE) for padrao in PADROES_CUSTOMIZADOS):
+        return CATEGORIA_CUSTOMIZADOS
+    return None
+
+
+def determinar_sem_atalho(nome_arquivo: str) -> list:
+    """determinar_categorias antigo: detectores sempre rodam, mesmo com keyword."""
+    categoria_especial = especial_sem_compilar(nome_arquivo)
+    categorias = identificar_categorias(nome_arquivo)
+    if not categorias:
+        categorias = [categoria_especial or CATEGORIA_PADRAO]
+    return categorias
+
+
+def gerar_nomes(quantidade: int, sem_keyword: float, semente: int = 42) -> list:
+    """Nomes do gerador de bibliotecas com uma fração sem keyword (hash, português, aleatórios)."""
+    rng = random.Random(semente)
+    nomes = []
+    for indice in range(quantidade):
+        if rng.random() >= sem_keyword:
+            nomes.append(gerar_nome(rng, indice))
+            continue
+        tipo = rng.random()
+        if tipo < 0.3:
+            nomes.append(f"f{rng.randrange(10 ** 8, 10 ** 10)}.fxp")
+        elif tipo < 0.6:
+            nomes.append(f"{rng.choice(PALAVRAS_PORTUGUES).title()} {indice}.fxp")
+        else:
+            nomes.append(f"Zx{rng.randrange(10 ** 6)} Qw {indice}.fxp")
+    return nomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das categorias especiais")
+    parser.add_argument("--nomes", type=int, default=50000)
+    parser.add_argument("--sem-keyword", type=float, default=0.2, help="Fração de nomes sem keyword")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    args = parser.parse_args()
+
+    nomes = gerar_nomes(args.nomes, args.sem_keyword)
+    diferentes = sum(especial_sem_compilar(nome) != identificar_categoria_especial(nome) for nome in nomes)
+    print(f"\n  ⏱️  Medindo {len(nomes)} nomes ({diferentes} resultados diferentes)...\n")
+
+    resultados = {
+        "parametros": vars(args),
+        "diferencas": diferentes,
+        "especial_sem_compilar": medir(
+            lambda: [especial_sem_compilar(nome) for nome in nomes], args.repeticoes, len(nomes)
+        ),
+        "especial_compilado": medir(
+            lambda: [identificar_categoria_especial(nome) for nome in nomes], args.repeticoes, len(nomes)
+        ),
+        "determinar_sem_atalho": medir(
+            lambda: [determinar_sem_atalho(nome) for nome in nomes], args.repeticoes, len(nomes)
+        ),
+        "determinar_categorias": medir(
+            lambda: [determinar_categorias(nome) for nome in nomes], args.repeticoes, len(nomes)
+        ),
+    }
+
+    imprimir_resultados(resultados)
+    arquivo = salvar_resultado("especiais", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Leitura - Serum Preset Organizer
+=============================================
+Compara o hash com leitura em blocos (iter + f.read, um objeto bytes por bloco)
+com calcular_hash_arquivo (readinto no buffer da thread / mmap) em presets
+pequenos. Além do tempo, mede o pico de memória (tracemalloc) e, no Linux,
+as chamadas de leitura ao kernel (syscr em /proc/self/io).
+
+USO:
+    python -m benchmarks.bench_leitura --arquivos 5000
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import DISTRIBUICOES, gerar_biblioteca
+from src.manipulador_arquivos import buscar_presets_recursivo, calcular_hash_arquivo
+
+
+def hash_em_blocos(caminho_arquivo: Path, tamanho_bloco: int = 65536) -> str:
+    """Implementação anterior de calcular_hash_arquivo (referência)."""
+    hasher = hashlib.md5()
+    with open(caminho_arquivo, 'rb') as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b''):
+            hasher.update(bloco)
+    return hasher.hexdigest()
+
+
+def leituras_do_processo():
+    """Retorna o total de chamadas de leitura do processo (Linux) ou None."""
+    try:
+        with open("/proc/self/io", encoding="ascii") as f:
+            for linha in f:
+                if linha.startswith("syscr:"):
+                    return int(linha.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def bench_hash(arquivos: list, funcao, repeticoes: int) -> dict:
+    """Mede tempo, pico de memória e chamadas de leitura de uma função de hash."""
+    resultado = medir(lambda: [funcao(arquivo) for arquivo in arquivos], repeticoes, itens=len(arquivos))
+
+    # Uma passada extra, fora da medição de tempo, para memória e syscalls
+    antes = leituras_do_processo()
+    tracemalloc.start()
+    for arquivo in arquivos:
+        funcao(arquivo)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    depois = leituras_do_processo()
+
+    resultado["pico_memoria_bytes"] = pico
+    if antes is not None and depois is not None:
+        # Inclui a leitura do próprio /proc/self/io (1 chamada)
+        resultado["leituras_por_arquivo"] = round((depois - antes - 1) / len(arquivos), 2)
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de leitura: blocos x readinto/mmap")
+    parser.add_argument("--arquivos", type=int, default=3000)
+    parser.add_argument("--distribuicao", choices=DISTRIBUICOES, default="preset")
+    parser.add_argument("--tamanho", type=int, default=20 * 1024, help="Tamanho em bytes (distribuição fixo)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="serum_bench_leitura_") as pasta_temp:
+        print(f"\n  🏗️  Gerando {args.arquivos} presets ({args.distribuicao})...")
+        biblioteca = gerar_biblioteca(
+            pasta_temp,
+            total_arquivos=args.arquivos,
+            distribuicao=args.distribuicao,
+            tamanho_fixo=args.tamanho,
+            proporcao_duplicatas=0,
+            proporcao_colisoes=0,
+        )
+        arquivos = list(buscar_presets_recursivo(pasta_temp))
+
+        print("  ⏱️  Medindo...\n")
+        resultados = {
+            "parametros": vars(args),
+            "biblioteca": biblioteca,
+            "blocos_read": bench_hash(arquivos, hash_em_blocos, args.repeticoes),
+            "readinto_mmap": bench_hash(arquivos, calcular_hash_arquivo, args.repeticoes),
+        }
+
+    imprimir_resultados(resultados)
+    for nome in ("blocos_read", "readinto_mmap"):
+        dados = resultados[nome]
+        print(f"  {nome:32} pico {dados['pico_memoria_bytes']:>9} bytes  "
+              f"leituras/arquivo {dados.get('leituras_por_arquivo', 'n/d')}")
+
+    arquivo = salvar_resultado("leitura", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Memória - Serum Preset Organizer
+==============================================
+Memória da organização com e sem o modo de memória limitada
+(src/memoria_limitada.py), cada medição num processo separado para que o
+pico de RSS de uma não contamine a outra.
+
+- Sintético (--arquivos, padrão 2 milhões): só a contabilidade por arquivo
+  de organizar_presets, sem I/O de presets: a lista de trabalho, o
+  registro de hashes (10% de duplicatas) e arquivos_processados. É o que
+  cresce com o número de arquivos; sem ela, o processo fica constante.
+- Real (--real N): uma biblioteca de N presets do gerador, organizada por
+  organizar_presets de verdade.
+
+Para cada modo: pico do tracemalloc (alocações do Python), pico de RSS do
+processo e tempo.
+
+USO:
+    python -m benchmarks.bench_memoria --arquivos 2000000
+    python -m benchmarks.bench_memoria --arquivos 200000 --real 5000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import salvar_resultado
+from benchmarks.gerador_biblioteca import gerar_biblioteca, gerar_nome
+from src.config import MAPA_CATEGORIAS
+from src.manipulador_arquivos import criar_estatisticas, organizar_presets
+from src.memoria_limitada import ControleMemoria, medir_rss, pasta_trabalho_padrao
+from src.registro_hashes import RegistroHashes
+
+MODOS = ("normal", "limitado")
+
+
+def _pico_rss() -> int:
+    """Pico de RSS do processo (getrusage), ou o RSS atual onde não houver."""
+    try:
+        import resource
+    except ImportError:
+        return medir_rss() or 0
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+def contabilidade_sintetica(quantidade: int, trabalho: str, limitado: bool) -> dict:
+    """A parte de organizar_presets que cresce com os arquivos, para `quantidade` arquivos sintéticos."""
+    rng = random.Random(42)
+    raiz = Path("/mnt/nas/Presets")
+    pastas = [raiz / f"Pack {indice}" / "Serum" for indice in range(200)]
+    categorias = list(MAPA_CATEGORIAS)
+    nomes = [gerar_nome(rng, indice) for indice in range(5000)]  # Reaproveitados: não medem o gerador
+
+    memoria = ControleMemoria(trabalho, limite_mb=None) if limitado else None
+    estatisticas = criar_estatisticas(False, memoria)
+    registro = memoria.registro if limitado else RegistroHashes()
+
+    # Scan: a lista de trabalho
+    arquivos = memoria.nova_fila() if limitado else []
+    for indice in range(quantidade):
+        arquivos.append(pastas[indice % len(pastas)] / f"{indice:07d} {nomes[indice % len(nomes)]}")
+
+    # Processamento: registro de hashes (10% duplicatas) e registros por arquivo
+    for indice, arquivo in enumerate(arquivos):
+        if memoria is not None:
+            memoria.verificar()
+        conteudo = indice if indice % 10 else indice // 10
+        digest = hashlib.md5(conteudo.to_bytes(8, "little")).digest()
+        if digest in registro:
+            estatisticas["total_duplicatas_ignoradas"] += 1
+            continue
+        categoria = categorias[indice % len(categorias)]
+        registro[digest] = str(Path("/mnt/nas/Organized") / categoria / arquivo.name)
+        estatisticas["arquivos_processados"].append({
+            "origem": str(arquivo), "categorias": [categoria], "multi": False
+        })
+
+    resultado = {"duplicatas": estatisticas["total_duplicatas_ignoradas"]}
+    if memoria is not None:
+        resultado["memoria"] = memoria.para_dict()
+        memoria.fechar()
+    return resultado
+
+
+def organizacao_real(origem: str, destino: str, limitado: bool) -> dict:
+    """organizar_presets de verdade sobre a biblioteca gerada."""
+    memoria = ControleMemoria(str(pasta_trabalho_padrao(destino))) if limitado else None
+    estatisticas = organizar_presets(origem, destino, modo_mover=False, memoria=memoria)
+    resultado = {
+        "copias": estatisticas["total_copias_realizadas"],
+        "duplicatas": estatisticas["total_duplicatas_ignoradas"],
+    }
+    if memoria is not None:
+        resultado["memoria"] = memoria.para_dict()
+        memoria.fechar()
+    return resultado
+
+
+def medir_interno(args) -> dict:
+    """Executa uma medição neste processo (chamado pelo processo principal)."""
+    rss_inicial = medir_rss()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    if args.interno == "sintetico":
+        resultado = contabilidade_sintetica(args.arquivos, args.trabalho, args.modo == "limitado")
+    else:
+        resultado = organizacao_real(args.origem, args.destino, args.modo == "limitado")
+    tempo = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    resultado.update({
+        "tempo_s": round(tempo, 3),
+        "tracemalloc_pico_bytes": pico,
+        "rss_inicial_bytes": rss_inicial,
+        "rss_pico_bytes": _pico_rss(),
+    })
+    return resultado
+
+
+def medir_em_processo(argumentos: list) -> dict:
+    """Roda uma medição num processo novo e devolve o JSON que ele imprime."""
+    saida = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_memoria", *argumentos],
+        cwd=Path(__file__).resolve().parent.parent, capture_output=True, text=True, check=True,
+    )
+    return json.loads(saida.stdout.splitlines()[-1])
+
+
+def _mib(valor) -> str:
+    return f"{valor / 2**20:9.1f} MiB" if valor else "        ?"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memória: normal x memória limitada")
+    parser.add_argument("--arquivos", type=int, default=2_000_000, help="Arquivos do teste sintético (0 = pula)")
+    parser.add_argument("--real", type=int, default=0, metavar="N", help="Também organiza N presets reais")
+    parser.add_argument("--trabalho", default=None, help="Pasta temporária (padrão: a do sistema)")
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    # Uso interno: uma medição por processo
+    parser.add_argument("--interno", choices=["sintetico", "real"], help=argparse.SUPPRESS)
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    parser.add_argument("--origem", help=argparse.SUPPRESS)
+    parser.add_argument("--destino", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.interno:
+        print(json.dumps(medir_interno(args)))
+        return
+
+    resultados = {"parametros": {"arquivos": args.arquivos, "real": args.real}}
+    with tempfile.TemporaryDirectory(dir=args.trabalho) as pasta:
+        if args.arquivos:
+            print(f"\n  ⏱️  Contabilidade sintética de {args.arquivos} arquivos...")
+            for modo in MODOS:
+                trabalho = os.path.join(pasta, f"sintetico_{modo}")
+                resultados[f"sintetico_{modo}"] = medir_em_processo([
+                    "--interno", "sintetico", "--modo", modo, "--arquivos", str(args.arquivos),
+                    "--trabalho", trabalho,
+                ])
+
+        if args.real:
+            origem = os.path.join(pasta, "origem")
+            print(f"  🏗️  Gerando {args.real} presets...")
+            gerar_biblioteca(origem, args.real)
+            print("  ⏱️  Organizando...")
+            for modo in MODOS:
+                resultados[f"real_{modo}"] = medir_em_processo([
+                    "--interno", "real", "--modo", modo,
+                    "--origem", origem, "--destino", os.path.join(pasta, f"destino_{modo}"),
+                ])
+
+    print()
+    for nome, dados in resultados.items():
+        if nome == "parametros":
+            continue
+        print(f"  {nome:20} tracemalloc {_mib(dados['tracemalloc_pico_bytes'])}   "
+              f"RSS pico {_mib(dados['rss_pico_bytes'])}   {dados['tempo_s']:8.2f}s")
+
+    arquivo = salvar_resultado("memoria", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
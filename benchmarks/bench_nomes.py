@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark da Análise de Nomes - Serum Preset Organizer
+=======================================================
+Cria uma pasta de categoria sintética (arquivos vazios, só os nomes importam)
+e mede o subcomando 'analisar-nomes' nela: a análise completa da pasta e só o
+agrupamento por trigramas (MinHash + LSH).
+
+USO:
+    python -m benchmarks.bench_nomes --arquivos 100000
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import gerar_nome
+from src.analise_nomes import agrupar_nomes, analisar_pasta, normalizar_stem
+
+
+def criar_pasta_categoria(pasta: Path, quantidade: int, colisoes: float, semente: int = 42):
+    """
+    Cria `quantidade` presets vazios em uma pasta de categoria.
+
+    Uma fração `colisoes` repete um nome anterior com sufixo _N (como faz
+    gerar_nome_unico); o resto recebe uma etiqueta aleatória depois do número,
+    para que os nomes normalizados continuem distintos.
+    """
+    rng = random.Random(semente)
+    pasta.mkdir(parents=True, exist_ok=True)
+    nomes = []
+    for numero in range(quantidade):
+        if nomes and rng.random() < colisoes:
+            stem, extensao = os.path.splitext(rng.choice(nomes))
+            nome = f"{stem}_{numero}{extensao}"
+        else:
+            stem, extensao = os.path.splitext(gerar_nome(rng, numero))
+            etiqueta = "".join(rng.choices(string.ascii_lowercase, k=3))
+            nome = f"{stem} {etiqueta}{extensao}"
+            nomes.append(nome)
+        (pasta / nome).touch()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da análise de nomes")
+    parser.add_argument("--arquivos", type=int, default=100000)
+    parser.add_argument("--colisoes", type=float, default=0.1)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="serum_bench_nomes_") as pasta_temp:
+        pasta = Path(pasta_temp) / "Bass"
+        print(f"\n  🏗️  Criando {args.arquivos} presets sintéticos...")
+        criar_pasta_categoria(pasta, args.arquivos, args.colisoes)
+        stems = list(dict.fromkeys(normalizar_stem(nome) for nome in os.listdir(pasta)))
+
+        print("  ⏱️  Medindo...\n")
+        analise = analisar_pasta(pasta)
+        resultados = {
+            "parametros": vars(args),
+            "nomes_distintos": len(stems),
+            "grupos": len(analise["grupos"]),
+            "arquivos_em_grupos": sum(len(grupo["arquivos"]) for grupo in analise["grupos"]),
+            "analisar_pasta": medir(lambda: analisar_pasta(pasta), args.repeticoes, args.arquivos),
+            "agrupar_nomes": medir(lambda: agrupar_nomes(stems), args.repeticoes, len(stems)),
+        }
+
+    imprimir_resultados(resultados)
+    arquivo = salvar_resultado("nomes", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
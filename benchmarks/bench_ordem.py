@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Ordem Física - Serum Preset Organizer
+===================================================
+Mede o hash de todos os presets com o cache frio em cada ordem de
+processamento (src/ordem_fisica.py): a do scan, por inode e pelo endereço
+físico do primeiro extent (FIEMAP). O tempo inclui a própria ordenação.
+
+Antes de cada repetição os arquivos são tirados do page cache
+(posix_fadvise DONTNEED; com --drop-caches, também /proc/sys/vm/drop_caches,
+que exige root). O ganho só aparece em disco rotacional: rode com
+--trabalho apontando para o HD (ou --pasta para uma biblioteca existente).
+Em disco virtual o cache do hospedeiro pode esconder a diferença.
+
+USO:
+    python -m benchmarks.bench_ordem --arquivos 5000 --trabalho /mnt/hd/tmp
+    python -m benchmarks.bench_ordem --pasta /mnt/hd/Presets --drop-caches
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import gerar_biblioteca
+from src.manipulador_arquivos import buscar_presets_recursivo, calcular_digest_arquivo
+from src.ordem_fisica import ORDENS, ordenar_arquivos, primeiro_extent
+
+
+def esvaziar_cache(arquivos: list, drop_caches: bool = False):
+    """Tira os arquivos do page cache para a próxima leitura ir ao disco."""
+    os.sync()
+    if drop_caches:
+        with open("/proc/sys/vm/drop_caches", "w", encoding="ascii") as f:
+            f.write("3\n")
+        return
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for arquivo in arquivos:
+        with contextlib.suppress(OSError):
+            fd = os.open(arquivo, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+
+
+def hash_na_ordem(arquivos: list, ordem: str):
+    """Ordena (fora do cache: stat/FIEMAP também vão ao disco) e calcula o hash de todos."""
+    for arquivo in ordenar_arquivos(arquivos, ordem):
+        calcular_digest_arquivo(arquivo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da ordem física com cache frio")
+    parser.add_argument("--arquivos", type=int, default=5000)
+    parser.add_argument("--pasta", default=None, help="Biblioteca existente (não gera arquivos)")
+    parser.add_argument("--trabalho", default=None, help="Onde gerar a biblioteca sintética (padrão: tmp)")
+    parser.add_argument("--drop-caches", action="store_true", help="Usa /proc/sys/vm/drop_caches (root)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="serum_bench_ordem_", dir=args.trabalho) as pasta_temp:
+        pasta = args.pasta
+        if pasta is None:
+            pasta = os.path.join(pasta_temp, "biblioteca")
+            print(f"\n  🏗️  Gerando {args.arquivos} presets em {pasta}...")
+            gerar_biblioteca(pasta, total_arquivos=args.arquivos, profundidade=3)
+            os.sync()  # Aloca os extents (alocação atrasada) antes do FIEMAP
+
+        arquivos = list(buscar_presets_recursivo(pasta))
+        com_extent = sum(1 for arquivo in arquivos if primeiro_extent(arquivo) is not None)
+
+        print("  ⏱️  Medindo (cache frio)...\n")
+        resultados = {
+            "parametros": vars(args),
+            "arquivos": len(arquivos),
+            "arquivos_com_extent": com_extent,
+        }
+        for ordem in ORDENS:
+            resultados[f"hash_ordem_{ordem}"] = medir(
+                lambda ordem=ordem: hash_na_ordem(arquivos, ordem),
+                args.repeticoes,
+                itens=len(arquivos),
+                preparar=lambda: esvaziar_cache(arquivos, args.drop_caches),
+            )
+
+    imprimir_resultados(resultados)
+    arquivo = salvar_resultado("ordem", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
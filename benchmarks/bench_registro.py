@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark do Registro de Hashes - Serum Preset Organizer
+=========================================================
+Compara a memória (tracemalloc) e o tempo de consulta do registro de
+deduplicação compacto (RegistroHashes: digest de 16 bytes + tabela de pastas)
+com o dicionário anterior (hash hexadecimal -> caminho completo).
+
+USO:
+    python -m benchmarks.bench_registro --entradas 1000000
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import sys
+import tracemalloc
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import gerar_nome
+from src.config import MAPA_CATEGORIAS
+from src.registro_hashes import RegistroHashes
+
+
+def gerar_entradas(quantidade: int, raiz: str, semente: int = 42) -> list:
+    """Gera (digest, pasta, nome) realistas: nomes de preset em pastas de categoria."""
+    rng = random.Random(semente)
+    pastas = [os.path.join(raiz, categoria) for categoria in MAPA_CATEGORIAS]
+    return [
+        (hashlib.md5(numero.to_bytes(8, "little")).digest(), rng.choice(pastas), gerar_nome(rng, numero))
+        for numero in range(quantidade)
+    ]
+
+
+def medir_memoria(construir) -> int:
+    """Retorna os bytes alocados (tracemalloc) pela estrutura construída."""
+    tracemalloc.start()
+    estrutura = construir()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del estrutura
+    return atual
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do registro de hashes: dict hex x compacto")
+    parser.add_argument("--entradas", type=int, default=200000)
+    parser.add_argument("--raiz", default="/home/usuario/Serum Presets/Organizado")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    args = parser.parse_args()
+
+    print(f"\n  🏗️  Gerando {args.entradas} entradas...")
+    entradas = gerar_entradas(args.entradas, args.raiz)
+
+    # Os caminhos são montados dentro da construção, como no organizador
+    # (cada arquivo gera um str novo), para que entrem na medição
+    def construir_dict():
+        return {digest.hex(): os.path.join(pasta, nome) for digest, pasta, nome in entradas}
+
+    def construir_registro():
+        registro = RegistroHashes()
+        for digest, pasta, nome in entradas:
+            registro[digest] = os.path.join(pasta, nome)
+        return registro
+
+    print("  ⏱️  Medindo...\n")
+    memoria_dict = medir_memoria(construir_dict)
+    memoria_registro = medir_memoria(construir_registro)
+
+    dicionario = construir_dict()
+    registro = construir_registro()
+    consultas_hex = [digest.hex() for digest, _, _ in entradas]
+    consultas_digest = [digest for digest, _, _ in entradas]
+
+    resultados = {
+        "parametros": vars(args),
+        "memoria": {
+            "dict_hex_bytes": memoria_dict,
+            "registro_bytes": memoria_registro,
+            "dict_hex_bytes_por_entrada": round(memoria_dict / args.entradas, 1),
+            "registro_bytes_por_entrada": round(memoria_registro / args.entradas, 1),
+            "registro_estimado": registro.uso_memoria(),
+        },
+        "consulta_dict_hex": medir(
+            lambda: [chave in dicionario for chave in consultas_hex], args.repeticoes, itens=args.entradas
+        ),
+        "consulta_registro": medir(
+            lambda: [chave in registro for chave in consultas_digest], args.repeticoes, itens=args.entradas
+        ),
+    }
+
+    imprimir_resultados(resultados)
+    memoria = resultados["memoria"]
+    print(f"  {'memória dict hex':32} {memoria['dict_hex_bytes_por_entrada']:8} bytes/entrada")
+    print(f"  {'memória RegistroHashes':32} {memoria['registro_bytes_por_entrada']:8} bytes/entrada")
+
+    arquivo = salvar_resultado("registro", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+Funções Comuns dos Benchmarks - Serum Preset Organizer
+=======================================================
+Medição com repetições, informações do ambiente e gravação dos resultados em JSON.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+# Pasta padrão dos resultados (um JSON por execução)
+PASTA_RESULTADOS = Path(__file__).resolve().parent / "resultados"
+
+
+def medir(funcao: Callable[[], object], repeticoes: int = 5, itens: int = 0,
+          preparar: Optional[Callable[[], None]] = None) -> dict:
+    """
+    Executa uma função várias vezes e resume os tempos.
+
+    Args:
+        funcao: Função sem argumentos a medir
+        repeticoes: Número de repetições
+        itens: Quantidade de itens processados por repetição (para tempo por item)
+        preparar: Função chamada antes de cada repetição, fora da medição
+
+    Returns:
+        Dicionário com min, mediana, média e (se itens > 0) microssegundos por item
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        if preparar:
+            preparar()
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+
+    resultado = {
+        "repeticoes": repeticoes,
+        "min_s": round(min(tempos), 6),
+        "mediana_s": round(statistics.median(tempos), 6),
+        "media_s": round(statistics.mean(tempos), 6),
+    }
+    if itens:
+        resultado["itens"] = itens
+        resultado["us_por_item"] = round(min(tempos) / itens * 1e6, 3)
+    return resultado
+
+
+def commit_atual() -> Optional[str]:
+    """Retorna o hash curto do commit atual (ou None fora de um repositório git)."""
+    try:
+        saida = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, check=True,
+        )
+        return saida.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def info_ambiente() -> dict:
+    """Coleta dados do ambiente para tornar os resultados comparáveis."""
+    return {
+        "commit": commit_atual(),
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def salvar_resultado(nome: str, dados: dict, pasta: Optional[str] = None) -> Path:
+    """
+    Grava o resultado de um benchmark em JSON.
+
+    O arquivo recebe a data e o commit no nome, para comparar execuções
+    entre commits (veja executar_benchmarks --comparar).
+
+    Args:
+        nome: Nome do benchmark (prefixo do arquivo)
+        dados: Resultados medidos
+        pasta: Pasta de saída (padrão: benchmarks/resultados)
+
+    Returns:
+        Caminho do arquivo gravado
+    """
+    ambiente = info_ambiente()
+    pasta_saida = Path(pasta) if pasta else PASTA_RESULTADOS
+    pasta_saida.mkdir(parents=True, exist_ok=True)
+
+    carimbo = datetime.now().strftime("%Y%m%d_%H%M%S")
+    arquivo = pasta_saida / f"{nome}_{carimbo}_{ambiente['commit'] or 'sem-commit'}.json"
+    with open(arquivo, "w", encoding="utf-8") as f:
+        json.dump({"benchmark": nome, "ambiente": ambiente, "resultados": dados},
+                  f, ensure_ascii=False, indent=2)
+    return arquivo
+
+
+def imprimir_resultados(resultados: dict):
+    """Imprime uma tabela simples com os resultados de cada medição."""
+    for nome, dados in resultados.items():
+        if not isinstance(dados, dict) or "min_s" not in dados:
+            continue
+        por_item = f"{dados['us_por_item']:10.2f} µs/item" if "us_por_item" in dados else ""
+        print(f"  {nome:32} min {dados['min_s']:9.4f}s  mediana {dados['mediana_s']:9.4f}s  {por_item}")
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Suite de Benchmarks - Serum Preset Organizer
+============================================
+Gera uma biblioteca sintética e mede as etapas principais do organizador:
+busca (buscar_presets_recursivo), classificação (identificar_categorias e o
+ClassificadorTokens), hash (calcular_hash_arquivo) e a organização completa
+(organizar_presets_multiplas_origens). O resultado é gravado em JSON.
+
+USO:
+    python -m benchmarks.executar_benchmarks --arquivos 5000 --origens 2
+    python -m benchmarks.executar_benchmarks --comparar benchmarks/resultados/ANTERIOR.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.comum import medir, salvar_resultado, imprimir_resultados
+from benchmarks.gerador_biblioteca import gerar_biblioteca
+from src.categorizador import identificar_categorias
+from src.classificador_tokens import ClassificadorTokens
+from src.manipulador_arquivos import (
+    buscar_presets_recursivo,
+    calcular_hash_arquivo,
+    organizar_presets_multiplas_origens,
+)
+
+
+def bench_busca(origens: list, repeticoes: int) -> dict:
+    """Mede o scan recursivo de todas as origens."""
+    total = sum(1 for origem in origens for _ in buscar_presets_recursivo(origem))
+    return medir(
+        lambda: [list(buscar_presets_recursivo(origem)) for origem in origens],
+        repeticoes, itens=total,
+    )
+
+
+def bench_classificacao(nomes: list, repeticoes: int) -> dict:
+    """Mede a classificação por keywords de todos os nomes."""
+    return medir(lambda: [identificar_categorias(nome) for nome in nomes], repeticoes, itens=len(nomes))
+
+
+def bench_classificacao_tokens(nomes: list, repeticoes: int) -> dict:
+    """Mede a mesma classificação com as regras compiladas (palavras + autômato)."""
+    classificador = ClassificadorTokens()
+    return medir(
+        lambda: [classificador.identificar_categorias(nome) for nome in nomes], repeticoes, itens=len(nomes)
+    )
+
+
+def bench_hash(arquivos: list, repeticoes: int) -> dict:
+    """Mede o hash MD5 de todos os arquivos (cache quente após a 1ª repetição)."""
+    return medir(lambda: [calcular_hash_arquivo(arquivo) for arquivo in arquivos], repeticoes, itens=len(arquivos))
+
+
+def bench_organizacao(origens: list, pasta_trabalho: Path, repeticoes: int, leitura_unica: bool = False,
+                      origens_paralelas: bool = False) -> dict:
+    """Mede a organização completa (scan + hash + classificação + cópia)."""
+    destino = pasta_trabalho / "destino"
+    ultimas_estatisticas = {}
+
+    def limpar_destino():
+        shutil.rmtree(destino, ignore_errors=True)
+
+    def organizar():
+        ultimas_estatisticas.update(
+            organizar_presets_multiplas_origens(
+                origens, str(destino), modo_mover=False, leitura_unica=leitura_unica,
+                origens_paralelas=origens_paralelas
+            )
+        )
+
+    total = sum(1 for origem in origens for _ in buscar_presets_recursivo(origem))
+    resultado = medir(organizar, repeticoes, itens=total, preparar=limpar_destino)
+    resultado["metricas"] = ultimas_estatisticas.get("metricas")
+    resultado["copias"] = ultimas_estatisticas.get("total_copias_realizadas")
+    resultado["duplicatas"] = ultimas_estatisticas.get("total_duplicatas_ignoradas")
+    return resultado
+
+
+def comparar(atual: dict, arquivo_anterior: str):
+    """
+    Imprime a variação de cada medição em relação a um resultado anterior.
+
+    Args:
+        atual: Resultados desta execução
+        arquivo_anterior: JSON gravado por uma execução anterior
+    """
+    with open(arquivo_anterior, encoding="utf-8") as f:
+        anterior = json.load(f)
+
+    print(f"\n  📊 Comparação com {anterior['ambiente'].get('commit')} ({arquivo_anterior})")
+    parametros_anteriores = dict(anterior["resultados"].get("parametros", {}))
+    parametros_atuais = dict(atual.get("parametros", {}))
+    for ignorar in ("saida", "comparar"):
+        parametros_anteriores.pop(ignorar, None)
+        parametros_atuais.pop(ignorar, None)
+    if parametros_anteriores != parametros_atuais:
+        print("  ⚠️  Parâmetros diferentes entre as execuções; compare os tempos por item.")
+    for nome, dados in atual.items():
+        dados_anteriores = anterior["resultados"].get(nome)
+        if not isinstance(dados, dict) or not dados_anteriores or "min_s" not in dados:
+            continue
+        variacao = (dados["min_s"] / dados_anteriores["min_s"] - 1) * 100 if dados_anteriores["min_s"] else 0
+        sinal = "🔺" if variacao > 5 else ("🔻" if variacao < -5 else "  ")
+        print(f"  {sinal} {nome:30} {dados_anteriores['min_s']:9.4f}s → {dados['min_s']:9.4f}s ({variacao:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do Serum Preset Organizer")
+    parser.add_argument("--arquivos", type=int, default=2000, help="Arquivos por origem")
+    parser.add_argument("--origens", type=int, default=2, help="Quantidade de pastas de origem")
+    parser.add_argument("--profundidade", type=int, default=2)
+    parser.add_argument("--duplicatas", type=float, default=0.1)
+    parser.add_argument("--colisoes", type=float, default=0.05)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--saida", default=None, help="Pasta dos resultados JSON")
+    parser.add_argument("--comparar", default=None, metavar="JSON", help="Resultado anterior para comparação")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="serum_bench_") as pasta_temp:
+        pasta_trabalho = Path(pasta_temp)
+        origens = []
+
+        print(f"\n  🏗️  Gerando {args.origens} origem(ns) com {args.arquivos} presets cada...")
+        biblioteca = []
+        for indice in range(args.origens):
+            origem = pasta_trabalho / f"origem_{indice}"
+            biblioteca.append(gerar_biblioteca(
+                str(origem),
+                total_arquivos=args.arquivos,
+                profundidade=args.profundidade,
+                proporcao_duplicatas=args.duplicatas,
+                proporcao_colisoes=args.colisoes,
+                semente=42 + indice,
+            ))
+            origens.append(str(origem))
+
+        arquivos = [arquivo for origem in origens for arquivo in buscar_presets_recursivo(origem)]
+        nomes = [arquivo.name for arquivo in arquivos]
+
+        print("  ⏱️  Medindo...\n")
+        resultados = {
+            "parametros": vars(args),
+            "biblioteca": biblioteca,
+            "busca": bench_busca(origens, args.repeticoes),
+            "classificacao": bench_classificacao(nomes, args.repeticoes),
+            "classificacao_tokens": bench_classificacao_tokens(nomes, args.repeticoes),
+            "hash": bench_hash(arquivos, args.repeticoes),
+            "organizacao_completa": bench_organizacao(origens, pasta_trabalho, args.repeticoes),
+            "organizacao_leitura_unica": bench_organizacao(
+                origens, pasta_trabalho, args.repeticoes, leitura_unica=True
+            ),
+            "organizacao_origens_paralelas": bench_organizacao(
+                origens, pasta_trabalho, args.repeticoes, origens_paralelas=True
+            ),
+        }
+
+    imprimir_resultados(resultados)
+    arquivo = salvar_resultado("suite", resultados, args.saida)
+    print(f"\n  💾 Resultados salvos em: {arquivo}")
+
+    if args.comparar:
+        comparar(resultados, args.comparar)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+Gerador de Bibliotecas Sintéticas - Serum Preset Organizer
+===========================================================
+Cria árvores de presets falsos com nomes realistas (keywords de MAPA_CATEGORIAS),
+tamanhos na faixa de presets reais e proporções configuráveis de duplicatas
+(mesmo conteúdo, outro nome) e colisões de nome (mesmo nome, outro conteúdo).
+
+USO:
+    python -m benchmarks.gerador_biblioteca PASTA --arquivos 10000 --profundidade 3
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+from typing import List
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import MAPA_CATEGORIAS, TERMOS_GENERO_IGNORAR
+
+
+# Faixa de tamanho típica de um preset .fxp (5 KB a 100 KB)
+TAMANHO_MINIMO = 5 * 1024
+TAMANHO_MAXIMO = 100 * 1024
+
+DISTRIBUICOES = ["preset", "uniforme", "fixo"]
+
+# Peças extras para compor nomes parecidos com os de packs reais
+PREFIXOS_PACK = ["TSP", "KSHMR", "RKU", "VEN", "SRM", "ZEN", "ADSR", "OPP", "VOL2", "FS"]
+ADJETIVOS = [
+    "Deep", "Dark", "Bright", "Heavy", "Soft", "Wide", "Dirty", "Clean",
+    "Warm", "Cold", "Epic", "Tiny", "Huge", "Fat", "Thin", "Big", "Lo-Fi",
+]
+EXTENSOES = [".fxp", ".fxp", ".fxp", ".SerumPreset"]
+
+
+def bytes_aleatorios(rng: random.Random, tamanho: int) -> bytes:
+    """Gera `tamanho` bytes pseudoaleatórios reprodutíveis pela semente."""
+    return rng.getrandbits(tamanho * 8).to_bytes(tamanho, "little") if tamanho else b""
+
+
+def sortear_tamanho(rng: random.Random, distribuicao: str, tamanho_fixo: int) -> int:
+    """
+    Sorteia o tamanho de um arquivo segundo a distribuição escolhida.
+
+    Args:
+        rng: Gerador aleatório
+        distribuicao: 'preset' (log-normal ~25 KB), 'uniforme' ou 'fixo'
+        tamanho_fixo: Tamanho usado na distribuição 'fixo'
+
+    Returns:
+        Tamanho em bytes
+    """
+    if distribuicao == "fixo":
+        return tamanho_fixo
+    if distribuicao == "uniforme":
+        return rng.randint(TAMANHO_MINIMO, TAMANHO_MAXIMO)
+    # Log-normal centrada em ~25 KB, limitada à faixa de presets
+    tamanho = int(rng.lognormvariate(10.1, 0.6))
+    return max(TAMANHO_MINIMO, min(TAMANHO_MAXIMO, tamanho))
+
+
+def gerar_nome(rng: random.Random, indice: int) -> str:
+    """
+    Gera um nome de preset realista a partir das keywords de MAPA_CATEGORIAS.
+
+    Args:
+        rng: Gerador aleatório
+        indice: Número sequencial (garante nomes distintos)
+
+    Returns:
+        Nome de arquivo com extensão
+    """
+    categoria = rng.choice(list(MAPA_CATEGORIAS))
+    keyword = rng.choice(MAPA_CATEGORIAS[categoria]).strip("_")
+    partes = []
+
+    if rng.random() < 0.5:
+        partes.append(rng.choice(PREFIXOS_PACK))
+    if rng.random() < 0.1:
+        partes.append(rng.choice(TERMOS_GENERO_IGNORAR).title())
+    if rng.random() < 0.6:
+        partes.append(rng.choice(ADJETIVOS))
+
+    partes.append(keyword.upper() if len(keyword) <= 3 else keyword.title())
+
+    # ~15% dos nomes combinam duas categorias (multi-categoria)
+    if rng.random() < 0.15:
+        outra = rng.choice(list(MAPA_CATEGORIAS))
+        partes.append(rng.choice(MAPA_CATEGORIAS[outra]).strip("_").title())
+
+    separador = rng.choice(["_", " ", " - ", "-"])
+    return f"{separador.join(partes)} {indice:05d}{rng.choice(EXTENSOES)}"
+
+
+def gerar_pastas(rng: random.Random, raiz: Path, profundidade: int, largura: int) -> List[Path]:
+    """
+    Cria uma árvore de pastas (packs e subpastas).
+
+    Args:
+        rng: Gerador aleatório
+        raiz: Pasta raiz
+        profundidade: Número de níveis abaixo da raiz
+        largura: Quantidade de subpastas por nível
+
+    Returns:
+        Lista de todas as pastas criadas (incluindo a raiz)
+    """
+    pastas = [raiz]
+    nivel = [raiz]
+    for profundidade_atual in range(profundidade):
+        proximo = []
+        for pasta in nivel:
+            for i in range(largura):
+                nova = pasta / f"{rng.choice(PREFIXOS_PACK)} Pack {profundidade_atual}-{i}"
+                proximo.append(nova)
+        pastas.extend(proximo)
+        nivel = proximo
+    for pasta in pastas:
+        pasta.mkdir(parents=True, exist_ok=True)
+    return pastas
+
+
+def gerar_biblioteca(
+    pasta: str,
+    total_arquivos: int = 1000,
+    profundidade: int = 2,
+    largura: int = 4,
+    distribuicao: str = "preset",
+    tamanho_fixo: int = 20 * 1024,
+    proporcao_duplicatas: float = 0.1,
+    proporcao_colisoes: float = 0.05,
+    semente: int = 42
+) -> dict:
+    """
+    Gera uma biblioteca sintética de presets.
+
+    Args:
+        pasta: Pasta onde a biblioteca será criada
+        total_arquivos: Quantidade de arquivos de preset
+        profundidade: Níveis de subpastas
+        largura: Subpastas por nível
+        distribuicao: Distribuição de tamanhos ('preset', 'uniforme' ou 'fixo')
+        tamanho_fixo: Tamanho usado quando distribuicao='fixo'
+        proporcao_duplicatas: Fração de arquivos com conteúdo de outro arquivo
+        proporcao_colisoes: Fração de arquivos com nome de outro arquivo (conteúdo novo)
+        semente: Semente do gerador (mesma semente = mesma biblioteca)
+
+    Returns:
+        Dicionário com o resumo da biblioteca gerada
+    """
+    if distribuicao not in DISTRIBUICOES:
+        raise ValueError(f"Distribuição inválida: {distribuicao}")
+
+    rng = random.Random(semente)
+    pastas = gerar_pastas(rng, Path(pasta), profundidade, largura)
+
+    gerados = []  # (nome, conteudo) de arquivos com conteúdo único
+    resumo = {"arquivos": 0, "bytes": 0, "duplicatas": 0, "colisoes": 0, "pastas": len(pastas)}
+
+    for indice in range(total_arquivos):
+        sorteio = rng.random()
+
+        if gerados and sorteio < proporcao_duplicatas:
+            # Duplicata: mesmo conteúdo com outro nome
+            _, conteudo = rng.choice(gerados)
+            nome = gerar_nome(rng, indice)
+            resumo["duplicatas"] += 1
+        elif gerados and sorteio < proporcao_duplicatas + proporcao_colisoes:
+            # Colisão: mesmo nome de outro arquivo, conteúdo diferente
+            nome, _ = rng.choice(gerados)
+            conteudo = bytes_aleatorios(rng, sortear_tamanho(rng, distribuicao, tamanho_fixo))
+            resumo["colisoes"] += 1
+        else:
+            nome = gerar_nome(rng, indice)
+            conteudo = bytes_aleatorios(rng, sortear_tamanho(rng, distribuicao, tamanho_fixo))
+            gerados.append((nome, conteudo))
+
+        destino = rng.choice(pastas) / nome
+        if destino.exists():
+            # Colisão na mesma pasta: sobe para a raiz de um pack diferente
+            destino = pastas[indice % len(pastas)] / f"{indice:05d}_{nome}"
+        destino.write_bytes(conteudo)
+
+        resumo["arquivos"] += 1
+        resumo["bytes"] += len(conteudo)
+
+    # Alguns arquivos que não são presets (devem ser ignorados pelo scan)
+    for pasta_atual in pastas[: max(1, len(pastas) // 4)]:
+        (pasta_atual / "readme.txt").write_text("não é um preset", encoding="utf-8")
+
+    return resumo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera uma biblioteca sintética de presets")
+    parser.add_argument("pasta", help="Pasta de destino da biblioteca")
+    parser.add_argument("--arquivos", type=int, default=1000)
+    parser.add_argument("--profundidade", type=int, default=2)
+    parser.add_argument("--largura", type=int, default=4)
+    parser.add_argument("--distribuicao", choices=DISTRIBUICOES, default="preset")
+    parser.add_argument("--tamanho-fixo", type=int, default=20 * 1024)
+    parser.add_argument("--duplicatas", type=float, default=0.1, help="Proporção de duplicatas")
+    parser.add_argument("--colisoes", type=float, default=0.05, help="Proporção de colisões de nome")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+
+    resumo = gerar_biblioteca(
+        args.pasta,
+        total_arquivos=args.arquivos,
+        profundidade=args.profundidade,
+        largura=args.largura,
+        distribuicao=args.distribuicao,
+        tamanho_fixo=args.tamanho_fixo,
+        proporcao_duplicatas=args.duplicatas,
+        proporcao_colisoes=args.colisoes,
+        semente=args.semente,
+    )
+    print(f"  ✅ Biblioteca gerada em {args.pasta}: {resumo}")
+
+
+if __name__ == "__main__":
+    main()
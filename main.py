@@ -13,6 +13,9 @@ USO:
     
     O script solicitará os caminhos de origem e destino via terminal.
     Ou edite as variáveis PASTA_ORIGEM e PASTA_DESTINO abaixo.
+
+    Modo não-interativo (scripts/agendadores), veja src/cli.py:
+    python main.py organizar --origem PASTA --destino PASTA --formato json
 """
 
 import sys
@@ -24,7 +27,8 @@ from pathlib import Path
 # Adiciona o diretório atual ao path para importar módulos locais
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from src.manipulador_arquivos import organizar_presets, organizar_presets_multiplas_origens, buscar_presets_recursivo, detectar_modo_reverificacao
+from src.manipulador_arquivos import organizar_presets, organizar_presets_multiplas_origens, buscar_presets_recursivo, detectar_modo_reverificacao, anexar_quase_duplicatas
+from src.catalogo import CatalogoBiblioteca
 from src.categorizador import obter_todas_categorias
 from src.config import EXTENSOES_SUPORTADAS, MAPA_CATEGORIAS, CATEGORIA_CORROMPIDOS, CATEGORIA_CUSTOMIZADOS
 from src.interface_visual import (
@@ -35,7 +39,7 @@ from src.interface_visual import (
     sucesso, erro, aviso, info, destaque, dim,
     cabecalho, caixa_info, linha_separadora,
     barra_progresso, atualizar_linha,
-    ICONES_CATEGORIAS
+    ReporterProgresso, ICONES_CATEGORIAS
 )
 
 
@@ -47,6 +51,14 @@ PASTA_DESTINO = ""  # Ex: "C:/Users/SeuNome/Documents/Serum Organized"
 
 # Opções de exibição
 MODO_VERBOSE = True   # True = mostra cada arquivo, False = apenas progresso
+
+# Quase-duplicatas: relê os presets organizados para comparar o conteúdo
+# (dobra a leitura em bibliotecas grandes). No modo interativo é perguntado.
+BUSCAR_QUASE_DUPLICATAS = False
+
+# Catálogo SQLite da biblioteca (<destino>/.serum_catalogo.db), usado por
+# 'consultar' e 'reclassificar'. No modo interativo é perguntado.
+GRAVAR_CATALOGO = True
 # ============================================================================
 
 
@@ -80,7 +92,7 @@ def solicitar_caminhos_origem() -> list:
             break
         
         if not entrada:
-            print(f"  {Icones.AVISO} {aviso('Caminho vazio. Digite um caminho ou \"ok\" para continuar.')}")
+            print(f"  {Icones.AVISO} " + aviso('Caminho vazio. Digite um caminho ou "ok" para continuar.'))
             continue
         
         # Expande ~ para pasta do usuário se usado
@@ -146,6 +158,25 @@ def solicitar_caminho(mensagem: str, deve_existir: bool = True) -> str:
         return caminho
 
 
+def solicitar_sim_nao(mensagem: str, padrao: bool = False) -> bool:
+    """
+    Pergunta sim/não ao usuário (Enter mantém o padrão).
+    
+    Args:
+        mensagem: Pergunta a exibir
+        padrao: Resposta usada quando o usuário só aperta Enter
+        
+    Returns:
+        True para sim
+    """
+    opcoes = "[S/n]" if padrao else "[s/N]"
+    print(f"\n  {Icones.INFO} {Cores.BOLD}{mensagem}{Cores.RESET} {dim(opcoes)}")
+    resposta = input(f"  {Cores.CIANO_CLARO}>{Cores.RESET} ").strip().lower()
+    if not resposta:
+        return padrao
+    return resposta in ['s', 'sim', 'y', 'yes']
+
+
 def fase_busca_presets(pastas_origem: list) -> tuple:
     """
     Fase 1: Busca e conta os presets em todas as origens.
@@ -190,7 +221,13 @@ def fase_busca_presets(pastas_origem: list) -> tuple:
     return arquivos, tempo_busca
 
 
-def fase_organizacao(pastas_origem: list, pasta_destino: str, total_arquivos: int) -> tuple:
+def fase_organizacao(
+    pastas_origem: list,
+    pasta_destino: str,
+    total_arquivos: int,
+    buscar_similares: bool = False,
+    gravar_catalogo: bool = True
+) -> tuple:
     """
     Fase 2: Organiza os presets nas categorias.
     
@@ -198,6 +235,8 @@ def fase_organizacao(pastas_origem: list, pasta_destino: str, total_arquivos: in
         pastas_origem: Lista de caminhos de origem
         pasta_destino: Caminho do destino
         total_arquivos: Total de arquivos a processar
+        buscar_similares: Se True, procura quase-duplicatas depois de organizar
+        gravar_catalogo: Se False, não grava o catálogo do destino (como --sem-catalogo)
         
     Returns:
         Tuple com (estatisticas, tempo_execucao)
@@ -214,15 +253,27 @@ def fase_organizacao(pastas_origem: list, pasta_destino: str, total_arquivos: in
     arquivos_mostrados = 0
     max_mostrar = 50  # Limite de linhas para não poluir muito
     
+    # A barra de progresso é desenhada pela thread do reporter (taxa limitada);
+    # o callback apenas atualiza os contadores
+    reporter = ReporterProgresso(total_arquivos, max_por_segundo=10, largura=35)
+    if not MODO_VERBOSE:
+        reporter.iniciar()
+    
     def callback_arquivo(arquivo: str, categorias: list, info_extra: dict):
         """Callback chamado para cada arquivo processado."""
         nonlocal arquivos_mostrados
         
-        tipo = info_extra.get("tipo", "processado")
         contador = info_extra.get("contador", 0)
         total = info_extra.get("total", 0)
         
-        if MODO_VERBOSE and arquivos_mostrados < max_mostrar:
+        # Caminho rápido: depois do limite verbose só atualiza os contadores
+        if not MODO_VERBOSE or arquivos_mostrados > max_mostrar:
+            reporter.atualizar(contador, total)
+            return
+        
+        tipo = info_extra.get("tipo", "processado")
+        
+        if arquivos_mostrados < max_mostrar:
             if tipo == "duplicata_ignorada":
                 # Arquivo duplicata ignorado
                 print(f"  {Cores.AMARELO_CLARO}⊘{Cores.RESET} {dim(arquivo[:40])} {Cores.AMARELO_CLARO}(duplicata ignorada){Cores.RESET}")
@@ -248,35 +299,54 @@ def fase_organizacao(pastas_origem: list, pasta_destino: str, total_arquivos: in
             
             arquivos_mostrados += 1
             
-        elif arquivos_mostrados == max_mostrar:
+        else:
             print(f"\n  {Cores.DIM}... continuando em modo silencioso ({total - max_mostrar} restantes){Cores.RESET}\n")
             arquivos_mostrados += 1
-        
-        # Sempre atualiza a barra de progresso
-        if not MODO_VERBOSE or arquivos_mostrados >= max_mostrar:
-            porcentagem = (contador / total * 100) if total > 0 else 100
-            barra_visual = barra_progresso(contador, total, largura=35)
-            atualizar_linha(f"  {barra_visual} ({contador}/{total})")
+            reporter.atualizar(contador, total)
+            reporter.iniciar()
     
     inicio = time.time()
     
-    # Usa função de múltiplas origens se houver mais de uma pasta
-    if len(pastas_origem) > 1:
-        def callback_pasta(pasta, idx, total_pastas):
-            print(f"\n  {Cores.MAGENTA_CLARO}📂 [{idx}/{total_pastas}]{Cores.RESET} Processando: {dim(pasta)}")
+    # Catálogo SQLite da biblioteca (<destino>/.serum_catalogo.db)
+    catalogo = None
+    if gravar_catalogo:
+        catalogo = CatalogoBiblioteca.para_destino(pasta_destino)
+        catalogo.iniciar_execucao(pastas_origem, pasta_destino)
+    
+    try:
+        try:
+            # Usa função de múltiplas origens se houver mais de uma pasta
+            if len(pastas_origem) > 1:
+                def callback_pasta(pasta, idx, total_pastas):
+                    print(f"\n  {Cores.MAGENTA_CLARO}📂 [{idx}/{total_pastas}]{Cores.RESET} Processando: {dim(pasta)}")
+                
+                estatisticas = organizar_presets_multiplas_origens(
+                    pastas_origem, 
+                    pasta_destino,
+                    callback_arquivo=callback_arquivo,
+                    callback_pasta=callback_pasta,
+                    catalogo=catalogo
+                )
+            else:
+                estatisticas = organizar_presets(
+                    pastas_origem[0], 
+                    pasta_destino,
+                    callback_arquivo=callback_arquivo,
+                    catalogo=catalogo
+                )
+        finally:
+            # Para a thread do reporter mesmo em caso de erro
+            reporter.parar()
         
-        estatisticas = organizar_presets_multiplas_origens(
-            pastas_origem, 
-            pasta_destino,
-            callback_arquivo=callback_arquivo,
-            callback_pasta=callback_pasta
-        )
-    else:
-        estatisticas = organizar_presets(
-            pastas_origem[0], 
-            pasta_destino,
-            callback_arquivo=callback_arquivo
-        )
+        # Quase-duplicatas (conteúdo parecido) entram no relatório final
+        if buscar_similares:
+            print(f"\n  {Icones.BUSCAR} {info('Procurando quase-duplicatas...')}")
+            anexar_quase_duplicatas(estatisticas)
+        if catalogo is not None:
+            catalogo.finalizar_execucao(estatisticas)
+    finally:
+        if catalogo is not None:
+            catalogo.fechar()
     
     tempo_execucao = time.time() - inicio
     
@@ -393,6 +463,19 @@ def main():
             deve_existir=False
         )
     
+    # Opções: quase-duplicatas (relê toda a biblioteca organizada) e catálogo
+    buscar_similares = BUSCAR_QUASE_DUPLICATAS
+    gravar_catalogo = GRAVAR_CATALOGO
+    if not (PASTAS_ORIGEM and PASTA_DESTINO):
+        buscar_similares = solicitar_sim_nao(
+            "Procurar quase-duplicatas depois de organizar? (relê os presets organizados)",
+            padrao=BUSCAR_QUASE_DUPLICATAS
+        )
+        gravar_catalogo = solicitar_sim_nao(
+            "Gravar o catálogo da biblioteca no destino? (.serum_catalogo.db, usado por 'consultar')",
+            padrao=GRAVAR_CATALOGO
+        )
+    
     # Detecta se é modo de re-verificação (só para primeira pasta)
     modo_reverificacao = len(pastas_origem) == 1 and detectar_modo_reverificacao(pastas_origem[0], pasta_destino)
     
@@ -442,7 +525,9 @@ def main():
         estatisticas, tempo_organizacao = fase_organizacao(
             pastas_origem, 
             pasta_destino, 
-            len(arquivos)
+            len(arquivos),
+            buscar_similares=buscar_similares,
+            gravar_catalogo=gravar_catalogo
         )
     except Exception as e:
         print(f"\n  {Icones.ERRO} {erro(f'Erro durante a organização: {e}')}")
@@ -461,6 +546,11 @@ def main():
 
 
 if __name__ == "__main__":
+    # Com argumentos, roda o modo não-interativo (sem input() nem animações)
+    if len(sys.argv) > 1:
+        from src.cli import executar_cli
+        sys.exit(executar_cli(sys.argv[1:]))
+    
     try:
         main()
     except KeyboardInterrupt:
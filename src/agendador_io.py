@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo do Agendador de I/O - Serum Preset Organizer
+====================================================
+Limita quantas operações de arquivo (hash, cópia) rodam ao mesmo tempo em
+cada dispositivo, identificado pelo st_dev do arquivo.
+
+Um HD mecânico perde vazão com muitas leituras simultâneas (a cabeça fica
+pulando entre os arquivos), enquanto um SSD/NVMe só atinge a vazão máxima
+com filas profundas. Cada dispositivo tem o seu semáforo, com o limite
+padrão detectado em /sys/block/*/queue/rotational, então uma origem em HD e
+um destino em SSD não atrapalham um ao outro.
+"""
+
+import contextlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Union
+
+from src.metricas import MetricasExecucao
+
+
+# Operações simultâneas por dispositivo
+LIMITE_HDD = 2           # Deixa o NCQ reordenar sem provocar uma tempestade de seeks
+LIMITE_SSD = 16          # SSD/NVMe: filas profundas
+LIMITE_DESCONHECIDO = 8  # Rede (SMB/NFS), tmpfs, sem /sys
+
+_PASTA_SYS_BLOCOS = Path("/sys/dev/block")
+
+
+def dispositivo_de(caminho: Union[str, Path]) -> int:
+    """
+    Retorna o st_dev do caminho (ou da pasta existente mais próxima).
+
+    O destino de uma cópia ainda não existe; a pasta da categoria talvez
+    também não, então sobe até encontrar algo que exista.
+    """
+    atual = Path(caminho)
+    while True:
+        try:
+            return os.stat(atual).st_dev
+        except FileNotFoundError:
+            if atual.parent == atual:
+                raise
+            atual = atual.parent
+
+
+def disco_rotacional(dispositivo: int) -> Optional[bool]:
+    """
+    Indica se o dispositivo é um disco rotacional (HD), pelo /sys do Linux.
+
+    Para uma partição (sda1), o atributo fica no disco pai (sda).
+
+    Returns:
+        True (HD), False (SSD/NVMe) ou None (sem bloco associado: rede,
+        tmpfs, outros sistemas)
+    """
+    pasta = _PASTA_SYS_BLOCOS / f"{os.major(dispositivo)}:{os.minor(dispositivo)}"
+    for candidata in (pasta / "queue" / "rotational", pasta / ".." / "queue" / "rotational"):
+        try:
+            return candidata.read_text().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+
+def limite_padrao(dispositivo: int) -> int:
+    """Limite de operações simultâneas sugerido para o tipo do dispositivo."""
+    rotacional = disco_rotacional(dispositivo)
+    if rotacional is None:
+        return LIMITE_DESCONHECIDO
+    return LIMITE_HDD if rotacional else LIMITE_SSD
+
+
+class AgendadorIO:
+    """
+    Semáforo por dispositivo (st_dev) para as operações de arquivo.
+
+    Seguro para uso entre threads. Uma operação que envolve dois
+    dispositivos (cópia de um HD para um SSD) reserva uma vaga em cada um,
+    sempre em ordem crescente de st_dev para não haver deadlock.
+
+    Uso:
+        agendador = AgendadorIO({"/mnt/hd": 1})
+        with agendador.reservar(origem, destino):
+            copiar_conteudo(origem, destino)
+    """
+
+    def __init__(self, limites: Optional[Mapping[Union[str, int], int]] = None):
+        """
+        Args:
+            limites: Limites explícitos por caminho (qualquer arquivo ou pasta
+                     do dispositivo) ou por st_dev; os demais são detectados
+        """
+        self._lock = threading.Lock()
+        self._limites: Dict[int, int] = {}
+        self._semaforos: Dict[int, threading.BoundedSemaphore] = {}
+        self._dispositivo_pasta: Dict[str, int] = {}
+        for alvo, limite in (limites or {}).items():
+            self.definir_limite(alvo, limite)
+
+    def definir_limite(self, alvo: Union[str, Path, int], limite: int):
+        """Fixa o limite de um dispositivo (por caminho ou st_dev); vale para as próximas reservas."""
+        if limite < 1:
+            raise ValueError("o limite por dispositivo deve ser pelo menos 1")
+        dispositivo = alvo if isinstance(alvo, int) else dispositivo_de(alvo)
+        with self._lock:
+            self._limites[dispositivo] = limite
+            self._semaforos.pop(dispositivo, None)
+
+    def limite(self, dispositivo: int) -> int:
+        """Limite em uso para o dispositivo (explícito ou detectado)."""
+        with self._lock:
+            if dispositivo not in self._limites:
+                self._limites[dispositivo] = limite_padrao(dispositivo)
+            return self._limites[dispositivo]
+
+    def _dispositivo_arquivo(self, caminho: Union[str, Path]) -> int:
+        # Um stat por pasta: todos os presets de uma pasta estão no mesmo dispositivo
+        pasta = os.path.dirname(os.fspath(caminho)) or "."
+        dispositivo = self._dispositivo_pasta.get(pasta)
+        if dispositivo is None:
+            dispositivo = self._dispositivo_pasta[pasta] = dispositivo_de(pasta)
+        return dispositivo
+
+    def _semaforo(self, dispositivo: int) -> threading.BoundedSemaphore:
+        limite = self.limite(dispositivo)
+        with self._lock:
+            semaforo = self._semaforos.get(dispositivo)
+            if semaforo is None:
+                semaforo = self._semaforos[dispositivo] = threading.BoundedSemaphore(limite)
+            return semaforo
+
+    @contextlib.contextmanager
+    def reservar(self, *caminhos: Union[str, Path], metricas: Optional[MetricasExecucao] = None) -> Iterator[None]:
+        """
+        Reserva uma vaga em cada dispositivo dos caminhos durante o bloco.
+
+        Args:
+            caminhos: Arquivos envolvidos na operação (origem, destino...)
+            metricas: Se informado, o tempo esperando por vaga vai para a etapa "espera_io"
+        """
+        dispositivos = sorted({self._dispositivo_arquivo(caminho) for caminho in caminhos})
+        semaforos = [self._semaforo(dispositivo) for dispositivo in dispositivos]
+        adquiridos = []
+        try:
+            for semaforo in semaforos:
+                if not semaforo.acquire(blocking=False):
+                    inicio = time.perf_counter()
+                    semaforo.acquire()
+                    if metricas is not None:
+                        metricas.registrar("espera_io", time.perf_counter() - inicio)
+                adquiridos.append(semaforo)
+            yield
+        finally:
+            for semaforo in reversed(adquiridos):
+                semaforo.release()
+
+    def para_dict(self) -> dict:
+        """Limites dos dispositivos usados até agora ({"st_dev": {"limite", "rotacional"}})."""
+        with self._lock:
+            limites = dict(self._limites)
+        return {
+            str(dispositivo): {"limite": limite, "rotacional": disco_rotacional(dispositivo)}
+            for dispositivo, limite in sorted(limites.items())
+        }
+
+
+class _AgendadorNulo(AgendadorIO):
+    """Agendador que não limita nada (motor síncrono: uma operação por vez)."""
+
+    @contextlib.contextmanager
+    def reservar(self, *caminhos, metricas=None):
+        yield
+
+
+_AGENDADOR_NULO = _AgendadorNulo()
+
+
+def obter_agendador(agendador: Optional[AgendadorIO]) -> AgendadorIO:
+    """Retorna o agendador informado ou um que não limita nada."""
+    return agendador if agendador is not None else _AGENDADOR_NULO
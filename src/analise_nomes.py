@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Análise de Nomes - Serum Preset Organizer
+====================================================
+Encontra, em cada pasta de categoria do destino, grupos de presets com nomes
+quase iguais (ex: "Bass.fxp", "Bass_1.fxp", "Bass_2.fxp", "BASS 01.fxp").
+
+Os nomes são normalizados (minúsculas, sem o sufixo _N de gerar_nome_unico,
+separadores viram espaço) e comparados pela similaridade de Jaccard dos
+trigramas. Para não comparar todos os pares, cada conjunto de trigramas vira
+um esboço MinHash e passa pelo mesmo LSH por faixas da detecção de
+quase-duplicatas (src/similaridade.py): só os nomes que caem no mesmo balde
+são comparados, pelo Jaccard exato.
+
+A memória fica limitada a uma pasta de categoria por vez (apenas nomes).
+"""
+
+import os
+import re
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.armazem import mover_vinculo
+from src.categorizador import validar_extensao
+from src.config import EXTENSOES_SUPORTADAS
+from src.similaridade import agrupar_similares, esboco_de_hashes, hash_64
+
+
+# Similaridade de Jaccard (trigramas) mínima para dois nomes serem agrupados
+LIMIAR_NOMES = 0.7
+
+# Esboço dos trigramas: nomes têm poucos trigramas, então um esboço menor
+# que o dos presets basta (8 faixas x 4 linhas) e gera menos candidatos
+NUM_HASHES_NOMES = 32
+FAIXAS_NOMES = 8
+
+# Tamanho mínimo de um grupo para aparecer no relatório / ser agrupado
+MINIMO_GRUPO = 2
+
+# Sufixo adicionado por gerar_nome_unico ("Bass_1", "Bass_2", ...)
+_PADRAO_SUFIXO_UNICO = re.compile(r'(?:_\d+)+$')
+_PADRAO_SEPARADORES = re.compile(r'[\s_\-\.\[\]\(\)]+')
+_PADRAO_NUMERACAO_FINAL = re.compile(r'(?: \d+)+$')
+_PADRAO_ROTULO_INVALIDO = re.compile(r'[^\w\- ]+')
+
+
+def normalizar_stem(nome_arquivo: str) -> str:
+    """
+    Normaliza o nome para comparação.
+
+    A numeração final ("Bass 01", "Bass-2") também sai: é o que costuma
+    diferenciar as variações de um mesmo nome. Nomes só com números ficam.
+
+    Exemplo: "Deep_Bass-02_3.fxp" -> "deep bass"
+
+    Args:
+        nome_arquivo: Nome do arquivo
+
+    Returns:
+        Nome normalizado (pode ser vazio)
+    """
+    stem = _PADRAO_SUFIXO_UNICO.sub("", Path(nome_arquivo).stem)
+    stem = _PADRAO_SEPARADORES.sub(" ", stem.lower()).strip()
+    return _PADRAO_NUMERACAO_FINAL.sub("", stem) or stem
+
+
+def trigramas(texto: str) -> set:
+    """Trigramas do texto, com bordas marcadas ("  a", " ab", ..., "yz ")."""
+    marcado = f"  {texto} "
+    return {marcado[i:i + 3] for i in range(len(marcado) - 2)}
+
+
+def _jaccard(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    comuns = len(set(a).intersection(b))
+    return comuns / (len(a) + len(b) - comuns)
+
+
+def agrupar_nomes(stems: List[str], limiar: float = LIMIAR_NOMES) -> List[List[int]]:
+    """
+    Agrupa nomes normalizados parecidos pelos trigramas (MinHash + LSH).
+
+    Args:
+        stems: Nomes normalizados, sem repetição
+        limiar: Jaccard mínimo entre os trigramas
+
+    Returns:
+        Grupos de índices de stems (cada um com 2 ou mais)
+    """
+    # Trigramas como ids inteiros (vocabulário da pasta), cada um hasheado uma vez
+    vocabulario: Dict[str, int] = {}
+    hashes: List[int] = []
+    conjuntos: List[Tuple[int, ...]] = []
+    for stem in stems:
+        ids = []
+        for trigrama in trigramas(stem):
+            id_trigrama = vocabulario.get(trigrama)
+            if id_trigrama is None:
+                id_trigrama = vocabulario[trigrama] = len(hashes)
+                hashes.append(hash_64(trigrama.encode("utf-8")))
+            ids.append(id_trigrama)
+        conjuntos.append(tuple(ids))
+
+    esbocos = {
+        indice: esboco_de_hashes((hashes[t] for t in ids), NUM_HASHES_NOMES)
+        for indice, ids in enumerate(conjuntos)
+    }
+
+    # Os candidatos do LSH são confirmados pelo Jaccard exato
+    def verificar(a: int, b: int) -> bool:
+        return _jaccard(conjuntos[a], conjuntos[b]) >= limiar
+
+    return agrupar_similares(esbocos, limiar, FAIXAS_NOMES, verificar=verificar)
+
+
+def _rotulo_grupo(stems: Iterable[str]) -> str:
+    """Nome da pasta de um grupo: o nome normalizado mais curto."""
+    menor = min(stems, key=lambda stem: (len(stem), stem))
+    rotulo = _PADRAO_ROTULO_INVALIDO.sub("", menor).strip().replace(" ", "_")
+    return rotulo or "grupo"
+
+
+def analisar_pasta(pasta: Path, limiar: float = LIMIAR_NOMES, minimo_grupo: int = MINIMO_GRUPO) -> dict:
+    """
+    Encontra os grupos de nomes parecidos em uma pasta de categoria.
+
+    Args:
+        pasta: Pasta da categoria
+        limiar: Jaccard mínimo entre os trigramas
+        minimo_grupo: Arquivos mínimos por grupo
+
+    Returns:
+        Dicionário com a categoria, total de arquivos, grupos e tempo
+    """
+    inicio = time.perf_counter()
+
+    # Só os nomes (nada de conteúdo): arquivos com o mesmo nome normalizado
+    # já formam um grupo e são comparados uma única vez
+    por_stem: Dict[str, List[str]] = defaultdict(list)
+    total = 0
+    with os.scandir(pasta) as entradas:
+        for entrada in entradas:
+            if entrada.is_file() and validar_extensao(entrada.name, EXTENSOES_SUPORTADAS):
+                por_stem[normalizar_stem(entrada.name)].append(entrada.name)
+                total += 1
+
+    stems = list(por_stem)
+    agrupados = set()
+    grupos = []
+    for indices in agrupar_nomes(stems, limiar):
+        agrupados.update(indices)
+        grupos.append([stems[i] for i in indices])
+    grupos.extend([stem] for i, stem in enumerate(stems) if i not in agrupados and len(por_stem[stem]) > 1)
+
+    resultado = []
+    for grupo in grupos:
+        arquivos = sorted(arquivo for stem in grupo for arquivo in por_stem[stem])
+        if len(arquivos) >= minimo_grupo:
+            resultado.append({"rotulo": _rotulo_grupo(grupo), "arquivos": arquivos})
+    resultado.sort(key=lambda grupo: (-len(grupo["arquivos"]), grupo["rotulo"]))
+
+    return {
+        "categoria": pasta.name,
+        "total_arquivos": total,
+        "grupos": resultado,
+        "tempo_s": round(time.perf_counter() - inicio, 4),
+    }
+
+
+def listar_pastas_categoria(pasta_destino: str, categorias: Optional[List[str]] = None) -> List[Path]:
+    """Pastas de categoria do destino (ignora pastas internas como .serum_parcial)."""
+    with os.scandir(pasta_destino) as entradas:
+        pastas = sorted(
+            Path(entrada.path) for entrada in entradas
+            if entrada.is_dir() and not entrada.name.startswith(".")
+        )
+    if categorias:
+        pastas = [pasta for pasta in pastas if pasta.name in categorias]
+    return pastas
+
+
+def analisar_destino(
+    pasta_destino: str,
+    categorias: Optional[List[str]] = None,
+    limiar: float = LIMIAR_NOMES,
+    minimo_grupo: int = MINIMO_GRUPO
+) -> List[dict]:
+    """
+    Analisa cada pasta de categoria do destino, uma de cada vez.
+
+    Returns:
+        Lista com o resultado de analisar_pasta() por categoria
+    """
+    return [analisar_pasta(pasta, limiar, minimo_grupo) for pasta in listar_pastas_categoria(pasta_destino, categorias)]
+
+
+def agrupar_em_subpastas(pasta_destino: str, analise: List[dict], catalogo=None) -> int:
+    """
+    Move cada grupo para uma subpasta da categoria (<categoria>/<rótulo>/).
+
+    Args:
+        pasta_destino: Pasta organizada
+        analise: Resultado de analisar_destino()
+        catalogo: CatalogoBiblioteca opcional, atualizado com os novos caminhos
+
+    Returns:
+        Número de arquivos movidos
+    """
+    movidos = 0
+    for categoria in analise:
+        pasta_categoria = Path(pasta_destino) / categoria["categoria"]
+        for grupo in categoria["grupos"]:
+            subpasta = pasta_categoria / grupo["rotulo"]
+            subpasta.mkdir(exist_ok=True)
+            for arquivo in grupo["arquivos"]:
+                origem = pasta_categoria / arquivo
+                destino = subpasta / arquivo
+                if destino.exists():
+                    continue
+                mover_vinculo(origem, destino)
+                if catalogo is not None:
+                    catalogo.mover_destino(str(origem), str(destino))
+                movidos += 1
+    return movidos
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo do Armazém de Conteúdo - Serum Preset Organizer
+=======================================================
+Layout opcional do destino: cada conteúdo único é guardado uma vez em
+`<destino>/.store/ab/cdef...` (endereçado pelo MD5) e as pastas de categoria
+recebem vínculos (hardlink ou symlink) com o nome original do preset.
+
+Um preset em três categorias ocupa o espaço de um arquivo, e colocá-lo em
+mais uma categoria (ou reclassificá-lo) é criar ou mover um vínculo, sem
+copiar dados. O armazém também sobrevive entre execuções: um conteúdo que já
+está lá nunca é copiado de novo, mesmo vindo de outra origem.
+
+A cópia e a leitura ficam em src/manipulador_arquivos.py; aqui só há os
+caminhos e as operações de vínculo.
+"""
+
+import contextlib
+import errno
+import os
+import shutil
+from pathlib import Path
+from typing import Union
+
+
+# Pasta do armazém dentro do destino (oculta: o scan e a análise de nomes a ignoram)
+PASTA_ARMAZEM = ".store"
+
+# Tipos de vínculo nas pastas de categoria
+VINCULOS = ("hardlink", "symlink")
+VINCULO_PADRAO = "hardlink"
+
+# Erros de os.link que indicam que o sistema de arquivos não suporta hardlinks
+# (FAT/exFAT, alguns compartilhamentos SMB) ou que o inode atingiu o limite de links
+_ERROS_SEM_HARDLINK = {errno.EPERM, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EMLINK, errno.EXDEV, errno.ENOSYS}
+
+
+class ArmazemConteudo:
+    """
+    Armazém endereçado por conteúdo dentro da pasta de destino.
+
+    Não é seguro para duas threads guardarem o mesmo digest ao mesmo tempo;
+    os motores já serializam arquivos com o mesmo conteúdo.
+
+    Uso:
+        armazem = ArmazemConteudo(pasta_destino)
+        objeto = armazem.caminho_objeto(digest)
+        armazem.vincular(objeto, pasta_destino / "Bass" / "Deep Bass.fxp")
+    """
+
+    def __init__(self, pasta_destino: Union[str, Path], vinculo: str = VINCULO_PADRAO):
+        """
+        Args:
+            pasta_destino: Raiz da estrutura organizada
+            vinculo: "hardlink" (padrão) ou "symlink" (relativo ao vínculo)
+        """
+        if vinculo not in VINCULOS:
+            raise ValueError(f"Vínculo inválido: {vinculo} (use {', '.join(VINCULOS)})")
+        self.raiz = Path(pasta_destino) / PASTA_ARMAZEM
+        self.vinculo = vinculo
+        # Sem suporte a hardlink no destino: as próximas colocações já vão direto para a cópia
+        self.hardlink_indisponivel = False
+
+    def caminho_objeto(self, hash_arquivo: bytes) -> Path:
+        """Caminho do conteúdo no armazém: .store/<2 primeiros hex>/<restante>."""
+        hexa = hash_arquivo.hex()
+        return self.raiz / hexa[:2] / hexa[2:]
+
+    def contem(self, hash_arquivo: bytes) -> bool:
+        """Indica se o conteúdo já está guardado."""
+        return self.caminho_objeto(hash_arquivo).exists()
+
+    def mesmo_objeto(self, caminho: Path, objeto: Path) -> bool:
+        """Indica se `caminho` já é um vínculo (hard ou sym) para o objeto."""
+        try:
+            return os.path.samefile(caminho, objeto)
+        except OSError:
+            return False
+
+    def vincular(self, objeto: Path, caminho: Path) -> bool:
+        """
+        Cria o vínculo `caminho` -> objeto (a pasta deve existir e o nome estar livre).
+
+        Returns:
+            True se criou; False se o sistema de arquivos não aceita hardlinks
+            (quem chama copia o objeto no lugar)
+        """
+        if self.vinculo == "symlink":
+            os.symlink(os.path.relpath(objeto, caminho.parent), caminho)
+            return True
+        if self.hardlink_indisponivel:
+            return False
+        try:
+            os.link(objeto, caminho)
+        except OSError as erro:
+            if erro.errno not in _ERROS_SEM_HARDLINK:
+                raise
+            if erro.errno != errno.EMLINK:
+                self.hardlink_indisponivel = True
+            return False
+        return True
+
+    def para_dict(self) -> dict:
+        """Resumo do armazém (objetos e bytes guardados)."""
+        objetos = 0
+        tamanho = 0
+        if not self.raiz.is_dir():
+            return {"pasta": str(self.raiz), "vinculo": self.vinculo, "objetos": 0, "bytes": 0}
+        with os.scandir(self.raiz) as pastas:
+            subpastas = [pasta.path for pasta in pastas if pasta.is_dir()]
+        for subpasta in subpastas:
+            with os.scandir(subpasta) as entradas:
+                for entrada in entradas:
+                    if entrada.is_file(follow_symlinks=False) and not entrada.name.endswith(".parcial"):
+                        objetos += 1
+                        tamanho += entrada.stat(follow_symlinks=False).st_size
+        return {"pasta": str(self.raiz), "vinculo": self.vinculo, "objetos": objetos, "bytes": tamanho}
+
+
+def mover_vinculo(origem: Path, destino: Path):
+    """
+    Move um arquivo organizado, mantendo válido um symlink relativo do armazém.
+
+    Hardlinks e arquivos comuns são movidos normalmente; um symlink relativo
+    é recriado apontando para o mesmo objeto a partir da nova pasta.
+    """
+    if not os.path.islink(origem):
+        shutil.move(str(origem), str(destino))
+        return
+    alvo = os.readlink(origem)
+    if os.path.isabs(alvo):
+        os.replace(origem, destino)
+        return
+    objeto = os.path.normpath(os.path.join(os.path.dirname(origem), alvo))
+    os.symlink(os.path.relpath(objeto, os.path.dirname(destino)), destino)
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(origem)
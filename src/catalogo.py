@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Catálogo - Serum Preset Organizer
+============================================
+Catálogo persistente (SQLite) da biblioteca organizada: cada preset por
+digest, os caminhos de origem vistos, os destinos onde foi colocado, as
+categorias e a execução que o registrou.
+
+O arquivo fica no próprio destino (<destino>/.serum_catalogo.db), em modo
+WAL, e as linhas são gravadas em lotes (executemany dentro de uma transação).
+Ao finalizar cada execução, as colocações dela entram no índice de busca
+(src/indice_busca.py), usado pelo subcomando 'consultar'; colocações
+removidas ou movidas depois são descontadas do índice na hora.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from src.indice_busca import LIMITE_PADRAO, IndiceBusca
+from src.registro_hashes import RegistroHashes, normalizar_digest
+
+
+# Nome do arquivo do catálogo dentro da pasta de destino
+NOME_CATALOGO = ".serum_catalogo.db"
+
+# Versão do esquema (PRAGMA user_version)
+VERSAO_ESQUEMA = 1
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    inicio REAL NOT NULL,
+    fim REAL,
+    destino TEXT NOT NULL,
+    origens TEXT NOT NULL,
+    modo_mover INTEGER,
+    estatisticas TEXT
+);
+
+CREATE TABLE IF NOT EXISTS presets (
+    digest BLOB PRIMARY KEY,
+    tamanho INTEGER NOT NULL,
+    nome TEXT NOT NULL,
+    execucao INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS origens (
+    caminho TEXT NOT NULL,
+    execucao INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    duplicata INTEGER NOT NULL,
+    PRIMARY KEY (caminho, execucao)
+);
+CREATE INDEX IF NOT EXISTS idx_origens_digest ON origens (digest);
+
+CREATE TABLE IF NOT EXISTS colocacoes (
+    destino TEXT PRIMARY KEY,
+    digest BLOB NOT NULL,
+    categoria TEXT NOT NULL,
+    execucao INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_colocacoes_digest ON colocacoes (digest);
+CREATE INDEX IF NOT EXISTS idx_colocacoes_categoria ON colocacoes (categoria);
+CREATE INDEX IF NOT EXISTS idx_colocacoes_execucao ON colocacoes (execucao);
+"""
+
+# Campos das estatísticas guardados com cada execução
+CAMPOS_ESTATISTICAS = (
+    "total_arquivos_origem",
+    "total_copias_realizadas",
+    "total_duplicatas_ignoradas",
+    "total_multi_categoria",
+    "total_deletados_origem",
+    "modo_mover",
+    "por_categoria",
+)
+
+
+def caminho_catalogo(pasta_destino: str) -> Path:
+    """Retorna o caminho do catálogo de uma pasta de destino."""
+    return Path(pasta_destino) / NOME_CATALOGO
+
+
+class CatalogoBiblioteca:
+    """
+    Catálogo SQLite da biblioteca organizada.
+
+    Uso:
+        with CatalogoBiblioteca.para_destino(pasta_destino) as catalogo:
+            catalogo.iniciar_execucao(origens, pasta_destino, modo_mover)
+            estatisticas = organizar_presets(..., catalogo=catalogo)
+            catalogo.finalizar_execucao(estatisticas)
+    """
+
+    def __init__(self, caminho: str, tamanho_lote: int = 1000):
+        """
+        Abre (ou cria) o catálogo.
+
+        Args:
+            caminho: Arquivo SQLite
+            tamanho_lote: Linhas acumuladas antes de gravar uma transação
+        """
+        self.caminho = str(caminho)
+        self.tamanho_lote = tamanho_lote
+        self.execucao_atual: Optional[int] = None
+
+        self._lock = threading.Lock()
+        self._presets: List[tuple] = []
+        self._origens: List[tuple] = []
+        self._colocacoes: List[tuple] = []
+        self._removidos: List[tuple] = []
+
+        self._conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(ESQUEMA)
+        self._conexao.execute(f"PRAGMA user_version={VERSAO_ESQUEMA}")
+        self._conexao.commit()
+        self.indice = IndiceBusca(self._conexao)
+
+    @classmethod
+    def para_destino(cls, pasta_destino: str, **kwargs) -> "CatalogoBiblioteca":
+        """Abre o catálogo da pasta de destino (criando a pasta se preciso)."""
+        Path(pasta_destino).mkdir(parents=True, exist_ok=True)
+        return cls(str(caminho_catalogo(pasta_destino)), **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
+
+    # ------------------------------------------------------------------
+    # Gravação
+    # ------------------------------------------------------------------
+
+    def iniciar_execucao(self, origens: Sequence[str], destino: str, modo_mover: Optional[bool] = None) -> int:
+        """
+        Registra o início de uma execução; os arquivos seguintes pertencem a ela.
+
+        Returns:
+            Id da execução
+        """
+        with self._lock:
+            cursor = self._conexao.execute(
+                "INSERT INTO execucoes (inicio, destino, origens, modo_mover) VALUES (?, ?, ?, ?)",
+                (time.time(), str(destino), json.dumps([str(origem) for origem in origens]),
+                 None if modo_mover is None else int(modo_mover)),
+            )
+            self._conexao.commit()
+            self.execucao_atual = cursor.lastrowid
+        return self.execucao_atual
+
+    def registrar_arquivo(
+        self,
+        origem: Path,
+        digest: bytes,
+        tamanho: int,
+        colocacoes: Iterable[Tuple[str, Path, bool, bool]] = (),
+        duplicata: bool = False
+    ):
+        """
+        Acumula um preset processado (gravado em lote).
+
+        Args:
+            origem: Caminho de origem
+            digest: Digest MD5 do conteúdo
+            tamanho: Tamanho em bytes
+            colocacoes: (categoria, caminho_final, ja_existia, foi_deletado) de cada categoria
+            duplicata: Se True, o conteúdo já estava na biblioteca e não foi colocado
+        """
+        if self.execucao_atual is None:
+            raise RuntimeError("Nenhuma execução ativa: chame iniciar_execucao() antes")
+
+        execucao = self.execucao_atual
+        with self._lock:
+            self._presets.append((digest, tamanho, origem.name, execucao))
+            self._origens.append((str(origem), execucao, digest, int(duplicata)))
+            for categoria, caminho_final, _, _ in colocacoes:
+                self._colocacoes.append((str(caminho_final), digest, categoria, execucao))
+            cheio = len(self._origens) >= self.tamanho_lote
+
+        if cheio:
+            self.gravar()
+
+    def gravar(self):
+        """Grava as linhas acumuladas em uma única transação."""
+        with self._lock:
+            presets, self._presets = self._presets, []
+            origens, self._origens = self._origens, []
+            colocacoes, self._colocacoes = self._colocacoes, []
+            removidos, self._removidos = self._removidos, []
+            if not (presets or origens or colocacoes or removidos):
+                return
+            with self._conexao:
+                # Antes das colocações novas: um caminho esquecido pode ser ocupado de novo
+                descontadas = self._colocacoes_em(destino for (destino,) in removidos)
+                self._conexao.executemany("DELETE FROM colocacoes WHERE destino = ?", removidos)
+                self._conexao.executemany(
+                    "INSERT OR IGNORE INTO presets (digest, tamanho, nome, execucao) VALUES (?, ?, ?, ?)",
+                    presets,
+                )
+                self._conexao.executemany(
+                    "INSERT OR REPLACE INTO origens (caminho, execucao, digest, duplicata) VALUES (?, ?, ?, ?)",
+                    origens,
+                )
+                self._conexao.executemany(
+                    "INSERT OR REPLACE INTO colocacoes (destino, digest, categoria, execucao) VALUES (?, ?, ?, ?)",
+                    colocacoes,
+                )
+                self.indice.descontar(descontadas)
+
+    def _colocacoes_em(self, destinos: Iterable[str]) -> List[Tuple[bytes, str, str]]:
+        """(digest, destino, categoria) das colocações gravadas nesses caminhos."""
+        colocacoes = []
+        for destino in destinos:
+            colocacoes.extend(self._conexao.execute(
+                "SELECT digest, destino, categoria FROM colocacoes WHERE destino = ?", (destino,)
+            ))
+        return colocacoes
+
+    def mover_destino(self, antigo: str, novo: str):
+        """Atualiza o caminho de uma colocação (e o índice) depois que o arquivo foi movido no destino."""
+        self.gravar()
+        with self._lock, self._conexao:
+            movidas = self._colocacoes_em([str(antigo)])
+            self._conexao.execute("UPDATE colocacoes SET destino = ? WHERE destino = ?", (str(novo), str(antigo)))
+            self.indice.descontar(movidas)
+            for digest, _, _ in movidas:
+                self.indice.indexar_destino(digest, str(novo))
+
+    def registrar_colocacao(self, destino: str, digest: bytes, categoria: str):
+        """Acumula uma colocação feita fora da organização (ex: reclassificação) na execução atual."""
+        if self.execucao_atual is None:
+            raise RuntimeError("Nenhuma execução ativa: chame iniciar_execucao() antes")
+        with self._lock:
+            self._colocacoes.append((str(destino), digest, categoria, self.execucao_atual))
+
+    def esquecer_destino(self, destino: str):
+        """
+        Acumula a remoção de uma colocação cujo arquivo saiu do destino (gravada
+        em lote, como registrar_arquivo; ex: um preset de Uncategorized movido
+        para a categoria certa na re-verificação).
+        """
+        with self._lock:
+            self._removidos.append((str(destino),))
+
+    def remover_destino(self, destino: str):
+        """Esquece uma colocação (e a tira do índice) cujo arquivo foi apagado do destino."""
+        self.gravar()
+        with self._lock, self._conexao:
+            removidas = self._colocacoes_em([str(destino)])
+            self._conexao.execute("DELETE FROM colocacoes WHERE destino = ?", (str(destino),))
+            self.indice.descontar(removidas)
+
+    def finalizar_execucao(self, estatisticas: Optional[dict] = None):
+        """Grava o que falta e fecha a execução atual com o resumo das estatísticas."""
+        self.gravar()
+        if self.execucao_atual is None:
+            return
+        resumo = {
+            campo: estatisticas[campo]
+            for campo in CAMPOS_ESTATISTICAS
+            if estatisticas and campo in estatisticas
+        }
+        if estatisticas:
+            resumo["total_erros"] = len(estatisticas.get("erros", []))
+        with self._lock:
+            with self._conexao:
+                self._conexao.execute(
+                    "UPDATE execucoes SET fim = ?, estatisticas = ? WHERE id = ?",
+                    (time.time(), json.dumps(resumo, ensure_ascii=False), self.execucao_atual),
+                )
+            self.indice.atualizar(self.execucao_atual)
+        self.execucao_atual = None
+
+    def fechar(self):
+        """Grava o que falta e fecha a conexão."""
+        self.gravar()
+        self._conexao.close()
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    def consultar_digest(self, hash_arquivo) -> dict:
+        """
+        Retorna tudo o que o catálogo sabe sobre um conteúdo.
+
+        Args:
+            hash_arquivo: Digest (bytes) ou hash hexadecimal
+
+        Returns:
+            Dicionário com preset (ou None), destinos e origens
+        """
+        digest = normalizar_digest(hash_arquivo)
+        self.gravar()
+        preset = self._conexao.execute(
+            "SELECT tamanho, nome, execucao FROM presets WHERE digest = ?", (digest,)
+        ).fetchone()
+        destinos = self._conexao.execute(
+            "SELECT destino, categoria, execucao FROM colocacoes WHERE digest = ? ORDER BY destino", (digest,)
+        ).fetchall()
+        origens = self._conexao.execute(
+            "SELECT caminho, execucao, duplicata FROM origens WHERE digest = ? ORDER BY execucao, caminho",
+            (digest,),
+        ).fetchall()
+        return {
+            "digest": digest.hex(),
+            "preset": None if preset is None else {"tamanho": preset[0], "nome": preset[1], "execucao": preset[2]},
+            "destinos": [{"destino": d, "categoria": c, "execucao": e} for d, c, e in destinos],
+            "origens": [{"origem": o, "execucao": e, "duplicata": bool(dup)} for o, e, dup in origens],
+        }
+
+    def buscar(self, categorias: Sequence[str] = (), nome: Optional[str] = None,
+               limite: Optional[int] = LIMITE_PADRAO) -> dict:
+        """Busca no índice por categorias e/ou trecho do nome (ver IndiceBusca.buscar)."""
+        with self._lock:
+            return self.indice.buscar(categorias, nome, limite)
+
+    def reindexar(self):
+        """Reconstrói o índice de busca a partir de todas as colocações."""
+        self.gravar()
+        with self._lock:
+            self.indice.reconstruir()
+
+    def contar(self) -> dict:
+        """Retorna o número de presets, origens, colocações e execuções."""
+        self.gravar()
+        return {
+            tabela: self._conexao.execute(f"SELECT COUNT(*) FROM {tabela}").fetchone()[0]
+            for tabela in ("presets", "origens", "colocacoes", "execucoes")
+        }
+
+    def execucoes(self) -> List[dict]:
+        """Lista as execuções registradas, da mais recente para a mais antiga."""
+        linhas = self._conexao.execute(
+            "SELECT id, inicio, fim, destino, origens, modo_mover, estatisticas FROM execucoes ORDER BY id DESC"
+        ).fetchall()
+        return [
+            {
+                "id": id_execucao,
+                "inicio": inicio,
+                "fim": fim,
+                "destino": destino,
+                "origens": json.loads(origens),
+                "modo_mover": None if modo_mover is None else bool(modo_mover),
+                "estatisticas": json.loads(estatisticas) if estatisticas else None,
+            }
+            for id_execucao, inicio, fim, destino, origens, modo_mover, estatisticas in linhas
+        ]
+
+    def listar_colocacoes(self) -> List[Tuple[str, bytes, str, Optional[str]]]:
+        """Todas as colocações como (destino, digest, categoria, nome original do preset)."""
+        self.gravar()
+        return self._conexao.execute(
+            "SELECT c.destino, c.digest, c.categoria, p.nome "
+            "FROM colocacoes c LEFT JOIN presets p ON p.digest = c.digest ORDER BY c.rowid"
+        ).fetchall()
+
+    def carregar_registro(self, verificar_existencia: bool = True) -> RegistroHashes:
+        """
+        Monta um RegistroHashes com os destinos catalogados.
+
+        Args:
+            verificar_existencia: Se True, ignora destinos que não existem mais no disco
+
+        Returns:
+            Registro digest -> um destino existente
+        """
+        self.gravar()
+        registro = RegistroHashes()
+        for digest, destino in self._conexao.execute("SELECT digest, destino FROM colocacoes ORDER BY rowid"):
+            if digest in registro:
+                continue
+            if verificar_existencia and not os.path.exists(destino):
+                continue
+            registro[digest] = destino
+        return registro
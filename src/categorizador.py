@@ -5,9 +5,10 @@ Módulo de Categorização - Serum Preset Organizer
 Contém a lógica de identificação de categoria baseada no nome do arquivo.
 """
 
+import os
 import re
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 from src.config import (
     MAPA_CATEGORIAS, 
@@ -51,6 +52,38 @@ def limpar_nome_para_analise(nome_arquivo: str) -> str:
     return nome_lower
 
 
+# Palavra para o índice de busca: letras e dígitos (o "_" também separa)
+_PADRAO_TOKEN = re.compile(r'[^\W_]+')
+
+
+def tokenizar_texto(texto: str) -> List[str]:
+    """
+    Divide um texto em palavras minúsculas, sem repetição, na ordem em que aparecem.
+
+    Por exemplo: "Deep_Bass-Growl 02" -> ["deep", "bass", "growl", "02"]
+
+    Args:
+        texto: Texto a dividir (nome de preset ou termo de busca)
+
+    Returns:
+        Lista de palavras
+    """
+    return list(dict.fromkeys(_PADRAO_TOKEN.findall(texto.lower())))
+
+
+def tokenizar_nome(nome_arquivo: str) -> List[str]:
+    """
+    Divide o nome do arquivo (sem extensão) em palavras para o índice de busca.
+
+    Args:
+        nome_arquivo: Nome do arquivo
+
+    Returns:
+        Palavras do nome, como em tokenizar_texto()
+    """
+    return tokenizar_texto(Path(nome_arquivo).stem)
+
+
 def verificar_keyword_valida(keyword: str, nome: str, nome_original: str = None) -> bool:
     """
     Verifica se uma keyword é um match válido no nome.
@@ -119,6 +152,81 @@ def identificar_categorias(nome_arquivo: str) -> List[str]:
     return list(categorias_encontradas)
 
 
+def determinar_categorias(nome_arquivo: str) -> List[str]:
+    """
+    Determina as categorias finais de um preset para a organização.
+    
+    Usa as categorias por keyword; sem nenhuma, cai para a categoria especial
+    (Arquivos_Corrompidos ou Customizados) e, por último, para CATEGORIA_PADRAO.
+    
+    Args:
+        nome_arquivo: Nome do arquivo de preset
+        
+    Returns:
+        Lista com pelo menos uma categoria
+    """
+    # Identifica TODAS as categorias aplicáveis (keywords)
+    categorias = identificar_categorias(nome_arquivo)
+    
+    # Se nenhuma categoria por keyword encontrada
+    if not categorias:
+        # Só então verifica as categorias especiais (hash, português)
+        categoria_especial = identificar_categoria_especial(nome_arquivo)
+        if categoria_especial:
+            # Usa categoria especial (Arquivos_Corrompidos ou Customizados)
+            categorias = [categoria_especial]
+        else:
+            # Vai para Uncategorized
+            categorias = [CATEGORIA_PADRAO]
+    
+    return categorias
+
+
+def classificar_lote(nomes: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Determina as categorias de vários presets de uma vez.
+    
+    Cada nome distinto é classificado uma única vez (bibliotecas têm muitos
+    nomes repetidos em pastas diferentes).
+    
+    Args:
+        nomes: Nomes de arquivo
+        
+    Returns:
+        Dicionário nome -> categorias, como em determinar_categorias()
+    """
+    return {nome: determinar_categorias(nome) for nome in dict.fromkeys(nomes)}
+
+
+def explicar_categoria(nome_arquivo: str, categoria: str) -> Optional[str]:
+    """
+    Indica qual regra coloca o preset na categoria.
+    
+    Exemplo: ("Growl Hook.fxp", "Lead") -> "hook"
+    
+    Args:
+        nome_arquivo: Nome do arquivo de preset
+        categoria: Categoria a explicar
+        
+    Returns:
+        A keyword que casou, a regra especial ("nome tipo hash", "português",
+        "padrão customizado", "sem keyword") ou None se a categoria não se aplica
+    """
+    if categoria in MAPA_CATEGORIAS:
+        nome_original = Path(nome_arquivo).stem.lower()
+        nome_limpo = limpar_nome_para_analise(nome_arquivo)
+        for keyword in MAPA_CATEGORIAS[categoria]:
+            if verificar_keyword_valida(keyword, nome_limpo, nome_original):
+                return keyword
+        return None
+    
+    if categoria not in determinar_categorias(nome_arquivo):
+        return None
+    if categoria == CATEGORIA_PADRAO:
+        return "sem keyword"
+    return _DETECTOR_ESPECIAL.regra(nome_arquivo)
+
+
 def identificar_categoria(nome_arquivo: str) -> str:
     """
     Identifica a categoria principal de um preset (compatibilidade).
@@ -163,6 +271,122 @@ def validar_extensao(nome_arquivo: str, extensoes_validas: list) -> bool:
     return any(nome_lower.endswith(ext.lower()) for ext in extensoes_validas)
 
 
+def compilar_alternativas(palavras: Iterable[str]) -> "re.Pattern":
+    """
+    Compila uma lista de palavras num único regex em forma de árvore de prefixos.
+    
+    Ex: ["sala", "salao", "sino"] -> s(?:ala(?:o)?|ino). Um search() diz se
+    alguma palavra aparece no texto, como any(p in texto for p in palavras),
+    sem testar as alternativas uma a uma em cada posição.
+    
+    Args:
+        palavras: Palavras literais (já em minúsculas, se for o caso)
+        
+    Returns:
+        Regex compilado (nunca casa se a lista estiver vazia)
+    """
+    arvore: dict = {}
+    for palavra in palavras:
+        no = arvore
+        for caractere in palavra:
+            no = no.setdefault(caractere, {})
+        no[""] = {}
+    
+    def montar(no: dict) -> str:
+        ramos = [re.escape(caractere) + montar(filho) for caractere, filho in sorted(no.items()) if caractere]
+        if not ramos:
+            return ""
+        corpo = ramos[0] if len(ramos) == 1 else "(?:" + "|".join(ramos) + ")"
+        # Uma palavra termina aqui: o resto é opcional
+        return f"(?:{corpo})?" if "" in no else corpo
+    
+    if "" in arvore:
+        return re.compile("")  # Palavra vazia está em qualquer texto
+    return re.compile(montar(arvore) or "(?!)")
+
+
+class DetectorEspecial:
+    """
+    Detectores das categorias especiais compilados uma vez.
+    
+    O padrão de hash, as palavras em português (numa árvore de prefixos) e os
+    padrões customizados viram um único regex: uma alternação com grupos
+    nomeados, tentada uma vez no início de "nome\\nradical" (tudo em
+    minúsculas, MULTILINE para que ^/$ dos padrões valham por linha), na
+    ordem de precedência hash > português > customizado. categoria() e
+    regra() fazem uma busca só; os eh_*() mantêm um regex cada.
+    """
+    
+    # Grupo nomeado da alternação -> regra, como em explicar_categoria()
+    REGRAS = {
+        "especial_hash": "nome tipo hash",
+        "especial_portugues": "português",
+        "especial_customizado": "padrão customizado",
+    }
+    
+    def __init__(self, padrao_hash: str = PADRAO_HASH, palavras_portugues: Iterable[str] = PALAVRAS_PORTUGUES,
+                 padroes_customizados: Iterable[str] = PADROES_CUSTOMIZADOS):
+        """
+        Args:
+            padrao_hash: Regex do nome inteiro de um arquivo tipo hash
+            palavras_portugues: Palavras que indicam preset customizado
+            padroes_customizados: Regex (re.match no nome sem extensão)
+        
+        Nenhum padrão pode usar referências numeradas (\\1) nem flags globais
+        como (?i), pois todos são unidos numa alternação.
+        """
+        self._hash = re.compile(padrao_hash, re.IGNORECASE)
+        self._portugues = compilar_alternativas(dict.fromkeys(palavras_portugues))
+        padroes = list(padroes_customizados)
+        customizados = "|".join(f"(?:{padrao})" for padrao in padroes) if padroes else "(?!)"
+        self._customizados = re.compile(customizados, re.IGNORECASE)
+        
+        # Linha 1: o nome (hash e português não podem passar dela); linha 2: o radical
+        self._especial = re.compile(
+            rf"\A(?:(?P<especial_hash>(?i:{padrao_hash}))(?=[^\n]*\n)"
+            rf"|(?=[^\n]*?(?:{self._portugues.pattern}))(?P<especial_portugues>)"
+            rf"|[^\n]*\n(?P<especial_customizado>(?i:{customizados})))",
+            re.MULTILINE
+        )
+    
+    def eh_hash(self, nome_arquivo: str) -> bool:
+        return self._hash.match(nome_arquivo) is not None
+    
+    def eh_portugues(self, nome_arquivo: str) -> bool:
+        return self._portugues.search(nome_arquivo.lower()) is not None
+    
+    def eh_padrao_customizado(self, nome_arquivo: str) -> bool:
+        return self._customizados.match(Path(nome_arquivo).stem.lower()) is not None
+    
+    def regra(self, nome_arquivo: str) -> Optional[str]:
+        """Regra especial que vale para o arquivo ("nome tipo hash", "português", "padrão customizado") ou None."""
+        if "\n" in nome_arquivo or os.sep in nome_arquivo or (os.altsep and os.altsep in nome_arquivo):
+            # Quebra de linha confundiria as linhas do texto combinado; caminho
+            # (não só o nome) precisa de Path para achar o radical
+            for regra, detectar in (("nome tipo hash", self.eh_hash), ("português", self.eh_portugues),
+                                    ("padrão customizado", self.eh_padrao_customizado)):
+                if detectar(nome_arquivo):
+                    return regra
+            return None
+        # Radical como Path.stem, sem construir um Path (o que custava mais que o regex)
+        ponto = nome_arquivo.rfind(".")
+        radical = nome_arquivo[:ponto] if 0 < ponto < len(nome_arquivo) - 1 else nome_arquivo
+        achado = self._especial.match(f"{nome_arquivo.lower()}\n{radical.lower()}")
+        if achado is None:
+            return None
+        return next(regra for grupo, regra in self.REGRAS.items() if achado.group(grupo) is not None)
+    
+    def categoria(self, nome_arquivo: str) -> Optional[str]:
+        """Categoria especial do arquivo (veja identificar_categoria_especial) ou None."""
+        regra = self.regra(nome_arquivo)
+        if regra is None:
+            return None
+        return CATEGORIA_CORROMPIDOS if regra == "nome tipo hash" else CATEGORIA_CUSTOMIZADOS
+
+
+_DETECTOR_ESPECIAL = DetectorEspecial()
+
+
 def eh_arquivo_hash(nome_arquivo: str) -> bool:
     """
     Verifica se o arquivo tem nome tipo hash (ex: f892346344.fxp).
@@ -174,7 +398,7 @@ def eh_arquivo_hash(nome_arquivo: str) -> bool:
     Returns:
         True se é um arquivo com nome tipo hash
     """
-    return bool(re.match(PADRAO_HASH, nome_arquivo, re.IGNORECASE))
+    return _DETECTOR_ESPECIAL.eh_hash(nome_arquivo)
 
 
 def eh_arquivo_portugues(nome_arquivo: str) -> bool:
@@ -187,8 +411,7 @@ def eh_arquivo_portugues(nome_arquivo: str) -> bool:
     Returns:
         True se contém palavras em português
     """
-    nome_lower = nome_arquivo.lower()
-    return any(palavra in nome_lower for palavra in PALAVRAS_PORTUGUES)
+    return _DETECTOR_ESPECIAL.eh_portugues(nome_arquivo)
 
 
 def eh_arquivo_padrao_customizado(nome_arquivo: str) -> bool:
@@ -202,8 +425,7 @@ def eh_arquivo_padrao_customizado(nome_arquivo: str) -> bool:
     Returns:
         True se segue um padrão customizado
     """
-    nome_sem_ext = Path(nome_arquivo).stem.lower()
-    return any(re.match(padrao, nome_sem_ext, re.IGNORECASE) for padrao in PADROES_CUSTOMIZADOS)
+    return _DETECTOR_ESPECIAL.eh_padrao_customizado(nome_arquivo)
 
 
 def identificar_categoria_especial(nome_arquivo: str) -> str:
@@ -221,14 +443,4 @@ def identificar_categoria_especial(nome_arquivo: str) -> str:
     Returns:
         Nome da categoria especial ou None
     """
-    if eh_arquivo_hash(nome_arquivo):
-        return CATEGORIA_CORROMPIDOS
-    
-    if eh_arquivo_portugues(nome_arquivo):
-        return CATEGORIA_CUSTOMIZADOS
-    
-    if eh_arquivo_padrao_customizado(nome_arquivo):
-        return CATEGORIA_CUSTOMIZADOS
-    
-    return None
-
+    return _DETECTOR_ESPECIAL.categoria(nome_arquivo)
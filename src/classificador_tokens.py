@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo do Classificador por Tokens - Serum Preset Organizer
+============================================================
+Motor alternativo de identificar_categorias(), com o mesmo resultado e
+sem percorrer todas as keywords de todas as categorias a cada nome.
+
+As regras de MAPA_CATEGORIAS são compiladas uma vez:
+
+- Keywords curtas (KEYWORDS_CURTAS): o regex de word boundary do
+  categorizador casa exatamente com uma palavra do nome limpo, então o
+  nome é dividido em palavras uma vez e cada palavra é procurada num
+  dicionário palavra -> categorias.
+- Keywords normais (substring): um autômato de Aho-Corasick acha todas
+  numa única passada pelo nome limpo.
+- Keywords com "_" (prefixos de pack): continuam como substring do nome
+  original, como no categorizador.
+
+Os separadores são os do categorizador (espaço, "_", "-", ".", colchetes e
+parênteses). Dividir também em camelCase ou entre letras e dígitos faria
+"LD01" virar Lead, o que o motor atual não faz; a paridade vem primeiro.
+Nomes com caracteres não-ASCII (onde o IGNORECASE do regex difere de
+lower()) usam o motor original.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from src.categorizador import DetectorEspecial
+from src.config import CATEGORIA_PADRAO, KEYWORDS_CURTAS, MAPA_CATEGORIAS, TERMOS_GENERO_IGNORAR
+
+
+# Mesma normalização de limpar_nome_para_analise (separadores viram espaço)
+_SEPARADORES = re.compile(r'[_\-\.\[\]\(\)]')
+_ESPACOS = re.compile(r'\s+')
+
+
+def _stem(nome_arquivo: str) -> str:
+    """Path(nome).stem sem criar o Path."""
+    return os.path.splitext(os.path.basename(nome_arquivo))[0]
+
+
+class AutomatoSubstrings:
+    """
+    Autômato de Aho-Corasick: todas as keywords contidas num texto em uma passada.
+
+    Cada keyword carrega um valor (a categoria); buscar() devolve o
+    conjunto de valores das keywords encontradas.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, str]]):
+        """
+        Args:
+            keywords: Pares (keyword, valor)
+        """
+        self._transicoes: List[Dict[str, int]] = [{}]
+        self._saidas: List[FrozenSet[str]] = [frozenset()]
+        saidas: List[Set[str]] = [set()]
+
+        for keyword, valor in keywords:
+            estado = 0
+            for caractere in keyword:
+                proximo = self._transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = len(self._transicoes)
+                    self._transicoes[estado][caractere] = proximo
+                    self._transicoes.append({})
+                    saidas.append(set())
+                estado = proximo
+            saidas[estado].add(valor)
+
+        # Links de falha em largura; as saídas acumulam as dos sufixos
+        self._falhas = [0] * len(self._transicoes)
+        fila = list(self._transicoes[0].values())
+        while fila:
+            proxima_fila = []
+            for estado in fila:
+                for caractere, filho in self._transicoes[estado].items():
+                    falha = self._falhas[estado]
+                    while falha and caractere not in self._transicoes[falha]:
+                        falha = self._falhas[falha]
+                    destino = self._transicoes[falha].get(caractere, 0)
+                    self._falhas[filho] = destino if destino != filho else 0
+                    saidas[filho] |= saidas[self._falhas[filho]]
+                    proxima_fila.append(filho)
+            fila = proxima_fila
+        self._saidas = [frozenset(saida) for saida in saidas]
+
+    def buscar(self, texto: str) -> Set[str]:
+        """Valores de todas as keywords que aparecem em `texto`."""
+        transicoes = self._transicoes
+        falhas = self._falhas
+        saidas = self._saidas
+        encontrados: Set[str] = set(saidas[0])  # Keyword vazia está em qualquer texto
+        estado = 0
+        for caractere in texto:
+            while estado and caractere not in transicoes[estado]:
+                estado = falhas[estado]
+            estado = transicoes[estado].get(caractere, 0)
+            if saidas[estado]:
+                encontrados |= saidas[estado]
+        return encontrados
+
+
+class ClassificadorTokens:
+    """
+    Regras de categoria compiladas para classificar muitos nomes.
+
+    Uso:
+        classificador = ClassificadorTokens()
+        classificador.identificar_categorias("LD_Screamer.fxp")  # ["Lead"]
+    """
+
+    def __init__(
+        self,
+        mapa: Optional[Dict[str, List[str]]] = None,
+        keywords_curtas: Optional[Iterable[str]] = None,
+        termos_genero: Optional[Iterable[str]] = None,
+        detector: Optional[DetectorEspecial] = None
+    ):
+        """
+        Args:
+            mapa: Categoria -> keywords (padrão: MAPA_CATEGORIAS)
+            keywords_curtas: Keywords com word boundary (padrão: KEYWORDS_CURTAS)
+            termos_genero: Termos removidos antes da análise (padrão: TERMOS_GENERO_IGNORAR)
+            detector: Categorias especiais para nomes sem keyword (padrão: as de src/config.py)
+        """
+        mapa = MAPA_CATEGORIAS if mapa is None else mapa
+        self.mapa = {categoria: list(keywords) for categoria, keywords in mapa.items()}
+        self.detector = detector if detector is not None else DetectorEspecial()
+        self._curtas = set(KEYWORDS_CURTAS if keywords_curtas is None else keywords_curtas)
+        termos = TERMOS_GENERO_IGNORAR if termos_genero is None else termos_genero
+        self._termos_genero = [re.compile(re.escape(termo), re.IGNORECASE) for termo in termos]
+        # Um único search decide se algum termo aparece (quase nunca): só então a remoção termo a termo
+        self._algum_genero = re.compile("|".join(re.escape(termo) for termo in termos) or "(?!)", re.IGNORECASE)
+
+        # Ordem das categorias no resultado: a do mapa
+        self._ordem = {categoria: indice for indice, categoria in enumerate(self.mapa)}
+        self._por_palavra: Dict[str, Set[str]] = {}
+        self._prefixos: List[Tuple[str, str]] = []
+        self._curtas_compostas: List[Tuple[re.Pattern, str]] = []
+        substrings: List[Tuple[str, str]] = []
+
+        for categoria, keywords in self.mapa.items():
+            for keyword in keywords:
+                keyword_lower = keyword.lower()
+                if '_' in keyword:
+                    self._prefixos.append((keyword_lower, categoria))
+                elif keyword_lower in self._curtas:
+                    if _SEPARADORES.search(keyword_lower) or _ESPACOS.search(keyword_lower):
+                        # Várias palavras: fica com o regex do categorizador
+                        padrao = r'(?:^|[\s_\-])' + re.escape(keyword_lower) + r'(?:[\s_\-]|$)'
+                        self._curtas_compostas.append((re.compile(padrao, re.IGNORECASE), categoria))
+                    else:
+                        self._por_palavra.setdefault(keyword_lower, set()).add(categoria)
+                else:
+                    substrings.append((keyword_lower, categoria))
+
+        self._automato = AutomatoSubstrings(substrings)
+
+    def limpar_nome(self, nome_arquivo: str) -> str:
+        """Mesmo resultado de limpar_nome_para_analise(), com os termos de gênero pré-compilados."""
+        nome_lower = _stem(nome_arquivo).lower()
+        if self._algum_genero.search(nome_lower):
+            for padrao in self._termos_genero:
+                nome_lower = padrao.sub(' ', nome_lower)
+        nome_lower = _SEPARADORES.sub(' ', nome_lower)
+        return _ESPACOS.sub(' ', nome_lower).strip()
+
+    def identificar_categorias(self, nome_arquivo: str) -> List[str]:
+        """
+        Categorias por keyword, como categorizador.identificar_categorias().
+
+        Args:
+            nome_arquivo: Nome do arquivo de preset (com ou sem extensão)
+
+        Returns:
+            Categorias na ordem do mapa (pode ser vazia)
+        """
+        if not nome_arquivo.isascii():
+            return self._identificar_por_regex(nome_arquivo)
+
+        nome_limpo = self.limpar_nome(nome_arquivo)
+        categorias = self._automato.buscar(nome_limpo)
+
+        por_palavra = self._por_palavra
+        for palavra in nome_limpo.split(' '):
+            encontradas = por_palavra.get(palavra)
+            if encontradas:
+                categorias |= encontradas
+
+        if self._prefixos:
+            nome_original = _stem(nome_arquivo).lower()
+            for prefixo, categoria in self._prefixos:
+                if prefixo in nome_original:
+                    categorias.add(categoria)
+
+        for padrao, categoria in self._curtas_compostas:
+            if padrao.search(nome_limpo):
+                categorias.add(categoria)
+
+        return sorted(categorias, key=self._ordem.get)
+
+    def _casa(self, keyword: str, nome_limpo: str, nome_original: str) -> bool:
+        """Uma keyword contra um nome, como verificar_keyword_valida()."""
+        keyword_lower = keyword.lower()
+        if '_' in keyword:
+            return keyword_lower in nome_original
+        if keyword_lower in self._curtas:
+            padrao = r'(?:^|[\s_\-])' + re.escape(keyword_lower) + r'(?:[\s_\-]|$)'
+            return bool(re.search(padrao, nome_limpo, re.IGNORECASE))
+        return keyword_lower in nome_limpo
+
+    def _identificar_por_regex(self, nome_arquivo: str) -> List[str]:
+        """Caminho do categorizador (keyword por keyword), para nomes não-ASCII."""
+        nome_original = Path(nome_arquivo).stem.lower()
+        nome_limpo = self.limpar_nome(nome_arquivo)
+        return [
+            categoria for categoria, keywords in self.mapa.items()
+            if any(self._casa(keyword, nome_limpo, nome_original) for keyword in keywords)
+        ]
+
+    def determinar_categorias(self, nome_arquivo: str) -> List[str]:
+        """
+        Categorias finais, como categorizador.determinar_categorias().
+
+        Args:
+            nome_arquivo: Nome do arquivo de preset
+
+        Returns:
+            Lista com pelo menos uma categoria
+        """
+        categorias = self.identificar_categorias(nome_arquivo)
+        if categorias:
+            return categorias
+        return [self.detector.categoria(nome_arquivo) or CATEGORIA_PADRAO]
+
+    def explicar_categoria(self, nome_arquivo: str, categoria: str) -> Optional[str]:
+        """
+        Regra que coloca o preset na categoria, como categorizador.explicar_categoria().
+
+        Returns:
+            A keyword que casou, a regra especial ("nome tipo hash", "português",
+            "padrão customizado", "sem keyword") ou None se a categoria não se aplica
+        """
+        if categoria in self.mapa:
+            nome_original = Path(nome_arquivo).stem.lower()
+            nome_limpo = self.limpar_nome(nome_arquivo)
+            return next(
+                (keyword for keyword in self.mapa[categoria] if self._casa(keyword, nome_limpo, nome_original)),
+                None,
+            )
+        if categoria not in self.determinar_categorias(nome_arquivo):
+            return None
+        if categoria == CATEGORIA_PADRAO:
+            return "sem keyword"
+        return self.detector.regra(nome_arquivo)
+
+    def classificar_lote(self, nomes: Iterable[str]) -> Dict[str, List[str]]:
+        """Nome -> categorias (determinar_categorias) de cada nome distinto."""
+        return {nome: self.determinar_categorias(nome) for nome in dict.fromkeys(nomes)}
@@ -0,0 +1,814 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Linha de Comando - Serum Preset Organizer
+====================================================
+Ponto de entrada não-interativo (argparse) para uso em scripts e agendadores.
+
+Ao contrário do modo interativo de main.py, aqui não há input(), animações
+nem barras de progresso: a saída é texto simples, um resumo JSON ou eventos
+NDJSON (um objeto JSON por linha), ideal para comparar execuções.
+
+USO:
+    python main.py organizar --origem PASTA [--origem PASTA2] --destino PASTA
+                             [--modo auto|copiar|mover] [--formato texto|json|ndjson]
+                             [--metricas-json ARQUIVO] [--profile ARQUIVO]
+                             [--concorrencia N | --origens-paralelas]
+                             [--limite-dispositivo CAMINHO=N ...] [--ordem scan|inode|extent]
+                             [--sem-metadados] [--leitura-unica] [--armazem [hardlink|symlink]]
+                             [--indexar-destino] [--sem-catalogo] [--similares [LIMIAR]]
+                             [--regras ARQUIVO [--vigiar-regras [SEGUNDOS]]]
+                             [--memoria-maxima MB [--registros ARQUIVO]]
+    python main.py consultar --destino PASTA [--categoria CAT ...] [--nome TEXTO]
+                             [--digest HASH] [--limite N] [--formato texto|json]
+                             [--reindexar]
+    python main.py analisar-nomes --destino PASTA [--categoria CAT ...] [--limiar 0.7]
+                                  [--minimo N] [--agrupar] [--formato texto|json]
+    python main.py reclassificar --destino PASTA [--aplicar] [--do-catalogo]
+                                 [--incluir-pasta NOME ...] [--limite N] [--formato texto|json]
+                                 [--regras ARQUIVO]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import cProfile
+import json
+import os
+import sys
+import time
+from typing import Callable, List, Optional, TextIO
+
+from src.agendador_io import AgendadorIO
+from src.analise_nomes import LIMIAR_NOMES, MINIMO_GRUPO, agrupar_em_subpastas, analisar_destino
+from src.armazem import VINCULO_PADRAO, VINCULOS, ArmazemConteudo
+from src.catalogo import CatalogoBiblioteca, caminho_catalogo
+from src.categorizador import tokenizar_texto
+from src.indexador_destino import indexar_destino
+from src.indice_busca import LIMITE_PADRAO
+from src.manipulador_arquivos import (
+    anexar_quase_duplicatas,
+    organizar_presets,
+    organizar_presets_async,
+    organizar_presets_multiplas_origens,
+)
+from src.memoria_limitada import ControleMemoria, LimiteMemoriaExcedido, pasta_trabalho_padrao
+from src.metricas import MetricasExecucao
+from src.ordem_fisica import ORDEM_PADRAO, ORDENS
+from src.reclassificacao import reclassificar_destino
+from src.regras import INTERVALO_VIGIA_PADRAO, RegrasCompiladas, RegrasRecarregaveis
+from src.similaridade import LIMIAR_SIMILARIDADE
+
+
+# Códigos de saída (argumentos inválidos saem com 2, pelo próprio argparse)
+SAIDA_OK = 0
+SAIDA_COM_ERROS = 1
+
+# Modos aceitos em --modo e o valor correspondente de modo_mover
+MODOS = {
+    "auto": None,     # Detecta re-verificação automaticamente
+    "copiar": False,
+    "mover": True,
+}
+
+FORMATOS = ["texto", "json", "ndjson"]
+
+
+def ler_limite_dispositivo(texto: str) -> tuple:
+    """Converte 'CAMINHO=N' (opção --limite-dispositivo) em (caminho, limite)."""
+    caminho, separador, limite = texto.rpartition("=")
+    if not separador or not caminho or not limite.isdigit() or int(limite) < 1:
+        raise argparse.ArgumentTypeError(f"use CAMINHO=N com N >= 1: {texto!r}")
+    return caminho, int(limite)
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    """
+    Cria o parser de argumentos da linha de comando.
+
+    Returns:
+        ArgumentParser com os subcomandos configurados
+    """
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Serum Preset Organizer - modo não-interativo",
+    )
+    subparsers = parser.add_subparsers(dest="comando", metavar="COMANDO")
+    subparsers.required = True
+
+    # Subcomando: organizar
+    p_organizar = subparsers.add_parser(
+        "organizar",
+        help="Organiza presets de uma ou mais origens para o destino",
+    )
+    p_organizar.add_argument(
+        "--origem", "-o", action="append", required=True, metavar="PASTA",
+        help="Pasta de origem (repita a opção para múltiplas origens)",
+    )
+    p_organizar.add_argument(
+        "--destino", "-d", required=True, metavar="PASTA",
+        help="Pasta de destino onde a estrutura organizada será criada",
+    )
+    p_organizar.add_argument(
+        "--modo", choices=list(MODOS), default="auto",
+        help="copiar, mover ou auto (detecta re-verificação). Padrão: auto",
+    )
+    p_organizar.add_argument(
+        "--formato", choices=FORMATOS, default="texto",
+        help="texto (relatório), json (resumo) ou ndjson (evento por arquivo)",
+    )
+    p_organizar.add_argument(
+        "--saida", metavar="ARQUIVO", default=None,
+        help="Grava a saída neste arquivo em vez do stdout",
+    )
+    p_organizar.add_argument(
+        "--metricas-json", metavar="ARQUIVO", default=None,
+        help="Exporta o tempo por etapa e os bytes lidos/escritos em JSON",
+    )
+    p_organizar.add_argument(
+        "--profile", metavar="ARQUIVO", default=None,
+        help="Executa sob cProfile e grava as estatísticas (pstats) neste arquivo",
+    )
+    p_organizar.add_argument(
+        "--concorrencia", "-j", type=int, default=None, metavar="N",
+        help="Usa o motor assíncrono com N operações de arquivo simultâneas "
+             "(indicado para SMB/NFS e discos lentos)",
+    )
+    p_organizar.add_argument(
+        "--origens-paralelas", action="store_true",
+        help="Lê e calcula os hashes de todas as origens ao mesmo tempo (uma thread "
+             "por origem); indicado quando as origens estão em discos diferentes",
+    )
+    p_organizar.add_argument(
+        "--limite-dispositivo", action="append", type=ler_limite_dispositivo, default=[],
+        metavar="CAMINHO=N",
+        help="Máximo de operações de arquivo simultâneas no disco que contém CAMINHO "
+             "(repita para vários discos; padrão: detectado, HD 2 / SSD 16)",
+    )
+    p_organizar.add_argument(
+        "--ordem", choices=ORDENS, default=ORDEM_PADRAO,
+        help="Ordem de leitura depois do scan: scan (padrão), inode ou extent "
+             "(posição física no disco; menos seeks em HD)",
+    )
+    p_organizar.add_argument(
+        "--sem-metadados", action="store_true",
+        help="Não copia datas e permissões dos presets (cópia mais rápida)",
+    )
+    p_organizar.add_argument(
+        "--leitura-unica", action="store_true",
+        help="Lê cada preset uma única vez (hash calculado durante a cópia); "
+             "indicado para cache frio e discos lentos",
+    )
+    p_organizar.add_argument(
+        "--armazem", nargs="?", choices=VINCULOS, const=VINCULO_PADRAO, default=None,
+        metavar="hardlink|symlink",
+        help="Guarda cada conteúdo uma vez em <destino>/.store e cria vínculos nas "
+             f"pastas de categoria em vez de cópias (padrão: {VINCULO_PADRAO})",
+    )
+    p_organizar.add_argument(
+        "--indexar-destino", action="store_true",
+        help="Antes de organizar, registra os presets que já estão no destino (hashes em "
+             "cache por tamanho+mtime), para não copiar de novo o que já existe com outro nome",
+    )
+    p_organizar.add_argument(
+        "--sem-catalogo", action="store_true",
+        help="Não grava o catálogo SQLite (<destino>/.serum_catalogo.db)",
+    )
+    p_organizar.add_argument(
+        "--similares", nargs="?", type=float, const=LIMIAR_SIMILARIDADE, default=None, metavar="LIMIAR",
+        help="Procura quase-duplicatas (conteúdo parecido, MD5 diferente) e as inclui no relatório; "
+             f"LIMIAR de 0 a 1 (padrão: {LIMIAR_SIMILARIDADE})",
+    )
+    p_organizar.add_argument(
+        "--regras", metavar="ARQUIVO", default=None,
+        help="Regras de categoria de um arquivo .json ou .toml (veja src/regras.py) "
+             "em vez das de src/config.py",
+    )
+    p_organizar.add_argument(
+        "--vigiar-regras", nargs="?", type=float, const=INTERVALO_VIGIA_PADRAO, default=None,
+        metavar="SEGUNDOS",
+        help="Recarrega o arquivo de --regras quando ele muda, sem interromper a execução; "
+             f"verifica a cada SEGUNDOS (padrão: {INTERVALO_VIGIA_PADRAO})",
+    )
+    p_organizar.add_argument(
+        "--memoria-maxima", type=float, default=None, metavar="MB",
+        help="Modo de memória limitada (NAS com pouca RAM): lista de trabalho, registro de "
+             "hashes e registros por arquivo ficam em disco (<destino>/.serum_memoria) e a "
+             "execução é interrompida se o RSS passar de MB",
+    )
+    p_organizar.add_argument(
+        "--registros", metavar="ARQUIVO", default=None,
+        help="Com --memoria-maxima, guarda os registros por arquivo neste NDJSON",
+    )
+    p_organizar.set_defaults(funcao=comando_organizar)
+
+    # Subcomando: consultar
+    p_consultar = subparsers.add_parser(
+        "consultar",
+        help="Consulta o catálogo de uma biblioteca já organizada",
+    )
+    p_consultar.add_argument(
+        "--destino", "-d", required=True, metavar="PASTA",
+        help="Pasta organizada (onde está o .serum_catalogo.db)",
+    )
+    p_consultar.add_argument(
+        "--categoria", "-c", action="append", default=[], metavar="CATEGORIA",
+        help="Categoria exigida (repita para exigir todas, ex: -c Bass -c Dubstep)",
+    )
+    p_consultar.add_argument(
+        "--nome", "-n", default=None, metavar="TEXTO",
+        help="Trecho do nome do preset",
+    )
+    p_consultar.add_argument(
+        "--digest", default=None, metavar="HASH",
+        help="Hash MD5 (hexadecimal) do conteúdo: mostra origens e destinos",
+    )
+    p_consultar.add_argument(
+        "--limite", type=int, default=LIMITE_PADRAO, metavar="N",
+        help=f"Máximo de resultados listados (padrão: {LIMITE_PADRAO}; 0 = todos)",
+    )
+    p_consultar.add_argument(
+        "--formato", choices=["texto", "json"], default="texto",
+        help="texto (lista) ou json",
+    )
+    p_consultar.add_argument(
+        "--saida", metavar="ARQUIVO", default=None,
+        help="Grava a saída neste arquivo em vez do stdout",
+    )
+    p_consultar.add_argument(
+        "--reindexar", action="store_true",
+        help="Reconstrói o índice de busca a partir do catálogo antes de consultar",
+    )
+    p_consultar.set_defaults(funcao=comando_consultar)
+
+    # Subcomando: analisar-nomes
+    p_nomes = subparsers.add_parser(
+        "analisar-nomes",
+        help="Encontra grupos de nomes quase iguais em cada pasta de categoria",
+    )
+    p_nomes.add_argument(
+        "--destino", "-d", required=True, metavar="PASTA",
+        help="Pasta organizada",
+    )
+    p_nomes.add_argument(
+        "--categoria", "-c", action="append", default=[], metavar="CATEGORIA",
+        help="Analisa só esta categoria (repita para várias; padrão: todas)",
+    )
+    p_nomes.add_argument(
+        "--limiar", type=float, default=LIMIAR_NOMES,
+        help=f"Similaridade mínima dos nomes, de 0 a 1 (padrão: {LIMIAR_NOMES})",
+    )
+    p_nomes.add_argument(
+        "--minimo", type=int, default=MINIMO_GRUPO, metavar="N",
+        help=f"Arquivos mínimos por grupo (padrão: {MINIMO_GRUPO})",
+    )
+    p_nomes.add_argument(
+        "--agrupar", action="store_true",
+        help="Move cada grupo para uma subpasta <categoria>/<rótulo>/ (atualiza o catálogo)",
+    )
+    p_nomes.add_argument(
+        "--formato", choices=["texto", "json"], default="texto",
+        help="texto (relatório) ou json",
+    )
+    p_nomes.add_argument(
+        "--saida", metavar="ARQUIVO", default=None,
+        help="Grava a saída neste arquivo em vez do stdout",
+    )
+    p_nomes.set_defaults(funcao=comando_analisar_nomes)
+
+    # Subcomando: reclassificar
+    p_reclassificar = subparsers.add_parser(
+        "reclassificar",
+        help="Reaplica as regras de categoria atuais a uma biblioteca já organizada",
+    )
+    p_reclassificar.add_argument(
+        "--destino", "-d", required=True, metavar="PASTA",
+        help="Pasta organizada",
+    )
+    p_reclassificar.add_argument(
+        "--aplicar", action="store_true",
+        help="Executa o plano (padrão: só mostra o relatório do que mudaria)",
+    )
+    p_reclassificar.add_argument(
+        "--do-catalogo", action="store_true",
+        help="Lê as colocações do catálogo em vez de calcular os digests do destino",
+    )
+    p_reclassificar.add_argument(
+        "--incluir-pasta", action="append", default=[], metavar="NOME",
+        help="Pasta do destino, além das categorias do organizador, que pode ser alterada",
+    )
+    p_reclassificar.add_argument(
+        "--limite", type=int, default=20, metavar="N",
+        help="Operações listadas no relatório em texto (padrão: 20; 0 = todas)",
+    )
+    p_reclassificar.add_argument(
+        "--formato", choices=["texto", "json"], default="texto",
+        help="texto (relatório) ou json",
+    )
+    p_reclassificar.add_argument(
+        "--saida", metavar="ARQUIVO", default=None,
+        help="Grava a saída neste arquivo em vez do stdout",
+    )
+    p_reclassificar.add_argument(
+        "--regras", metavar="ARQUIVO", default=None,
+        help="Reaplica as regras deste arquivo .json ou .toml em vez das de src/config.py",
+    )
+    p_reclassificar.set_defaults(funcao=comando_reclassificar)
+
+    return parser
+
+
+def limpar_para_json(valor):
+    """
+    Remove campos internos (prefixo '_') para serialização em JSON.
+
+    Args:
+        valor: Estrutura de estatísticas (dict, lista ou valor simples)
+
+    Returns:
+        Cópia serializável, sem chaves internas
+    """
+    if isinstance(valor, dict):
+        return {
+            chave: limpar_para_json(item)
+            for chave, item in valor.items()
+            if not str(chave).startswith("_")
+        }
+    if isinstance(valor, (list, tuple)):
+        return [limpar_para_json(item) for item in valor]
+    return valor
+
+
+def montar_resumo(args, estatisticas: dict, tempo_total: float) -> dict:
+    """
+    Monta o resumo da execução em formato serializável.
+
+    Args:
+        args: Argumentos da linha de comando
+        estatisticas: Estatísticas retornadas pelo organizador
+        tempo_total: Tempo total em segundos
+
+    Returns:
+        Dicionário com o resumo da execução
+    """
+    total = estatisticas.get("total_arquivos_origem", 0)
+
+    # arquivos_processados é redundante no resumo (use ndjson para detalhes)
+    dados = {
+        chave: valor for chave, valor in estatisticas.items()
+        if chave != "arquivos_processados"
+    }
+    if "estatisticas_por_pasta" in dados:
+        dados["estatisticas_por_pasta"] = {
+            pasta: {chave: valor for chave, valor in stats.items() if chave != "arquivos_processados"}
+            for pasta, stats in dados["estatisticas_por_pasta"].items()
+        }
+
+    resumo = {
+        "evento": "resumo",
+        "origens": args.origem,
+        "destino": args.destino,
+        "modo": args.modo,
+        "tempo_total_s": round(tempo_total, 6),
+        "arquivos_por_segundo": round(total / tempo_total, 2) if tempo_total > 0 else None,
+        "estatisticas": limpar_para_json(dados),
+    }
+
+    # Memória do registro de deduplicação (compartilhado entre as origens)
+    registro = estatisticas.get("_hashes")
+    if registro is not None:
+        resumo["registro_hashes"] = registro.uso_memoria()
+
+    return resumo
+
+
+def criar_emissor_ndjson(saida: TextIO) -> Callable[[dict], None]:
+    """
+    Cria uma função que escreve um evento JSON por linha.
+
+    Args:
+        saida: Stream de saída
+
+    Returns:
+        Função que recebe um dicionário e grava como linha NDJSON
+    """
+    def emitir(evento: dict):
+        saida.write(json.dumps(evento, ensure_ascii=False))
+        saida.write("\n")
+
+    return emitir
+
+
+def comando_organizar(args, saida: TextIO) -> int:
+    """
+    Executa o subcomando 'organizar'.
+
+    Args:
+        args: Argumentos já validados
+        saida: Stream onde a saída será escrita
+
+    Returns:
+        Código de saída do processo
+    """
+    callback_arquivo = None
+    callback_pasta = None
+    emitir = None
+
+    if args.formato == "ndjson":
+        emitir = criar_emissor_ndjson(saida)
+
+        def callback_arquivo(arquivo: str, categorias: list, info_extra: dict):
+            evento = {"evento": "arquivo", "arquivo": arquivo, "categorias": categorias}
+            evento.update(info_extra)
+            emitir(evento)
+
+        def callback_pasta(pasta: str, idx: int, total_pastas: int):
+            emitir({"evento": "pasta", "pasta": pasta, "indice": idx, "total": total_pastas})
+
+    modo_mover = MODOS[args.modo]
+    metricas = MetricasExecucao()
+
+    # Catálogo persistente no destino (um registro por execução)
+    catalogo = None
+    execucao = None
+    if not args.sem_catalogo:
+        catalogo = CatalogoBiblioteca.para_destino(args.destino)
+        execucao = catalogo.iniciar_execucao(args.origem, args.destino, modo_mover)
+
+    # Limites explícitos por disco; sem eles, os modos concorrentes detectam HD x SSD
+    agendador = AgendadorIO(dict(args.limite_dispositivo)) if args.limite_dispositivo else None
+    armazem = ArmazemConteudo(args.destino, args.armazem) if args.armazem else None
+    regras = None
+    if args.regras:
+        regras = RegrasRecarregaveis(args.regras, args.vigiar_regras or INTERVALO_VIGIA_PADRAO)
+    memoria = None
+    if args.memoria_maxima:
+        memoria = ControleMemoria(pasta_trabalho_padrao(args.destino), args.memoria_maxima, args.registros)
+
+    opcoes = dict(
+        callback_arquivo=callback_arquivo,
+        modo_mover=modo_mover,
+        metricas=metricas,
+        preservar_metadados=not args.sem_metadados,
+        leitura_unica=args.leitura_unica,
+        catalogo=catalogo,
+        agendador=agendador,
+        ordem=args.ordem,
+        armazem=armazem,
+        classificador=regras.determinar_categorias if regras else None,
+        memoria=memoria,
+    )
+
+    indice_destino = None
+
+    def organizar() -> dict:
+        nonlocal indice_destino
+        if args.indexar_destino:
+            # Origens dentro do destino (re-verificação) não entram no índice
+            opcoes["hashes_existentes"], indice_destino = indexar_destino(
+                args.destino, ignorar=args.origem, metricas=metricas, agendador=agendador
+            )
+        if len(args.origem) > 1:
+            return organizar_presets_multiplas_origens(
+                args.origem,
+                args.destino,
+                callback_pasta=callback_pasta,
+                concorrencia=args.concorrencia,
+                origens_paralelas=args.origens_paralelas,
+                **opcoes,
+            )
+        if args.concorrencia:
+            return asyncio.run(organizar_presets_async(
+                args.origem[0],
+                args.destino,
+                concorrencia=args.concorrencia,
+                **opcoes,
+            ))
+        return organizar_presets(args.origem[0], args.destino, **opcoes)
+
+    inicio = time.perf_counter()
+    if regras and args.vigiar_regras is not None:
+        regras.iniciar_vigia()
+
+    interrupcao = None
+    try:
+        if args.profile:
+            profiler = cProfile.Profile()
+            estatisticas = profiler.runcall(organizar)
+            profiler.dump_stats(args.profile)
+        else:
+            estatisticas = organizar()
+        if args.similares is not None:
+            anexar_quase_duplicatas(estatisticas, metricas, args.similares)
+        if catalogo:
+            catalogo.finalizar_execucao(estatisticas)
+    except LimiteMemoriaExcedido as erro:
+        # O que já foi organizado fica no destino (e no catálogo)
+        interrupcao = erro
+    finally:
+        if regras:
+            regras.parar_vigia()
+        if catalogo:
+            catalogo.fechar()
+        if memoria:
+            memoria.fechar()
+
+    tempo_total = time.perf_counter() - inicio
+    if interrupcao is not None:
+        resultado = {
+            "evento": "interrompido",
+            "erro": str(interrupcao),
+            "tempo_total_s": round(tempo_total, 6),
+            "memoria": memoria.para_dict(),
+        }
+        if args.formato == "ndjson":
+            emitir(resultado)
+        elif args.formato == "json":
+            json.dump(resultado, saida, ensure_ascii=False, indent=2)
+            saida.write("\n")
+        else:
+            saida.write(f"✗ Execução interrompida: {interrupcao}\n")
+        return SAIDA_COM_ERROS
+
+    resumo = montar_resumo(args, estatisticas, tempo_total)
+    if catalogo:
+        resumo["catalogo"] = {"caminho": catalogo.caminho, "execucao": execucao}
+    if agendador:
+        resumo["agendador_io"] = agendador.para_dict()
+    if armazem:
+        resumo["armazem"] = armazem.para_dict()
+    if indice_destino:
+        resumo["indice_destino"] = indice_destino
+    if regras:
+        resumo["regras"] = regras.para_dict()
+    if memoria:
+        resumo["memoria"] = memoria.para_dict()
+
+    if args.metricas_json:
+        metricas.exportar_json(args.metricas_json)
+
+    if args.formato == "ndjson":
+        emitir(resumo)
+    elif args.formato == "json":
+        json.dump(resumo, saida, ensure_ascii=False, indent=2)
+        saida.write("\n")
+    else:
+        # Import tardio: o modo texto é o único que usa a interface colorida
+        from src.interface_visual import exibir_resultado_final
+        exibir_resultado_final(estatisticas, tempo_total, args.destino)
+        if memoria and memoria.pico_rss:
+            saida.write(f"Pico de memória (RSS): {memoria.pico_rss / 2**20:.0f} MiB "
+                        f"de {args.memoria_maxima:g} MiB\n")
+
+    return SAIDA_COM_ERROS if estatisticas.get("erros") else SAIDA_OK
+
+
+def comando_consultar(args, saida: TextIO) -> int:
+    """
+    Executa o subcomando 'consultar'.
+
+    Args:
+        args: Argumentos já validados
+        saida: Stream onde a saída será escrita
+
+    Returns:
+        Código de saída do processo
+    """
+    inicio = time.perf_counter()
+
+    with CatalogoBiblioteca(str(caminho_catalogo(args.destino))) as catalogo:
+        if args.reindexar:
+            catalogo.reindexar()
+
+        resultado = {"evento": "consulta", "destino": args.destino}
+        if args.digest:
+            resultado["digest"] = catalogo.consultar_digest(args.digest)
+        if args.categoria or args.nome:
+            resultado.update(catalogo.buscar(args.categoria, args.nome, args.limite or None))
+
+    resultado["tempo_ms"] = round((time.perf_counter() - inicio) * 1000, 3)
+
+    if args.formato == "json":
+        json.dump(resultado, saida, ensure_ascii=False, indent=2)
+        saida.write("\n")
+        return SAIDA_OK
+
+    if "digest" in resultado:
+        dados = resultado["digest"]
+        saida.write(f"{dados['digest']}: " + (dados["preset"]["nome"] if dados["preset"] else "não catalogado") + "\n")
+        for destino in dados["destinos"]:
+            saida.write(f"  → [{destino['categoria']}] {destino['destino']}\n")
+        for origem in dados["origens"]:
+            marca = " (duplicata)" if origem["duplicata"] else ""
+            saida.write(f"  ← {origem['origem']}{marca}\n")
+    if "resultados" in resultado:
+        for item in resultado["resultados"]:
+            categorias = ", ".join(sorted({destino["categoria"] for destino in item["destinos"]}))
+            saida.write(f"{item['destinos'][0]['destino']}  [{categorias}]  {item['digest']}\n")
+        saida.write(f"{len(resultado['resultados'])} de {resultado['total']} preset(s) "
+                    f"em {resultado['tempo_ms']} ms\n")
+    return SAIDA_OK
+
+
+def comando_analisar_nomes(args, saida: TextIO) -> int:
+    """
+    Executa o subcomando 'analisar-nomes'.
+
+    Args:
+        args: Argumentos já validados
+        saida: Stream onde a saída será escrita
+
+    Returns:
+        Código de saída do processo
+    """
+    inicio = time.perf_counter()
+    analise = analisar_destino(args.destino, args.categoria, args.limiar, args.minimo)
+
+    resultado = {"evento": "analise_nomes", "destino": args.destino, "categorias": analise}
+    if args.agrupar:
+        catalogo = None
+        if caminho_catalogo(args.destino).is_file():
+            catalogo = CatalogoBiblioteca(str(caminho_catalogo(args.destino)))
+        try:
+            resultado["arquivos_movidos"] = agrupar_em_subpastas(args.destino, analise, catalogo)
+        finally:
+            if catalogo:
+                catalogo.fechar()
+    resultado["tempo_total_s"] = round(time.perf_counter() - inicio, 4)
+
+    if args.formato == "json":
+        json.dump(resultado, saida, ensure_ascii=False, indent=2)
+        saida.write("\n")
+        return SAIDA_OK
+
+    for categoria in analise:
+        if not categoria["grupos"]:
+            continue
+        saida.write(f"{categoria['categoria']}: {len(categoria['grupos'])} grupo(s) "
+                    f"em {categoria['total_arquivos']} arquivo(s)\n")
+        for grupo in categoria["grupos"]:
+            amostra = ", ".join(grupo["arquivos"][:4])
+            resto = f" (+{len(grupo['arquivos']) - 4})" if len(grupo["arquivos"]) > 4 else ""
+            saida.write(f"  [{grupo['rotulo']}] {len(grupo['arquivos'])}: {amostra}{resto}\n")
+    if "arquivos_movidos" in resultado:
+        saida.write(f"{resultado['arquivos_movidos']} arquivo(s) movido(s) para subpastas\n")
+    saida.write(f"Concluído em {resultado['tempo_total_s']} s\n")
+    return SAIDA_OK
+
+
+def comando_reclassificar(args, saida: TextIO) -> int:
+    """
+    Executa o subcomando 'reclassificar'.
+
+    Args:
+        args: Argumentos já validados
+        saida: Stream onde a saída será escrita
+
+    Returns:
+        Código de saída do processo (SAIDA_COM_ERROS se alguma operação falhou)
+    """
+    inicio = time.perf_counter()
+    metricas = MetricasExecucao()
+    regras = RegrasCompiladas.de_arquivo(args.regras) if args.regras else None
+
+    catalogo = None
+    if caminho_catalogo(args.destino).is_file():
+        catalogo = CatalogoBiblioteca(str(caminho_catalogo(args.destino)))
+    try:
+        plano = reclassificar_destino(
+            args.destino, args.aplicar, catalogo, args.do_catalogo, args.incluir_pasta, metricas, regras
+        )
+    finally:
+        if catalogo:
+            catalogo.fechar()
+
+    resultado = {"evento": "reclassificacao", **plano, "metricas": metricas.para_dict()}
+    if regras:
+        resultado["regras"] = {"arquivo": regras.arquivo, "assinatura": regras.assinatura}
+    resultado["tempo_total_s"] = round(time.perf_counter() - inicio, 4)
+    aplicacao = resultado.get("aplicacao")
+    codigo = SAIDA_COM_ERROS if aplicacao and aplicacao["erros"] else SAIDA_OK
+
+    if args.formato == "json":
+        json.dump(limpar_para_json(resultado), saida, ensure_ascii=False, indent=2)
+        saida.write("\n")
+        return codigo
+
+    saida.write(f"{resultado['alterados']} de {resultado['presets']} preset(s) mudam de categoria\n")
+    for regra in resultado["por_regra"]:
+        motivo = f" ({regra['regra']})" if regra["regra"] else ""
+        saida.write(f"  {regra['mudanca']}{regra['categoria']}{motivo}: {regra['presets']}\n")
+    if resultado["operacoes"]:
+        saida.write("Operações: " + ", ".join(
+            f"{quantidade} {acao}" for acao, quantidade in resultado["por_acao"].items() if quantidade
+        ) + "\n")
+    listadas = resultado["operacoes"][:args.limite or None]
+    for operacao in listadas:
+        alvo = f" → {operacao['destino']}" if "destino" in operacao else ""
+        saida.write(f"  {operacao['acao']}: {operacao['origem']}{alvo}\n")
+    if len(listadas) < len(resultado["operacoes"]):
+        saida.write(f"  ... e mais {len(resultado['operacoes']) - len(listadas)}\n")
+    if aplicacao:
+        saida.write(f"Aplicado: {sum(aplicacao['aplicadas'].values())} operação(ões), "
+                    f"{aplicacao['ja_existiam']} já existiam, {len(aplicacao['erros'])} erro(s)\n")
+        for erro in aplicacao["erros"]:
+            saida.write(f"  ✗ {erro['arquivo']}: {erro['erro']}\n")
+    elif resultado["operacoes"]:
+        saida.write("Simulação: use --aplicar para executar\n")
+    saida.write(f"Concluído em {resultado['tempo_total_s']} s\n")
+    return codigo
+
+
+def executar_cli(argv: Optional[List[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Lista de argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída do processo
+    """
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+
+    # Valida as pastas de origem antes de começar
+    for pasta in getattr(args, "origem", None) or []:
+        if not os.path.isdir(pasta):
+            parser.error(f"pasta de origem inválida: {pasta}")
+
+    if getattr(args, "concorrencia", None) is not None and args.concorrencia < 1:
+        parser.error("--concorrencia deve ser pelo menos 1")
+
+    for caminho, _ in getattr(args, "limite_dispositivo", None) or []:
+        if not os.path.exists(caminho):
+            parser.error(f"--limite-dispositivo: caminho inexistente: {caminho}")
+
+    if getattr(args, "origens_paralelas", False) and args.concorrencia:
+        parser.error("--origens-paralelas não pode ser usado com --concorrencia")
+
+    if getattr(args, "similares", None) is not None and not 0 < args.similares <= 1:
+        parser.error("--similares deve estar entre 0 (exclusivo) e 1")
+
+    if getattr(args, "memoria_maxima", None) is not None:
+        if args.memoria_maxima <= 0:
+            parser.error("--memoria-maxima deve ser maior que 0")
+        if args.similares is not None:
+            parser.error("--similares compara todos os conteúdos em memória: não use com --memoria-maxima")
+        if args.ordem != ORDEM_PADRAO:
+            parser.error(f"--ordem {args.ordem} precisa da lista inteira em memória: não use com --memoria-maxima")
+        if args.indexar_destino:
+            parser.error("--indexar-destino carrega o digest de cada preset do destino em memória: "
+                         "não use com --memoria-maxima")
+    if getattr(args, "registros", None) and args.memoria_maxima is None:
+        parser.error("--registros exige --memoria-maxima")
+
+    if getattr(args, "vigiar_regras", None) is not None:
+        if not args.regras:
+            parser.error("--vigiar-regras exige --regras")
+        if args.vigiar_regras <= 0:
+            parser.error("--vigiar-regras deve ser maior que 0")
+
+    if getattr(args, "regras", None):
+        try:
+            RegrasCompiladas.de_arquivo(args.regras)
+        except (OSError, ValueError) as erro:
+            parser.error(f"--regras: {erro}")
+
+    if args.comando == "analisar-nomes":
+        if not os.path.isdir(args.destino):
+            parser.error(f"pasta de destino inválida: {args.destino}")
+        if not 0 < args.limiar <= 1:
+            parser.error("--limiar deve estar entre 0 (exclusivo) e 1")
+        if args.minimo < 2:
+            parser.error("--minimo deve ser pelo menos 2")
+
+    if args.comando == "reclassificar":
+        if not os.path.isdir(args.destino):
+            parser.error(f"pasta de destino inválida: {args.destino}")
+        if args.do_catalogo and not caminho_catalogo(args.destino).is_file():
+            parser.error(f"--do-catalogo: catálogo não encontrado em: {args.destino}")
+        if args.limite < 0:
+            parser.error("--limite não pode ser negativo")
+
+    if args.comando == "consultar":
+        if not caminho_catalogo(args.destino).is_file():
+            parser.error(f"catálogo não encontrado em: {args.destino}")
+        if not (args.categoria or args.nome or args.digest or args.reindexar):
+            parser.error("informe --categoria, --nome, --digest ou --reindexar")
+        if args.nome is not None and not tokenizar_texto(args.nome):
+            parser.error("--nome precisa conter letras ou números")
+        if args.limite < 0:
+            parser.error("--limite não pode ser negativo")
+        if args.digest:
+            try:
+                bytes.fromhex(args.digest)
+            except ValueError:
+                parser.error(f"--digest inválido: {args.digest}")
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo_saida:
+            # O relatório em texto usa print(), então redireciona o stdout também
+            with contextlib.redirect_stdout(arquivo_saida):
+                return args.funcao(args, arquivo_saida)
+
+    return args.funcao(args, sys.stdout)
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo do Indexador do Destino - Serum Preset Organizer
+========================================================
+Preenche o registro de deduplicação com os conteúdos que já estão na
+biblioteca organizada, antes de processar as origens. Sem isso, um preset
+que já existe no destino com outro nome (ou em outra categoria) é copiado
+de novo, porque copiar_preset_seguro só compara conteúdos quando os nomes
+colidem.
+
+Os digests ficam em cache no próprio destino (<destino>/.serum_digests.db),
+indexados pelo caminho e validados por (tamanho, mtime): numa reimportação
+só os arquivos novos ou alterados são lidos. Os que precisam de hash são
+lidos em paralelo, respeitando os limites por disco do agendador de I/O.
+Arquivos com o mesmo inode (hardlinks do armazém) são lidos uma vez, e os
+objetos do armazém (.store) já trazem o digest no nome.
+"""
+
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.agendador_io import AgendadorIO
+from src.armazem import PASTA_ARMAZEM
+from src.categorizador import validar_extensao
+from src.config import EXTENSOES_SUPORTADAS
+from src.manipulador_arquivos import calcular_digest_arquivo
+from src.metricas import MetricasExecucao, obter_metricas
+from src.registro_hashes import RegistroHashes
+
+
+# Arquivo do cache de digests dentro da pasta de destino
+NOME_CACHE = ".serum_digests.db"
+
+# Threads que calculam os hashes que não estão em cache (o agendador limita cada disco)
+TRABALHADORES_PADRAO = 8
+
+ESQUEMA_CACHE = """
+CREATE TABLE IF NOT EXISTS digests (
+    caminho TEXT PRIMARY KEY,
+    tamanho INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+# (caminho, tamanho, mtime_ns, (st_dev, st_ino))
+_Entrada = Tuple[str, int, int, Tuple[int, int]]
+
+
+class CacheDigests:
+    """
+    Cache SQLite caminho -> (tamanho, mtime_ns, digest) de um destino.
+
+    Uso:
+        with CacheDigests(caminho) as cache:
+            conhecidos = cache.carregar()
+            cache.atualizar(novos, removidos)
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = str(caminho)
+        self._conexao = sqlite3.connect(self.caminho)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.executescript(ESQUEMA_CACHE)
+
+    @classmethod
+    def para_destino(cls, pasta_destino: str) -> "CacheDigests":
+        """Abre o cache da pasta de destino."""
+        return cls(str(Path(pasta_destino) / NOME_CACHE))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
+
+    def carregar(self) -> Dict[str, Tuple[int, int, bytes]]:
+        """Todas as entradas (caminho -> (tamanho, mtime_ns, digest))."""
+        return {
+            caminho: (tamanho, mtime_ns, digest)
+            for caminho, tamanho, mtime_ns, digest in self._conexao.execute(
+                "SELECT caminho, tamanho, mtime_ns, digest FROM digests"
+            )
+        }
+
+    def atualizar(self, entradas: Iterable[Tuple[str, int, int, bytes]], removidos: Iterable[str] = ()):
+        """Grava digests novos/alterados e apaga os caminhos que sumiram, numa transação."""
+        with self._conexao:
+            self._conexao.executemany(
+                "INSERT OR REPLACE INTO digests (caminho, tamanho, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                entradas,
+            )
+            self._conexao.executemany("DELETE FROM digests WHERE caminho = ?", ((caminho,) for caminho in removidos))
+
+    def fechar(self):
+        """Fecha a conexão."""
+        self._conexao.close()
+
+
+def _percorrer_destino(pasta_destino: Path, ignorar: List[str]) -> Tuple[List[_Entrada], List[Tuple[str, bytes]]]:
+    """
+    Lista os presets do destino (sem pastas ocultas nem as pastas ignoradas).
+
+    Returns:
+        Tuple com (presets, objetos_do_armazem), onde cada objeto é (caminho, digest)
+    """
+    presets: List[_Entrada] = []
+    objetos: List[Tuple[str, bytes]] = []
+    pendentes = [str(pasta_destino)]
+    while pendentes:
+        pasta = pendentes.pop()
+        with os.scandir(pasta) as entradas:
+            for entrada in entradas:
+                if entrada.is_dir():
+                    if entrada.name == PASTA_ARMAZEM and pasta == str(pasta_destino):
+                        objetos.extend(_listar_armazem(entrada.path))
+                    elif not entrada.name.startswith(".") and entrada.path not in ignorar:
+                        pendentes.append(entrada.path)
+                elif entrada.is_file() and validar_extensao(entrada.name, EXTENSOES_SUPORTADAS):
+                    info = entrada.stat()
+                    presets.append((entrada.path, info.st_size, info.st_mtime_ns, (info.st_dev, info.st_ino)))
+    return presets, objetos
+
+
+def _listar_armazem(pasta_armazem: str) -> List[Tuple[str, bytes]]:
+    """Objetos do armazém: o digest é o nome (.store/ab/cdef...), sem leitura."""
+    objetos = []
+    with os.scandir(pasta_armazem) as prefixos:
+        for prefixo in prefixos:
+            if not prefixo.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(prefixo.path) as entradas:
+                for entrada in entradas:
+                    try:
+                        digest = bytes.fromhex(prefixo.name + entrada.name)
+                    except ValueError:
+                        continue  # .parcial ou arquivo estranho
+                    if len(digest) == 16:
+                        objetos.append((entrada.path, digest))
+    return objetos
+
+
+def digests_do_destino(
+    pasta_destino: str,
+    ignorar: Iterable[str] = (),
+    trabalhadores: int = TRABALHADORES_PADRAO,
+    metricas: Optional[MetricasExecucao] = None,
+    agendador: Optional[AgendadorIO] = None,
+    usar_cache: bool = True
+) -> Tuple[Dict[str, bytes], Dict[str, bytes], dict]:
+    """
+    Digest de cada preset do destino (do cache quando tamanho e mtime batem).
+
+    Args:
+        pasta_destino: Biblioteca organizada (se não existir, nada é indexado)
+        ignorar: Pastas que não entram no índice (veja indexar_destino)
+        trabalhadores: Threads para os hashes que não estão em cache
+        metricas: Métricas da execução (etapa "indexacao" e bytes lidos)
+        agendador: Agendador de I/O; se None, um AgendadorIO com os limites detectados
+        usar_cache: Se False, não lê nem grava <destino>/.serum_digests.db
+
+    Returns:
+        Tuple com (presets, objetos_armazem, resumo): os dois primeiros mapeiam
+        caminho absoluto -> digest; resumo traz arquivos, em_cache, calculados,
+        objetos_armazem, erros e tempo_s
+    """
+    inicio = time.perf_counter()
+    metricas = obter_metricas(metricas)
+    resumo = {"arquivos": 0, "em_cache": 0, "calculados": 0, "objetos_armazem": 0, "erros": [], "tempo_s": 0.0}
+
+    pasta = Path(os.path.abspath(pasta_destino))
+    ignorar = [os.path.abspath(caminho) for caminho in ignorar]
+    if not pasta.is_dir() or str(pasta) in ignorar:
+        return {}, {}, resumo
+    if agendador is None:
+        agendador = AgendadorIO()
+
+    with metricas.medir("indexacao"):
+        presets, objetos = _percorrer_destino(pasta, ignorar)
+        resumo["arquivos"] = len(presets)
+        resumo["objetos_armazem"] = len(objetos)
+
+        cache = CacheDigests.para_destino(str(pasta)) if usar_cache else None
+        try:
+            conhecidos = cache.carregar() if cache else {}
+
+            # Inode -> digest: hardlinks do armazém (e o próprio objeto) não são relidos
+            por_inode: Dict[Tuple[int, int], bytes] = {}
+            for caminho, digest in objetos:
+                info = os.stat(caminho)
+                por_inode[(info.st_dev, info.st_ino)] = digest
+
+            digests: Dict[str, bytes] = {}
+            a_calcular: Dict[Tuple[int, int], List[_Entrada]] = {}
+            for entrada in presets:
+                caminho, tamanho, mtime_ns, inode = entrada
+                em_cache = conhecidos.get(caminho)
+                if em_cache is not None and em_cache[0] == tamanho and em_cache[1] == mtime_ns:
+                    digests[caminho] = em_cache[2]
+                    resumo["em_cache"] += 1
+                elif inode in por_inode:
+                    digests[caminho] = por_inode[inode]
+                    resumo["em_cache"] += 1
+                else:
+                    a_calcular.setdefault(inode, []).append(entrada)
+
+            def calcular(entradas: List[_Entrada]) -> bytes:
+                with agendador.reservar(entradas[0][0], metricas=metricas):
+                    return calcular_digest_arquivo(entradas[0][0])
+
+            if a_calcular:
+                grupos = list(a_calcular.values())
+                with ThreadPoolExecutor(max_workers=max(1, trabalhadores), thread_name_prefix="indexador") as executor:
+                    futuros = [executor.submit(calcular, entradas) for entradas in grupos]
+                    for entradas, futuro in zip(grupos, futuros):
+                        try:
+                            digest = futuro.result()
+                        except OSError as erro:
+                            resumo["erros"].append({"arquivo": entradas[0][0], "erro": str(erro)})
+                            continue
+                        metricas.adicionar_bytes(lidos=entradas[0][1])
+                        resumo["calculados"] += 1
+                        for caminho, *_ in entradas:
+                            digests[caminho] = digest
+
+            if cache:
+                novos = [
+                    (caminho, tamanho, mtime_ns, digests[caminho])
+                    for caminho, tamanho, mtime_ns, _ in presets
+                    if caminho in digests and conhecidos.get(caminho, (None, None, None))[:2] != (tamanho, mtime_ns)
+                ]
+                vistos = {caminho for caminho, *_ in presets}
+                cache.atualizar(novos, [caminho for caminho in conhecidos if caminho not in vistos])
+        finally:
+            if cache:
+                cache.fechar()
+
+    resumo["tempo_s"] = round(time.perf_counter() - inicio, 4)
+    # Na ordem do percurso (não na de conclusão dos hashes)
+    return (
+        {caminho: digests[caminho] for caminho, *_ in presets if caminho in digests},
+        dict(objetos),
+        resumo,
+    )
+
+
+def indexar_destino(
+    pasta_destino: str,
+    registro: Optional[RegistroHashes] = None,
+    ignorar: Iterable[str] = (),
+    trabalhadores: int = TRABALHADORES_PADRAO,
+    metricas: Optional[MetricasExecucao] = None,
+    agendador: Optional[AgendadorIO] = None,
+    usar_cache: bool = True
+) -> Tuple[RegistroHashes, dict]:
+    """
+    Registra os digests dos presets que já estão no destino.
+
+    Args:
+        pasta_destino: Biblioteca organizada (se não existir, nada é indexado)
+        registro: Registro a preencher (um novo se None); entradas existentes são mantidas
+        ignorar: Pastas que não entram no índice, como uma origem dentro do
+                 destino (re-verificação de Uncategorized, cujos arquivos
+                 precisam ser processados e não tratados como duplicatas)
+        trabalhadores: Threads para os hashes que não estão em cache
+        metricas: Métricas da execução (etapa "indexacao" e bytes lidos)
+        agendador: Agendador de I/O; se None, um AgendadorIO com os limites detectados
+        usar_cache: Se False, não lê nem grava <destino>/.serum_digests.db
+
+    Returns:
+        Tuple com (registro, resumo), onde resumo é o de digests_do_destino()
+    """
+    registro = registro if registro is not None else RegistroHashes()
+    presets, objetos, resumo = digests_do_destino(
+        pasta_destino, ignorar, trabalhadores, metricas, agendador, usar_cache
+    )
+
+    # Pastas de categoria primeiro: o "original" de uma duplicata é um caminho legível
+    for caminho, digest in presets.items():
+        registro.registrar_se_ausente(digest, caminho)
+    for caminho, digest in objetos.items():
+        registro.registrar_se_ausente(digest, caminho)
+
+    return registro, resumo
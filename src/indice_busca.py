@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Índice de Busca - Serum Preset Organizer
+===================================================
+Índice de consulta da biblioteca organizada, guardado no catálogo SQLite:
+
+- cada conteúdo (digest) recebe um número de item;
+- índice invertido: palavra do nome -> lista ordenada de itens;
+- bitmaps por categoria: inteiro Python onde o bit N indica o item N.
+
+Consultas por categoria são ANDs de bitmaps; por nome, uniões/interseções
+das listas de itens. O índice é atualizado ao final de cada execução com
+as colocações registradas por organizar_presets (ver CatalogoBiblioteca);
+colocações removidas ou movidas depois são descontadas na hora.
+"""
+
+import re
+import sqlite3
+import sys
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.categorizador import tokenizar_nome, tokenizar_texto
+
+
+ESQUEMA_INDICE = """
+CREATE TABLE IF NOT EXISTS indice_itens (
+    id INTEGER PRIMARY KEY,
+    digest BLOB NOT NULL UNIQUE
+);
+
+-- As listas ficam fora do índice (numerico, token): a busca por trecho
+-- percorre só o índice, sem ler as listas de itens do disco. Palavras só
+-- com dígitos (numeração, muitas vezes única por preset) ficam separadas
+-- e não são percorridas quando o termo buscado tem letras.
+CREATE TABLE IF NOT EXISTS indice_tokens (
+    id INTEGER PRIMARY KEY,
+    numerico INTEGER NOT NULL,
+    token TEXT NOT NULL,
+    itens BLOB NOT NULL,
+    UNIQUE (numerico, token)
+);
+
+CREATE TABLE IF NOT EXISTS indice_categorias (
+    categoria TEXT PRIMARY KEY,
+    bitmap BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Limite de resultados devolvidos por padrão
+LIMITE_PADRAO = 50
+
+# Parâmetros por consulta "IN (...)" (limite antigo do SQLite é 999)
+_TAMANHO_LOTE_SQL = 500
+
+# Bytes diferentes de zero no bitmap (para pular regiões vazias em C)
+_PADRAO_BYTE_OCUPADO = re.compile(b"[^\x00]")
+
+
+def _lista_de_blob(blob: bytes) -> array:
+    """Lê uma lista de itens (uint32 little-endian)."""
+    itens = array("I")
+    itens.frombytes(blob)
+    if sys.byteorder != "little":
+        itens.byteswap()
+    return itens
+
+
+def _blob_de_lista(itens: array) -> bytes:
+    """Grava uma lista de itens (uint32 little-endian)."""
+    if sys.byteorder != "little":
+        itens = array("I", itens)
+        itens.byteswap()
+    return itens.tobytes()
+
+
+def bitmap_de_itens(itens: Iterable[int]) -> int:
+    """Monta o bitmap (int) com os bits dos itens ligados."""
+    itens = list(itens)
+    if not itens:
+        return 0
+    dados = bytearray(max(itens) // 8 + 1)
+    for item in itens:
+        dados[item >> 3] |= 1 << (item & 7)
+    return int.from_bytes(dados, "little")
+
+
+def itens_do_bitmap(bitmap: int, limite: Optional[int] = None) -> List[int]:
+    """
+    Lista os itens (bits ligados) de um bitmap, em ordem crescente.
+
+    Args:
+        bitmap: Bitmap de itens
+        limite: Máximo de itens a devolver (None = todos)
+
+    Returns:
+        Lista de números de item
+    """
+    itens = []
+    if bitmap <= 0 or limite == 0:
+        return itens
+    dados = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for ocupado in _PADRAO_BYTE_OCUPADO.finditer(dados):
+        posicao = ocupado.start()
+        byte = dados[posicao]
+        for bit in range(8):
+            if byte >> bit & 1:
+                itens.append(posicao * 8 + bit)
+                if limite is not None and len(itens) >= limite:
+                    return itens
+    return itens
+
+
+def contar_bits(bitmap: int) -> int:
+    """Conta os itens de um bitmap."""
+    return bin(bitmap).count("1")
+
+
+class IndiceBusca:
+    """
+    Índice invertido e bitmaps de categoria sobre a conexão do catálogo.
+
+    Não tem lock próprio: quem chama (CatalogoBiblioteca) serializa o acesso.
+    """
+
+    def __init__(self, conexao: sqlite3.Connection):
+        self._conexao = conexao
+        self._conexao.executescript(ESQUEMA_INDICE)
+
+    # ------------------------------------------------------------------
+    # Construção
+    # ------------------------------------------------------------------
+
+    def atualizar(self, execucao: Optional[int] = None):
+        """
+        Indexa as colocações de uma execução (ou todas, se execucao for None).
+
+        Args:
+            execucao: Id da execução cujas colocações entram no índice
+        """
+        filtro, parametros = ("WHERE c.execucao = ?", (execucao,)) if execucao is not None else ("", ())
+
+        with self._conexao:
+            self._conexao.execute(
+                f"INSERT OR IGNORE INTO indice_itens (digest) SELECT DISTINCT c.digest FROM colocacoes c {filtro}",
+                parametros,
+            )
+            linhas = self._conexao.execute(
+                f"SELECT i.id, c.destino, c.categoria FROM colocacoes c "
+                f"JOIN indice_itens i ON i.digest = c.digest {filtro}",
+                parametros,
+            )
+
+            tokens: Dict[str, Set[int]] = defaultdict(set)
+            categorias: Dict[str, Set[int]] = defaultdict(set)
+            for item, destino, categoria in linhas:
+                categorias[categoria].add(item)
+                for token in tokenizar_nome(destino):
+                    tokens[token].add(item)
+
+            self._mesclar_tokens(tokens)
+            self._mesclar_categorias(categorias)
+
+    def _mesclar_tokens(self, tokens: Dict[str, Set[int]]):
+        """Junta os itens novos às listas já gravadas de cada palavra."""
+        inserir = []
+        atualizar = []
+        for token, novos in tokens.items():
+            itens = array("I", sorted(novos))
+            numerico = int(token.isdigit())
+            linha = self._conexao.execute(
+                "SELECT id, itens FROM indice_tokens WHERE numerico = ? AND token = ?", (numerico, token)
+            ).fetchone()
+            if linha is None:
+                inserir.append((numerico, token, _blob_de_lista(itens)))
+                continue
+            antigos = _lista_de_blob(linha[1])
+            if antigos and antigos[-1] < itens[0]:
+                # Caso comum: itens novos têm números maiores
+                antigos.extend(itens)
+                itens = antigos
+            else:
+                itens = array("I", sorted(set(antigos).union(itens)))
+            atualizar.append((_blob_de_lista(itens), linha[0]))
+        self._conexao.executemany("INSERT INTO indice_tokens (numerico, token, itens) VALUES (?, ?, ?)", inserir)
+        self._conexao.executemany("UPDATE indice_tokens SET itens = ? WHERE id = ?", atualizar)
+
+    def _mesclar_categorias(self, categorias: Dict[str, Set[int]]):
+        """Liga os bits dos itens novos no bitmap de cada categoria."""
+        gravar = []
+        for categoria, novos in categorias.items():
+            bitmap = bitmap_de_itens(novos) | self._bitmap_categoria(categoria)
+            gravar.append((categoria, bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")))
+        self._conexao.executemany(
+            "INSERT OR REPLACE INTO indice_categorias (categoria, bitmap) VALUES (?, ?)", gravar
+        )
+
+    def _item(self, digest: bytes) -> Optional[int]:
+        linha = self._conexao.execute("SELECT id FROM indice_itens WHERE digest = ?", (digest,)).fetchone()
+        return linha[0] if linha else None
+
+    def descontar(self, removidas: Iterable[Tuple[bytes, str, str]]):
+        """
+        Tira do índice colocações que saíram da tabela colocacoes.
+
+        Um bit de categoria ou uma palavra só sai se nenhuma colocação restante
+        do mesmo conteúdo ainda os tiver. Roda dentro da transação de quem
+        chama, depois de a tabela já estar atualizada.
+
+        Args:
+            removidas: (digest, destino, categoria) de cada colocação removida ou movida
+        """
+        tokens: Dict[str, Set[int]] = defaultdict(set)
+        categorias: Dict[str, Set[int]] = defaultdict(set)
+        for digest, destino, categoria in removidas:
+            item = self._item(digest)
+            if item is None:
+                continue
+            restantes = self._conexao.execute(
+                "SELECT destino, categoria FROM colocacoes WHERE digest = ?", (digest,)
+            ).fetchall()
+            if all(outra != categoria for _, outra in restantes):
+                categorias[categoria].add(item)
+            tokens_restantes = {token for outro, _ in restantes for token in tokenizar_nome(outro)}
+            for token in set(tokenizar_nome(destino)) - tokens_restantes:
+                tokens[token].add(item)
+
+        for token, removidos in tokens.items():
+            numerico = int(token.isdigit())
+            linha = self._conexao.execute(
+                "SELECT id, itens FROM indice_tokens WHERE numerico = ? AND token = ?", (numerico, token)
+            ).fetchone()
+            if linha is None:
+                continue
+            itens = array("I", (item for item in _lista_de_blob(linha[1]) if item not in removidos))
+            if itens:
+                self._conexao.execute(
+                    "UPDATE indice_tokens SET itens = ? WHERE id = ?", (_blob_de_lista(itens), linha[0])
+                )
+            else:
+                self._conexao.execute("DELETE FROM indice_tokens WHERE id = ?", (linha[0],))
+
+        for categoria, removidos in categorias.items():
+            bitmap = self._bitmap_categoria(categoria) & ~bitmap_de_itens(removidos)
+            self._conexao.execute(
+                "UPDATE indice_categorias SET bitmap = ? WHERE categoria = ?",
+                (bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little"), categoria),
+            )
+
+    def indexar_destino(self, digest: bytes, destino: str):
+        """Acrescenta as palavras de um novo caminho a um conteúdo já indexado (ex: renomeado)."""
+        item = self._item(digest)
+        if item is not None:
+            self._mesclar_tokens({token: {item} for token in tokenizar_nome(destino)})
+
+    def reconstruir(self):
+        """Apaga o índice e indexa novamente todas as colocações do catálogo."""
+        with self._conexao:
+            self._conexao.execute("DELETE FROM indice_tokens")
+            self._conexao.execute("DELETE FROM indice_categorias")
+            self._conexao.execute("DELETE FROM indice_itens")
+        self.atualizar()
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def _bitmap_categoria(self, categoria: str) -> int:
+        linha = self._conexao.execute(
+            "SELECT bitmap FROM indice_categorias WHERE categoria = ?", (categoria,)
+        ).fetchone()
+        return int.from_bytes(linha[0], "little") if linha else 0
+
+    def _itens_com_termo(self, termo: str) -> Set[int]:
+        """Itens com alguma palavra do nome contendo o termo."""
+        # Um termo com letras nunca está dentro de uma palavra só de dígitos
+        filtro = "" if termo.isdigit() else "numerico = 0 AND "
+        ids = [
+            id_token for (id_token,) in
+            self._conexao.execute(f"SELECT id FROM indice_tokens WHERE {filtro}instr(token, ?) > 0", (termo,))
+        ]
+        itens: Set[int] = set()
+        for id_token in ids:
+            blob = self._conexao.execute("SELECT itens FROM indice_tokens WHERE id = ?", (id_token,)).fetchone()[0]
+            itens.update(_lista_de_blob(blob))
+        return itens
+
+    def buscar(
+        self,
+        categorias: Iterable[str] = (),
+        nome: Optional[str] = None,
+        limite: Optional[int] = LIMITE_PADRAO
+    ) -> dict:
+        """
+        Busca presets por categorias (todas) e/ou trecho do nome.
+
+        Cada palavra do trecho precisa aparecer dentro de alguma palavra do
+        nome do preset ("dee bas" encontra "Deep_Bass.fxp").
+
+        Args:
+            categorias: Categorias que o preset deve ter (AND)
+            nome: Trecho do nome
+            limite: Máximo de resultados detalhados (None = todos)
+
+        Returns:
+            Dicionário com o total de itens e os resultados (digest e destinos)
+        """
+        candidatos: Optional[Set[int]] = None
+        for termo in tokenizar_texto(nome or ""):
+            itens = self._itens_com_termo(termo)
+            candidatos = itens if candidatos is None else candidatos & itens
+            if not candidatos:
+                break
+
+        bitmap: Optional[int] = None
+        for categoria in categorias:
+            bitmap_categoria = self._bitmap_categoria(categoria)
+            bitmap = bitmap_categoria if bitmap is None else bitmap & bitmap_categoria
+
+        if candidatos is None and bitmap is None:
+            raise ValueError("informe ao menos uma categoria ou um trecho do nome")
+
+        if candidatos is None:
+            total = contar_bits(bitmap)
+            itens = itens_do_bitmap(bitmap, limite)
+        else:
+            if bitmap is not None:
+                dados = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+                candidatos = {
+                    item for item in candidatos
+                    if (item >> 3) < len(dados) and dados[item >> 3] >> (item & 7) & 1
+                }
+            total = len(candidatos)
+            itens = sorted(candidatos)[:limite] if limite is not None else sorted(candidatos)
+
+        return {"total": total, "resultados": self.resolver(itens)}
+
+    def resolver(self, itens: List[int]) -> List[dict]:
+        """Converte números de item em digest + destinos (na ordem recebida)."""
+        por_item: Dict[int, dict] = {}
+        for inicio in range(0, len(itens), _TAMANHO_LOTE_SQL):
+            lote = itens[inicio:inicio + _TAMANHO_LOTE_SQL]
+            marcadores = ",".join("?" * len(lote))
+            linhas = self._conexao.execute(
+                f"SELECT i.id, i.digest, c.destino, c.categoria FROM indice_itens i "
+                f"JOIN colocacoes c ON c.digest = i.digest WHERE i.id IN ({marcadores}) "
+                f"ORDER BY c.destino",
+                lote,
+            )
+            for item, digest, destino, categoria in linhas:
+                resultado = por_item.setdefault(item, {"digest": digest.hex(), "destinos": []})
+                resultado["destinos"].append({"destino": destino, "categoria": categoria})
+        return [por_item[item] for item in itens if item in por_item]
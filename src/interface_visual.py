@@ -8,7 +8,10 @@ Contém funções para exibição formatada no terminal com cores e estilos.
 import os
 import sys
 import time
+import itertools
+import threading
 from datetime import datetime
+from typing import Callable, Optional, TextIO
 
 
 # ============================================================================
@@ -287,6 +290,110 @@ def atualizar_linha(texto: str):
     sys.stdout.flush()
 
 
+class ReporterProgresso:
+    """
+    Desenha a barra de progresso em uma thread própria, com taxa limitada.
+    
+    O loop de trabalho só grava contadores (atribuições simples, atômicas no
+    CPython); a formatação e o sys.stdout.write acontecem na thread do
+    reporter, no máximo `max_por_segundo` vezes por segundo e apenas quando
+    o contador mudou. Se o stream não for um terminal, nada é desenhado.
+    
+    Uso:
+        with ReporterProgresso(total) as reporter:
+            for i, item in enumerate(itens, 1):
+                ...
+                reporter.atualizar(i)
+    """
+    
+    def __init__(
+        self,
+        total: int = 0,
+        max_por_segundo: float = 10,
+        largura: int = 35,
+        stream: Optional[TextIO] = None,
+        ativo: Optional[bool] = None,
+        formatador: Optional[Callable[[int, int], str]] = None
+    ):
+        """
+        Args:
+            total: Total de itens esperado
+            max_por_segundo: Máximo de redesenhos por segundo
+            largura: Largura da barra de progresso
+            stream: Stream de saída (padrão: sys.stdout)
+            ativo: Força ligar/desligar; None = ativo apenas se o stream é um TTY
+            formatador: Função (contador, total) -> texto da linha
+        """
+        self.stream = stream or sys.stdout
+        if ativo is None:
+            isatty = getattr(self.stream, "isatty", None)
+            ativo = bool(isatty and isatty())
+        self.ativo = ativo
+        self.intervalo = 1.0 / max_por_segundo if max_por_segundo > 0 else 0.1
+        self.largura = largura
+        self.formatador = formatador or self._formatar_barra
+        
+        self.contador = 0
+        self.total = total
+        self.desenhos = 0
+        
+        self._sequencia = itertools.count(1)
+        self._ultimo_desenhado = None
+        self._parar = threading.Event()
+        self._thread = None
+    
+    def _formatar_barra(self, contador: int, total: int) -> str:
+        """Formato padrão: barra de progresso com contagem."""
+        return f"  {barra_progresso(contador, total, largura=self.largura)} ({contador}/{total})"
+    
+    def atualizar(self, contador: int, total: Optional[int] = None):
+        """Registra o progresso atual (chamado pelo loop de trabalho)."""
+        self.contador = contador
+        if total is not None:
+            self.total = total
+    
+    def incrementar(self):
+        """Incrementa o contador; seguro entre threads (itertools.count é atômico)."""
+        self.contador = next(self._sequencia)
+    
+    def _desenhar(self):
+        """Redesenha a linha se o progresso mudou desde o último desenho."""
+        estado = (self.contador, self.total)
+        if estado == self._ultimo_desenhado:
+            return
+        self._ultimo_desenhado = estado
+        self.stream.write(f"\r{self.formatador(*estado)}")
+        self.stream.flush()
+        self.desenhos += 1
+    
+    def _loop(self):
+        while not self._parar.wait(self.intervalo):
+            self._desenhar()
+    
+    def iniciar(self) -> "ReporterProgresso":
+        """Inicia a thread de desenho (idempotente; não faz nada fora de um TTY)."""
+        if self.ativo and self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="reporter-progresso", daemon=True)
+            self._thread.start()
+        return self
+    
+    def parar(self):
+        """Para a thread e desenha o estado final."""
+        if self._thread is None:
+            return
+        self._parar.set()
+        self._thread.join()
+        self._thread = None
+        self._desenhar()
+    
+    def __enter__(self) -> "ReporterProgresso":
+        return self.iniciar()
+    
+    def __exit__(self, *exc):
+        self.parar()
+        return False
+
+
 def spinner_animado(frame: int) -> str:
     """
     Retorna o caractere atual do spinner animado.
@@ -555,6 +662,14 @@ def exibir_resultado_final(estatisticas: dict, tempo_execucao: float, pasta_dest
             
             print(f"  {icone} {categoria:18} {quantidade:5} {barra} {Cores.DIM}({pct:.1f}%){Cores.RESET}")
     
+    # Quase-duplicatas (conteúdo parecido, MD5 diferente)
+    if estatisticas.get('quase_duplicatas'):
+        exibir_quase_duplicatas(estatisticas['quase_duplicatas'], pasta_destino)
+    
+    # Tempo por etapa (instrumentação do organizador)
+    if estatisticas.get('metricas'):
+        exibir_metricas_etapas(estatisticas['metricas'])
+    
     # Erros (se houver)
     if estatisticas.get('erros'):
         print(f"\n  {Cores.BOLD}{Cores.VERMELHO_CLARO}⚠️ ERROS ENCONTRADOS{Cores.RESET}")
@@ -586,6 +701,71 @@ def exibir_resultado_final(estatisticas: dict, tempo_execucao: float, pasta_dest
     print()
 
 
+def formatar_bytes(quantidade: int) -> str:
+    """Formata um volume em bytes com a unidade mais adequada."""
+    valor = float(quantidade)
+    for unidade in ("B", "KB", "MB", "GB"):
+        if valor < 1024 or unidade == "GB":
+            return f"{valor:.1f} {unidade}" if unidade != "B" else f"{int(valor)} B"
+        valor /= 1024
+
+
+def exibir_quase_duplicatas(grupos: list, pasta_destino: Optional[str] = None, max_grupos: int = 5):
+    """
+    Exibe os grupos de presets quase iguais encontrados.
+    
+    Args:
+        grupos: Grupos no formato de detectar_quase_duplicatas()
+        pasta_destino: Se informada, os caminhos são mostrados relativos a ela
+        max_grupos: Quantos grupos listar
+    """
+    total_arquivos = sum(len(grupo['arquivos']) for grupo in grupos)
+    
+    print(f"\n  {Cores.BOLD}🧬 QUASE-DUPLICATAS{Cores.RESET} {Cores.DIM}({len(grupos)} grupos, {total_arquivos} arquivos){Cores.RESET}")
+    print(f"  {Cores.DIM}{'─' * 50}{Cores.RESET}")
+    
+    for i, grupo in enumerate(grupos[:max_grupos], 1):
+        similaridade = grupo['similaridade_minima'] * 100
+        print(f"  {i}. {Cores.AMARELO_CLARO}{len(grupo['arquivos'])} arquivos{Cores.RESET} {Cores.DIM}(≥ {similaridade:.0f}% iguais){Cores.RESET}")
+        for arquivo in grupo['arquivos'][:4]:
+            if pasta_destino:
+                arquivo = os.path.relpath(arquivo, pasta_destino)
+            print(f"     {Cores.DIM}{arquivo}{Cores.RESET}")
+        if len(grupo['arquivos']) > 4:
+            print(f"     {Cores.DIM}... e mais {len(grupo['arquivos']) - 4}{Cores.RESET}")
+    
+    if len(grupos) > max_grupos:
+        print(f"  {Cores.DIM}... e mais {len(grupos) - max_grupos} grupos (use --formato json para a lista completa){Cores.RESET}")
+
+
+def exibir_metricas_etapas(metricas: dict):
+    """
+    Exibe o tempo acumulado e a contagem de cada etapa do organizador.
+    
+    Args:
+        metricas: Dicionário de métricas (formato de MetricasExecucao.para_dict)
+    """
+    etapas = metricas.get('etapas', {})
+    tempo_medido = sum(valores['tempo_s'] for valores in etapas.values())
+    
+    print(f"\n  {Cores.BOLD}⏱️  TEMPO POR ETAPA{Cores.RESET}")
+    print(f"  {Cores.DIM}{'─' * 50}{Cores.RESET}")
+    
+    for etapa, valores in etapas.items():
+        if valores['contagem'] == 0:
+            continue
+        pct = (valores['tempo_s'] / tempo_medido * 100) if tempo_medido > 0 else 0
+        print(
+            f"  {etapa:15} {valores['tempo_s']:9.3f}s "
+            f"{Cores.DIM}{valores['contagem']:8} ops ({pct:5.1f}%){Cores.RESET}"
+        )
+    
+    print(
+        f"  {Cores.DIM}Lidos: {formatar_bytes(metricas.get('bytes_lidos', 0))}"
+        f"  │  Escritos: {formatar_bytes(metricas.get('bytes_escritos', 0))}{Cores.RESET}"
+    )
+
+
 def exibir_progresso_tempo_real(mensagem: str, atual: int, total: int):
     """
     Atualiza o progresso em tempo real na mesma linha.
@@ -6,32 +6,129 @@ Contém funções para busca, cópia e organização de arquivos.
 """
 
 import os
+import sys
+import mmap
+import queue
+import errno
 import shutil
+import threading
 import time
+import asyncio
 import hashlib
+import tempfile
+import functools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator, Tuple, Callable, Optional, List, Set, Dict
+from typing import Generator, Tuple, Callable, Optional, List, Set, Dict, Mapping
 
 from src.config import EXTENSOES_SUPORTADAS, CATEGORIA_PADRAO
-from src.categorizador import identificar_categorias, validar_extensao, identificar_categoria_especial
+from src.categorizador import determinar_categorias, validar_extensao
+from src.metricas import MetricasExecucao, obter_metricas
+from src.registro_hashes import RegistroHashes, obter_registro
+from src.memoria_limitada import ControleMemoria, FilaEmDisco, LimiteMemoriaExcedido
+from src.agendador_io import AgendadorIO, obter_agendador
+from src.armazem import ArmazemConteudo
+from src.ordem_fisica import ORDEM_PADRAO, ordenar_arquivos
+from src.catalogo import CatalogoBiblioteca
+from src.similaridade import LIMIAR_SIMILARIDADE, detectar_quase_duplicatas
 
 
-def calcular_hash_arquivo(caminho_arquivo: Path, tamanho_bloco: int = 65536) -> str:
+# Buffer de leitura reutilizado por thread: a maioria dos presets (5-100 KB)
+# cabe inteira nele e é lida com um único readinto, sem criar objetos bytes
+TAMANHO_BUFFER_LEITURA = 256 * 1024
+
+# A partir deste tamanho o hash usa mmap (sem copiar os dados para o Python)
+LIMITE_MMAP = 8 * 1024 * 1024
+
+_dados_thread = threading.local()
+
+
+def _buffer_leitura(tamanho: int = TAMANHO_BUFFER_LEITURA) -> memoryview:
+    """Retorna o buffer de leitura desta thread (alocado uma vez por thread)."""
+    buffer = getattr(_dados_thread, "buffer", None)
+    if buffer is None or len(buffer) < tamanho:
+        buffer = memoryview(bytearray(tamanho))
+        _dados_thread.buffer = buffer
+    return buffer
+
+
+def _aconselhar_leitura_sequencial(fd: int):
+    """Avisa o kernel que o arquivo será lido uma vez, do início ao fim."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for conselho in (os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_NOREUSE):
+        with contextlib.suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, conselho)
+
+
+def calcular_digest_arquivo(
+    caminho_arquivo: Path,
+    tamanho_bloco: int = TAMANHO_BUFFER_LEITURA,
+    agendador: Optional[AgendadorIO] = None
+) -> bytes:
+    """
+    Calcula o digest MD5 (16 bytes) de um arquivo para detectar duplicatas.
+    
+    Arquivos pequenos são lidos com readinto no buffer da thread (normalmente
+    uma única chamada); arquivos a partir de LIMITE_MMAP são mapeados com mmap.
+    
+    Args:
+        caminho_arquivo: Path do arquivo
+        tamanho_bloco: Tamanho mínimo do buffer de leitura
+        agendador: Se informado, a leitura espera uma vaga no dispositivo do arquivo
+        
+    Returns:
+        Digest MD5 do arquivo (bytes brutos, como guardado no RegistroHashes)
+    """
+    if agendador is not None:
+        with agendador.reservar(caminho_arquivo):
+            return calcular_digest_arquivo(caminho_arquivo, tamanho_bloco)
+    
+    hasher = hashlib.md5()
+    with open(caminho_arquivo, 'rb', buffering=0) as f:
+        fd = f.fileno()
+        tamanho = os.fstat(fd).st_size
+        _aconselhar_leitura_sequencial(fd)
+        
+        if tamanho >= LIMITE_MMAP:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapa:
+                if hasattr(mapa, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapa.madvise(mmap.MADV_SEQUENTIAL)
+                hasher.update(mapa)
+            return hasher.digest()
+        
+        buffer = _buffer_leitura(tamanho_bloco)
+        total = 0
+        while True:
+            lidos = f.readinto(buffer)
+            if not lidos:
+                break
+            hasher.update(buffer[:lidos])
+            total += lidos
+            # Leu o tamanho do fstat: evita a chamada extra só para ver o EOF
+            if total >= tamanho:
+                break
+    return hasher.digest()
+
+
+def calcular_hash_arquivo(
+    caminho_arquivo: Path,
+    tamanho_bloco: int = TAMANHO_BUFFER_LEITURA,
+    agendador: Optional[AgendadorIO] = None
+) -> str:
     """
     Calcula o hash MD5 de um arquivo para detectar duplicatas.
     
     Args:
         caminho_arquivo: Path do arquivo
-        tamanho_bloco: Tamanho do bloco para leitura
+        tamanho_bloco: Tamanho mínimo do buffer de leitura
+        agendador: Se informado, a leitura espera uma vaga no dispositivo do arquivo
         
     Returns:
         Hash MD5 do arquivo como string hexadecimal
     """
-    hasher = hashlib.md5()
-    with open(caminho_arquivo, 'rb') as f:
-        for bloco in iter(lambda: f.read(tamanho_bloco), b''):
-            hasher.update(bloco)
-    return hasher.hexdigest()
+    return calcular_digest_arquivo(caminho_arquivo, tamanho_bloco, agendador).hex()
 
 
 def buscar_presets_recursivo(
@@ -98,11 +195,121 @@ def gerar_nome_unico(caminho_destino: Path) -> Path:
             raise RuntimeError(f"Muitas duplicatas para o arquivo: {nome_base}")
 
 
-def copiar_preset_seguro(arquivo_origem: Path, pasta_destino: Path, mover: bool = False, deletar_se_existe: bool = False) -> Tuple[Path, bool, bool]:
+# ============================================================================
+# MOTOR DE CÓPIA
+# ============================================================================
+
+# Pasta de trabalho (dentro do destino) para as cópias temporárias da leitura única
+PASTA_TEMPORARIA = ".serum_parcial"
+
+# Bloco do fallback em Python (mesmo tamanho usado pelo shutil no Linux)
+TAMANHO_BLOCO_COPIA = 1024 * 1024
+
+# Erros que indicam que a chamada do kernel não serve para este par de arquivos
+# (kernel antigo, sistemas de arquivos diferentes, FS sem suporte, sandbox)
+_ERROS_SEM_SUPORTE = {
+    errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP,
+    errno.ENOTSUP, errno.EBADF, errno.EPERM, errno.ETXTBSY,
+}
+
+# Chamadas de cópia dentro do kernel, em ordem de preferência:
+# (nome, função(fd_origem, fd_destino, restante, offset) -> bytes copiados)
+_METODOS_KERNEL = []
+if hasattr(os, "copy_file_range"):
+    # Permite reflink/cópia no servidor (Btrfs, XFS, NFS 4.2, SMB3)
+    _METODOS_KERNEL.append((
+        "copy_file_range",
+        lambda fd_origem, fd_destino, restante, offset: os.copy_file_range(fd_origem, fd_destino, restante),
+    ))
+if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+    _METODOS_KERNEL.append((
+        "sendfile",
+        lambda fd_origem, fd_destino, restante, offset: os.sendfile(fd_destino, fd_origem, offset, restante),
+    ))
+
+
+def _copiar_no_kernel(chamada: Callable, fd_origem: int, fd_destino: int, tamanho: int) -> bool:
+    """
+    Copia `tamanho` bytes com uma chamada do kernel.
+    
+    Returns:
+        True se copiou; False se a chamada não é suportada (nada foi escrito)
+    """
+    copiados = 0
+    while copiados < tamanho:
+        try:
+            enviados = chamada(fd_origem, fd_destino, tamanho - copiados, copiados)
+        except OSError as erro:
+            if copiados == 0 and erro.errno in _ERROS_SEM_SUPORTE:
+                return False
+            raise
+        if enviados == 0:
+            # 0 logo no início: FS que não implementa a chamada (ex: procfs)
+            # 0 depois: a origem encolheu durante a cópia
+            if copiados == 0:
+                return False
+            break
+        copiados += enviados
+    return True
+
+
+def copiar_conteudo(origem: Path, destino: Path, preservar_metadados: bool = True) -> str:
+    """
+    Copia um arquivo usando cópia no kernel sempre que possível.
+    
+    Tenta os.copy_file_range e os.sendfile (Linux) e cai para leitura em
+    blocos em Python quando o sistema não suporta. Os dados nunca passam
+    por buffers Python no caminho rápido.
+    
+    Args:
+        origem: Arquivo de origem
+        destino: Caminho do novo arquivo (sobrescrito se existir)
+        preservar_metadados: Se True, copia datas e permissões como shutil.copy2;
+                             se False, evita as chamadas extras de copystat
+        
+    Returns:
+        Nome do método usado ('copy_file_range', 'sendfile' ou 'python')
+    """
+    try:
+        with open(origem, "rb") as f_origem, open(destino, "wb") as f_destino:
+            fd_origem = f_origem.fileno()
+            fd_destino = f_destino.fileno()
+            tamanho = os.fstat(fd_origem).st_size
+            
+            metodo = "python"
+            for nome, chamada in _METODOS_KERNEL:
+                if _copiar_no_kernel(chamada, fd_origem, fd_destino, tamanho):
+                    metodo = nome
+                    break
+            else:
+                shutil.copyfileobj(f_origem, f_destino, TAMANHO_BLOCO_COPIA)
+    except BaseException:
+        # Não deixa um arquivo pela metade no destino
+        with contextlib.suppress(OSError):
+            os.unlink(destino)
+        raise
+    
+    if preservar_metadados:
+        shutil.copystat(origem, destino)
+    
+    return metodo
+
+
+def copiar_preset_seguro(
+    arquivo_origem: Path,
+    pasta_destino: Path,
+    mover: bool = False,
+    deletar_se_existe: bool = False,
+    metricas: Optional[MetricasExecucao] = None,
+    preservar_metadados: bool = True,
+    hash_origem: Optional[bytes] = None,
+    agendador: Optional[AgendadorIO] = None,
+    conteudo_de: Optional[Path] = None
+) -> Tuple[Path, bool, bool]:
     """
     Copia ou move um preset para a pasta de destino de forma segura.
     
-    - Preserva metadados usando shutil.copy2 ou shutil.move
+    - Copia com copiar_conteudo() (cópia no kernel) ou move com shutil.move
     - Gera nome único se arquivo com mesmo nome já existir
     - Pode deletar origem se já existe no destino (modo re-verificação, comparando hash)
     
@@ -111,26 +318,45 @@ def copiar_preset_seguro(arquivo_origem: Path, pasta_destino: Path, mover: bool
         pasta_destino: Path da pasta de destino
         mover: Se True, move o arquivo em vez de copiar
         deletar_se_existe: Se True e arquivo IDÊNTICO já existe no destino, deleta da origem
+        metricas: Métricas de execução (opcional) para instrumentar mkdir/stat/hash/cópia
+        preservar_metadados: Se False, a cópia não replica datas e permissões
+        hash_origem: Digest já calculado da origem (evita reler a origem em colisões)
+        agendador: Agendador de I/O (opcional); a cópia reserva uma vaga no
+                   dispositivo da origem e no do destino
+        conteudo_de: Arquivo idêntico de onde copiar no lugar da origem (ex: a
+                     primeira colocação da leitura única); o nome continua o da origem
         
     Returns:
         Tuple com (caminho_final, ja_existia, foi_deletado_origem)
     """
+    metricas = obter_metricas(metricas)
+    agendador = obter_agendador(agendador)
+    
     # Cria a pasta de destino se não existir
-    pasta_destino.mkdir(parents=True, exist_ok=True)
+    with metricas.medir("mkdir"):
+        pasta_destino.mkdir(parents=True, exist_ok=True)
     
     # Define caminho de destino
     caminho_destino = pasta_destino / arquivo_origem.name
     
+    with metricas.medir("stat"):
+        existe_no_destino = caminho_destino.exists()
+    
     # Se já existe no destino
-    if caminho_destino.exists():
+    if existe_no_destino:
         # Verifica se são o mesmo arquivo (mesmo caminho absoluto)
         if arquivo_origem.resolve() == caminho_destino.resolve():
             # É o mesmo arquivo - não faz nada
             return caminho_destino, True, False
         
         # Compara hash para verificar se é duplicata real
-        hash_origem = calcular_hash_arquivo(arquivo_origem)
-        hash_destino = calcular_hash_arquivo(caminho_destino)
+        if hash_origem is None:
+            with agendador.reservar(arquivo_origem, metricas=metricas), metricas.medir("hash"):
+                hash_origem = calcular_digest_arquivo(arquivo_origem)
+            metricas.adicionar_bytes(lidos=arquivo_origem.stat().st_size)
+        with agendador.reservar(caminho_destino, metricas=metricas), metricas.medir("hash"):
+            hash_destino = calcular_digest_arquivo(caminho_destino)
+        metricas.adicionar_bytes(lidos=caminho_destino.stat().st_size)
         
         if hash_origem == hash_destino:
             # Conteúdo idêntico - é duplicata real
@@ -142,15 +368,270 @@ def copiar_preset_seguro(arquivo_origem: Path, pasta_destino: Path, mover: bool
             # Nome igual mas conteúdo diferente - gera nome único
             caminho_destino = gerar_nome_unico(caminho_destino)
     
-    # Copia ou move preservando metadados
-    if mover:
-        shutil.move(str(arquivo_origem), str(caminho_destino))
-    else:
-        shutil.copy2(arquivo_origem, caminho_destino)
+    # Copia ou move
+    fonte = conteudo_de if conteudo_de is not None and not mover else arquivo_origem
+    with agendador.reservar(fonte, caminho_destino, metricas=metricas), metricas.medir("copia"):
+        if mover:
+            shutil.move(str(arquivo_origem), str(caminho_destino))
+        else:
+            copiar_conteudo(fonte, caminho_destino, preservar_metadados)
     
     return caminho_destino, False, False
 
 
+def copiar_com_hash(
+    arquivo_origem: Path,
+    pasta_temporaria: Path,
+    metricas: Optional[MetricasExecucao] = None,
+    tamanho_bloco: int = TAMANHO_BUFFER_LEITURA,
+    agendador: Optional[AgendadorIO] = None
+) -> Tuple[int, bytes, Path]:
+    """
+    Lê a origem uma única vez, calculando o hash enquanto grava um arquivo temporário.
+    
+    O temporário fica em uma pasta de trabalho dentro do destino (mesmo sistema
+    de arquivos), para ser renomeado atomicamente por posicionar_temporario()
+    ou descartado com descartar_temporario() se o conteúdo for duplicata.
+    
+    Args:
+        arquivo_origem: Path do preset
+        pasta_temporaria: Pasta onde o temporário será criado (criada se não existir)
+        metricas: Métricas de execução (opcional)
+        tamanho_bloco: Tamanho do bloco para leitura
+        agendador: Agendador de I/O (opcional); reserva a origem e o destino
+        
+    Returns:
+        Tuple com (tamanho, digest_md5, caminho_temporario)
+    """
+    metricas = obter_metricas(metricas)
+    agendador = obter_agendador(agendador)
+    
+    with metricas.medir("mkdir"):
+        pasta_temporaria.mkdir(parents=True, exist_ok=True)
+    
+    reserva = agendador.reservar(arquivo_origem, pasta_temporaria / arquivo_origem.name, metricas=metricas)
+    with reserva, metricas.medir("hash_copia"):
+        fd_temporario, nome_temporario = tempfile.mkstemp(
+            prefix=f"{arquivo_origem.stem}.", suffix=".parcial", dir=pasta_temporaria
+        )
+        caminho_temporario = Path(nome_temporario)
+        hasher = hashlib.md5()
+        tamanho = 0
+        try:
+            with open(arquivo_origem, 'rb', buffering=0) as f_origem, \
+                    os.fdopen(fd_temporario, 'wb', buffering=0) as f_temporario:
+                _aconselhar_leitura_sequencial(f_origem.fileno())
+                buffer = _buffer_leitura(tamanho_bloco)
+                while True:
+                    lidos = f_origem.readinto(buffer)
+                    if not lidos:
+                        break
+                    bloco = buffer[:lidos]
+                    hasher.update(bloco)
+                    while bloco:
+                        # Escrita sem buffer pode ser parcial
+                        bloco = bloco[f_temporario.write(bloco):]
+                    tamanho += lidos
+        except BaseException:
+            descartar_temporario(caminho_temporario)
+            raise
+    
+    metricas.adicionar_bytes(lidos=tamanho, escritos=tamanho)
+    return tamanho, hasher.digest(), caminho_temporario
+
+
+def posicionar_temporario(
+    caminho_temporario: Path,
+    arquivo_origem: Path,
+    pasta_destino: Path,
+    hash_origem: bytes,
+    metricas: Optional[MetricasExecucao] = None,
+    preservar_metadados: bool = True,
+    agendador: Optional[AgendadorIO] = None
+) -> Tuple[Path, bool]:
+    """
+    Renomeia o temporário de copiar_com_hash() para o nome final na pasta de destino.
+    
+    Segue as mesmas regras de copiar_preset_seguro(): se já existe um arquivo
+    idêntico com o mesmo nome, o temporário é descartado; se o nome colide com
+    outro conteúdo, recebe sufixo numérico.
+    
+    Args:
+        caminho_temporario: Arquivo temporário com o conteúdo da origem
+        arquivo_origem: Preset de origem (nome e metadados)
+        pasta_destino: Pasta da categoria
+        hash_origem: Digest calculado durante a cópia
+        metricas: Métricas de execução (opcional)
+        preservar_metadados: Se True, copia datas e permissões da origem
+        agendador: Agendador de I/O (opcional) para reler um destino com o mesmo nome
+        
+    Returns:
+        Tuple com (caminho_final, ja_existia)
+    """
+    metricas = obter_metricas(metricas)
+    agendador = obter_agendador(agendador)
+    
+    with metricas.medir("mkdir"):
+        pasta_destino.mkdir(parents=True, exist_ok=True)
+    
+    caminho_destino = pasta_destino / arquivo_origem.name
+    
+    with metricas.medir("stat"):
+        existe_no_destino = caminho_destino.exists()
+    
+    if existe_no_destino:
+        with agendador.reservar(caminho_destino, metricas=metricas), metricas.medir("hash"):
+            hash_destino = calcular_digest_arquivo(caminho_destino)
+        metricas.adicionar_bytes(lidos=caminho_destino.stat().st_size)
+        
+        if hash_destino == hash_origem:
+            descartar_temporario(caminho_temporario)
+            return caminho_destino, True
+        caminho_destino = gerar_nome_unico(caminho_destino)
+    
+    with metricas.medir("copia"):
+        if preservar_metadados:
+            shutil.copystat(arquivo_origem, caminho_temporario)
+        os.replace(caminho_temporario, caminho_destino)
+    
+    return caminho_destino, False
+
+
+def descartar_temporario(caminho_temporario: Path):
+    """Remove um temporário de copiar_com_hash() (não falha se já não existir)."""
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(caminho_temporario)
+
+
+def guardar_no_armazem(
+    armazem: ArmazemConteudo,
+    arquivo_origem: Path,
+    hash_origem: bytes,
+    mover: bool = False,
+    metricas: Optional[MetricasExecucao] = None,
+    preservar_metadados: bool = True,
+    temporario: Optional[Path] = None,
+    agendador: Optional[AgendadorIO] = None
+) -> Tuple[Path, bool]:
+    """
+    Guarda o conteúdo de um preset no armazém, se ainda não estiver lá.
+    
+    O objeto é escrito com um nome temporário e renomeado no fim, para que
+    um objeto no armazém esteja sempre completo (ele nunca é relido para
+    conferir o hash).
+    
+    Args:
+        armazem: Armazém do destino
+        arquivo_origem: Preset de origem
+        hash_origem: Digest do conteúdo (endereço no armazém)
+        mover: Se True, move a origem para o armazém em vez de copiar
+        metricas: Métricas de execução (opcional)
+        preservar_metadados: Se False, o objeto não recebe as datas e permissões da origem
+        temporario: Cópia temporária de copiar_com_hash(); é renomeada para o objeto
+        agendador: Agendador de I/O (opcional) para a cópia
+        
+    Returns:
+        Tuple com (caminho_do_objeto, novo), onde novo indica que o conteúdo
+        foi guardado agora
+    """
+    metricas = obter_metricas(metricas)
+    objeto = armazem.caminho_objeto(hash_origem)
+    
+    with metricas.medir("stat"):
+        existe = objeto.exists()
+    if existe:
+        return objeto, False
+    
+    with metricas.medir("mkdir"):
+        objeto.parent.mkdir(parents=True, exist_ok=True)
+    
+    if temporario is not None:
+        with metricas.medir("copia"):
+            if preservar_metadados:
+                shutil.copystat(arquivo_origem, temporario)
+            os.replace(temporario, objeto)
+        return objeto, True
+    
+    parcial = objeto.with_name(f"{objeto.name}.parcial")
+    with obter_agendador(agendador).reservar(arquivo_origem, objeto, metricas=metricas), metricas.medir("copia"):
+        if mover:
+            shutil.move(str(arquivo_origem), str(parcial))
+        else:
+            copiar_conteudo(arquivo_origem, parcial, preservar_metadados)
+        os.replace(parcial, objeto)
+    return objeto, True
+
+
+def vincular_preset(
+    armazem: ArmazemConteudo,
+    objeto: Path,
+    arquivo_origem: Path,
+    pasta_destino: Path,
+    hash_origem: bytes,
+    metricas: Optional[MetricasExecucao] = None,
+    preservar_metadados: bool = True,
+    agendador: Optional[AgendadorIO] = None
+) -> Tuple[Path, bool]:
+    """
+    Coloca na pasta da categoria um vínculo para o objeto, com o nome do preset.
+    
+    Segue as regras de nome de copiar_preset_seguro(): um vínculo para o
+    mesmo objeto (ou um arquivo comum idêntico, de antes do armazém) já
+    existente é mantido; outro conteúdo com o mesmo nome gera sufixo
+    numérico. Sem suporte a hardlink, o objeto é copiado no lugar.
+    
+    Args:
+        armazem: Armazém do destino
+        objeto: Caminho do conteúdo no armazém (de guardar_no_armazem)
+        arquivo_origem: Preset de origem (nome)
+        pasta_destino: Pasta da categoria
+        hash_origem: Digest do conteúdo
+        metricas: Métricas de execução (opcional)
+        preservar_metadados: Usado só na cópia de fallback
+        agendador: Agendador de I/O (opcional) para releituras e a cópia de fallback
+        
+    Returns:
+        Tuple com (caminho_final, ja_existia)
+    """
+    metricas = obter_metricas(metricas)
+    agendador = obter_agendador(agendador)
+    
+    with metricas.medir("mkdir"):
+        pasta_destino.mkdir(parents=True, exist_ok=True)
+    
+    caminho_destino = pasta_destino / arquivo_origem.name
+    
+    with metricas.medir("stat"):
+        existe_no_destino = os.path.lexists(caminho_destino)
+        mesmo_objeto = existe_no_destino and armazem.mesmo_objeto(caminho_destino, objeto)
+    
+    if mesmo_objeto:
+        return caminho_destino, True
+    
+    if existe_no_destino:
+        if not caminho_destino.exists():
+            # Symlink quebrado (objeto apagado do armazém): é substituído
+            os.unlink(caminho_destino)
+        else:
+            with agendador.reservar(caminho_destino, metricas=metricas), metricas.medir("hash"):
+                hash_destino = calcular_digest_arquivo(caminho_destino)
+            metricas.adicionar_bytes(lidos=caminho_destino.stat().st_size)
+            if hash_destino == hash_origem:
+                return caminho_destino, True
+            caminho_destino = gerar_nome_unico(caminho_destino)
+    
+    with metricas.medir("vinculo"):
+        vinculado = armazem.vincular(objeto, caminho_destino)
+    
+    if not vinculado:
+        with agendador.reservar(objeto, caminho_destino, metricas=metricas), metricas.medir("copia"):
+            copiar_conteudo(objeto, caminho_destino, preservar_metadados)
+        tamanho = objeto.stat().st_size
+        metricas.adicionar_bytes(lidos=tamanho, escritos=tamanho)
+    
+    return caminho_destino, False
+
+
 def detectar_modo_reverificacao(pasta_origem: str, pasta_destino: str) -> bool:
     """
     Detecta se é um modo de re-verificação (reorganização).
@@ -206,13 +687,478 @@ def contar_presets_com_progresso(
     return arquivos
 
 
+def listar_trabalho(
+    pasta_origem: str,
+    callback_scan: Optional[Callable],
+    ordem: str,
+    metricas: MetricasExecucao,
+    memoria: Optional[ControleMemoria] = None
+):
+    """
+    Scan e ordem de processamento de uma origem.
+    
+    Args:
+        pasta_origem: Pasta de origem
+        callback_scan: Função chamada com (contador) a cada arquivo encontrado
+        ordem: Ordem de processamento (veja organizar_presets)
+        metricas: Métricas da execução (etapas "scan" e "ordenacao")
+        memoria: Modo de memória limitada: os caminhos vão para uma
+                 FilaEmDisco em vez de uma lista (só na ordem do scan)
+        
+    Returns:
+        Lista de Paths, ou a FilaEmDisco (iterável e com len()); quem
+        percorre libera com fechar_trabalho() ao terminar
+    """
+    if memoria is None:
+        with metricas.medir("scan"):
+            arquivos = contar_presets_com_progresso(pasta_origem, callback_scan)
+        return ordenar_arquivos(arquivos, ordem, metricas)
+    
+    if ordem != ORDEM_PADRAO:
+        raise ValueError(f"ordem '{ordem}' precisa da lista inteira em memória; "
+                         f"use '{ORDEM_PADRAO}' com memória limitada")
+    fila = memoria.nova_fila()
+    try:
+        with metricas.medir("scan"):
+            for contador, arquivo in enumerate(buscar_presets_recursivo(pasta_origem), 1):
+                fila.append(arquivo)
+                if callback_scan:
+                    callback_scan(contador)
+    except BaseException:
+        fila.fechar()
+        raise
+    return fila
+
+
+def fechar_trabalho(arquivos):
+    """Libera a lista de listar_trabalho(): fecha e apaga a FilaEmDisco do modo de memória limitada."""
+    if isinstance(arquivos, FilaEmDisco):
+        arquivos.fechar()
+
+
+def _obter_registro_execucao(
+    hashes_existentes: Optional[Mapping[str, str]],
+    memoria: Optional[ControleMemoria]
+):
+    """Registro da execução: o de obter_registro(), ou o em disco do modo de memória limitada."""
+    if memoria is None:
+        return obter_registro(hashes_existentes)
+    if hashes_existentes is not None and hashes_existentes is not memoria.registro:
+        for digest in hashes_existentes:
+            memoria.registro.registrar_se_ausente(digest, hashes_existentes[digest])
+    return memoria.registro
+
+
+def criar_estatisticas(modo_mover: bool, memoria: Optional[ControleMemoria] = None) -> dict:
+    """
+    Cria o dicionário de estatísticas de uma origem (formato comum a todos os motores).
+    
+    Args:
+        modo_mover: Modo usado na organização
+        memoria: Modo de memória limitada: arquivos_processados grava em disco
+                 (memoria.registros) em vez de acumular numa lista
+        
+    Returns:
+        Dicionário de estatísticas zerado
+    """
+    return {
+        "total_arquivos_origem": 0,
+        "total_copias_realizadas": 0,
+        "total_duplicatas_ignoradas": 0,
+        "total_multi_categoria": 0,
+        "por_categoria": {},
+        "erros": [],
+        "arquivos_processados": [] if memoria is None else memoria.registros,
+        "modo_mover": modo_mover  # Registra o modo usado
+    }
+
+
+def _contar_categoria(estatisticas: dict, categoria: str):
+    """Incrementa a contagem de uma categoria nas estatísticas."""
+    if categoria not in estatisticas["por_categoria"]:
+        estatisticas["por_categoria"][categoria] = 0
+    estatisticas["por_categoria"][categoria] += 1
+
+
+def medir_e_calcular_hash(
+    arquivo_preset: Path,
+    metricas: MetricasExecucao,
+    agendador: Optional[AgendadorIO] = None
+) -> Tuple[int, bytes]:
+    """
+    Obtém o tamanho e o hash de um preset, registrando as métricas.
+    
+    Args:
+        arquivo_preset: Path do arquivo
+        metricas: Métricas de execução
+        agendador: Agendador de I/O (opcional); a espera por vaga fica em "espera_io"
+        
+    Returns:
+        Tuple com (tamanho_em_bytes, digest_md5)
+    """
+    with metricas.medir("stat"):
+        tamanho_arquivo = arquivo_preset.stat().st_size
+    
+    with obter_agendador(agendador).reservar(arquivo_preset, metricas=metricas), metricas.medir("hash"):
+        hash_arquivo = calcular_digest_arquivo(arquivo_preset)
+    metricas.adicionar_bytes(lidos=tamanho_arquivo)
+    
+    return tamanho_arquivo, hash_arquivo
+
+
+def distribuir_nas_categorias(
+    arquivo_preset: Path,
+    categorias: List[str],
+    pasta_destino_path: Path,
+    modo_mover: bool,
+    tamanho_arquivo: int,
+    metricas: MetricasExecucao,
+    preservar_metadados: bool = True,
+    hash_arquivo: Optional[bytes] = None,
+    temporario: Optional[Path] = None,
+    agendador: Optional[AgendadorIO] = None,
+    armazem: Optional[ArmazemConteudo] = None
+) -> Tuple[Optional[str], List[Tuple[str, Path, bool, bool]]]:
+    """
+    Copia (ou move) um preset para a pasta de cada categoria.
+    
+    Faz apenas operações de arquivo, sem tocar nas estatísticas, para que
+    possa rodar em threads de trabalho; use registrar_colocacoes() depois.
+    
+    Args:
+        arquivo_preset: Path do preset
+        categorias: Categorias de destino
+        pasta_destino_path: Raiz da estrutura organizada
+        modo_mover: Se True, move na primeira categoria e copia nas demais
+        tamanho_arquivo: Tamanho do preset (para contabilizar bytes)
+        metricas: Métricas de execução
+        preservar_metadados: Se False, as cópias não replicam datas e permissões
+        hash_arquivo: Digest já calculado do preset (evita reler a origem em colisões)
+        temporario: Cópia temporária de copiar_com_hash(); é renomeada para a
+                    primeira categoria e as demais copiam dela, sem reler a origem
+        agendador: Agendador de I/O (opcional) repassado às cópias
+        armazem: Se informado, o conteúdo é guardado uma vez no armazém e
+                 cada categoria recebe um vínculo (veja src/armazem.py)
+        
+    Returns:
+        Tuple com (primeiro_destino, colocacoes), onde cada colocação é
+        (categoria, caminho_final, ja_existia, foi_deletado)
+    """
+    if armazem is not None:
+        return _vincular_nas_categorias(
+            armazem, arquivo_preset, categorias, pasta_destino_path, modo_mover, tamanho_arquivo,
+            metricas, preservar_metadados, hash_arquivo, temporario, agendador
+        )
+    
+    primeiro_destino = None
+    colocacoes = []
+    
+    for indice, categoria in enumerate(categorias):
+        if temporario is not None and indice == 0:
+            # Leitura única: o conteúdo já está no destino, só falta o nome final
+            caminho_final, ja_existia = posicionar_temporario(
+                temporario,
+                arquivo_preset,
+                pasta_destino_path / categoria,
+                hash_arquivo,
+                metricas=metricas,
+                preservar_metadados=preservar_metadados,
+                agendador=agendador
+            )
+            if not ja_existia:
+                primeiro_destino = str(caminho_final)
+            colocacoes.append((categoria, caminho_final, ja_existia, False))
+            continue
+        
+        # Só move na primeira categoria; deleta se já existe (re-verificação)
+        mover_agora = modo_mover and primeiro_destino is None
+        caminho_final, ja_existia, foi_deletado = copiar_preset_seguro(
+            arquivo_preset,
+            pasta_destino_path / categoria,
+            mover=mover_agora,
+            deletar_se_existe=mover_agora,
+            metricas=metricas,
+            preservar_metadados=preservar_metadados,
+            hash_origem=hash_arquivo,
+            agendador=agendador,
+            # Leitura única: a primeira colocação (nova ou idêntica já existente) tem o conteúdo
+            conteudo_de=colocacoes[0][1] if temporario is not None else None
+        )
+        
+        if not ja_existia:
+            if not mover_agora:
+                # Cópia: lê a origem e escreve o destino (mover é rename)
+                metricas.adicionar_bytes(lidos=tamanho_arquivo, escritos=tamanho_arquivo)
+            
+            if primeiro_destino is None:
+                primeiro_destino = str(caminho_final)
+        
+        colocacoes.append((categoria, caminho_final, ja_existia, foi_deletado))
+    
+    return primeiro_destino, colocacoes
+
+
+def _vincular_nas_categorias(
+    armazem: ArmazemConteudo,
+    arquivo_preset: Path,
+    categorias: List[str],
+    pasta_destino_path: Path,
+    modo_mover: bool,
+    tamanho_arquivo: int,
+    metricas: MetricasExecucao,
+    preservar_metadados: bool,
+    hash_arquivo: bytes,
+    temporario: Optional[Path],
+    agendador: Optional[AgendadorIO]
+) -> Tuple[Optional[str], List[Tuple[str, Path, bool, bool]]]:
+    """distribuir_nas_categorias() com armazém: guarda o conteúdo uma vez e vincula em cada categoria."""
+    objeto, novo = guardar_no_armazem(
+        armazem, arquivo_preset, hash_arquivo, mover=modo_mover, metricas=metricas,
+        preservar_metadados=preservar_metadados, temporario=temporario, agendador=agendador
+    )
+    if novo and not modo_mover and temporario is None:
+        metricas.adicionar_bytes(lidos=tamanho_arquivo, escritos=tamanho_arquivo)
+    
+    # Movendo um conteúdo que já estava guardado: a origem sobra (antes de
+    # vincular, porque a origem pode ocupar o nome de uma das colocações)
+    foi_deletado = False
+    if modo_mover and not novo and arquivo_preset.exists():
+        arquivo_preset.unlink()
+        foi_deletado = True
+    
+    primeiro_destino = None
+    colocacoes = []
+    for categoria in categorias:
+        caminho_final, ja_existia = vincular_preset(
+            armazem, objeto, arquivo_preset, pasta_destino_path / categoria, hash_arquivo,
+            metricas=metricas, preservar_metadados=preservar_metadados, agendador=agendador
+        )
+        # Mesmo com todos os vínculos já existentes o conteúdo está no destino:
+        # registra o digest para as duplicatas desta execução serem ignoradas
+        if primeiro_destino is None:
+            primeiro_destino = str(caminho_final)
+        colocacoes.append((categoria, caminho_final, ja_existia, foi_deletado and not colocacoes))
+    
+    return primeiro_destino, colocacoes
+
+
+def registrar_colocacoes(estatisticas: dict, colocacoes: List[Tuple[str, Path, bool, bool]]):
+    """
+    Atualiza as estatísticas com o resultado de distribuir_nas_categorias().
+    
+    Args:
+        estatisticas: Estatísticas da origem
+        colocacoes: Lista de (categoria, caminho_final, ja_existia, foi_deletado)
+    """
+    for categoria, _, ja_existia, foi_deletado in colocacoes:
+        if foi_deletado:
+            estatisticas["total_deletados_origem"] = estatisticas.get("total_deletados_origem", 0) + 1
+        
+        if not ja_existia:
+            estatisticas["total_copias_realizadas"] += 1
+        
+        # Atualiza contagem por categoria
+        _contar_categoria(estatisticas, categoria)
+
+
+def _catalogar(
+    catalogo: Optional[CatalogoBiblioteca],
+    metricas: MetricasExecucao,
+    arquivo_preset: Path,
+    hash_arquivo: bytes,
+    tamanho_arquivo: int,
+    colocacoes=(),
+    duplicata: bool = False
+):
+    """Registra o preset no catálogo, se houver um ativo."""
+    if catalogo is None:
+        return
+    with metricas.medir("catalogo"):
+        catalogo.registrar_arquivo(arquivo_preset, hash_arquivo, tamanho_arquivo, colocacoes, duplicata)
+
+
+def posicionar_preset(
+    arquivo_preset: Path,
+    tamanho_arquivo: int,
+    hash_arquivo: bytes,
+    temporario: Optional[Path],
+    estatisticas: dict,
+    hashes_copiados: RegistroHashes,
+    pasta_destino_path: Path,
+    modo_mover: bool,
+    metricas: MetricasExecucao,
+    preservar_metadados: bool = True,
+    catalogo: Optional[CatalogoBiblioteca] = None,
+    agendador: Optional[AgendadorIO] = None,
+    armazem: Optional[ArmazemConteudo] = None,
+    classificador: Optional[Callable[[str], List[str]]] = None,
+    categorias: Optional[List[str]] = None,
+    trava: Optional[threading.Lock] = None
+) -> Tuple[List[str], dict]:
+    """
+    Decide o destino de um preset já hasheado e o coloca lá.
+    
+    Duplicata (digest já registrado) é ignorada; sem categoria em
+    re-verificação permanece em Uncategorized; o resto é distribuído nas
+    categorias e o digest é registrado com o primeiro destino. Atualiza as
+    estatísticas, o registro e o catálogo: roda em um único lugar por vez
+    (o laço de organizar_presets ou o coordenador das origens paralelas) ou,
+    no motor assíncrono, em várias threads com `trava` e sob as travas do
+    digest e das pastas de categoria.
+    
+    Args:
+        arquivo_preset: Path do preset
+        tamanho_arquivo: Tamanho do preset
+        hash_arquivo: Digest do conteúdo
+        temporario: Cópia temporária de copiar_com_hash() (leitura única), se houver
+        estatisticas: Estatísticas da origem
+        hashes_copiados: Registro digest -> primeiro destino
+        pasta_destino_path: Raiz da estrutura organizada
+        modo_mover: Se True, move em vez de copiar
+        metricas: Métricas de execução
+        preservar_metadados: Se False, as cópias não replicam datas e permissões
+        catalogo: Catálogo com execução ativa (opcional)
+        agendador: Agendador de I/O (opcional) repassado às cópias
+        armazem: Armazém de conteúdo do destino (opcional; veja distribuir_nas_categorias)
+        classificador: Função nome -> categorias no lugar de determinar_categorias
+                       (ex: RegrasRecarregaveis.determinar_categorias)
+        categorias: Categorias já determinadas pelo chamador (o classificador não é chamado)
+        trava: Trava das estatísticas quando chamada de várias threads; a
+               distribuição nas categorias roda fora dela
+        
+    Returns:
+        Tuple com (categorias, info) para o callback_arquivo, onde info["tipo"]
+        é "duplicata_ignorada" ou "processado"
+    """
+    contabilidade = trava if trava is not None else contextlib.nullcontext()
+    
+    # Verifica se já copiamos um arquivo com este conteúdo
+    if hash_arquivo in hashes_copiados:
+        with contabilidade:
+            estatisticas["total_duplicatas_ignoradas"] += 1
+        _catalogar(catalogo, metricas, arquivo_preset, hash_arquivo, tamanho_arquivo, duplicata=True)
+        return [], {"tipo": "duplicata_ignorada", "original": hashes_copiados[hash_arquivo]}
+    
+    if categorias is None:
+        with metricas.medir("classificacao"):
+            categorias = (classificador or determinar_categorias)(arquivo_preset.name)
+    
+    # Se múltiplas categorias, registra
+    if len(categorias) > 1:
+        with contabilidade:
+            estatisticas["total_multi_categoria"] += 1
+    
+    # CORREÇÃO: Se a única categoria é Uncategorized e estamos em modo mover
+    # da pasta Uncategorized, não faz nada (arquivo já está no lugar certo)
+    if modo_mover and categorias == [CATEGORIA_PADRAO]:
+        with contabilidade:
+            _contar_categoria(estatisticas, CATEGORIA_PADRAO)
+        _catalogar(catalogo, metricas, arquivo_preset, hash_arquivo, tamanho_arquivo,
+                   [(CATEGORIA_PADRAO, arquivo_preset, True, False)])
+        return categorias, {"tipo": "processado", "multi": False, "movido": False}
+    
+    # Copia/Move para cada categoria encontrada
+    primeiro_destino, colocacoes = distribuir_nas_categorias(
+        arquivo_preset, categorias, pasta_destino_path, modo_mover, tamanho_arquivo, metricas,
+        preservar_metadados, hash_arquivo, temporario, agendador, armazem
+    )
+    with contabilidade:
+        registrar_colocacoes(estatisticas, colocacoes)
+    _catalogar(catalogo, metricas, arquivo_preset, hash_arquivo, tamanho_arquivo, colocacoes)
+    if modo_mover and catalogo is not None and not os.path.lexists(arquivo_preset):
+        # Movido (ou apagado por já existir): na re-verificação a origem é uma
+        # colocação antiga (Uncategorized/...) que não existe mais
+        catalogo.esquecer_destino(str(arquivo_preset))
+    
+    # Registra o hash com o primeiro destino
+    if primeiro_destino:
+        hashes_copiados[hash_arquivo] = primeiro_destino
+    
+    # Registra detalhes do arquivo
+    with contabilidade:
+        estatisticas["arquivos_processados"].append({
+            "origem": str(arquivo_preset),
+            "categorias": categorias,
+            "multi": len(categorias) > 1
+        })
+    return categorias, {"tipo": "processado", "multi": len(categorias) > 1, "movido": modo_mover}
+
+
+def anexar_quase_duplicatas(
+    estatisticas: dict,
+    metricas: Optional[MetricasExecucao] = None,
+    limiar: float = LIMIAR_SIMILARIDADE
+) -> List[dict]:
+    """
+    Procura quase-duplicatas entre os conteúdos organizados e anexa o resultado.
+    
+    Compara um arquivo por conteúdo (o destino registrado em estatisticas["_hashes"]),
+    já que as cópias idênticas foram descartadas pelo MD5.
+    
+    Args:
+        estatisticas: Estatísticas retornadas por um dos organizadores
+        metricas: Métricas da execução (etapa "similaridade")
+        limiar: Similaridade estimada mínima (0 a 1)
+        
+    Returns:
+        Grupos encontrados (também em estatisticas["quase_duplicatas"])
+    """
+    registro = estatisticas.get("_hashes") or {}
+    destinos = [registro[digest] for digest in registro]
+    grupos = detectar_quase_duplicatas(destinos, limiar, metricas)
+    
+    estatisticas["quase_duplicatas"] = grupos
+    if metricas is not None:
+        estatisticas["metricas"] = metricas.para_dict()
+    return grupos
+
+
+def _consolidar_origem(estatisticas_total: dict, metricas_total: MetricasExecucao, pasta_origem: str, stats: dict):
+    """Soma as estatísticas e métricas de uma origem ao total de organizar_presets_multiplas_origens()."""
+    estatisticas_total["total_arquivos_origem"] += stats["total_arquivos_origem"]
+    estatisticas_total["total_copias_realizadas"] += stats["total_copias_realizadas"]
+    estatisticas_total["total_duplicatas_ignoradas"] += stats["total_duplicatas_ignoradas"]
+    estatisticas_total["total_multi_categoria"] += stats["total_multi_categoria"]
+    estatisticas_total["erros"].extend(stats["erros"])
+    if stats["arquivos_processados"] is not estatisticas_total["arquivos_processados"]:
+        estatisticas_total["arquivos_processados"].extend(stats["arquivos_processados"])
+    estatisticas_total["pastas_processadas"].append(pasta_origem)
+    estatisticas_total["modo_mover"] = estatisticas_total["modo_mover"] or stats["modo_mover"]
+    if stats.get("total_deletados_origem"):
+        estatisticas_total["total_deletados_origem"] = (
+            estatisticas_total.get("total_deletados_origem", 0) + stats["total_deletados_origem"]
+        )
+    estatisticas_total["estatisticas_por_pasta"][pasta_origem] = stats
+    
+    metricas_total.mesclar(stats["metricas"])
+    
+    # Consolida contagem por categoria
+    for cat, qtd in stats["por_categoria"].items():
+        if cat not in estatisticas_total["por_categoria"]:
+            estatisticas_total["por_categoria"][cat] = 0
+        estatisticas_total["por_categoria"][cat] += qtd
+
+
 def organizar_presets_multiplas_origens(
     pastas_origem: List[str],
     pasta_destino: str,
     callback_progresso: Optional[Callable] = None,
     callback_arquivo: Optional[Callable] = None,
     callback_scan: Optional[Callable] = None,
-    callback_pasta: Optional[Callable] = None
+    callback_pasta: Optional[Callable] = None,
+    modo_mover: bool = None,
+    metricas: Optional[MetricasExecucao] = None,
+    concorrencia: Optional[int] = None,
+    preservar_metadados: bool = True,
+    leitura_unica: bool = False,
+    catalogo: Optional[CatalogoBiblioteca] = None,
+    origens_paralelas: bool = False,
+    agendador: Optional[AgendadorIO] = None,
+    ordem: str = ORDEM_PADRAO,
+    armazem: Optional[ArmazemConteudo] = None,
+    hashes_existentes: Optional[Mapping[str, str]] = None,
+    classificador: Optional[Callable[[str], List[str]]] = None,
+    memoria: Optional[ControleMemoria] = None
 ) -> dict:
     """
     Organiza presets de MÚLTIPLAS pastas de origem para um único destino.
@@ -224,10 +1170,33 @@ def organizar_presets_multiplas_origens(
         callback_arquivo: Função chamada com (arquivo, categorias, info)
         callback_scan: Função chamada durante o scan com (contador)
         callback_pasta: Função chamada ao iniciar cada pasta (pasta, indice, total)
+        modo_mover: Se True, move arquivos. Se None, detecta automaticamente por pasta.
+        metricas: Métricas de execução (opcional); acumula as etapas de todas as origens
+        concorrencia: Se informado, usa o motor assíncrono (organizar_presets_async)
+                      com este número de operações simultâneas por origem
+        preservar_metadados: Se False, as cópias não replicam datas e permissões
+        leitura_unica: Se True, calcula o hash durante a cópia (veja organizar_presets)
+        catalogo: Catálogo com execução ativa onde cada preset é registrado (opcional)
+        origens_paralelas: Se True, escaneia e calcula os hashes de todas as origens
+                           ao mesmo tempo (veja organizar_origens_em_paralelo); útil
+                           quando as origens estão em discos diferentes
+        agendador: Agendador de I/O com os limites por dispositivo (opcional;
+                   os modos concorrentes criam um com os limites detectados)
+        ordem: Ordem de processamento de cada origem depois do scan (veja organizar_presets)
+        armazem: Armazém de conteúdo do destino (veja organizar_presets)
+        hashes_existentes: Conteúdos já conhecidos antes da primeira origem
+                           (ex: o destino, via indexar_destino); um
+                           RegistroHashes é usado e atualizado por referência
+        classificador: Função nome -> categorias (veja organizar_presets)
+        memoria: Modo de memória limitada (veja organizar_presets); o registro
+                 em disco é compartilhado por todas as origens
         
     Returns:
         Dicionário com estatísticas consolidadas de todas as origens
     """
+    if origens_paralelas and concorrencia:
+        raise ValueError("origens_paralelas e concorrencia não podem ser usados juntos")
+    
     # Estatísticas consolidadas
     estatisticas_total = {
         "total_arquivos_origem": 0,
@@ -242,41 +1211,67 @@ def organizar_presets_multiplas_origens(
         "estatisticas_por_pasta": {}
     }
     
-    # Hashes globais para detectar duplicatas entre pastas
-    hashes_globais: Dict[str, str] = {}
+    # Registro único para detectar duplicatas entre pastas (passado por referência)
+    hashes_globais = _obter_registro_execucao(hashes_existentes, memoria)
+    if memoria is not None:
+        estatisticas_total["arquivos_processados"] = memoria.registros
     
-    for idx, pasta_origem in enumerate(pastas_origem, 1):
-        if callback_pasta:
-            callback_pasta(pasta_origem, idx, len(pastas_origem))
-        
-        # Organiza esta pasta
-        stats = organizar_presets(
-            pasta_origem,
+    # Métricas consolidadas (cada origem mede as suas e elas são somadas aqui)
+    metricas_total = metricas if metricas is not None else MetricasExecucao()
+    
+    if origens_paralelas and len(pastas_origem) > 1:
+        resultados = organizar_origens_em_paralelo(
+            pastas_origem,
             pasta_destino,
+            hashes_globais,
             callback_progresso=callback_progresso,
             callback_arquivo=callback_arquivo,
             callback_scan=callback_scan,
-            hashes_existentes=hashes_globais  # Passa hashes acumulados
+            callback_pasta=callback_pasta,
+            modo_mover=modo_mover,
+            preservar_metadados=preservar_metadados,
+            leitura_unica=leitura_unica,
+            catalogo=catalogo,
+            agendador=agendador,
+            ordem=ordem,
+            armazem=armazem,
+            classificador=classificador,
+            memoria=memoria
         )
-        
-        # Consolida estatísticas
-        estatisticas_total["total_arquivos_origem"] += stats["total_arquivos_origem"]
-        estatisticas_total["total_copias_realizadas"] += stats["total_copias_realizadas"]
-        estatisticas_total["total_duplicatas_ignoradas"] += stats["total_duplicatas_ignoradas"]
-        estatisticas_total["total_multi_categoria"] += stats["total_multi_categoria"]
-        estatisticas_total["erros"].extend(stats["erros"])
-        estatisticas_total["arquivos_processados"].extend(stats["arquivos_processados"])
-        estatisticas_total["pastas_processadas"].append(pasta_origem)
-        estatisticas_total["estatisticas_por_pasta"][pasta_origem] = stats
-        
-        # Consolida contagem por categoria
-        for cat, qtd in stats["por_categoria"].items():
-            if cat not in estatisticas_total["por_categoria"]:
-                estatisticas_total["por_categoria"][cat] = 0
-            estatisticas_total["por_categoria"][cat] += qtd
-        
-        # Atualiza hashes globais
-        hashes_globais.update(stats.get("_hashes", {}))
+        for pasta_origem, stats in zip(pastas_origem, resultados):
+            _consolidar_origem(estatisticas_total, metricas_total, pasta_origem, stats)
+    else:
+        for idx, pasta_origem in enumerate(pastas_origem, 1):
+            if callback_pasta:
+                callback_pasta(pasta_origem, idx, len(pastas_origem))
+            
+            # Organiza esta pasta
+            parametros = dict(
+                callback_progresso=callback_progresso,
+                callback_arquivo=callback_arquivo,
+                callback_scan=callback_scan,
+                modo_mover=modo_mover,
+                hashes_existentes=hashes_globais,  # Mesmo registro para todas as origens
+                preservar_metadados=preservar_metadados,
+                leitura_unica=leitura_unica,
+                catalogo=catalogo,
+                agendador=agendador,
+                ordem=ordem,
+                armazem=armazem,
+                classificador=classificador,
+                memoria=memoria
+            )
+            if concorrencia:
+                stats = asyncio.run(organizar_presets_async(
+                    pasta_origem, pasta_destino, concorrencia=concorrencia, **parametros
+                ))
+            else:
+                stats = organizar_presets(pasta_origem, pasta_destino, **parametros)
+            
+            _consolidar_origem(estatisticas_total, metricas_total, pasta_origem, stats)
+    
+    estatisticas_total["metricas"] = metricas_total.para_dict()
+    estatisticas_total["_hashes"] = hashes_globais
     
     return estatisticas_total
 
@@ -288,7 +1283,16 @@ def organizar_presets(
     callback_arquivo: Optional[Callable] = None,
     callback_scan: Optional[Callable] = None,
     modo_mover: bool = None,
-    hashes_existentes: Optional[Dict[str, str]] = None
+    hashes_existentes: Optional[Mapping[str, str]] = None,
+    metricas: Optional[MetricasExecucao] = None,
+    preservar_metadados: bool = True,
+    leitura_unica: bool = False,
+    catalogo: Optional[CatalogoBiblioteca] = None,
+    agendador: Optional[AgendadorIO] = None,
+    ordem: str = ORDEM_PADRAO,
+    armazem: Optional[ArmazemConteudo] = None,
+    classificador: Optional[Callable[[str], List[str]]] = None,
+    memoria: Optional[ControleMemoria] = None
 ) -> dict:
     """
     Função principal que organiza todos os presets da origem para o destino.
@@ -307,7 +1311,30 @@ def organizar_presets(
         callback_arquivo: Função chamada com (arquivo, categorias, info)
         callback_scan: Função chamada durante o scan com (contador)
         modo_mover: Se True, move arquivos. Se None, detecta automaticamente.
-        hashes_existentes: Dicionário de hashes já processados (para múltiplas origens)
+        hashes_existentes: Hashes já processados (para múltiplas origens). Um
+                           RegistroHashes é usado e atualizado por referência;
+                           um dict é copiado
+        metricas: Métricas de execução; se None, uma nova instância é criada.
+                  O resultado vai em estatisticas["metricas"].
+        preservar_metadados: Se False, as cópias não replicam datas e permissões
+        leitura_unica: Se True (e copiando), lê cada origem uma única vez: o hash é
+                       calculado durante a cópia para um temporário, que é renomeado
+                       no lugar ou descartado se for duplicata
+        catalogo: Catálogo (CatalogoBiblioteca) com execução ativa; cada preset
+                  processado é registrado nele (digest, origem, destinos)
+        agendador: Agendador de I/O (opcional) que limita as operações por dispositivo
+        ordem: Ordem de processamento depois do scan: "scan", "inode" ou "extent"
+               (posição no disco; menos seeks em HD, veja src/ordem_fisica.py)
+        armazem: Se informado (ArmazemConteudo do destino), cada conteúdo é
+                 guardado uma vez em <destino>/.store e as categorias recebem
+                 hardlinks/symlinks em vez de cópias
+        classificador: Função nome -> categorias no lugar de determinar_categorias
+                       (ex: RegrasRecarregaveis.determinar_categorias, de um
+                       arquivo de regras; veja src/regras.py)
+        memoria: ControleMemoria (veja src/memoria_limitada.py): a lista de
+                 trabalho, o registro de hashes e arquivos_processados ficam
+                 em disco, e o RSS é verificado contra o teto durante a
+                 execução (LimiteMemoriaExcedido interrompe). Exige ordem "scan"
         
     Returns:
         Dicionário com estatísticas da operação
@@ -317,157 +1344,521 @@ def organizar_presets(
         modo_mover = detectar_modo_reverificacao(pasta_origem, pasta_destino)
     
     # Inicializa estatísticas
-    estatisticas = {
-        "total_arquivos_origem": 0,
-        "total_copias_realizadas": 0,
-        "total_duplicatas_ignoradas": 0,
-        "total_multi_categoria": 0,
-        "por_categoria": {},
-        "erros": [],
-        "arquivos_processados": [],
-        "modo_mover": modo_mover  # Registra o modo usado
-    }
+    estatisticas = criar_estatisticas(modo_mover, memoria)
     
     pasta_destino_path = Path(pasta_destino)
     
+    # Mover é um rename: não há cópia para aproveitar a leitura
+    leitura_unica = leitura_unica and not modo_mover
+    pasta_temporaria = pasta_destino_path / PASTA_TEMPORARIA
+    
     # Registro de hashes para detectar duplicatas de conteúdo
-    # Usa hashes existentes se fornecido (para múltiplas origens)
-    hashes_copiados: Dict[str, str] = dict(hashes_existentes) if hashes_existentes else {}
+    # Compartilhado por referência entre origens (sem cópia por origem)
+    hashes_copiados = _obter_registro_execucao(hashes_existentes, memoria)
+    
+    # Métricas desta origem (tempo por etapa e volume de I/O)
+    if metricas is None:
+        metricas = MetricasExecucao()
     
     # Fase 1: Escaneia todos os arquivos
-    arquivos = contar_presets_com_progresso(pasta_origem, callback_scan)
+    arquivos = listar_trabalho(pasta_origem, callback_scan, ordem, metricas, memoria)
     total_arquivos = len(arquivos)
     estatisticas["total_arquivos_origem"] = total_arquivos
     
     # Fase 2: Processa cada arquivo
-    for contador, arquivo_preset in enumerate(arquivos, 1):
-        try:
-            # Calcula hash do arquivo para detectar duplicatas
-            hash_arquivo = calcular_hash_arquivo(arquivo_preset)
+    try:
+        for contador, arquivo_preset in enumerate(arquivos, 1):
+            # Fora do try: teto de memória excedido interrompe a execução, não é erro do arquivo
+            if memoria is not None:
+                memoria.verificar()
+            temporario = None
+            try:
+                if leitura_unica:
+                    tamanho_arquivo, hash_arquivo, temporario = copiar_com_hash(
+                        arquivo_preset, pasta_temporaria, metricas, agendador=agendador
+                    )
+                else:
+                    tamanho_arquivo, hash_arquivo = medir_e_calcular_hash(arquivo_preset, metricas, agendador)
+            
+                categorias, info = posicionar_preset(
+                    arquivo_preset, tamanho_arquivo, hash_arquivo, temporario,
+                    estatisticas, hashes_copiados, pasta_destino_path, modo_mover,
+                    metricas, preservar_metadados, catalogo, agendador, armazem,
+                    classificador
+                )
             
-            # Verifica se já copiamos um arquivo com este conteúdo
-            if hash_arquivo in hashes_copiados:
-                estatisticas["total_duplicatas_ignoradas"] += 1
+                # Callback para atualizar interface
+                info["contador"] = contador
+                info["total"] = total_arquivos
+                with metricas.medir("callback"):
+                    if callback_arquivo:
+                        callback_arquivo(arquivo_preset.name, categorias, info)
                 
-                if callback_arquivo:
-                    callback_arquivo(
-                        arquivo_preset.name,
-                        [],  # Nenhuma categoria (duplicata)
-                        {
-                            "tipo": "duplicata_ignorada",
-                            "original": hashes_copiados[hash_arquivo],
-                            "contador": contador,
-                            "total": total_arquivos
-                        }
-                    )
-                continue
+                    if callback_progresso and info["tipo"] == "processado":
+                        callback_progresso(contador, total_arquivos)
             
-            # Primeiro, verifica categorias especiais (hash, português)
-            categoria_especial = identificar_categoria_especial(arquivo_preset.name)
+            except Exception as erro:
+                estatisticas["erros"].append({
+                    "arquivo": str(arquivo_preset),
+                    "erro": str(erro)
+                })
+        
+            finally:
+                # Duplicata ou erro: o temporário não foi renomeado
+                if temporario is not None:
+                    descartar_temporario(temporario)
+    finally:
+        fechar_trabalho(arquivos)
+    
+    if leitura_unica:
+        with contextlib.suppress(OSError):
+            pasta_temporaria.rmdir()
+    
+    # Retorna hashes para uso em múltiplas origens
+    estatisticas["_hashes"] = hashes_copiados
+    estatisticas["metricas"] = metricas.para_dict()
+    
+    return estatisticas
+
+
+# ============================================================================
+# ORIGENS EM PARALELO (uma thread de leitura por origem + coordenador)
+# ============================================================================
+
+# Arquivos hasheados que os trabalhadores podem adiantar ao coordenador
+# (limita a memória e, com leitura única, os temporários pendentes)
+TAMANHO_FILA_COORDENADOR = 256
+
+
+def _ler_origem(
+    indice: int,
+    pasta_origem: str,
+    fila: "queue.Queue",
+    parar: threading.Event,
+    metricas: MetricasExecucao,
+    callback_scan: Optional[Callable],
+    leitura_unica: bool,
+    pasta_temporaria: Path,
+    agendador: AgendadorIO,
+    ordem: str,
+    memoria: Optional[ControleMemoria] = None
+):
+    """
+    Trabalhador de uma origem: escaneia e calcula o hash de cada preset.
+    
+    Só lê a origem (e, com leitura única, escreve o temporário); cada arquivo
+    vai para a fila como (tipo, indice, arquivo, dados) e as decisões ficam
+    com o coordenador. Sempre termina com uma mensagem "fim".
+    """
+    try:
+        arquivos = listar_trabalho(pasta_origem, callback_scan, ordem, metricas, memoria)
+        try:
+            fila.put(("inicio", indice, None, len(arquivos)))
             
-            # Identifica TODAS as categorias aplicáveis (keywords)
-            categorias = identificar_categorias(arquivo_preset.name)
+            for arquivo_preset in arquivos:
+                if parar.is_set():
+                    break
+                try:
+                    if leitura_unica:
+                        dados = copiar_com_hash(arquivo_preset, pasta_temporaria, metricas, agendador=agendador)
+                    else:
+                        dados = medir_e_calcular_hash(arquivo_preset, metricas, agendador) + (None,)
+                except Exception as erro:
+                    fila.put(("erro", indice, arquivo_preset, str(erro)))
+                    continue
+                fila.put(("arquivo", indice, arquivo_preset, dados))
+        finally:
+            fechar_trabalho(arquivos)
+    
+    except Exception as erro:
+        fila.put(("erro", indice, Path(pasta_origem), str(erro)))
+    
+    finally:
+        fila.put(("fim", indice, None, None))
+
+
+def organizar_origens_em_paralelo(
+    pastas_origem: List[str],
+    pasta_destino: str,
+    hashes_copiados: RegistroHashes,
+    callback_progresso: Optional[Callable] = None,
+    callback_arquivo: Optional[Callable] = None,
+    callback_scan: Optional[Callable] = None,
+    callback_pasta: Optional[Callable] = None,
+    modo_mover: bool = None,
+    preservar_metadados: bool = True,
+    leitura_unica: bool = False,
+    catalogo: Optional[CatalogoBiblioteca] = None,
+    agendador: Optional[AgendadorIO] = None,
+    ordem: str = ORDEM_PADRAO,
+    armazem: Optional[ArmazemConteudo] = None,
+    classificador: Optional[Callable[[str], List[str]]] = None,
+    memoria: Optional[ControleMemoria] = None
+) -> List[dict]:
+    """
+    Organiza várias origens ao mesmo tempo, cada uma lida por sua própria thread.
+    
+    Os trabalhadores só escaneiam e calculam os hashes (a parte que depende
+    do disco de origem), então origens em discos diferentes são lidas em
+    paralelo; origens no mesmo disco dividem as vagas dele no agendador. Esta thread é o coordenador: é a única que consulta e atualiza
+    o registro de hashes, as estatísticas e o catálogo, e faz as colocações
+    uma de cada vez (posicionar_preset), na ordem em que os arquivos chegam.
+    A garantia de copiar cada conteúdo uma única vez continua valendo entre
+    as origens; só a escolha de qual origem "ganha" uma duplicata depende
+    de quem terminou o hash primeiro.
+    
+    Os callbacks rodam na thread do coordenador (callback_scan roda na
+    thread de cada origem). callback_pasta é chamado quando o scan de uma
+    origem termina; callback_progresso recebe o total de todas as origens
+    já escaneadas.
+    
+    Args:
+        pastas_origem: Pastas de origem
+        pasta_destino: Pasta onde será criada a estrutura organizada
+        hashes_copiados: Registro compartilhado (atualizado por referência)
+        callback_progresso: Função chamada com (atual, total) para atualizar progresso
+        callback_arquivo: Função chamada com (arquivo, categorias, info)
+        callback_scan: Função chamada durante o scan com (contador)
+        callback_pasta: Função chamada com (pasta, indice, total) ao terminar o scan de cada pasta
+        modo_mover: Se True, move arquivos. Se None, detecta automaticamente por pasta.
+        preservar_metadados: Se False, as cópias não replicam datas e permissões
+        leitura_unica: Se True (e copiando), calcula o hash durante a cópia (veja organizar_presets)
+        catalogo: Catálogo com execução ativa onde cada preset é registrado (opcional)
+        agendador: Agendador de I/O; se None, um AgendadorIO com os limites detectados
+        ordem: Ordem de leitura de cada origem (veja organizar_presets)
+        armazem: Armazém de conteúdo do destino (veja organizar_presets)
+        classificador: Função nome -> categorias (veja organizar_presets)
+        memoria: Modo de memória limitada (veja organizar_presets)
+        
+    Returns:
+        Estatísticas de cada origem (mesmo formato de organizar_presets), na ordem de pastas_origem
+    """
+    pasta_destino_path = Path(pasta_destino)
+    pasta_temporaria = pasta_destino_path / PASTA_TEMPORARIA
+    if agendador is None:
+        agendador = AgendadorIO()
+    
+    origens = []
+    for pasta_origem in pastas_origem:
+        mover = modo_mover if modo_mover is not None else detectar_modo_reverificacao(pasta_origem, pasta_destino)
+        origens.append({
+            "pasta": pasta_origem,
+            "modo_mover": mover,
+            "leitura_unica": leitura_unica and not mover,
+            "estatisticas": criar_estatisticas(mover, memoria),
+            "metricas": MetricasExecucao(),  # Compartilhada pelo trabalhador e o coordenador
+            "concluidos": 0,
+        })
+    
+    fila: "queue.Queue" = queue.Queue(maxsize=TAMANHO_FILA_COORDENADOR)
+    parar = threading.Event()
+    trabalhadores = [
+        threading.Thread(
+            target=_ler_origem,
+            args=(indice, origem["pasta"], fila, parar, origem["metricas"], callback_scan,
+                  origem["leitura_unica"], pasta_temporaria, agendador, ordem, memoria),
+            name=f"origem-{indice}",
+            daemon=True
+        )
+        for indice, origem in enumerate(origens)
+    ]
+    for trabalhador in trabalhadores:
+        trabalhador.start()
+    
+    ativos = len(trabalhadores)
+    escaneadas = 0
+    total_geral = 0
+    concluidos_geral = 0
+    
+    try:
+        while ativos:
+            tipo, indice, arquivo_preset, dados = fila.get()
+            origem = origens[indice]
+            estatisticas = origem["estatisticas"]
+            metricas = origem["metricas"]
             
-            # Se nenhuma categoria por keyword encontrada
-            if not categorias:
-                if categoria_especial:
-                    # Usa categoria especial (Arquivos_Corrompidos ou Customizados)
-                    categorias = [categoria_especial]
-                else:
-                    # Vai para Uncategorized
-                    categorias = [CATEGORIA_PADRAO]
+            if tipo == "fim":
+                ativos -= 1
+                continue
             
-            # Se múltiplas categorias, registra
-            if len(categorias) > 1:
-                estatisticas["total_multi_categoria"] += 1
+            if tipo == "inicio":
+                estatisticas["total_arquivos_origem"] = dados
+                total_geral += dados
+                escaneadas += 1
+                if callback_pasta:
+                    callback_pasta(origem["pasta"], escaneadas, len(origens))
+                continue
             
-            # CORREÇÃO: Se a única categoria é Uncategorized e estamos em modo mover
-            # da pasta Uncategorized, não faz nada (arquivo já está no lugar certo)
-            if modo_mover and categorias == [CATEGORIA_PADRAO]:
-                # Arquivo sem categoria, permanece onde está
-                if CATEGORIA_PADRAO not in estatisticas["por_categoria"]:
-                    estatisticas["por_categoria"][CATEGORIA_PADRAO] = 0
-                estatisticas["por_categoria"][CATEGORIA_PADRAO] += 1
-                
-                if callback_arquivo:
-                    callback_arquivo(
-                        arquivo_preset.name,
-                        categorias,
-                        {
-                            "tipo": "processado",
-                            "multi": False,
-                            "contador": contador,
-                            "total": total_arquivos,
-                            "movido": False
-                        }
-                    )
-                
-                if callback_progresso:
-                    callback_progresso(contador, total_arquivos)
-                continue  # Pula para o próximo arquivo
+            if tipo == "erro":
+                estatisticas["erros"].append({"arquivo": str(arquivo_preset), "erro": dados})
+                continue
             
-            # Copia/Move para cada categoria encontrada
-            primeiro_destino = None
-            arquivo_deletado = False
-            for categoria in categorias:
-                pasta_categoria = pasta_destino_path / categoria
-                caminho_final, ja_existia, foi_deletado = copiar_preset_seguro(
-                    arquivo_preset, 
-                    pasta_categoria, 
-                    mover=(modo_mover and primeiro_destino is None),  # Só move na primeira categoria
-                    deletar_se_existe=(modo_mover and primeiro_destino is None)  # Deleta se já existe (re-verificação)
+            tamanho_arquivo, hash_arquivo, temporario = dados
+            origem["concluidos"] += 1
+            concluidos_geral += 1
+            if memoria is not None:
+                try:
+                    memoria.verificar()
+                except LimiteMemoriaExcedido:
+                    if temporario is not None:
+                        descartar_temporario(temporario)
+                    raise
+            try:
+                categorias, info = posicionar_preset(
+                    arquivo_preset, tamanho_arquivo, hash_arquivo, temporario,
+                    estatisticas, hashes_copiados, pasta_destino_path, origem["modo_mover"],
+                    metricas, preservar_metadados, catalogo, agendador, armazem,
+                    classificador
                 )
                 
-                if foi_deletado:
-                    arquivo_deletado = True
-                    estatisticas["total_deletados_origem"] = estatisticas.get("total_deletados_origem", 0) + 1
-                
-                if not ja_existia:
-                    estatisticas["total_copias_realizadas"] += 1
-                    
-                    if primeiro_destino is None:
-                        primeiro_destino = str(caminho_final)
-                
-                # Atualiza contagem por categoria
-                if categoria not in estatisticas["por_categoria"]:
-                    estatisticas["por_categoria"][categoria] = 0
-                estatisticas["por_categoria"][categoria] += 1
-            
-            # Registra o hash com o primeiro destino
-            if primeiro_destino:
-                hashes_copiados[hash_arquivo] = primeiro_destino
+                info["contador"] = origem["concluidos"]
+                info["total"] = estatisticas["total_arquivos_origem"]
+                with metricas.medir("callback"):
+                    if callback_arquivo:
+                        callback_arquivo(arquivo_preset.name, categorias, info)
+                    if callback_progresso and info["tipo"] == "processado":
+                        callback_progresso(concluidos_geral, total_geral)
             
-            # Registra detalhes do arquivo
-            estatisticas["arquivos_processados"].append({
-                "origem": str(arquivo_preset),
-                "categorias": categorias,
-                "multi": len(categorias) > 1
-            })
+            except Exception as erro:
+                estatisticas["erros"].append({
+                    "arquivo": str(arquivo_preset),
+                    "erro": str(erro)
+                })
             
-            # Callback para atualizar interface
-            if callback_arquivo:
-                callback_arquivo(
-                    arquivo_preset.name,
-                    categorias,
-                    {
-                        "tipo": "processado",
-                        "multi": len(categorias) > 1,
-                        "contador": contador,
-                        "total": total_arquivos,
-                        "movido": modo_mover
-                    }
+            finally:
+                # Duplicata ou erro: o temporário não foi renomeado
+                if temporario is not None:
+                    descartar_temporario(temporario)
+    
+    finally:
+        # Interrompido: libera os trabalhadores presos na fila cheia
+        parar.set()
+        while any(trabalhador.is_alive() for trabalhador in trabalhadores) or not fila.empty():
+            try:
+                tipo, _, _, dados = fila.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if tipo == "arquivo" and dados[2] is not None:
+                descartar_temporario(dados[2])
+        for trabalhador in trabalhadores:
+            trabalhador.join()
+    
+    if any(origem["leitura_unica"] for origem in origens):
+        with contextlib.suppress(OSError):
+            pasta_temporaria.rmdir()
+    
+    resultados = []
+    for origem in origens:
+        estatisticas = origem["estatisticas"]
+        estatisticas["_hashes"] = hashes_copiados
+        estatisticas["metricas"] = origem["metricas"].para_dict()
+        resultados.append(estatisticas)
+    return resultados
+
+
+# ============================================================================
+# MOTOR ASSÍNCRONO (armazenamento em rede com alta latência)
+# ============================================================================
+
+class _TravasPorChave:
+    """
+    Travas asyncio criadas sob demanda por chave e descartadas quando ninguém as usa.
+    
+    Uso:
+        travas = _TravasPorChave()
+        async with travas.para("chave"):
+            ...
+    """
+    
+    def __init__(self):
+        self._travas: Dict[object, list] = {}  # chave -> [asyncio.Lock, usuarios]
+    
+    @contextlib.asynccontextmanager
+    async def para(self, chave):
+        entrada = self._travas.setdefault(chave, [asyncio.Lock(), 0])
+        entrada[1] += 1
+        try:
+            async with entrada[0]:
+                yield
+        finally:
+            entrada[1] -= 1
+            if entrada[1] == 0:
+                del self._travas[chave]
+
+
+async def organizar_presets_async(
+    pasta_origem: str,
+    pasta_destino: str,
+    callback_progresso: Optional[Callable] = None,
+    callback_arquivo: Optional[Callable] = None,
+    callback_scan: Optional[Callable] = None,
+    modo_mover: bool = None,
+    hashes_existentes: Optional[Mapping[str, str]] = None,
+    metricas: Optional[MetricasExecucao] = None,
+    concorrencia: int = 8,
+    preservar_metadados: bool = True,
+    leitura_unica: bool = False,
+    catalogo: Optional[CatalogoBiblioteca] = None,
+    agendador: Optional[AgendadorIO] = None,
+    ordem: str = ORDEM_PADRAO,
+    armazem: Optional[ArmazemConteudo] = None,
+    classificador: Optional[Callable[[str], List[str]]] = None,
+    memoria: Optional[ControleMemoria] = None
+) -> dict:
+    """
+    Variante assíncrona de organizar_presets() para SMB/NFS e outros discos lentos.
+    
+    Stat, hash e cópias rodam em um pool de threads limitado a `concorrencia`,
+    mantendo vários arquivos em andamento enquanto o link espera a rede.
+    As garantias são as mesmas do motor síncrono:
+    - Um hash por vez: arquivos com o mesmo conteúdo são serializados, então
+      nunca dois trabalhadores colocam o mesmo digest no destino
+    - Uma colocação por vez em cada pasta de categoria (gerar_nome_unico não corre)
+    - Mesmo formato do dicionário de estatísticas
+    
+    Os callbacks são chamados na thread do event loop, na ordem de conclusão
+    (callback_scan roda na thread do scan).
+    
+    Args:
+        pasta_origem: Caminho da pasta com os presets desorganizados
+        pasta_destino: Caminho da pasta onde será criada a estrutura organizada
+        callback_progresso: Função chamada com (atual, total) para atualizar progresso
+        callback_arquivo: Função chamada com (arquivo, categorias, info)
+        callback_scan: Função chamada durante o scan com (contador)
+        modo_mover: Se True, move arquivos. Se None, detecta automaticamente.
+        hashes_existentes: Hashes já processados (para múltiplas origens). Um
+                           RegistroHashes é usado e atualizado por referência;
+                           um dict é copiado
+        metricas: Métricas de execução; se None, uma nova instância é criada.
+        concorrencia: Máximo de operações de arquivo simultâneas
+        preservar_metadados: Se False, as cópias não replicam datas e permissões
+        leitura_unica: Se True (e copiando), calcula o hash durante a cópia (veja organizar_presets)
+        catalogo: Catálogo com execução ativa onde cada preset é registrado (opcional)
+        agendador: Agendador de I/O; se None, um AgendadorIO com os limites
+                   detectados por dispositivo (HD x SSD)
+        ordem: Ordem em que os arquivos são entregues aos trabalhadores (veja organizar_presets)
+        armazem: Armazém de conteúdo do destino (veja organizar_presets)
+        classificador: Função nome -> categorias (veja organizar_presets)
+        memoria: Modo de memória limitada (veja organizar_presets)
+        
+    Returns:
+        Dicionário com estatísticas da operação (mesmo formato de organizar_presets)
+    """
+    if concorrencia < 1:
+        raise ValueError("concorrencia deve ser pelo menos 1")
+    
+    if modo_mover is None:
+        modo_mover = detectar_modo_reverificacao(pasta_origem, pasta_destino)
+    
+    estatisticas = criar_estatisticas(modo_mover, memoria)
+    pasta_destino_path = Path(pasta_destino)
+    leitura_unica = leitura_unica and not modo_mover
+    pasta_temporaria = pasta_destino_path / PASTA_TEMPORARIA
+    hashes_copiados = _obter_registro_execucao(hashes_existentes, memoria)
+    
+    if metricas is None:
+        metricas = MetricasExecucao()
+    
+    # Vários arquivos em andamento: limita cada dispositivo ao que ele aguenta
+    if agendador is None:
+        agendador = AgendadorIO()
+    
+    loop = asyncio.get_running_loop()
+    travas_hash = _TravasPorChave()
+    travas_pasta = _TravasPorChave()
+    trava_estatisticas = threading.Lock()  # posicionar_preset roda nas threads do executor
+    concluidos = 0
+    
+    with ThreadPoolExecutor(max_workers=concorrencia, thread_name_prefix="organizador") as executor:
+        
+        def em_thread(funcao, *args, **kwargs):
+            return loop.run_in_executor(executor, functools.partial(funcao, *args, **kwargs))
+        
+        # Fase 1: Escaneia todos os arquivos
+        arquivos = await em_thread(listar_trabalho, pasta_origem, callback_scan, ordem, metricas, memoria)
+        total_arquivos = len(arquivos)
+        estatisticas["total_arquivos_origem"] = total_arquivos
+        
+        def notificar(nome: str, categorias: list, info_extra: dict):
+            nonlocal concluidos
+            concluidos += 1
+            info_extra["contador"] = concluidos
+            info_extra["total"] = total_arquivos
+            with metricas.medir("callback"):
+                if callback_arquivo:
+                    callback_arquivo(nome, categorias, info_extra)
+                if callback_progresso and info_extra["tipo"] == "processado":
+                    callback_progresso(concluidos, total_arquivos)
+        
+        async def processar(arquivo_preset: Path):
+            temporario = None
+            if leitura_unica:
+                tamanho_arquivo, hash_arquivo, temporario = await em_thread(
+                    copiar_com_hash, arquivo_preset, pasta_temporaria, metricas, agendador=agendador
+                )
+            else:
+                tamanho_arquivo, hash_arquivo = await em_thread(
+                    medir_e_calcular_hash, arquivo_preset, metricas, agendador
                 )
             
-            if callback_progresso:
-                callback_progresso(contador, total_arquivos)
+            try:
+                await posicionar(arquivo_preset, tamanho_arquivo, hash_arquivo, temporario)
+            finally:
+                # Duplicata ou erro: o temporário não foi renomeado
+                if temporario is not None:
+                    descartar_temporario(temporario)
+        
+        async def posicionar(arquivo_preset: Path, tamanho_arquivo: int, hash_arquivo: bytes,
+                             temporario: Optional[Path]):
+            # Serializa arquivos com o mesmo conteúdo: o segundo só decide
+            # depois que o primeiro registrou (ou não) o seu destino
+            async with travas_hash.para(hash_arquivo):
+                # Classifica antes para saber quais pastas travar (duplicata não trava nenhuma)
+                categorias = None
+                if hash_arquivo not in hashes_copiados:
+                    with metricas.medir("classificacao"):
+                        categorias = (classificador or determinar_categorias)(arquivo_preset.name)
+                
+                # Trava as pastas de categoria em ordem fixa (evita deadlock)
+                async with contextlib.AsyncExitStack() as pilha:
+                    for categoria in sorted(set(categorias or ())):
+                        await pilha.enter_async_context(travas_pasta.para(categoria))
+                    
+                    categorias, info = await em_thread(
+                        posicionar_preset,
+                        arquivo_preset, tamanho_arquivo, hash_arquivo, temporario,
+                        estatisticas, hashes_copiados, pasta_destino_path, modo_mover,
+                        metricas, preservar_metadados, catalogo, agendador, armazem,
+                        classificador, categorias=categorias, trava=trava_estatisticas
+                    )
             
-        except Exception as erro:
-            estatisticas["erros"].append({
-                "arquivo": str(arquivo_preset),
-                "erro": str(erro)
-            })
+            notificar(arquivo_preset.name, categorias, info)
+        
+        # Fase 2: `concorrencia` trabalhadores consomem a mesma lista
+        pendentes = iter(arquivos)
+        
+        async def trabalhador():
+            for arquivo_preset in pendentes:
+                if memoria is not None:
+                    memoria.verificar()
+                try:
+                    await processar(arquivo_preset)
+                except Exception as erro:
+                    estatisticas["erros"].append({
+                        "arquivo": str(arquivo_preset),
+                        "erro": str(erro)
+                    })
+        
+        try:
+            await asyncio.gather(*(trabalhador() for _ in range(concorrencia)))
+        finally:
+            fechar_trabalho(arquivos)
+    
+    if leitura_unica:
+        with contextlib.suppress(OSError):
+            pasta_temporaria.rmdir()
     
-    # Retorna hashes para uso em múltiplas origens
     estatisticas["_hashes"] = hashes_copiados
+    estatisticas["metricas"] = metricas.para_dict()
     
     return estatisticas
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Memória Limitada - Serum Preset Organizer
+====================================================
+Modo para máquinas com pouca RAM (ex: NAS com 1 GB) e milhões de presets.
+As estruturas que crescem com o número de arquivos saem da memória:
+
+- Lista de trabalho: FilaEmDisco (caminhos gravados durante o scan e
+  relidos em sequência, em vez de uma lista de Paths)
+- Registro de deduplicação: RegistroHashesDisco (SQLite, veja
+  src/registro_hashes.py)
+- Registros por arquivo (arquivos_processados): RegistrosEmDisco, gravados
+  em NDJSON à medida que são produzidos
+
+ControleMemoria reúne os três numa pasta de trabalho (por padrão dentro do
+destino, já que /tmp costuma ser RAM em NAS) e mede o RSS do processo a
+cada LOTE_VERIFICACAO arquivos. Acima do teto ele tenta liberar memória
+(coleta de lixo, cache do SQLite); se continuar acima, a execução é
+interrompida com LimiteMemoriaExcedido, com o que já foi organizado
+intacto. O pico medido vai para o resumo.
+"""
+
+import contextlib
+import gc
+import itertools
+import json
+import os
+import shutil
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from src.registro_hashes import RegistroHashesDisco
+
+try:
+    import resource
+except ImportError:  # Windows: sem getrusage
+    resource = None
+
+
+# Pasta de trabalho padrão, dentro do destino (oculta para o indexador)
+PASTA_TRABALHO = ".serum_memoria"
+
+# Arquivos processados entre duas medições do RSS
+LOTE_VERIFICACAO = 1000
+
+# Prefixo de cada caminho na FilaEmDisco (tamanho em bytes)
+_TAMANHO = struct.Struct("<I")
+
+# Buffer de escrita/leitura dos arquivos de trabalho
+_BUFFER = 1024 * 1024
+
+
+class LimiteMemoriaExcedido(MemoryError):
+    """O RSS continuou acima do teto depois de liberar o que era possível."""
+
+    def __init__(self, rss: int, limite: int):
+        super().__init__(
+            f"uso de memória ({rss / 2**20:.0f} MiB) acima do limite ({limite / 2**20:.0f} MiB)"
+        )
+        self.rss = rss
+        self.limite = limite
+
+
+def medir_rss() -> Optional[int]:
+    """
+    RSS atual do processo em bytes.
+
+    Usa /proc/self/statm (Linux); em outros sistemas, o pico de
+    getrusage() (sempre >= o atual); None se nenhum estiver disponível.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as arquivo:
+            return int(arquivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+class FilaEmDisco:
+    """
+    Lista de caminhos num arquivo: append() durante o scan, iteração depois.
+
+    Cada caminho é gravado com o tamanho na frente (nomes podem conter
+    quebras de linha); só a contagem fica em memória.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = str(caminho)
+        self._arquivo = open(self.caminho, "wb", buffering=_BUFFER)
+        self._quantidade = 0
+
+    def append(self, caminho: Path):
+        dados = os.fsencode(caminho)
+        self._arquivo.write(_TAMANHO.pack(len(dados)))
+        self._arquivo.write(dados)
+        self._quantidade += 1
+
+    def extend(self, caminhos: Iterable[Path]):
+        for caminho in caminhos:
+            self.append(caminho)
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __iter__(self) -> Iterator[Path]:
+        self._arquivo.flush()
+        with open(self.caminho, "rb", buffering=_BUFFER) as leitor:
+            for _ in range(self._quantidade):
+                (tamanho,) = _TAMANHO.unpack(leitor.read(_TAMANHO.size))
+                yield Path(os.fsdecode(leitor.read(tamanho)))
+
+    def fechar(self):
+        """Fecha e apaga o arquivo da fila."""
+        self._arquivo.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.caminho)
+
+
+class RegistrosEmDisco:
+    """
+    Substituto de estatisticas["arquivos_processados"] que grava cada
+    registro como uma linha JSON em vez de acumulá-lo numa lista.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = str(caminho)
+        self._arquivo = open(self.caminho, "w", encoding="utf-8", buffering=_BUFFER)
+        self._quantidade = 0
+
+    def append(self, registro: dict):
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False))
+        self._arquivo.write("\n")
+        self._quantidade += 1
+
+    def extend(self, registros: Iterable[dict]):
+        for registro in registros:
+            self.append(registro)
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __iter__(self) -> Iterator[dict]:
+        self._arquivo.flush()
+        with open(self.caminho, encoding="utf-8") as leitor:
+            for linha in leitor:
+                yield json.loads(linha)
+
+    def fechar(self):
+        self._arquivo.close()
+
+
+def pasta_trabalho_padrao(pasta_destino: str) -> Path:
+    """Pasta de trabalho do modo de memória limitada dentro do destino."""
+    return Path(pasta_destino) / PASTA_TRABALHO
+
+
+class ControleMemoria:
+    """
+    Estruturas em disco e teto de RSS de uma execução com memória limitada.
+
+    Uso:
+        with ControleMemoria(pasta_trabalho_padrao(destino), limite_mb=512) as memoria:
+            estatisticas = organizar_presets(origem, destino, memoria=memoria,
+                                             hashes_existentes=memoria.registro)
+            print(memoria.para_dict())
+    """
+
+    def __init__(
+        self,
+        pasta_trabalho: str,
+        limite_mb: Optional[float] = None,
+        arquivo_registros: Optional[str] = None,
+        intervalo: int = LOTE_VERIFICACAO
+    ):
+        """
+        Args:
+            pasta_trabalho: Pasta dos arquivos temporários (criada e removida ao fechar)
+            limite_mb: Teto de RSS em MiB (None: só mede e informa o pico)
+            arquivo_registros: NDJSON onde os registros por arquivo são gravados
+                               e mantidos (padrão: na pasta de trabalho, descartado)
+            intervalo: Arquivos processados entre duas medições do RSS
+        """
+        self.pasta_trabalho = Path(pasta_trabalho)
+        self.pasta_trabalho.mkdir(parents=True, exist_ok=True)
+        self.limite_bytes = int(limite_mb * 2**20) if limite_mb else None
+        self.intervalo = max(1, intervalo)
+        self.arquivo_registros = arquivo_registros
+        # Um registro de uma execução interrompida transformaria tudo em "duplicata"
+        arquivo_hashes = self.pasta_trabalho / "hashes.db"
+        with contextlib.suppress(FileNotFoundError):
+            arquivo_hashes.unlink()
+        self.registro = RegistroHashesDisco(str(arquivo_hashes))
+        self.registros = RegistrosEmDisco(
+            arquivo_registros or str(self.pasta_trabalho / "arquivos_processados.ndjson")
+        )
+        self.liberadores: List[Callable[[], None]] = [self.registro.liberar]
+        self.pico_rss = medir_rss() or 0
+        self.verificacoes = 0
+        self.liberacoes = 0
+        self.excedido = False
+        self._filas = itertools.count(1)  # next() é atômico: uma fila por thread de origem
+        self._desde_verificacao = self.intervalo  # O primeiro arquivo já é medido
+
+    def nova_fila(self) -> FilaEmDisco:
+        """Fila de trabalho para o scan de uma origem."""
+        return FilaEmDisco(str(self.pasta_trabalho / f"fila_{next(self._filas)}.bin"))
+
+    def liberar(self):
+        """Coleta de lixo e os liberadores registrados (cache do registro em disco, etc.)."""
+        self.liberacoes += 1
+        for liberador in self.liberadores:
+            liberador()
+        gc.collect()
+
+    def verificar(self, forcar: bool = False):
+        """
+        Conta um arquivo e mede o RSS contra o teto no primeiro e depois a cada `intervalo`.
+
+        Raises:
+            LimiteMemoriaExcedido: RSS acima do teto mesmo depois de liberar
+        """
+        if not forcar and self._desde_verificacao < self.intervalo:
+            self._desde_verificacao += 1
+            return
+        self._desde_verificacao = 1
+        self.verificacoes += 1
+        rss = medir_rss()
+        if rss is None:
+            return
+        self.pico_rss = max(self.pico_rss, rss)
+        if self.limite_bytes is None or rss <= self.limite_bytes:
+            return
+        self.liberar()
+        rss = medir_rss()
+        if rss > self.limite_bytes:
+            self.excedido = True
+            raise LimiteMemoriaExcedido(rss, self.limite_bytes)
+
+    def para_dict(self) -> dict:
+        """Resumo para o relatório: teto, pico de RSS, medições e estruturas em disco."""
+        return {
+            "limite_bytes": self.limite_bytes,
+            "pico_rss_bytes": self.pico_rss or None,
+            "verificacoes": self.verificacoes,
+            "liberacoes": self.liberacoes,
+            "excedido": self.excedido,
+            "registro_hashes": self.registro.uso_memoria(),
+            "registros": len(self.registros),
+            "arquivo_registros": self.arquivo_registros,
+        }
+
+    def fechar(self):
+        """Fecha as estruturas e apaga a pasta de trabalho (o arquivo_registros é mantido)."""
+        self.registros.fechar()
+        self.registro.fechar()
+        shutil.rmtree(self.pasta_trabalho, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Métricas - Serum Preset Organizer
+============================================
+Instrumentação do caminho crítico: tempo acumulado e contagem por etapa
+(indexação do destino, scan, ordenação física, stat, hash, classificação, mkdir, cópia, hash+cópia,
+vínculo no armazém, catálogo, callback, similaridade, espera por vaga no agendador de I/O) e bytes
+lidos/escritos.
+"""
+
+import json
+import threading
+import time
+from typing import Dict, Optional
+
+
+# Etapas instrumentadas, na ordem em que aparecem no relatório
+ETAPAS = (
+    "indexacao", "scan", "ordenacao", "stat", "hash", "classificacao", "mkdir", "copia", "hash_copia", "vinculo",
+    "catalogo", "callback", "similaridade", "espera_io",
+)
+
+
+class _Medicao:
+    """Context manager leve que soma a duração de um bloco em uma etapa."""
+
+    __slots__ = ("metricas", "etapa", "inicio")
+
+    def __init__(self, metricas: "MetricasExecucao", etapa: str):
+        self.metricas = metricas
+        self.etapa = etapa
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.metricas.registrar(self.etapa, time.perf_counter() - self.inicio)
+        return False
+
+
+class MetricasExecucao:
+    """
+    Acumula tempo e contagem por etapa e o volume de I/O de uma execução.
+
+    Seguro para uso entre threads (motores concorrentes compartilham a mesma instância).
+
+    Uso:
+        metricas = MetricasExecucao()
+        with metricas.medir("hash"):
+            calcular_hash_arquivo(arquivo)
+        metricas.adicionar_bytes(lidos=tamanho)
+    """
+
+    def __init__(self):
+        self.tempos: Dict[str, float] = {etapa: 0.0 for etapa in ETAPAS}
+        self.contagens: Dict[str, int] = {etapa: 0 for etapa in ETAPAS}
+        self.bytes_lidos = 0
+        self.bytes_escritos = 0
+        self._lock = threading.Lock()
+
+    def medir(self, etapa: str) -> _Medicao:
+        """Retorna um context manager que mede o bloco na etapa indicada."""
+        return _Medicao(self, etapa)
+
+    def registrar(self, etapa: str, duracao: float, quantidade: int = 1):
+        """
+        Soma uma duração à etapa.
+
+        Args:
+            etapa: Nome da etapa
+            duracao: Duração em segundos
+            quantidade: Quantas operações a duração representa
+        """
+        with self._lock:
+            self.tempos[etapa] = self.tempos.get(etapa, 0.0) + duracao
+            self.contagens[etapa] = self.contagens.get(etapa, 0) + quantidade
+
+    def adicionar_bytes(self, lidos: int = 0, escritos: int = 0):
+        """Soma bytes lidos e/ou escritos."""
+        with self._lock:
+            self.bytes_lidos += lidos
+            self.bytes_escritos += escritos
+
+    def mesclar(self, dados: dict):
+        """
+        Soma as métricas de outro relatório (formato de para_dict()).
+
+        Args:
+            dados: Dicionário gerado por para_dict()
+        """
+        with self._lock:
+            for etapa, valores in dados.get("etapas", {}).items():
+                self.tempos[etapa] = self.tempos.get(etapa, 0.0) + valores["tempo_s"]
+                self.contagens[etapa] = self.contagens.get(etapa, 0) + valores["contagem"]
+            self.bytes_lidos += dados.get("bytes_lidos", 0)
+            self.bytes_escritos += dados.get("bytes_escritos", 0)
+
+    def para_dict(self) -> dict:
+        """
+        Exporta as métricas em formato serializável.
+
+        Returns:
+            Dicionário com etapas (tempo_s, contagem) e bytes lidos/escritos
+        """
+        with self._lock:
+            return {
+                "etapas": {
+                    etapa: {
+                        "tempo_s": round(self.tempos[etapa], 6),
+                        "contagem": self.contagens[etapa],
+                    }
+                    for etapa in self.tempos
+                },
+                "bytes_lidos": self.bytes_lidos,
+                "bytes_escritos": self.bytes_escritos,
+            }
+
+    def exportar_json(self, caminho: str):
+        """Grava as métricas em um arquivo JSON."""
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(self.para_dict(), f, ensure_ascii=False, indent=2)
+
+
+class _MetricasNulas(MetricasExecucao):
+    """Implementação que descarta tudo, usada quando não há métricas ativas."""
+
+    class _MedicaoNula:
+        __slots__ = ()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    _MEDICAO = _MedicaoNula()
+
+    def medir(self, etapa: str):
+        return self._MEDICAO
+
+    def registrar(self, etapa: str, duracao: float, quantidade: int = 1):
+        pass
+
+    def adicionar_bytes(self, lidos: int = 0, escritos: int = 0):
+        pass
+
+
+# Instância compartilhada para chamadas sem métricas
+METRICAS_NULAS = _MetricasNulas()
+
+
+def obter_metricas(metricas: Optional[MetricasExecucao]) -> MetricasExecucao:
+    """Retorna as métricas informadas ou a instância nula."""
+    return metricas if metricas is not None else METRICAS_NULAS
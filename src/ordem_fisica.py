@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Ordem Física - Serum Preset Organizer
+================================================
+Reordena a lista de presets entre o scan e o hash/cópia para seguir a
+posição dos arquivos no disco, em vez da ordem das entradas de diretório.
+
+Em ext4/XFS a ordem do scandir é a da tabela hash do diretório e salta de
+um lado para o outro do prato; num HD isso vira um seek por arquivo.
+Ordenar por número de inode aproxima a ordem de criação (e, em geral, a de
+alocação); o FIEMAP (Linux) informa o endereço físico do primeiro extent,
+que é a ordem real no disco. Em SSD a ordem não faz diferença.
+
+A ordem muda qual cópia de um conteúdo duplicado é a "original" (a primeira
+processada), nunca quais conteúdos são copiados.
+"""
+
+import os
+import struct
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem ioctl, a ordem por extent cai para inode
+    fcntl = None
+
+from src.metricas import MetricasExecucao, obter_metricas
+
+
+# Ordens disponíveis: a do scan (sem custo), por inode (um stat por arquivo)
+# e por endereço físico do primeiro extent (stat + ioctl por arquivo)
+ORDENS = ("scan", "inode", "extent")
+ORDEM_PADRAO = "scan"
+
+# ioctl FS_IOC_FIEMAP: struct fiemap (32 bytes) seguida de um struct fiemap_extent (56 bytes)
+_FS_IOC_FIEMAP = 0xC020660B
+_FORMATO_FIEMAP = "=QQIIII"
+_FORMATO_EXTENT = "=QQQQQIIII"
+_TAMANHO_FIEMAP = struct.calcsize(_FORMATO_FIEMAP)
+_TAMANHO_PEDIDO = _TAMANHO_FIEMAP + struct.calcsize(_FORMATO_EXTENT)
+_FIEMAP_EXTENT_UNKNOWN = 0x2  # Ainda sem endereço (alocação atrasada) ou desconhecido
+
+
+def primeiro_extent(caminho: Path) -> Optional[int]:
+    """
+    Endereço físico (bytes) do primeiro extent do arquivo, via FIEMAP.
+
+    Returns:
+        Offset físico, ou None se o sistema de arquivos não informar (tmpfs,
+        rede, Windows, arquivo vazio ou ainda não alocado)
+    """
+    if fcntl is None:
+        return None
+    pedido = bytearray(_TAMANHO_PEDIDO)
+    struct.pack_into(_FORMATO_FIEMAP, pedido, 0, 0, 0xFFFFFFFFFFFFFFFF, 0, 0, 1, 0)
+    try:
+        fd = os.open(caminho, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        fcntl.ioctl(fd, _FS_IOC_FIEMAP, pedido, True)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+    extents = struct.unpack_from(_FORMATO_FIEMAP, pedido, 0)[3]
+    if not extents:
+        return None
+    _, fisico, _, _, _, flags, _, _, _ = struct.unpack_from(_FORMATO_EXTENT, pedido, _TAMANHO_FIEMAP)
+    if flags & _FIEMAP_EXTENT_UNKNOWN:
+        return None
+    return fisico
+
+
+def _chave_inode(caminho: Path) -> Tuple[int, int]:
+    try:
+        info = os.stat(caminho)
+    except OSError:
+        return (0, 0)  # O erro aparece (e é registrado) no hash
+    return (info.st_dev, info.st_ino)
+
+
+def _chave_extent(caminho: Path) -> Tuple[int, int, int]:
+    dispositivo, inode = _chave_inode(caminho)
+    fisico = primeiro_extent(caminho)
+    # Sem endereço físico: depois dos que têm, por inode
+    if fisico is None:
+        return (dispositivo, 1, inode)
+    return (dispositivo, 0, fisico)
+
+
+def ordenar_arquivos(
+    arquivos: List[Path],
+    ordem: str = ORDEM_PADRAO,
+    metricas: Optional[MetricasExecucao] = None
+) -> List[Path]:
+    """
+    Reordena os presets encontrados no scan.
+
+    Args:
+        arquivos: Lista do scan
+        ordem: "scan" (mantém), "inode" ou "extent" (veja ORDENS)
+        metricas: Métricas da execução (etapa "ordenacao")
+
+    Returns:
+        Lista na nova ordem (a própria lista, se ordem == "scan")
+    """
+    if ordem not in ORDENS:
+        raise ValueError(f"Ordem inválida: {ordem} (use {', '.join(ORDENS)})")
+    if ordem == "scan":
+        return arquivos
+
+    chave = _chave_inode if ordem == "inode" else _chave_extent
+    with obter_metricas(metricas).medir("ordenacao"):
+        return sorted(arquivos, key=chave)
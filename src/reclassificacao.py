@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Reclassificação - Serum Preset Organizer
+===================================================
+Reaplica as regras de categoria (MAPA_CATEGORIAS, KEYWORDS_CURTAS...) a uma
+biblioteca já organizada, sem reorganizar tudo de novo.
+
+1. Inventário: cada conteúdo (digest) e as pastas de categoria onde está
+   hoje, lido do destino (digests em cache, veja src/indexador_destino.py)
+   ou do catálogo.
+2. Classificação em lote dos nomes (cada nome distinto uma vez).
+3. Plano mínimo por conteúdo: uma categoria que saiu e outra que entrou
+   viram um único rename; categorias novas restantes recebem um vínculo do
+   armazém (ou uma cópia, sem armazém); categorias que saíram e sobraram
+   têm o arquivo apagado. Um conteúdo nunca perde a última colocação.
+4. Relatório por regra (quantos presets cada keyword nova leva para uma
+   categoria e quantos saem de cada categoria) antes de aplicar.
+
+Só as pastas de categoria conhecidas são tocadas; pastas criadas à mão
+(ex: "Favoritos") ficam de fora, a não ser que sejam incluídas.
+
+As regras podem vir de um arquivo (RegrasCompiladas, veja src/regras.py)
+em vez de src/config.py; as categorias das duas continuam reclassificáveis,
+para que presets saiam de uma categoria que o arquivo deixou de ter.
+"""
+
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from src.agendador_io import AgendadorIO
+from src.armazem import ArmazemConteudo, mover_vinculo
+from src.catalogo import CatalogoBiblioteca
+from src.categorizador import classificar_lote, explicar_categoria, obter_todas_categorias
+from src.config import CATEGORIA_CORROMPIDOS, CATEGORIA_CUSTOMIZADOS
+from src.indexador_destino import digests_do_destino
+from src.manipulador_arquivos import calcular_digest_arquivo, copiar_conteudo, gerar_nome_unico
+from src.metricas import MetricasExecucao, obter_metricas
+from src.regras import RegrasCompiladas
+
+
+# Ações do plano, na ordem em que aparecem no relatório
+ACOES = ("mover", "vincular", "copiar", "remover")
+
+
+def categorias_reclassificaveis(
+    extras: Iterable[str] = (),
+    regras: Optional[RegrasCompiladas] = None
+) -> List[str]:
+    """Pastas de categoria que a reclassificação pode alterar (as do organizador, das regras + extras)."""
+    categorias = obter_todas_categorias() + [CATEGORIA_CORROMPIDOS, CATEGORIA_CUSTOMIZADOS]
+    if regras is not None:
+        categorias += regras.categorias()
+    return list(dict.fromkeys(categorias + list(extras)))
+
+
+def _categoria_do_caminho(pasta_destino: str, caminho: str) -> Optional[str]:
+    """Pasta de categoria (primeiro nível do destino) de um arquivo, ou None se estiver fora dela."""
+    relativo = os.path.relpath(caminho, pasta_destino)
+    partes = Path(relativo).parts
+    if len(partes) < 2 or partes[0] == "..":
+        return None
+    return partes[0]
+
+
+def _novo_item(inventario: Dict[bytes, dict], digest: bytes, nome: Optional[str]) -> dict:
+    item = inventario.get(digest)
+    if item is None:
+        item = inventario[digest] = {"nome": nome, "colocacoes": {}}
+    return item
+
+
+def _nome_para_classificar(item: dict) -> str:
+    """Nome original (catálogo) ou o mais curto das colocações (Bass.fxp antes de Bass_1.fxp)."""
+    if item["nome"]:
+        return item["nome"]
+    nomes = [os.path.basename(caminho) for caminhos in item["colocacoes"].values() for caminho in caminhos]
+    return min(nomes, key=lambda nome: (len(nome), nome))
+
+
+def inventariar_destino(
+    pasta_destino: str,
+    categorias: Iterable[str],
+    metricas: Optional[MetricasExecucao] = None,
+    agendador: Optional[AgendadorIO] = None
+) -> Dict[bytes, dict]:
+    """
+    Colocações atuais pelo conteúdo dos arquivos no destino.
+
+    Returns:
+        digest -> {"nome": None, "colocacoes": {categoria: [caminhos]}}
+    """
+    categorias = set(categorias)
+    pasta_destino = os.path.abspath(pasta_destino)
+    presets, _, _ = digests_do_destino(pasta_destino, metricas=metricas, agendador=agendador)
+    inventario: Dict[bytes, dict] = {}
+    for caminho, digest in presets.items():
+        categoria = _categoria_do_caminho(pasta_destino, caminho)
+        if categoria in categorias:
+            _novo_item(inventario, digest, None)["colocacoes"].setdefault(categoria, []).append(caminho)
+    return inventario
+
+
+def inventariar_catalogo(
+    catalogo: CatalogoBiblioteca,
+    pasta_destino: str,
+    categorias: Iterable[str]
+) -> Dict[bytes, dict]:
+    """
+    Colocações atuais segundo o catálogo (sem ler o conteúdo dos arquivos).
+
+    Colocações cujo arquivo não existe mais são ignoradas; a categoria vem
+    da pasta onde o arquivo está hoje.
+
+    Returns:
+        digest -> {"nome": nome original, "colocacoes": {categoria: [caminhos]}}
+    """
+    categorias = set(categorias)
+    pasta_destino = os.path.abspath(pasta_destino)
+    inventario: Dict[bytes, dict] = {}
+    for caminho, digest, _, nome in catalogo.listar_colocacoes():
+        caminho = os.path.abspath(caminho)
+        categoria = _categoria_do_caminho(pasta_destino, caminho)
+        if categoria not in categorias or not os.path.lexists(caminho):
+            continue
+        caminhos = _novo_item(inventario, digest, nome)["colocacoes"].setdefault(categoria, [])
+        if caminho not in caminhos:
+            caminhos.append(caminho)
+    return inventario
+
+
+def planejar_reclassificacao(
+    inventario: Dict[bytes, dict],
+    pasta_destino: str,
+    metricas: Optional[MetricasExecucao] = None,
+    regras: Optional[RegrasCompiladas] = None
+) -> dict:
+    """
+    Compara as colocações atuais com as regras atuais e monta o plano mínimo.
+
+    Args:
+        inventario: Resultado de inventariar_destino() ou inventariar_catalogo()
+        pasta_destino: Biblioteca organizada
+        metricas: Métricas da execução (etapa "classificacao")
+        regras: Regras de um arquivo (padrão: as de src/config.py)
+
+    Returns:
+        Dicionário com presets, alterados, operacoes, por_acao e por_regra
+        (lista de {"categoria", "mudanca" ("+" ou "-"), "regra", "presets"})
+    """
+    metricas = obter_metricas(metricas)
+    pasta_destino = os.path.abspath(pasta_destino)
+    armazem = ArmazemConteudo(pasta_destino)
+
+    nomes = {digest: _nome_para_classificar(item) for digest, item in inventario.items()}
+    with metricas.medir("classificacao"):
+        novas = (regras.classificar_lote if regras is not None else classificar_lote)(nomes.values())
+    explicar = regras.explicar_categoria if regras is not None else explicar_categoria
+
+    operacoes = []
+    por_regra: Counter = Counter()
+    alterados = 0
+    for digest, item in inventario.items():
+        nome = nomes[digest]
+        atuais = item["colocacoes"]
+        categorias = novas[nome]
+        removidas = sorted(set(atuais) - set(categorias))
+        adicionadas = [categoria for categoria in categorias if categoria not in atuais]
+        if not removidas and not adicionadas:
+            continue
+        alterados += 1
+        for categoria in adicionadas:
+            por_regra[(categoria, "+", explicar(nome, categoria))] += 1
+        for categoria in removidas:
+            por_regra[(categoria, "-", None)] += 1
+
+        hexa = digest.hex()
+        # Uma categoria que sai e outra que entra: um rename em vez de vínculo + remoção
+        movidos = list(zip(removidas, adicionadas))
+        mantidas = [caminhos[0] for categoria, caminhos in atuais.items() if categoria in categorias]
+        for antiga, nova in movidos:
+            caminho, *extras = atuais[antiga]
+            destino = os.path.join(pasta_destino, nova, os.path.basename(caminho))
+            operacoes.append({
+                "acao": "mover", "digest": hexa, "categoria": nova, "origem": caminho, "destino": destino,
+            })
+            mantidas.append(destino)
+            operacoes.extend(
+                {"acao": "remover", "digest": hexa, "categoria": antiga, "origem": extra} for extra in extras
+            )
+
+        # Demais categorias novas: vínculo ao objeto do armazém ou cópia de uma colocação que fica.
+        # As cópias vêm antes das remoções, então sempre há uma colocação de onde copiar.
+        objeto = armazem.caminho_objeto(digest)
+        no_armazem = objeto.exists()
+        simbolico = no_armazem and any(
+            os.path.islink(caminho) for caminhos in atuais.values() for caminho in caminhos
+        )
+        fonte = str(objeto) if no_armazem else (mantidas[0] if mantidas else None)
+        for nova in adicionadas[len(movidos):]:
+            operacoes.append({
+                "acao": "vincular" if no_armazem else "copiar", "digest": hexa, "categoria": nova,
+                "origem": fonte, "destino": os.path.join(pasta_destino, nova, nome), "simbolico": simbolico,
+            })
+
+        for antiga in removidas[len(movidos):]:
+            operacoes.extend(
+                {"acao": "remover", "digest": hexa, "categoria": antiga, "origem": caminho}
+                for caminho in atuais[antiga]
+            )
+
+    contagem_acoes = Counter(operacao["acao"] for operacao in operacoes)
+    return {
+        "destino": pasta_destino,
+        "presets": len(inventario),
+        "alterados": alterados,
+        "por_acao": {acao: contagem_acoes.get(acao, 0) for acao in ACOES},
+        "por_regra": [
+            {"categoria": categoria, "mudanca": mudanca, "regra": regra, "presets": quantidade}
+            for (categoria, mudanca, regra), quantidade in sorted(
+                por_regra.items(), key=lambda par: (-par[1], par[0][0], par[0][1], par[0][2] or "")
+            )
+        ],
+        "operacoes": operacoes,
+    }
+
+
+def _caminho_livre(destino: Path, origem: Path, digest: bytes) -> Optional[Path]:
+    """
+    Caminho onde colocar o preset, ou None se o destino já tem este conteúdo.
+
+    Colisão de nome com outro conteúdo ganha um sufixo (gerar_nome_unico);
+    um symlink quebrado é substituído.
+    """
+    if not os.path.lexists(destino):
+        return destino
+    if not destino.exists():
+        destino.unlink()
+        return destino
+    try:
+        if os.path.samefile(destino, origem) or calcular_digest_arquivo(destino) == digest:
+            return None
+    except OSError:
+        pass
+    return gerar_nome_unico(destino)
+
+
+def aplicar_reclassificacao(
+    plano: dict,
+    catalogo: Optional[CatalogoBiblioteca] = None,
+    metricas: Optional[MetricasExecucao] = None,
+    preservar_metadados: bool = True
+) -> dict:
+    """
+    Executa as operações de um plano de planejar_reclassificacao().
+
+    Args:
+        plano: Plano com "destino" e "operacoes"
+        catalogo: Catálogo da biblioteca a manter em dia (uma execução nova registra as colocações)
+        metricas: Métricas da execução (etapas "vinculo", "copia" e "catalogo")
+        preservar_metadados: Se False, as cópias não copiam datas e permissões
+
+    Returns:
+        Dicionário com aplicadas (por ação), ja_existiam, erros e tempo_s
+    """
+    inicio = time.perf_counter()
+    metricas = obter_metricas(metricas)
+    resumo = {"aplicadas": {acao: 0 for acao in ACOES}, "ja_existiam": 0, "erros": [], "tempo_s": 0.0}
+    if catalogo:
+        catalogo.iniciar_execucao([], plano["destino"])
+
+    # Destino planejado -> caminho real (um rename que ganhou sufixo ainda serve de fonte para cópias)
+    realizados: Dict[str, str] = {}
+    for operacao in plano["operacoes"]:
+        acao = operacao["acao"]
+        origem = Path(realizados.get(operacao["origem"], operacao["origem"]))
+        digest = bytes.fromhex(operacao["digest"])
+        try:
+            if acao == "remover":
+                with metricas.medir("vinculo"):
+                    if os.path.lexists(origem):
+                        origem.unlink()
+                if catalogo:
+                    with metricas.medir("catalogo"):
+                        catalogo.remover_destino(str(origem))
+                resumo["aplicadas"][acao] += 1
+                continue
+
+            destino = Path(operacao["destino"])
+            destino.parent.mkdir(parents=True, exist_ok=True)
+            livre = _caminho_livre(destino, origem, digest)
+            if livre is None:
+                resumo["ja_existiam"] += 1
+                if acao == "mover":
+                    # A nova categoria já tem o conteúdo: o rename vira só a remoção da antiga
+                    realizados[operacao["destino"]] = str(destino)
+                    origem.unlink()
+                    if catalogo:
+                        catalogo.remover_destino(str(origem))
+                        catalogo.registrar_colocacao(str(destino), digest, operacao["categoria"])
+                continue
+
+            if acao == "mover":
+                with metricas.medir("vinculo"):
+                    mover_vinculo(origem, livre)
+                realizados[operacao["destino"]] = str(livre)
+            elif acao == "vincular":
+                armazem = ArmazemConteudo(plano["destino"], "symlink" if operacao["simbolico"] else "hardlink")
+                with metricas.medir("vinculo"):
+                    vinculado = armazem.vincular(origem, livre)
+                if not vinculado:
+                    with metricas.medir("copia"):
+                        copiar_conteudo(origem, livre, preservar_metadados)
+                    metricas.adicionar_bytes(escritos=os.path.getsize(livre))
+            else:
+                with metricas.medir("copia"):
+                    copiar_conteudo(origem, livre, preservar_metadados)
+                metricas.adicionar_bytes(escritos=os.path.getsize(livre))
+
+            if catalogo:
+                with metricas.medir("catalogo"):
+                    if acao == "mover":
+                        catalogo.remover_destino(str(origem))
+                    catalogo.registrar_colocacao(str(livre), digest, operacao["categoria"])
+            resumo["aplicadas"][acao] += 1
+        except OSError as erro:
+            resumo["erros"].append({"arquivo": str(origem), "acao": acao, "erro": str(erro)})
+
+    resumo["tempo_s"] = round(time.perf_counter() - inicio, 4)
+    if catalogo:
+        catalogo.finalizar_execucao(resumo)
+        catalogo.reindexar()
+    return resumo
+
+
+def reclassificar_destino(
+    pasta_destino: str,
+    aplicar: bool = False,
+    catalogo: Optional[CatalogoBiblioteca] = None,
+    do_catalogo: bool = False,
+    extras: Iterable[str] = (),
+    metricas: Optional[MetricasExecucao] = None,
+    regras: Optional[RegrasCompiladas] = None
+) -> dict:
+    """
+    Planeja (e opcionalmente aplica) a reclassificação de uma biblioteca organizada.
+
+    Args:
+        pasta_destino: Biblioteca organizada
+        aplicar: Se False, só monta o plano e o relatório (simulação)
+        catalogo: Catálogo da biblioteca; atualizado ao aplicar
+        do_catalogo: Se True, o inventário vem do catálogo em vez do conteúdo do destino
+        extras: Pastas além das categorias do organizador que podem ser alteradas
+        metricas: Métricas da execução
+        regras: Regras de um arquivo (padrão: as de src/config.py)
+
+    Returns:
+        O plano de planejar_reclassificacao(), com "aplicacao" se aplicado
+    """
+    metricas = obter_metricas(metricas)
+    categorias = categorias_reclassificaveis(extras, regras)
+    if do_catalogo:
+        if catalogo is None:
+            raise ValueError("do_catalogo exige o catálogo da biblioteca")
+        inventario = inventariar_catalogo(catalogo, pasta_destino, categorias)
+    else:
+        inventario = inventariar_destino(pasta_destino, categorias, metricas)
+
+    plano = planejar_reclassificacao(inventario, pasta_destino, metricas, regras)
+    if aplicar:
+        plano["aplicacao"] = aplicar_reclassificacao(plano, catalogo, metricas)
+    return plano
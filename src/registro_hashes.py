@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Registro de Hashes - Serum Preset Organizer
+======================================================
+Registro único de conteúdo já organizado (hash -> primeiro destino),
+compartilhado por referência entre origens e trabalhadores paralelos.
+
+Para caber milhões de entradas, o registro guarda o digest MD5 bruto
+(16 bytes, não os 32 caracteres hex) e o destino como índice em uma
+tabela de pastas + nome do arquivo, empacotados em um único bytes.
+
+Com pouca RAM (modo de memória limitada, veja src/memoria_limitada.py),
+RegistroHashesDisco guarda as mesmas entradas numa tabela SQLite, com
+um cache de páginas de tamanho fixo.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Mapping, Optional, Union
+
+# Bytes usados para o índice da pasta no valor empacotado
+_BYTES_INDICE_PASTA = 4
+
+# Cache de páginas do RegistroHashesDisco (KiB) e escritas por transação
+CACHE_REGISTRO_DISCO_KB = 8 * 1024
+LOTE_REGISTRO_DISCO = 5000
+
+# Digests lidos por consulta ao iterar o RegistroHashesDisco
+_PAGINA_ITERACAO = 1000
+
+Chave = Union[bytes, str]
+
+
+def normalizar_digest(hash_arquivo: Chave) -> bytes:
+    """
+    Converte um hash para o digest bruto de 16 bytes.
+
+    Args:
+        hash_arquivo: Digest (bytes) ou hash hexadecimal (str)
+
+    Returns:
+        Digest em bytes
+    """
+    if isinstance(hash_arquivo, str):
+        return bytes.fromhex(hash_arquivo)
+    return hash_arquivo
+
+
+class RegistroHashes(MutableMapping):
+    """
+    Registro de deduplicação: digest MD5 -> caminho do primeiro destino.
+
+    Funciona como um dicionário, mas é passado por referência entre as
+    origens (nenhuma cópia por origem) e protegido por lock, podendo ser
+    usado por vários trabalhadores ao mesmo tempo. Aceita o digest bruto
+    ou o hash hexadecimal como chave; a iteração devolve digests (bytes).
+
+    Uso:
+        registro = RegistroHashes()
+        original = registro.registrar_se_ausente(digest, destino)
+        if original is not None:
+            ...  # duplicata de `original`
+    """
+
+    def __init__(self, dados: Optional[Mapping[Chave, str]] = None):
+        # digest -> índice da pasta (4 bytes) + nome do arquivo em UTF-8
+        self._entradas: Dict[bytes, bytes] = {}
+        self._pastas: List[str] = []
+        self._indices_pastas: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for hash_arquivo, destino in (dados or {}).items():
+            self[hash_arquivo] = destino
+
+    def _empacotar(self, destino: str) -> bytes:
+        """Converte o caminho em índice da pasta + nome (chamar com o lock)."""
+        pasta, nome = os.path.split(destino)
+        indice = self._indices_pastas.get(pasta)
+        if indice is None:
+            indice = len(self._pastas)
+            self._pastas.append(pasta)
+            self._indices_pastas[pasta] = indice
+        return indice.to_bytes(_BYTES_INDICE_PASTA, "little") + nome.encode("utf-8", "surrogateescape")
+
+    def _desempacotar(self, valor: bytes) -> str:
+        """Reconstrói o caminho a partir do valor empacotado."""
+        pasta = self._pastas[int.from_bytes(valor[:_BYTES_INDICE_PASTA], "little")]
+        return os.path.join(pasta, valor[_BYTES_INDICE_PASTA:].decode("utf-8", "surrogateescape"))
+
+    def __getitem__(self, hash_arquivo: Chave) -> str:
+        return self._desempacotar(self._entradas[normalizar_digest(hash_arquivo)])
+
+    def __setitem__(self, hash_arquivo: Chave, destino: str):
+        digest = normalizar_digest(hash_arquivo)
+        with self._lock:
+            self._entradas[digest] = self._empacotar(destino)
+
+    def __delitem__(self, hash_arquivo: Chave):
+        with self._lock:
+            del self._entradas[normalizar_digest(hash_arquivo)]
+
+    def __contains__(self, hash_arquivo) -> bool:
+        if hash_arquivo.__class__ is bytes:
+            # Caminho quente da deduplicação: sem conversão
+            return hash_arquivo in self._entradas
+        return normalizar_digest(hash_arquivo) in self._entradas
+
+    def __iter__(self) -> Iterator[bytes]:
+        with self._lock:
+            return iter(list(self._entradas))
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __repr__(self) -> str:
+        return f"RegistroHashes({len(self)} entradas, {len(self._pastas)} pastas)"
+
+    def registrar_se_ausente(self, hash_arquivo: Chave, destino: str) -> Optional[str]:
+        """
+        Registra o destino de um hash, de forma atômica, se ainda não existir.
+
+        Args:
+            hash_arquivo: Digest (ou hash hexadecimal) do conteúdo
+            destino: Caminho onde o conteúdo foi colocado
+
+        Returns:
+            None se registrou; o destino já registrado se o hash existia
+        """
+        digest = normalizar_digest(hash_arquivo)
+        with self._lock:
+            existente = self._entradas.get(digest)
+            if existente is None:
+                self._entradas[digest] = self._empacotar(destino)
+                return None
+        return self._desempacotar(existente)
+
+    def uso_memoria(self) -> dict:
+        """
+        Estima a memória ocupada pelo registro (tabelas + chaves + valores).
+
+        Returns:
+            Dicionário com entradas, pastas, bytes estimados e bytes por entrada
+        """
+        with self._lock:
+            total = sys.getsizeof(self._entradas) + sum(
+                sys.getsizeof(chave) + sys.getsizeof(valor)
+                for chave, valor in self._entradas.items()
+            )
+            total += sys.getsizeof(self._pastas) + sys.getsizeof(self._indices_pastas)
+            total += sum(sys.getsizeof(pasta) for pasta in self._pastas)
+            entradas = len(self._entradas)
+            pastas = len(self._pastas)
+        return {
+            "entradas": entradas,
+            "pastas": pastas,
+            "bytes": total,
+            "bytes_por_entrada": round(total / entradas, 1) if entradas else 0,
+        }
+
+
+class RegistroHashesDisco(MutableMapping):
+    """
+    Registro de deduplicação em SQLite, com a mesma interface do RegistroHashes.
+
+    A memória usada fica limitada ao cache de páginas (cache_kb), qualquer
+    que seja o número de entradas. O arquivo é temporário: sem journal nem
+    fsync, e as escritas são agrupadas em transações de LOTE_REGISTRO_DISCO.
+
+    Uso:
+        registro = RegistroHashesDisco("/nas/destino/.serum_memoria/hashes.db")
+        original = registro.registrar_se_ausente(digest, destino)
+        registro.fechar()
+    """
+
+    def __init__(self, caminho: str, cache_kb: int = CACHE_REGISTRO_DISCO_KB):
+        """
+        Args:
+            caminho: Arquivo SQLite (criado se não existir; entradas existentes são mantidas)
+            cache_kb: Tamanho máximo do cache de páginas do SQLite
+        """
+        self.caminho = str(caminho)
+        self._lock = threading.Lock()
+        self._pendentes = 0
+        self._uso_final: Optional[dict] = None
+        self._conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=OFF")
+        self._conexao.execute("PRAGMA synchronous=OFF")
+        self._conexao.execute(f"PRAGMA cache_size=-{int(cache_kb)}")
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS hashes (digest BLOB PRIMARY KEY, destino TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self._conexao.commit()
+
+    def _escreveu(self):
+        """Conta uma escrita e fecha a transação a cada lote (chamar com o lock)."""
+        self._pendentes += 1
+        if self._pendentes >= LOTE_REGISTRO_DISCO:
+            self._conexao.commit()
+            self._pendentes = 0
+
+    def _buscar(self, digest: bytes) -> Optional[str]:
+        linha = self._conexao.execute("SELECT destino FROM hashes WHERE digest = ?", (digest,)).fetchone()
+        return linha[0] if linha else None
+
+    def __getitem__(self, hash_arquivo: Chave) -> str:
+        with self._lock:
+            destino = self._buscar(normalizar_digest(hash_arquivo))
+        if destino is None:
+            raise KeyError(hash_arquivo)
+        return destino
+
+    def __setitem__(self, hash_arquivo: Chave, destino: str):
+        digest = normalizar_digest(hash_arquivo)
+        with self._lock:
+            self._conexao.execute("INSERT OR REPLACE INTO hashes VALUES (?, ?)", (digest, destino))
+            self._escreveu()
+
+    def __delitem__(self, hash_arquivo: Chave):
+        with self._lock:
+            cursor = self._conexao.execute("DELETE FROM hashes WHERE digest = ?", (normalizar_digest(hash_arquivo),))
+            self._escreveu()
+        if not cursor.rowcount:
+            raise KeyError(hash_arquivo)
+
+    def __contains__(self, hash_arquivo) -> bool:
+        digest = normalizar_digest(hash_arquivo)
+        with self._lock:
+            return self._conexao.execute("SELECT 1 FROM hashes WHERE digest = ?", (digest,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Em páginas, pela chave: não carrega todos os digests de uma vez
+        ultimo = b""
+        while True:
+            with self._lock:
+                pagina = self._conexao.execute(
+                    "SELECT digest FROM hashes WHERE digest > ? ORDER BY digest LIMIT ?",
+                    (ultimo, _PAGINA_ITERACAO),
+                ).fetchall()
+            for (digest,) in pagina:
+                yield digest
+            if len(pagina) < _PAGINA_ITERACAO:
+                return
+            ultimo = pagina[-1][0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conexao.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"RegistroHashesDisco({self.caminho!r})"
+
+    def registrar_se_ausente(self, hash_arquivo: Chave, destino: str) -> Optional[str]:
+        """Como RegistroHashes.registrar_se_ausente(): None se registrou, senão o destino existente."""
+        digest = normalizar_digest(hash_arquivo)
+        with self._lock:
+            cursor = self._conexao.execute("INSERT OR IGNORE INTO hashes VALUES (?, ?)", (digest, destino))
+            if cursor.rowcount:
+                self._escreveu()
+                return None
+            return self._buscar(digest)
+
+    def liberar(self):
+        """Grava a transação pendente e devolve a memória de cache que o SQLite puder."""
+        with self._lock:
+            self._conexao.commit()
+            self._pendentes = 0
+            self._conexao.execute("PRAGMA shrink_memory")
+
+    def uso_memoria(self) -> dict:
+        """
+        Tamanho do registro: entradas, bytes no disco e o teto do cache em memória.
+
+        Returns:
+            Dicionário com entradas, bytes_disco, bytes_cache_max e bytes_por_entrada
+            (no disco); depois de fechar(), os valores do fechamento
+        """
+        if self._uso_final is not None:
+            return dict(self._uso_final)
+        entradas = len(self)
+        with self._lock:
+            paginas = self._conexao.execute("PRAGMA page_count").fetchone()[0]
+            tamanho_pagina = self._conexao.execute("PRAGMA page_size").fetchone()[0]
+            cache = self._conexao.execute("PRAGMA cache_size").fetchone()[0]
+        bytes_disco = paginas * tamanho_pagina
+        return {
+            "entradas": entradas,
+            "bytes_disco": bytes_disco,
+            "bytes_cache_max": -cache * 1024 if cache < 0 else cache * tamanho_pagina,
+            "bytes_por_entrada": round(bytes_disco / entradas, 1) if entradas else 0,
+        }
+
+    def fechar(self):
+        """Grava o que falta e fecha a conexão."""
+        if self._uso_final is not None:
+            return
+        self._uso_final = self.uso_memoria()
+        with self._lock:
+            self._conexao.commit()
+            self._conexao.close()
+
+
+def obter_registro(
+    hashes: Optional[Mapping[Chave, str]] = None
+) -> Union[RegistroHashes, RegistroHashesDisco]:
+    """
+    Retorna o registro a usar em uma organização.
+
+    Um RegistroHashes ou RegistroHashesDisco é usado por referência; qualquer
+    outro mapeamento (ex: dict de uma versão anterior) é copiado para um
+    registro novo.
+    """
+    if isinstance(hashes, (RegistroHashes, RegistroHashesDisco)):
+        return hashes
+    return RegistroHashes(hashes)
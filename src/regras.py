@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Regras Externas - Serum Preset Organizer
+===================================================
+Carrega as regras de categoria de um arquivo JSON ou TOML, em vez de editar
+src/config.py, e as compila no ClassificadorTokens.
+
+Formato (JSON; em TOML as mesmas chaves):
+
+    {
+        "categorias": {"Lead": ["topline"], "Riser": ["riser", "uplifter", "rs"]},
+        "keywords_curtas": ["rs"],
+        "termos_genero": ["future garage"],
+        "palavras_portugues": ["saudade"],
+        "padroes_customizados": ["^meu preset\\\\s*\\\\d*"],
+        "padrao_hash": "^(f\\\\d{8,}|\\\\d{6,})\\\\.fxp$",
+        "substituir": false
+    }
+
+Com "substituir": false (padrão) o arquivo acrescenta às regras de
+src/config.py (keywords a categorias existentes, categorias novas, termos);
+com true ele é o conjunto completo (as chaves ausentes ficam vazias, exceto
+padrao_hash).
+
+Em execuções longas, RegrasRecarregaveis verifica o arquivo periodicamente
+numa thread: o novo classificador é compilado fora do caminho quente e
+trocado de uma vez (uma atribuição); classificações em andamento terminam
+com o anterior. Um arquivo inválido não derruba a execução: as regras
+anteriores continuam e o erro é registrado. O memo de classificação é
+descartado quando a assinatura (hash) do conjunto de regras muda.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: só JSON
+    tomllib = None
+
+from src.categorizador import DetectorEspecial
+from src.classificador_tokens import ClassificadorTokens
+from src.config import (
+    CATEGORIA_PADRAO,
+    KEYWORDS_CURTAS,
+    MAPA_CATEGORIAS,
+    PADRAO_HASH,
+    PADROES_CUSTOMIZADOS,
+    PALAVRAS_PORTUGUES,
+    TERMOS_GENERO_IGNORAR,
+)
+
+
+# Segundos entre verificações do arquivo de regras pela thread de vigia
+INTERVALO_VIGIA_PADRAO = 2.0
+
+# Nomes guardados no memo de classificação antes de ele ser esvaziado
+LIMITE_MEMO = 200_000
+
+# Chaves de lista aceitas no arquivo (além de "categorias", "padrao_hash" e "substituir")
+_LISTAS = ("keywords_curtas", "termos_genero", "palavras_portugues", "padroes_customizados")
+
+
+def regras_padrao() -> dict:
+    """Regras atuais de src/config.py, no formato do arquivo."""
+    return {
+        "categorias": {categoria: list(keywords) for categoria, keywords in MAPA_CATEGORIAS.items()},
+        "keywords_curtas": sorted(KEYWORDS_CURTAS),
+        "termos_genero": list(TERMOS_GENERO_IGNORAR),
+        "palavras_portugues": list(PALAVRAS_PORTUGUES),
+        "padroes_customizados": list(PADROES_CUSTOMIZADOS),
+        "padrao_hash": PADRAO_HASH,
+    }
+
+
+def ler_arquivo_regras(caminho: str) -> dict:
+    """
+    Lê um arquivo de regras (.json ou .toml).
+
+    Raises:
+        ValueError: Extensão não suportada, TOML sem tomllib ou conteúdo inválido
+        OSError: Arquivo inacessível
+    """
+    extensao = Path(caminho).suffix.lower()
+    if extensao not in (".json", ".toml"):
+        raise ValueError(f"formato não suportado: {extensao or 'sem extensão'} (use .json ou .toml)")
+    if extensao == ".toml" and tomllib is None:
+        raise ValueError("arquivos TOML exigem Python 3.11+ (use JSON)")
+    with open(caminho, "rb") as arquivo:
+        conteudo = arquivo.read()
+    try:
+        texto = conteudo.decode("utf-8")
+        dados = json.loads(texto) if extensao == ".json" else tomllib.loads(texto)
+    except ValueError as erro:  # UnicodeDecodeError, JSONDecodeError e TOMLDecodeError
+        raise ValueError(f"{caminho}: {erro}") from erro
+    if not isinstance(dados, dict):
+        raise ValueError(f"{caminho}: o arquivo deve conter um objeto/tabela")
+    return dados
+
+
+def _lista_de_textos(valor, chave: str) -> List[str]:
+    if not isinstance(valor, list) or not all(isinstance(item, str) for item in valor):
+        raise ValueError(f"'{chave}' deve ser uma lista de textos")
+    return valor
+
+
+def montar_regras(dados: dict) -> dict:
+    """
+    Valida o conteúdo de um arquivo e monta o conjunto completo de regras.
+
+    Args:
+        dados: Conteúdo lido por ler_arquivo_regras()
+
+    Returns:
+        Regras no formato de regras_padrao()
+
+    Raises:
+        ValueError: Chave desconhecida, tipo errado ou regex inválido
+    """
+    desconhecidas = set(dados) - {"categorias", "padrao_hash", "substituir", *_LISTAS}
+    if desconhecidas:
+        raise ValueError(f"chaves desconhecidas: {', '.join(sorted(desconhecidas))}")
+    substituir = dados.get("substituir", False)
+    if not isinstance(substituir, bool):
+        raise ValueError("'substituir' deve ser true ou false")
+
+    if substituir:
+        regras = {"categorias": {}, **{chave: [] for chave in _LISTAS}, "padrao_hash": PADRAO_HASH}
+    else:
+        regras = regras_padrao()
+
+    categorias = dados.get("categorias", {})
+    if not isinstance(categorias, dict):
+        raise ValueError("'categorias' deve mapear categoria -> lista de keywords")
+    for categoria, keywords in categorias.items():
+        if not categoria or categoria.startswith(".") or os.sep in categoria or "/" in categoria:
+            raise ValueError(f"nome de categoria inválido: {categoria!r}")
+        existentes = regras["categorias"].setdefault(categoria, [])
+        existentes.extend(
+            keyword for keyword in _lista_de_textos(keywords, f"categorias.{categoria}") if keyword not in existentes
+        )
+
+    for chave in _LISTAS:
+        if chave in dados:
+            regras[chave] = list(dict.fromkeys(regras[chave] + _lista_de_textos(dados[chave], chave)))
+    regras["keywords_curtas"] = sorted({keyword.lower() for keyword in regras["keywords_curtas"]})
+
+    if "padrao_hash" in dados:
+        if not isinstance(dados["padrao_hash"], str):
+            raise ValueError("'padrao_hash' deve ser um texto")
+        regras["padrao_hash"] = dados["padrao_hash"]
+    return regras
+
+
+def assinatura_regras(regras: dict) -> str:
+    """Hash curto (SHA-256) do conjunto de regras: muda se e só se alguma regra mudar."""
+    canonico = json.dumps(regras, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonico.encode("utf-8")).hexdigest()[:16]
+
+
+class RegrasCompiladas:
+    """
+    Um conjunto de regras imutável, já compilado no ClassificadorTokens.
+
+    Uso:
+        regras = RegrasCompiladas.de_arquivo("regras.json")
+        regras.determinar_categorias("RS Uplifter 01.fxp")  # ["Riser"]
+    """
+
+    def __init__(self, regras: dict, arquivo: Optional[str] = None):
+        """
+        Args:
+            regras: Regras completas (montar_regras() ou regras_padrao())
+            arquivo: Arquivo de origem, se houver (só informativo)
+
+        Raises:
+            ValueError: Algum regex (padrao_hash, padroes_customizados) é inválido
+        """
+        self.regras = regras
+        self.arquivo = arquivo
+        self.assinatura = assinatura_regras(regras)
+        try:
+            detector = DetectorEspecial(
+                regras["padrao_hash"], regras["palavras_portugues"], regras["padroes_customizados"]
+            )
+        except re.error as erro:
+            raise ValueError(f"regex inválido: {erro}") from erro
+        self.classificador = ClassificadorTokens(
+            regras["categorias"], regras["keywords_curtas"], regras["termos_genero"], detector
+        )
+        self.determinar_categorias = self.classificador.determinar_categorias
+        self.classificar_lote = self.classificador.classificar_lote
+        self.explicar_categoria = self.classificador.explicar_categoria
+
+    @classmethod
+    def de_arquivo(cls, caminho: str) -> "RegrasCompiladas":
+        """Lê, valida e compila um arquivo de regras (ValueError/OSError se inválido)."""
+        return cls(montar_regras(ler_arquivo_regras(caminho)), str(caminho))
+
+    def categorias(self) -> List[str]:
+        """Categorias por keyword mais a padrão (como obter_todas_categorias())."""
+        return list(self.regras["categorias"]) + [CATEGORIA_PADRAO]
+
+
+class RegrasRecarregaveis:
+    """
+    Regras de um arquivo, recarregadas quando ele muda.
+
+    determinar_categorias() é seguro para várias threads: cada chamada usa o
+    conjunto vigente no início dela, e a troca é uma única atribuição.
+
+    Uso:
+        regras = RegrasRecarregaveis("regras.toml")
+        regras.iniciar_vigia()
+        organizar_presets(..., classificador=regras.determinar_categorias)
+        regras.parar_vigia()
+    """
+
+    def __init__(self, caminho: str, intervalo: float = INTERVALO_VIGIA_PADRAO):
+        """
+        Args:
+            caminho: Arquivo de regras (.json ou .toml); precisa ser válido na abertura
+            intervalo: Segundos entre verificações da thread de vigia
+        """
+        self.caminho = str(caminho)
+        self.intervalo = intervalo
+        self.recarregamentos = 0
+        self.erros: List[dict] = []
+        self._versao = self._versao_arquivo()
+        self._atual = RegrasCompiladas.de_arquivo(self.caminho)
+        self._memo: Tuple[str, Dict[str, List[str]]] = (self._atual.assinatura, {})
+        self._trava_recarga = threading.Lock()
+        self._parar = threading.Event()
+        self._vigia: Optional[threading.Thread] = None
+
+    @property
+    def atual(self) -> RegrasCompiladas:
+        """Conjunto de regras vigente."""
+        return self._atual
+
+    def _versao_arquivo(self) -> Optional[Tuple[int, int]]:
+        try:
+            info = os.stat(self.caminho)
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size
+
+    def verificar(self) -> bool:
+        """
+        Recarrega as regras se o arquivo mudou (mtime ou tamanho).
+
+        Returns:
+            True se um novo conjunto (com outra assinatura) entrou em vigor
+        """
+        with self._trava_recarga:
+            versao = self._versao_arquivo()
+            if versao is None or versao == self._versao:
+                return False
+            self._versao = versao
+            try:
+                novas = RegrasCompiladas.de_arquivo(self.caminho)
+            except (OSError, ValueError) as erro:
+                self.erros.append({"arquivo": self.caminho, "erro": str(erro), "momento": time.time()})
+                return False
+            if novas.assinatura == self._atual.assinatura:
+                return False
+            self._atual = novas
+            self.recarregamentos += 1
+            return True
+
+    def determinar_categorias(self, nome_arquivo: str) -> List[str]:
+        """Categorias do preset pelas regras vigentes (com memo por assinatura)."""
+        regras = self._atual
+        assinatura, memo = self._memo
+        if assinatura != regras.assinatura:
+            memo = {}
+            self._memo = (regras.assinatura, memo)
+        categorias = memo.get(nome_arquivo)
+        if categorias is None:
+            categorias = regras.determinar_categorias(nome_arquivo)
+            if len(memo) >= LIMITE_MEMO:
+                memo.clear()
+            memo[nome_arquivo] = categorias
+        return list(categorias)
+
+    def iniciar_vigia(self):
+        """Inicia a thread que verifica o arquivo a cada `intervalo` segundos."""
+        if self._vigia is not None:
+            return
+        self._parar.clear()
+
+        def vigiar():
+            while not self._parar.wait(self.intervalo):
+                self.verificar()
+
+        self._vigia = threading.Thread(target=vigiar, name="vigia-regras", daemon=True)
+        self._vigia.start()
+
+    def parar_vigia(self):
+        """Para a thread de vigia (se estiver rodando)."""
+        if self._vigia is None:
+            return
+        self._parar.set()
+        self._vigia.join()
+        self._vigia = None
+
+    def __enter__(self):
+        self.iniciar_vigia()
+        return self
+
+    def __exit__(self, *exc):
+        self.parar_vigia()
+        return False
+
+    def para_dict(self) -> dict:
+        """Resumo para o relatório (arquivo, assinatura vigente, recargas e erros)."""
+        return {
+            "arquivo": self.caminho,
+            "assinatura": self._atual.assinatura,
+            "categorias": len(self._atual.regras["categorias"]),
+            "recarregamentos": self.recarregamentos,
+            "erros": list(self.erros),
+        }
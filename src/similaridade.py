@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Módulo de Similaridade - Serum Preset Organizer
+================================================
+Detecção de quase-duplicatas: presets com conteúdo diferente (MD5 diferente)
+mas quase igual, como o mesmo preset salvo de novo com outro nome ou com um
+knob ajustado.
+
+Cada preset vira um esboço MinHash dos pedaços de tamanho fixo do conteúdo
+(uma única função de hash, com os valores distribuídos em compartimentos e
+densificação por rotação). O LSH por faixas agrupa os esboços parecidos em
+baldes, então só os pares candidatos são comparados, em tempo ~linear, e os
+pares confirmados são unidos em grupos (union-find).
+"""
+
+import hashlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+from src.metricas import MetricasExecucao, obter_metricas
+
+
+# Tamanho dos pedaços do conteúdo (bytes)
+TAMANHO_PEDACO = 64
+
+# Faixas x linhas do LSH (o esboço tem FAIXAS * LINHAS_POR_FAIXA valores)
+FAIXAS = 16
+LINHAS_POR_FAIXA = 4
+NUM_HASHES = FAIXAS * LINHAS_POR_FAIXA
+
+# Similaridade de Jaccard estimada mínima para dois presets serem agrupados
+LIMIAR_SIMILARIDADE = 0.8
+
+_MAXIMO_64 = 1 << 64
+
+Esboco = Tuple[int, ...]
+
+
+def hash_64(dados: bytes) -> int:
+    """Hash de 64 bits estável entre execuções (blake2b)."""
+    return int.from_bytes(hashlib.blake2b(dados, digest_size=8).digest(), "little")
+
+
+_hash_pedaco = hash_64
+
+
+def esboco_minhash(
+    dados: bytes,
+    num_hashes: int = NUM_HASHES,
+    tamanho_pedaco: int = TAMANHO_PEDACO
+) -> Esboco:
+    """
+    Calcula o esboço MinHash do conteúdo (conjunto dos pedaços de tamanho fixo).
+
+    Usa "one permutation hashing": cada pedaço é hasheado uma vez e o valor
+    cai em um dos num_hashes compartimentos, que guardam o mínimo. Os
+    compartimentos vazios (presets pequenos) copiam o próximo preenchido,
+    com um deslocamento pela distância, para continuarem comparáveis.
+
+    Args:
+        dados: Conteúdo do preset
+        num_hashes: Tamanho do esboço
+        tamanho_pedaco: Tamanho de cada pedaço em bytes
+
+    Returns:
+        Tupla com num_hashes inteiros
+    """
+    visao = memoryview(dados)
+    return esboco_de_hashes(
+        (_hash_pedaco(visao[inicio:inicio + tamanho_pedaco]) for inicio in range(0, len(dados), tamanho_pedaco)),
+        num_hashes,
+    )
+
+
+def esboco_de_hashes(valores: Iterable[int], num_hashes: int = NUM_HASHES) -> Esboco:
+    """
+    Esboço MinHash de um conjunto já hasheado (inteiros de 64 bits).
+
+    Usado por esboco_minhash() (pedaços do conteúdo) e pela análise de nomes
+    (trigramas).
+    """
+    largura = _MAXIMO_64 // num_hashes + 1
+    minimos: List[Optional[int]] = [None] * num_hashes
+
+    for valor in valores:
+        compartimento, resto = divmod(valor, largura)
+        atual = minimos[compartimento]
+        if atual is None or resto < atual:
+            minimos[compartimento] = resto
+
+    if all(minimo is None for minimo in minimos):
+        return (0,) * num_hashes
+
+    # Densificação por rotação: vazio recebe o próximo preenchido (circular)
+    esboco = list(minimos)
+    for indice in range(num_hashes):
+        if esboco[indice] is not None:
+            continue
+        distancia = 1
+        while minimos[(indice + distancia) % num_hashes] is None:
+            distancia += 1
+        esboco[indice] = minimos[(indice + distancia) % num_hashes] + distancia * largura
+    return tuple(esboco)
+
+
+def esboco_arquivo(caminho: Path, num_hashes: int = NUM_HASHES, tamanho_pedaco: int = TAMANHO_PEDACO) -> Esboco:
+    """Lê o preset e calcula o esboço MinHash do conteúdo."""
+    with open(caminho, "rb") as f:
+        return esboco_minhash(f.read(), num_hashes, tamanho_pedaco)
+
+
+def similaridade_estimada(esboco_a: Sequence[int], esboco_b: Sequence[int]) -> float:
+    """Estimativa da similaridade de Jaccard: fração de posições iguais."""
+    iguais = sum(1 for a, b in zip(esboco_a, esboco_b) if a == b)
+    return iguais / len(esboco_a)
+
+
+class UniaoBusca:
+    """Union-find (com compressão de caminho) para montar os grupos."""
+
+    def __init__(self):
+        self._pais: Dict[Hashable, Hashable] = {}
+
+    def encontrar(self, elemento: Hashable) -> Hashable:
+        raiz = self._pais.setdefault(elemento, elemento)
+        while raiz != self._pais[raiz]:
+            raiz = self._pais[raiz]
+        # Compressão: aponta o caminho percorrido direto para a raiz
+        while elemento != raiz:
+            self._pais[elemento], elemento = raiz, self._pais[elemento]
+        return raiz
+
+    def unir(self, elemento_a: Hashable, elemento_b: Hashable):
+        raiz_a = self.encontrar(elemento_a)
+        raiz_b = self.encontrar(elemento_b)
+        if raiz_a != raiz_b:
+            self._pais[raiz_b] = raiz_a
+
+    def grupos(self) -> List[List[Hashable]]:
+        """Retorna os grupos com mais de um elemento."""
+        por_raiz: Dict[Hashable, List[Hashable]] = defaultdict(list)
+        for elemento in self._pais:
+            por_raiz[self.encontrar(elemento)].append(elemento)
+        return [membros for membros in por_raiz.values() if len(membros) > 1]
+
+
+def agrupar_similares(
+    esbocos: Dict[Hashable, Esboco],
+    limiar: float = LIMIAR_SIMILARIDADE,
+    faixas: int = FAIXAS,
+    verificar: Optional[Callable[[Hashable, Hashable], bool]] = None
+) -> List[List[Hashable]]:
+    """
+    Agrupa as chaves cujos esboços são parecidos (LSH por faixas + union-find).
+
+    Cada faixa do esboço vira a chave de um balde; itens no mesmo balde
+    são candidatos e só são unidos se a similaridade estimada atingir o
+    limiar (ou se verificar() confirmar). Cada membro é comparado apenas
+    com o primeiro do balde, o que mantém o trabalho linear mesmo com
+    baldes grandes.
+
+    Args:
+        esbocos: Chave (ex: caminho) -> esboço MinHash
+        limiar: Similaridade estimada mínima
+        faixas: Número de faixas do LSH
+        verificar: Confirmação exata opcional de um par candidato
+
+    Returns:
+        Grupos de chaves (cada um com 2 ou mais), do maior para o menor
+    """
+    uniao = UniaoBusca()
+
+    for faixa in range(faixas):
+        baldes: Dict[Esboco, Hashable] = {}
+        for chave, esboco in esbocos.items():
+            linhas = len(esboco) // faixas
+            balde = esboco[faixa * linhas:(faixa + 1) * linhas]
+            primeiro = baldes.setdefault(balde, chave)
+            if primeiro is chave:
+                continue
+            if uniao.encontrar(primeiro) == uniao.encontrar(chave):
+                continue
+            if verificar is not None:
+                similar = verificar(primeiro, chave)
+            else:
+                similar = similaridade_estimada(esbocos[primeiro], esboco) >= limiar
+            if similar:
+                uniao.unir(primeiro, chave)
+
+    return sorted(uniao.grupos(), key=len, reverse=True)
+
+
+def detectar_quase_duplicatas(
+    caminhos: Iterable[str],
+    limiar: float = LIMIAR_SIMILARIDADE,
+    metricas: Optional[MetricasExecucao] = None
+) -> List[dict]:
+    """
+    Encontra grupos de presets quase iguais entre os arquivos informados.
+
+    Args:
+        caminhos: Presets a comparar (um por conteúdo, ex: destinos do registro de hashes)
+        limiar: Similaridade estimada mínima (0 a 1)
+        metricas: Métricas da execução (etapa "similaridade")
+
+    Returns:
+        Lista de grupos {"arquivos": [...], "similaridade_minima": float}
+    """
+    metricas = obter_metricas(metricas)
+    esbocos: Dict[str, Esboco] = {}
+
+    with metricas.medir("similaridade"):
+        for caminho in caminhos:
+            try:
+                esbocos[str(caminho)] = esboco_arquivo(Path(caminho))
+            except OSError:
+                continue
+        grupos = agrupar_similares(esbocos, limiar)
+
+    resultado = []
+    for grupo in grupos:
+        arquivos = sorted(grupo)
+        referencia = esbocos[arquivos[0]]
+        resultado.append({
+            "arquivos": arquivos,
+            "similaridade_minima": round(min(similaridade_estimada(referencia, esbocos[a]) for a in arquivos[1:]), 3),
+        })
+    return resultado
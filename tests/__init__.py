@@ -6,3 +6,19 @@ Pacote de Testes - Serum Preset Organizer
 
 from tests.test_categorizador import *
 from tests.test_manipulador import *
+from tests.test_cli import *
+from tests.test_interface_visual import *
+from tests.test_registro_hashes import *
+from tests.test_catalogo import *
+from tests.test_indice_busca import *
+from tests.test_similaridade import *
+from tests.test_analise_nomes import *
+from tests.test_agendador_io import *
+from tests.test_ordem_fisica import *
+from tests.test_armazem import *
+from tests.test_indexador_destino import *
+from tests.test_reclassificacao import *
+from tests.test_classificador_tokens import *
+from tests.test_regras import *
+from tests.test_memoria_limitada import *
+from tests.test_listar_arquivos import *
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Agendador de I/O - Serum Preset Organizer
+====================================================
+Testes para a detecção HD x SSD, os limites por dispositivo e o uso pelos motores concorrentes.
+"""
+
+import sys
+import os
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.agendador_io as agendador_io
+from src.agendador_io import (
+    LIMITE_DESCONHECIDO,
+    LIMITE_HDD,
+    LIMITE_SSD,
+    AgendadorIO,
+    disco_rotacional,
+    dispositivo_de,
+    limite_padrao,
+)
+from src.metricas import MetricasExecucao
+
+
+def test_deteccao_rotacional():
+    """Testa a leitura de queue/rotational (disco inteiro e partição) e o padrão sem /sys."""
+    original = agendador_io._PASTA_SYS_BLOCOS
+    with tempfile.TemporaryDirectory() as sys_falso:
+        raiz = Path(sys_falso)
+        # 8:0 = disco HD, 8:1 = partição dele (sem queue/), 259:0 = NVMe
+        (raiz / "sda" / "queue").mkdir(parents=True)
+        (raiz / "sda" / "queue" / "rotational").write_text("1\n")
+        (raiz / "sda" / "sda1").mkdir()
+        (raiz / "nvme0n1" / "queue").mkdir(parents=True)
+        (raiz / "nvme0n1" / "queue" / "rotational").write_text("0\n")
+        (raiz / "8:0").symlink_to(raiz / "sda")
+        (raiz / "8:1").symlink_to(raiz / "sda" / "sda1")
+        (raiz / "259:0").symlink_to(raiz / "nvme0n1")
+
+        agendador_io._PASTA_SYS_BLOCOS = raiz
+        try:
+            assert disco_rotacional(os.makedev(8, 0)) is True
+            assert disco_rotacional(os.makedev(8, 1)) is True, "Partição usa o disco pai"
+            assert disco_rotacional(os.makedev(259, 0)) is False
+            assert disco_rotacional(os.makedev(0, 42)) is None, "Sem bloco (tmpfs, rede)"
+
+            assert limite_padrao(os.makedev(8, 1)) == LIMITE_HDD
+            assert limite_padrao(os.makedev(259, 0)) == LIMITE_SSD
+            assert limite_padrao(os.makedev(0, 42)) == LIMITE_DESCONHECIDO
+        finally:
+            agendador_io._PASTA_SYS_BLOCOS = original
+
+    print("✅ test_deteccao_rotacional passou")
+
+
+def test_limite_por_dispositivo():
+    """Testa que nunca há mais operações simultâneas que o limite e que a espera é medida."""
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = Path(pasta) / "Bass.fxp"
+        arquivo.write_bytes(b"bass")
+
+        # Caminho que ainda não existe: usa a pasta existente mais próxima
+        assert dispositivo_de(Path(pasta) / "Nova" / "Lead.fxp") == os.stat(pasta).st_dev
+
+        agendador = AgendadorIO({pasta: 2})
+        assert agendador.limite(dispositivo_de(pasta)) == 2
+        metricas = MetricasExecucao()
+        ativos = 0
+        maximo = 0
+        trava = threading.Lock()
+
+        def operacao():
+            nonlocal ativos, maximo
+            with agendador.reservar(arquivo, Path(pasta) / "Pad" / "copia.fxp", metricas=metricas):
+                with trava:
+                    ativos += 1
+                    maximo = max(maximo, ativos)
+                time.sleep(0.01)
+                with trava:
+                    ativos -= 1
+
+        threads = [threading.Thread(target=operacao) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert maximo == 2, f"Limite 2, mas {maximo} operações simultâneas"
+        assert metricas.para_dict()["etapas"]["espera_io"]["contagem"] >= 1
+
+        try:
+            agendador.definir_limite(pasta, 0)
+            assert False, "Deveria rejeitar limite 0"
+        except ValueError:
+            pass
+
+    print("✅ test_limite_por_dispositivo passou")
+
+
+def test_motor_async_com_agendador():
+    """Testa o motor assíncrono limitado a 1 operação por disco: mesmo resultado do síncrono."""
+    import asyncio
+    from src.manipulador_arquivos import organizar_presets, organizar_presets_async
+
+    with tempfile.TemporaryDirectory() as origem:
+        for indice in range(12):
+            (Path(origem) / f"Bass_{indice}.fxp").write_bytes(f"bass{indice % 8}".encode())
+        (Path(origem) / "Lead_Pad.fxp").write_bytes(b"multi")
+
+        with tempfile.TemporaryDirectory() as destino_sincrono:
+            sincrono = organizar_presets(origem, destino_sincrono, modo_mover=False)
+        with tempfile.TemporaryDirectory() as destino:
+            assincrono = asyncio.run(organizar_presets_async(
+                origem, destino, modo_mover=False, concorrencia=6,
+                agendador=AgendadorIO({origem: 1, destino: 1})
+            ))
+
+        for chave in ("total_copias_realizadas", "total_duplicatas_ignoradas", "por_categoria"):
+            assert assincrono[chave] == sincrono[chave], f"{chave} difere com o agendador"
+        assert not assincrono["erros"]
+
+    print("✅ test_motor_async_com_agendador passou")
+
+
+def test_cli_limite_dispositivo():
+    """Testa --limite-dispositivo: limites no resumo JSON e validação do formato."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            (Path(origem) / "Bass.fxp").write_bytes(b"bass")
+            (Path(origem) / "Pad.fxp").write_bytes(b"pad")
+
+            saida = Path(origem) / "resumo.json"
+            codigo = executar_cli([
+                "organizar", "-o", origem, "-d", destino, "--modo", "copiar", "-j", "4",
+                "--limite-dispositivo", f"{origem}=1", "--sem-catalogo",
+                "--formato", "json", "--saida", str(saida)
+            ])
+            assert codigo == SAIDA_OK
+            resumo = json.loads(saida.read_text(encoding="utf-8"))
+            assert resumo["estatisticas"]["total_copias_realizadas"] == 2
+            assert resumo["agendador_io"][str(os.stat(origem).st_dev)]["limite"] == 1
+
+            for invalido in (f"{origem}=0", f"{origem}", "/caminho/que/nao/existe=2"):
+                try:
+                    executar_cli(["organizar", "-o", origem, "-d", destino, "--limite-dispositivo", invalido])
+                    assert False, f"Deveria rejeitar {invalido}"
+                except SystemExit:
+                    pass
+
+    print("✅ test_cli_limite_dispositivo passou")
+
+
+def executar_testes_agendador_io():
+    """Executa todos os testes do agendador de I/O."""
+    print("\n💽 TESTES DO AGENDADOR DE I/O")
+    print("─" * 40)
+
+    testes = [
+        test_deteccao_rotacional,
+        test_limite_por_dispositivo,
+        test_motor_async_com_agendador,
+        test_cli_limite_dispositivo,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_agendador_io()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
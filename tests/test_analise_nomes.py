@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da Análise de Nomes - Serum Preset Organizer
+====================================================
+Testes para a normalização, o agrupamento por trigramas e o subcomando analisar-nomes.
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analise_nomes import agrupar_nomes, analisar_pasta, normalizar_stem
+
+
+def test_normalizar_stem():
+    """Testa minúsculas, separadores e a remoção do sufixo de gerar_nome_unico."""
+    assert normalizar_stem("Deep_Bass-02_3.fxp") == "deep bass"
+    assert normalizar_stem("Bass_1_2.fxp") == "bass"
+    assert normalizar_stem("BASS 01.fxp") == "bass"
+    assert normalizar_stem("[KSHMR] Lead (Wide).SerumPreset") == "kshmr lead wide"
+    assert normalizar_stem("808 Sub 2.fxp") == "808 sub"
+    assert normalizar_stem("909.fxp") == "909", "Nome só com números fica"
+
+    print("✅ test_normalizar_stem passou")
+
+
+def test_agrupar_nomes():
+    """Testa que nomes quase iguais se agrupam e nomes diferentes ficam de fora."""
+    stems = ["deep growl bass", "deep growl bass 2", "deep growl bass v2", "soft pad", "soft pads", "pluck"]
+    stems += [f"preset unico {chr(97 + i)}{chr(97 + i)}{i}" for i in range(20)]
+
+    grupos = sorted(sorted(stems[i] for i in grupo) for grupo in agrupar_nomes(stems, 0.7))
+    assert ["deep growl bass", "deep growl bass 2", "deep growl bass v2"] in grupos, grupos
+    assert ["soft pad", "soft pads"] in grupos, grupos
+    assert not any("pluck" in grupo for grupo in grupos)
+    assert agrupar_nomes([]) == []
+
+    print("✅ test_agrupar_nomes passou")
+
+
+def test_analisar_pasta():
+    """Testa o relatório de uma pasta: colisões de nome, rótulo e grupo mínimo."""
+    with tempfile.TemporaryDirectory() as pasta:
+        for nome in ["Bass.fxp", "Bass_1.fxp", "Bass_2.fxp", "BASS 01.fxp", "Pluck.fxp", "notas.txt"]:
+            (Path(pasta) / nome).write_bytes(b"x")
+
+        analise = analisar_pasta(Path(pasta))
+        assert analise["total_arquivos"] == 5, "Só presets contam"
+        assert analise["grupos"] == [
+            {"rotulo": "bass", "arquivos": ["BASS 01.fxp", "Bass.fxp", "Bass_1.fxp", "Bass_2.fxp"]}
+        ], analise["grupos"]
+
+        assert analisar_pasta(Path(pasta), minimo_grupo=5)["grupos"] == []
+
+    print("✅ test_analisar_pasta passou")
+
+
+def test_cli_analisar_nomes():
+    """Testa o subcomando: relatório JSON e --agrupar movendo arquivos e atualizando o catálogo."""
+    from src.cli import executar_cli, SAIDA_OK
+    from src.catalogo import CatalogoBiblioteca
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            for indice, nome in enumerate(["Reese_Bass.fxp", "Reese_Bass_2.fxp", "Reese Bass 3.fxp", "Sub_Bass.fxp"]):
+                (Path(origem) / nome).write_bytes(f"conteudo {indice}".encode())
+            assert executar_cli(["organizar", "-o", origem, "-d", destino, "--modo", "copiar",
+                                "--formato", "json", "--saida", os.devnull]) == SAIDA_OK
+
+            saida = Path(origem) / "nomes.json"
+            codigo = executar_cli(["analisar-nomes", "-d", destino, "-c", "Bass", "--formato", "json", "--saida", str(saida)])
+            assert codigo == SAIDA_OK
+            resultado = json.loads(saida.read_text(encoding="utf-8"))
+            assert [c["categoria"] for c in resultado["categorias"]] == ["Bass"]
+            grupos = resultado["categorias"][0]["grupos"]
+            assert grupos == [
+                {"rotulo": "reese_bass", "arquivos": ["Reese Bass 3.fxp", "Reese_Bass.fxp", "Reese_Bass_2.fxp"]}
+            ], grupos
+            assert "arquivos_movidos" not in resultado
+
+            codigo = executar_cli(["analisar-nomes", "-d", destino, "--agrupar", "--formato", "json", "--saida", str(saida)])
+            assert codigo == SAIDA_OK
+            assert json.loads(saida.read_text(encoding="utf-8"))["arquivos_movidos"] == 3
+            assert (Path(destino) / "Bass" / "reese_bass" / "Reese_Bass_2.fxp").is_file()
+            assert (Path(destino) / "Bass" / "Sub_Bass.fxp").is_file()
+
+            # O catálogo passa a apontar para a subpasta
+            with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                resultados = catalogo.buscar(nome="reese")["resultados"]
+                destinos = sorted(d["destino"] for item in resultados for d in item["destinos"])
+            assert len(destinos) == 3
+            assert all(os.path.join("Bass", "reese_bass") in d for d in destinos), destinos
+
+            # Opções inválidas
+            try:
+                executar_cli(["analisar-nomes", "-d", destino, "--limiar", "1.5"])
+                assert False, "Deveria rejeitar --limiar > 1"
+            except SystemExit:
+                pass
+
+    print("✅ test_cli_analisar_nomes passou")
+
+
+def executar_testes_analise_nomes():
+    """Executa todos os testes da análise de nomes."""
+    print("\n🔤 TESTES DE ANÁLISE DE NOMES")
+    print("─" * 40)
+
+    testes = [
+        test_normalizar_stem,
+        test_agrupar_nomes,
+        test_analisar_pasta,
+        test_cli_analisar_nomes,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_analise_nomes()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
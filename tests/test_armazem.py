@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Armazém de Conteúdo - Serum Preset Organizer
+=======================================================
+Testes para o layout .store + vínculos nas pastas de categoria.
+"""
+
+import sys
+import os
+import json
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.armazem import PASTA_ARMAZEM, ArmazemConteudo, mover_vinculo
+from src.manipulador_arquivos import (
+    calcular_digest_arquivo,
+    organizar_presets,
+    organizar_presets_async,
+    organizar_presets_multiplas_origens,
+)
+from src.metricas import MetricasExecucao
+
+
+def _criar_biblioteca(pasta: Path):
+    """Um preset em duas categorias, uma duplicata (mesmas categorias) e um preset simples."""
+    (pasta / "Bass Lead Growl.fxp").write_bytes(b"growl" * 200)
+    (pasta / "Growl Lead Bass Copia.fxp").write_bytes(b"growl" * 200)  # Duplicata
+    (pasta / "Soft Pad.fxp").write_bytes(b"pad" * 100)
+
+
+def test_vinculos_em_vez_de_copias():
+    """Testa que cada conteúdo é guardado uma vez e as categorias recebem hardlinks."""
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_biblioteca(Path(origem))
+        armazem = ArmazemConteudo(destino)
+        metricas = MetricasExecucao()
+
+        stats = organizar_presets(origem, destino, modo_mover=False, metricas=metricas, armazem=armazem)
+
+        assert stats["total_duplicatas_ignoradas"] == 1
+        assert stats["total_multi_categoria"] == 1
+        assert armazem.para_dict()["objetos"] == 2
+        # Só os conteúdos únicos são escritos, não uma cópia por categoria
+        assert stats["metricas"]["bytes_escritos"] == 1000 + 300
+
+        objeto = armazem.caminho_objeto(calcular_digest_arquivo(Path(origem) / "Bass Lead Growl.fxp"))
+        assert objeto.parent.parent == Path(destino) / PASTA_ARMAZEM
+        # Qual das duplicatas é vinculada depende da ordem do scan
+        vinculos = [p for p in Path(destino).glob("*/*.fxp") if os.path.samefile(p, objeto)]
+        assert sorted(p.parent.name for p in vinculos) == ["Bass", "Lead"], vinculos
+        assert os.stat(objeto).st_nlink == 3
+
+        # Nova execução, outra origem: nada é copiado, só vinculado (entre execuções)
+        with tempfile.TemporaryDirectory() as outra:
+            (Path(outra) / "Growl Bass Renomeado.fxp").write_bytes(b"growl" * 200)
+            stats = organizar_presets(outra, destino, modo_mover=False, armazem=ArmazemConteudo(destino))
+            assert stats["metricas"]["bytes_escritos"] == 0
+            assert armazem.para_dict()["objetos"] == 2
+            assert os.path.samefile(Path(destino) / "Bass" / "Growl Bass Renomeado.fxp", objeto)
+
+        # Reexecução da mesma origem: vínculos já existem
+        stats = organizar_presets(origem, destino, modo_mover=False, armazem=armazem)
+        assert stats["total_copias_realizadas"] == 0
+
+    print("✅ test_vinculos_em_vez_de_copias passou")
+
+
+def test_mover_e_leitura_unica():
+    """Testa mover (origem vai para o armazém), leitura única e o motor assíncrono."""
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_biblioteca(Path(origem))
+        armazem = ArmazemConteudo(destino)
+        stats = organizar_presets(origem, destino, modo_mover=True, armazem=armazem)
+        assert not stats["erros"], stats["erros"]
+        restantes = list(Path(origem).iterdir())
+        assert len(restantes) == 1, "Só a duplicata fica na origem"
+        assert restantes[0].read_bytes() == b"growl" * 200
+        assert armazem.para_dict()["objetos"] == 2
+
+    for motor in ("leitura_unica", "async"):
+        with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+            _criar_biblioteca(Path(origem))
+            armazem = ArmazemConteudo(destino)
+            if motor == "async":
+                stats = asyncio.run(organizar_presets_async(
+                    origem, destino, modo_mover=False, concorrencia=4, armazem=armazem
+                ))
+            else:
+                stats = organizar_presets(origem, destino, modo_mover=False, leitura_unica=True, armazem=armazem)
+            assert not stats["erros"], stats["erros"]
+            assert stats["total_copias_realizadas"] == 3, motor
+            assert armazem.para_dict()["objetos"] == 2, motor
+            assert not (Path(destino) / ".serum_parcial").exists()
+
+    print("✅ test_mover_e_leitura_unica passou")
+
+
+def test_symlink_e_fallback_sem_hardlink():
+    """Testa symlinks relativos (também ao mover de pasta) e a cópia quando não há hardlink."""
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_biblioteca(Path(origem))
+        armazem = ArmazemConteudo(destino, "symlink")
+        organizar_presets(origem, destino, modo_mover=False, armazem=armazem)
+
+        vinculo = Path(destino) / "Pad" / "Soft Pad.fxp"
+        assert vinculo.is_symlink() and not os.path.isabs(os.readlink(vinculo))
+        subpasta = vinculo.parent / "Soft"
+        subpasta.mkdir()
+        mover_vinculo(vinculo, subpasta / vinculo.name)
+        assert (subpasta / vinculo.name).read_bytes() == b"pad" * 100, "Symlink continua válido"
+        assert not os.path.lexists(vinculo)
+
+        try:
+            ArmazemConteudo(destino, "reflink")
+            assert False, "Deveria rejeitar vínculo inválido"
+        except ValueError:
+            pass
+
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_biblioteca(Path(origem))
+        armazem = ArmazemConteudo(destino)
+        armazem.hardlink_indisponivel = True  # Ex: exFAT
+        stats = organizar_presets(origem, destino, modo_mover=False, armazem=armazem)
+        assert stats["total_copias_realizadas"] == 3
+        copia = Path(destino) / "Pad" / "Soft Pad.fxp"
+        assert copia.read_bytes() == b"pad" * 100
+        assert os.stat(copia).st_nlink == 1
+
+    print("✅ test_symlink_e_fallback_sem_hardlink passou")
+
+
+def test_cli_armazem():
+    """Testa --armazem na CLI com várias origens: resumo JSON com os objetos guardados."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as origem2, \
+            tempfile.TemporaryDirectory() as destino:
+        _criar_biblioteca(Path(origem))
+        (Path(origem2) / "Growl Lead.fxp").write_bytes(b"growl" * 200)
+
+        saida = Path(origem) / "resumo.json"
+        codigo = executar_cli([
+            "organizar", "-o", origem, "-o", origem2, "-d", destino, "--modo", "copiar",
+            "--armazem", "--formato", "json", "--saida", str(saida)
+        ])
+        assert codigo == SAIDA_OK
+        resumo = json.loads(saida.read_text(encoding="utf-8"))
+        assert resumo["armazem"]["objetos"] == 2
+        assert resumo["armazem"]["vinculo"] == "hardlink"
+        assert resumo["estatisticas"]["total_duplicatas_ignoradas"] == 2
+
+        stats = organizar_presets_multiplas_origens(
+            [origem, origem2], destino, modo_mover=False, armazem=ArmazemConteudo(destino)
+        )
+        assert stats["total_copias_realizadas"] == 0, "Tudo já vinculado"
+
+    print("✅ test_cli_armazem passou")
+
+
+def executar_testes_armazem():
+    """Executa todos os testes do armazém de conteúdo."""
+    print("\n🗄️  TESTES DO ARMAZÉM DE CONTEÚDO")
+    print("─" * 40)
+
+    testes = [
+        test_vinculos_em_vez_de_copias,
+        test_mover_e_leitura_unica,
+        test_symlink_e_fallback_sem_hardlink,
+        test_cli_armazem,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_armazem()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Catálogo - Serum Preset Organizer
+============================================
+Testes para o catálogo SQLite gravado no destino a cada execução.
+"""
+
+import sys
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.catalogo import CatalogoBiblioteca, NOME_CATALOGO, caminho_catalogo
+
+
+def test_catalogo_registra_execucao():
+    """Testa presets, origens (incluindo duplicatas) e colocações multi-categoria."""
+    from src.manipulador_arquivos import organizar_presets
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            (Path(origem) / "Bass_Lead_Growl.fxp").write_bytes(b"growl")
+            (Path(origem) / "Pad_Soft.fxp").write_bytes(b"pad")
+            (Path(origem) / "Copia_Pad.fxp").write_bytes(b"pad")  # Duplicata
+
+            with CatalogoBiblioteca.para_destino(destino, tamanho_lote=1) as catalogo:
+                execucao = catalogo.iniciar_execucao([origem], destino, False)
+                stats = organizar_presets(origem, destino, modo_mover=False, catalogo=catalogo)
+                catalogo.finalizar_execucao(stats)
+
+                contagem = catalogo.contar()
+                assert contagem["presets"] == 2, "Um preset por conteúdo"
+                assert contagem["origens"] == 3, "Toda origem vista é registrada"
+                assert contagem["colocacoes"] == 3, "Bass + Lead + Pad"
+                assert contagem["execucoes"] == 1
+
+                growl = catalogo.consultar_digest(hashlib.md5(b"growl").hexdigest())
+                assert growl["preset"]["nome"] == "Bass_Lead_Growl.fxp"
+                assert sorted(d["categoria"] for d in growl["destinos"]) == ["Bass", "Lead"]
+
+                pad = catalogo.consultar_digest(hashlib.md5(b"pad").digest())
+                assert len(pad["origens"]) == 2
+                assert [o["duplicata"] for o in pad["origens"]].count(True) == 1
+
+                execucoes = catalogo.execucoes()
+                assert execucoes[0]["id"] == execucao
+                assert execucoes[0]["fim"] is not None
+                assert execucoes[0]["estatisticas"]["total_duplicatas_ignoradas"] == 1
+
+            assert caminho_catalogo(destino).exists()
+
+    print("✅ test_catalogo_registra_execucao passou")
+
+
+def test_catalogo_carrega_registro():
+    """Testa que o catálogo reconstrói o registro de hashes de execuções anteriores."""
+    from src.manipulador_arquivos import organizar_presets
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            (Path(origem) / "Bass_A.fxp").write_bytes(b"a")
+            (Path(origem) / "Lead_B.fxp").write_bytes(b"b")
+
+            with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                catalogo.iniciar_execucao([origem], destino, False)
+                stats = organizar_presets(origem, destino, modo_mover=False, catalogo=catalogo)
+                catalogo.finalizar_execucao(stats)
+
+                registro = catalogo.carregar_registro()
+                assert len(registro) == 2
+                assert registro[hashlib.md5(b"a").digest()] == str(Path(destino) / "Bass" / "Bass_A.fxp")
+
+                # Destinos apagados do disco não entram no registro
+                (Path(destino) / "Lead" / "Lead_B.fxp").unlink()
+                assert len(catalogo.carregar_registro()) == 1
+                assert len(catalogo.carregar_registro(verificar_existencia=False)) == 2
+
+                # Registrar sem execução ativa é erro de uso
+                try:
+                    catalogo.registrar_arquivo(Path(origem) / "Bass_A.fxp", b"\0" * 16, 1)
+                    assert False, "Deveria exigir iniciar_execucao()"
+                except RuntimeError:
+                    pass
+
+    print("✅ test_catalogo_carrega_registro passou")
+
+
+def test_catalogo_reverificacao_move_colocacao():
+    """Testa que organizar duas vezes (a segunda movendo de Uncategorized) deixa uma colocação por arquivo."""
+    from src.config import CATEGORIA_PADRAO
+    from src.manipulador_arquivos import organizar_presets
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            (Path(origem) / "Zorp Thing.fxp").write_bytes(b"zorp")
+            (Path(origem) / "Qwzx.fxp").write_bytes(b"qwzx")
+            uncategorized = Path(destino) / CATEGORIA_PADRAO
+
+            # 1ª execução: sem regra para "zorp", tudo vai para Uncategorized
+            with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                catalogo.iniciar_execucao([origem], destino, False)
+                stats = organizar_presets(origem, destino, modo_mover=False, catalogo=catalogo,
+                                          classificador=lambda nome: [CATEGORIA_PADRAO])
+                catalogo.finalizar_execucao(stats)
+
+            # 2ª execução: re-verificação de Uncategorized com a regra nova (move)
+            def classificar(nome):
+                return ["Lead"] if "zorp" in nome.lower() else [CATEGORIA_PADRAO]
+
+            with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                catalogo.iniciar_execucao([str(uncategorized)], destino, True)
+                stats = organizar_presets(str(uncategorized), destino, modo_mover=True, catalogo=catalogo,
+                                          classificador=classificar)
+                catalogo.finalizar_execucao(stats)
+
+                zorp = catalogo.consultar_digest(hashlib.md5(b"zorp").digest())
+                assert [d["destino"] for d in zorp["destinos"]] == [str(Path(destino) / "Lead" / "Zorp Thing.fxp")]
+                qwzx = catalogo.consultar_digest(hashlib.md5(b"qwzx").digest())
+                assert [d["destino"] for d in qwzx["destinos"]] == [str(uncategorized / "Qwzx.fxp")]
+                assert catalogo.contar()["colocacoes"] == 2
+                assert all(os.path.exists(destino_) for destino_, _, _, _ in catalogo.listar_colocacoes())
+
+    print("✅ test_catalogo_reverificacao_move_colocacao passou")
+
+
+def test_cli_grava_catalogo():
+    """Testa que a CLI grava o catálogo por padrão e --sem-catalogo o desativa."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            (Path(origem) / "Bass_A.fxp").write_bytes(b"a")
+            saida = Path(origem) / "resumo.json"
+
+            codigo = executar_cli([
+                "organizar", "-o", origem, "-d", destino, "--modo", "copiar",
+                "--formato", "json", "--saida", str(saida)
+            ])
+            assert codigo == SAIDA_OK
+            resumo = json.loads(saida.read_text(encoding="utf-8"))
+            assert resumo["catalogo"]["caminho"] == str(Path(destino) / NOME_CATALOGO)
+            assert resumo["catalogo"]["execucao"] == 1
+
+            with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                assert catalogo.contar()["presets"] == 1
+
+        with tempfile.TemporaryDirectory() as destino:
+            codigo = executar_cli([
+                "organizar", "-o", origem, "-d", destino, "--modo", "copiar",
+                "--formato", "json", "--saida", str(saida), "--sem-catalogo"
+            ])
+            assert codigo == SAIDA_OK
+            assert not caminho_catalogo(destino).exists()
+            assert "catalogo" not in json.loads(saida.read_text(encoding="utf-8"))
+
+    print("✅ test_cli_grava_catalogo passou")
+
+
+def executar_testes_catalogo():
+    """Executa todos os testes do catálogo."""
+    print("\n🗃️  TESTES DO CATÁLOGO")
+    print("─" * 40)
+
+    testes = [
+        test_catalogo_registra_execucao,
+        test_catalogo_carrega_registro,
+        test_catalogo_reverificacao_move_colocacao,
+        test_cli_grava_catalogo,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_catalogo()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
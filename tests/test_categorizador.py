@@ -11,8 +11,11 @@ import os
 # Adiciona o diretório raiz ao path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.categorizador import identificar_categoria, identificar_categorias, validar_extensao
-from src.config import CATEGORIA_PADRAO
+from src.categorizador import (
+    identificar_categoria, identificar_categorias, validar_extensao, tokenizar_nome,
+    determinar_categorias, identificar_categoria_especial, compilar_alternativas, DetectorEspecial,
+)
+from src.config import CATEGORIA_PADRAO, CATEGORIA_CORROMPIDOS, CATEGORIA_CUSTOMIZADOS
 
 
 def test_identificar_categoria_bass():
@@ -170,6 +173,60 @@ def test_keywords_curtas_word_boundary():
     print("✅ test_keywords_curtas_word_boundary passou")
 
 
+def test_tokenizar_nome():
+    """Testa a divisão do nome em palavras para o índice de busca."""
+    assert tokenizar_nome("Deep_Bass-Growl 02.fxp") == ["deep", "bass", "growl", "02"]
+    assert tokenizar_nome("/destino/Bass/BASS bass.fxp") == ["bass"], "Sem repetição e sem a pasta"
+    assert tokenizar_nome("Pad.Etéreo (v2).serumpreset") == ["pad", "etéreo", "v2"]
+    assert tokenizar_nome("___.fxp") == []
+    
+    print("✅ test_tokenizar_nome passou")
+
+
+def test_categorias_especiais():
+    """Testa os detectores compilados (hash, português, padrão customizado) e a ordem de prioridade."""
+    assert identificar_categoria_especial("f892346344.fxp") == CATEGORIA_CORROMPIDOS
+    assert identificar_categoria_especial("116065.FXP") == CATEGORIA_CORROMPIDOS
+    assert identificar_categoria_especial("Noite Estrelada.fxp") == CATEGORIA_CUSTOMIZADOS
+    assert identificar_categoria_especial("SALAO 2.fxp") == CATEGORIA_CUSTOMIZADOS
+    assert identificar_categoria_especial("future 3d.fxp") == CATEGORIA_CUSTOMIZADOS
+    assert identificar_categoria_especial("Random_Name_123.fxp") is None
+    
+    # Só sem keyword: com keyword, a categoria especial não é consultada
+    assert determinar_categorias("Noite Bass.fxp") == ["Bass"]
+    assert determinar_categorias("Noite Azul.fxp") == [CATEGORIA_CUSTOMIZADOS]
+    assert determinar_categorias("Random_Name_123.fxp") == [CATEGORIA_PADRAO]
+    
+    # Árvore de prefixos equivale a any(palavra in texto)
+    palavras = ["sala", "salao", "sino", "s", "mao"]
+    padrao = compilar_alternativas(palavras)
+    for texto in ["", "xsalx", "mãos", "amao", "sin", "salao", "abc"]:
+        assert (padrao.search(texto) is not None) == any(p in texto for p in palavras), texto
+    assert compilar_alternativas([]).search("qualquer") is None
+    assert compilar_alternativas(["", "x"]).search("abc") is not None
+    
+    detector = DetectorEspecial(r"^\d+\.fxp$", ["casa"], [r"^meu\s*\d+", r"^teste"])
+    assert detector.categoria("123.fxp") == CATEGORIA_CORROMPIDOS
+    assert detector.categoria("Casa Nova.fxp") == CATEGORIA_CUSTOMIZADOS
+    assert detector.categoria("MEU 2.fxp") == detector.categoria("teste.fxp") == CATEGORIA_CUSTOMIZADOS
+    assert detector.categoria("f892346344.fxp") is None
+    
+    # Regex único: mesma resposta que os detectores em sequência, inclusive com
+    # $ no fim do radical, nome tipo hash com palavra em português e caminhos
+    detector = DetectorEspecial(r"^\d+\.fxp$", ["casa", "123"], [r"^meu\s*\d+$", r"^teste"])
+    for nome, regra in [("123.fxp", "nome tipo hash"), ("1234 casa.fxp", "português"),
+                        ("meu 2.fxp", "padrão customizado"), ("meu 2b.fxp", None),
+                        ("meu\n2.fxp", "padrão customizado"), ("pasta/teste.fxp", "padrão customizado"),
+                        ("testes", "padrão customizado"), (".fxp", None), ("meu 2.", None)]:
+        sequencial = next((r for r, detectar in (("nome tipo hash", detector.eh_hash),
+                                                  ("português", detector.eh_portugues),
+                                                  ("padrão customizado", detector.eh_padrao_customizado))
+                           if detectar(nome)), None)
+        assert detector.regra(nome) == sequencial == regra, nome
+    
+    print("✅ test_categorias_especiais passou")
+
+
 def executar_testes_categorizador():
     """Executa todos os testes do categorizador."""
     print("\n📂 TESTES DO CATEGORIZADOR")
@@ -189,6 +246,8 @@ def executar_testes_categorizador():
         test_compatibilidade_identificar_categoria,
         test_keywords_curtas_funcionam,
         test_keywords_curtas_word_boundary,
+        test_tokenizar_nome,
+        test_categorias_especiais,
     ]
     
     passou = 0
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Classificador por Tokens - Serum Preset Organizer
+============================================================
+Testes de paridade com o categorizador: os casos de test_categorizador.py
+rodam com o novo motor, e um corpus grande de nomes sintéticos (mais casos
+de borda) precisa dar as mesmas categorias nos dois.
+"""
+
+import sys
+import os
+import random
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tests.test_categorizador as casos_categorizador
+from benchmarks.gerador_biblioteca import gerar_nome
+from src.categorizador import determinar_categorias, identificar_categorias, limpar_nome_para_analise
+from src.classificador_tokens import AutomatoSubstrings, ClassificadorTokens
+from src.config import CATEGORIA_CORROMPIDOS, CATEGORIA_CUSTOMIZADOS, CATEGORIA_PADRAO
+
+
+# Nomes que exercitam os caminhos menos comuns dos dois motores
+CASOS_DE_BORDA = [
+    "Future Bass - LEAD 13.fxp",
+    "DnB - LEAD Heavy.fxp",
+    "drumdrum and bass& bass.fxp",      # Remover um gênero forma outro
+    "RKU_VLM_BT3_Growl.fxp",            # Prefixo com "_" (nome original)
+    "Subbass (Dubstep) [v2].fxp",
+    "sub.bass.fxp",
+    "BA.fxp", "ba", "xba.fxp", "ba-01.fxp", "LD01.fxp",
+    "  Sub  __ Lead  .fxp",
+    "Screamer Pluck Bell Flute.fxp",
+    "f12345678.fxp", "123456.fxp", "future 3d.fxp", "Noite Azul.fxp",
+    ".fxp", "a.b.fxp", "",
+    "Pé Grave Bäss.fxp", "ſub Lead.fxp", "Ｌead.fxp",   # Não-ASCII: motor original
+]
+
+
+def _corpus(quantidade: int = 3000, semente: int = 7) -> list:
+    rng = random.Random(semente)
+    return [gerar_nome(rng, indice) for indice in range(quantidade)] + CASOS_DE_BORDA
+
+
+def test_casos_do_categorizador():
+    """Roda os casos de test_categorizador.py com o classificador por tokens."""
+    classificador = ClassificadorTokens()
+    original = casos_categorizador.identificar_categorias
+    casos_categorizador.identificar_categorias = classificador.identificar_categorias
+    try:
+        casos = [funcao for nome, funcao in vars(casos_categorizador).items() if nome.startswith("test_")]
+        assert len(casos) >= 13, casos
+        for caso in casos:
+            caso()
+    finally:
+        casos_categorizador.identificar_categorias = original
+    print("✅ test_casos_do_categorizador passou")
+
+
+def test_paridade_corpus():
+    """Testa que os dois motores dão as mesmas categorias num corpus grande."""
+    classificador = ClassificadorTokens()
+    diferentes = []
+    for nome in _corpus():
+        if set(classificador.identificar_categorias(nome)) != set(identificar_categorias(nome)):
+            diferentes.append(nome)
+        elif set(classificador.determinar_categorias(nome)) != set(determinar_categorias(nome)):
+            diferentes.append(nome)
+        elif classificador.limpar_nome(nome) != limpar_nome_para_analise(nome):
+            diferentes.append(nome)
+    assert not diferentes, diferentes[:10]
+
+    # Categorias especiais e padrão só quando nenhuma keyword casa
+    assert classificador.determinar_categorias("f12345678.fxp") == [CATEGORIA_CORROMPIDOS]
+    assert classificador.determinar_categorias("Noite Azul.fxp") == [CATEGORIA_CUSTOMIZADOS]
+    assert classificador.determinar_categorias("Random_Name_123.fxp") == [CATEGORIA_PADRAO]
+    # Resultado em ordem estável (a do mapa)
+    assert classificador.identificar_categorias("Lead Bass.fxp") == ["Bass", "Lead"]
+    print("✅ test_paridade_corpus passou")
+
+
+def test_automato_e_regras_proprias():
+    """Testa keywords sobrepostas no autômato e um classificador com regras próprias."""
+    automato = AutomatoSubstrings([("scream", "A"), ("screamer", "B"), ("amer", "C"), ("he", "D"), ("she", "E")])
+    assert automato.buscar("ushers screamer") == {"A", "B", "C", "D", "E"}
+    assert automato.buscar("scre") == set()
+    assert AutomatoSubstrings([]).buscar("qualquer") == set()
+
+    classificador = ClassificadorTokens(
+        mapa={"Vox": ["vocal", "vx", "chop_"], "Fx": ["riser", "vx fx"]},
+        keywords_curtas={"vx", "vx fx"},
+        termos_genero=["vocal house"],
+    )
+    assert classificador.identificar_categorias("VX_Riser.fxp") == ["Vox", "Fx"]
+    assert classificador.identificar_categorias("vx-fx.fxp") == ["Vox", "Fx"]  # Curta com várias palavras
+    assert classificador.identificar_categorias("Vocal House Pad.fxp") == []
+    assert classificador.identificar_categorias("CHOP_01.fxp") == ["Vox"]
+    assert classificador.identificar_categorias("vxfx.fxp") == []
+    assert classificador.identificar_categorias("Vocal Ré.fxp") == ["Vox"]
+    lote = classificador.classificar_lote(["vx.fxp", "vx.fxp", "nada.fxp"])
+    assert lote == {"vx.fxp": ["Vox"], "nada.fxp": [CATEGORIA_PADRAO]}
+    print("✅ test_automato_e_regras_proprias passou")
+
+
+def executar_testes_classificador_tokens():
+    """Executa todos os testes do classificador por tokens."""
+    print("\n🔤 TESTES DO CLASSIFICADOR POR TOKENS")
+    print("─" * 40)
+
+    testes = [
+        test_casos_do_categorizador,
+        test_paridade_corpus,
+        test_automato_e_regras_proprias,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_classificador_tokens()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
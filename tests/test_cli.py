@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Módulo de Linha de Comando - Serum Preset Organizer
+==============================================================
+Testes para o modo não-interativo (argparse, resumo JSON e eventos NDJSON).
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cli import executar_cli, SAIDA_OK
+
+
+def test_cli_resumo_json():
+    """Testa que o formato json gera um resumo serializável com estatísticas."""
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            origem_path = Path(origem)
+            (origem_path / "Deep_Bass.fxp").write_bytes(b"bass1")
+            (origem_path / "Epic_Lead.fxp").write_bytes(b"lead1")
+            (origem_path / "Copia_Bass.fxp").write_bytes(b"bass1")  # Duplicata
+
+            saida = Path(destino) / "resumo.json"
+            codigo = executar_cli([
+                "organizar", "--origem", origem, "--destino", destino,
+                "--formato", "json", "--saida", str(saida)
+            ])
+
+            assert codigo == SAIDA_OK
+            resumo = json.loads(saida.read_text(encoding="utf-8"))
+
+            assert resumo["evento"] == "resumo"
+            assert resumo["estatisticas"]["total_arquivos_origem"] == 3
+            assert resumo["estatisticas"]["total_duplicatas_ignoradas"] == 1
+            assert "_hashes" not in resumo["estatisticas"], "Campos internos não devem ir para o JSON"
+            assert "arquivos_processados" not in resumo["estatisticas"]
+            assert resumo["registro_hashes"]["entradas"] == 2
+            assert (Path(destino) / "Bass" / "Deep_Bass.fxp").exists()
+
+    print("✅ test_cli_resumo_json passou")
+
+
+def test_cli_eventos_ndjson():
+    """Testa que o formato ndjson emite um evento por arquivo e um resumo final."""
+    with tempfile.TemporaryDirectory() as origem1:
+        with tempfile.TemporaryDirectory() as origem2:
+            with tempfile.TemporaryDirectory() as destino:
+                (Path(origem1) / "Bass_A.fxp").write_bytes(b"a")
+                (Path(origem2) / "Pad_B.fxp").write_bytes(b"b")
+
+                saida = Path(destino) / "eventos.ndjson"
+                codigo = executar_cli([
+                    "organizar", "-o", origem1, "-o", origem2, "-d", destino,
+                    "--modo", "copiar", "--formato", "ndjson", "--saida", str(saida)
+                ])
+
+                assert codigo == SAIDA_OK
+                eventos = [json.loads(linha) for linha in saida.read_text(encoding="utf-8").splitlines()]
+                tipos = [evento["evento"] for evento in eventos]
+
+                assert tipos.count("pasta") == 2
+                assert tipos.count("arquivo") == 2
+                assert tipos[-1] == "resumo"
+                assert eventos[-1]["estatisticas"]["total_copias_realizadas"] == 2
+
+    print("✅ test_cli_eventos_ndjson passou")
+
+
+def test_cli_metricas_e_profile():
+    """Testa a exportação das métricas em JSON e o dump do cProfile."""
+    import pstats
+    
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            (Path(origem) / "Bass_A.fxp").write_bytes(b"a" * 10)
+            
+            arquivo_metricas = Path(destino) / "metricas.json"
+            arquivo_profile = Path(destino) / "execucao.pstats"
+            saida = Path(destino) / "resumo.json"
+            codigo = executar_cli([
+                "organizar", "-o", origem, "-d", destino, "--formato", "json",
+                "--saida", str(saida),
+                "--metricas-json", str(arquivo_metricas),
+                "--profile", str(arquivo_profile),
+            ])
+            
+            assert codigo == SAIDA_OK
+            metricas = json.loads(arquivo_metricas.read_text(encoding="utf-8"))
+            assert metricas["etapas"]["hash"]["contagem"] == 1
+            assert metricas["bytes_escritos"] == 10
+            
+            resumo = json.loads(saida.read_text(encoding="utf-8"))
+            assert resumo["estatisticas"]["metricas"] == metricas
+            
+            # O arquivo de profile deve ser legível pelo pstats
+            assert pstats.Stats(str(arquivo_profile)).total_calls > 0
+    
+    print("✅ test_cli_metricas_e_profile passou")
+
+
+def executar_testes_cli():
+    """Executa todos os testes da linha de comando."""
+    print("\n⌨️  TESTES DA LINHA DE COMANDO")
+    print("─" * 40)
+
+    testes = [
+        test_cli_resumo_json,
+        test_cli_eventos_ndjson,
+        test_cli_metricas_e_profile,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_cli()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
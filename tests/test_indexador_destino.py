@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Indexador do Destino - Serum Preset Organizer
+========================================================
+Testes para o registro pré-preenchido com a biblioteca existente e o cache por (tamanho, mtime).
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.armazem import ArmazemConteudo
+from src.indexador_destino import NOME_CACHE, CacheDigests, indexar_destino
+from src.manipulador_arquivos import calcular_digest_arquivo, organizar_presets
+from src.metricas import MetricasExecucao
+
+
+def _criar_destino(destino: Path):
+    """Biblioteca organizada com dois presets e uma pasta interna que não é indexada."""
+    (destino / "Bass").mkdir()
+    (destino / "Pad").mkdir()
+    (destino / ".serum_parcial").mkdir()
+    (destino / "Bass" / "Deep Bass.fxp").write_bytes(b"deep" * 100)
+    (destino / "Pad" / "Warm Pad.fxp").write_bytes(b"warm" * 100)
+    (destino / ".serum_parcial" / "Lixo.fxp").write_bytes(b"lixo")
+    (destino / "Bass" / "leia-me.txt").write_text("não é preset")
+
+
+def test_indexar_e_cache():
+    """Testa o índice do destino e a revalidação do cache por tamanho e mtime."""
+    with tempfile.TemporaryDirectory() as destino:
+        _criar_destino(Path(destino))
+        metricas = MetricasExecucao()
+
+        registro, resumo = indexar_destino(destino, metricas=metricas)
+        assert resumo["arquivos"] == 2 and resumo["calculados"] == 2 and resumo["em_cache"] == 0
+        assert len(registro) == 2
+        digest = calcular_digest_arquivo(Path(destino) / "Bass" / "Deep Bass.fxp")
+        assert registro[digest] == os.path.join(os.path.abspath(destino), "Bass", "Deep Bass.fxp")
+        assert metricas.para_dict()["etapas"]["indexacao"]["contagem"] == 1
+        assert (Path(destino) / NOME_CACHE).exists()
+
+        # Segunda vez: tudo vem do cache, nada é lido
+        _, resumo = indexar_destino(destino)
+        assert resumo["em_cache"] == 2 and resumo["calculados"] == 0
+
+        # Arquivo alterado é relido; arquivo apagado sai do cache
+        alterado = Path(destino) / "Pad" / "Warm Pad.fxp"
+        alterado.write_bytes(b"outro conteudo")
+        os.utime(alterado, ns=(1, 1))
+        (Path(destino) / "Bass" / "Deep Bass.fxp").unlink()
+        registro, resumo = indexar_destino(destino)
+        assert resumo["calculados"] == 1 and resumo["arquivos"] == 1
+        assert calcular_digest_arquivo(alterado) in registro
+        with CacheDigests.para_destino(destino) as cache:
+            assert list(cache.carregar()) == [str(alterado)]
+
+        # Destino inexistente ou ignorado: nada a indexar
+        _, resumo = indexar_destino(os.path.join(destino, "nao_existe"))
+        assert resumo["arquivos"] == 0
+        _, resumo = indexar_destino(destino, ignorar=[destino])
+        assert resumo["arquivos"] == 0
+
+    print("✅ test_indexar_e_cache passou")
+
+
+def test_indexar_armazem_sem_ler():
+    """Testa que objetos do armazém e os seus hardlinks entram no índice sem leitura."""
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        (Path(origem) / "Bass Lead Growl.fxp").write_bytes(b"growl" * 50)
+        (Path(origem) / "Soft Pad.fxp").write_bytes(b"pad" * 50)
+        organizar_presets(origem, destino, modo_mover=False, armazem=ArmazemConteudo(destino))
+
+        registro, resumo = indexar_destino(destino, usar_cache=False)
+        assert resumo["objetos_armazem"] == 2
+        assert resumo["arquivos"] == 3 and resumo["calculados"] == 0
+        assert len(registro) == 2
+        # O "original" é o caminho na categoria, não o objeto
+        assert all(".store" not in registro[digest] for digest in registro)
+        assert not (Path(destino) / NOME_CACHE).exists()
+
+    print("✅ test_indexar_armazem_sem_ler passou")
+
+
+def test_cli_indexar_destino():
+    """Testa que uma reimportação com outros nomes não copia nada com --indexar-destino."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_destino(Path(destino))
+        (Path(origem) / "Renomeado Lead.fxp").write_bytes(b"deep" * 100)  # Já está em Bass
+        (Path(origem) / "Novo Pluck.fxp").write_bytes(b"novo")
+
+        saida = Path(origem) / "resumo.json"
+        codigo = executar_cli([
+            "organizar", "-o", origem, "-d", destino, "--modo", "copiar", "--indexar-destino",
+            "--sem-catalogo", "--formato", "json", "--saida", str(saida)
+        ])
+        assert codigo == SAIDA_OK
+        resumo = json.loads(saida.read_text(encoding="utf-8"))
+        assert resumo["estatisticas"]["total_copias_realizadas"] == 1
+        assert resumo["estatisticas"]["total_duplicatas_ignoradas"] == 1
+        assert resumo["indice_destino"]["arquivos"] == 2
+        assert not (Path(destino) / "Lead" / "Renomeado Lead.fxp").exists()
+
+        # Re-verificação: a origem dentro do destino não vira "duplicata de si mesma"
+        uncategorized = Path(destino) / "Uncategorized"
+        uncategorized.mkdir()
+        (uncategorized / "Agora Pad.fxp").write_bytes(b"agora")
+        codigo = executar_cli([
+            "organizar", "-o", str(uncategorized), "-d", destino, "--indexar-destino",
+            "--sem-catalogo", "--formato", "json", "--saida", str(saida)
+        ])
+        assert codigo == SAIDA_OK
+        assert (Path(destino) / "Pad" / "Agora Pad.fxp").exists()
+        assert not (uncategorized / "Agora Pad.fxp").exists()
+
+    print("✅ test_cli_indexar_destino passou")
+
+
+def executar_testes_indexador_destino():
+    """Executa todos os testes do indexador do destino."""
+    print("\n📇 TESTES DO INDEXADOR DO DESTINO")
+    print("─" * 40)
+
+    testes = [
+        test_indexar_e_cache,
+        test_indexar_armazem_sem_ler,
+        test_cli_indexar_destino,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_indexador_destino()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Índice de Busca - Serum Preset Organizer
+===================================================
+Testes para o índice invertido, os bitmaps de categoria e o subcomando 'consultar'.
+"""
+
+import sys
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.catalogo import CatalogoBiblioteca
+from src.indice_busca import bitmap_de_itens, contar_bits, itens_do_bitmap
+
+
+def _organizar_com_catalogo(origem: str, destino: str):
+    """Organiza a origem registrando a execução no catálogo do destino."""
+    from src.manipulador_arquivos import organizar_presets
+
+    with CatalogoBiblioteca.para_destino(destino) as catalogo:
+        catalogo.iniciar_execucao([origem], destino, False)
+        stats = organizar_presets(origem, destino, modo_mover=False, catalogo=catalogo)
+        catalogo.finalizar_execucao(stats)
+
+
+def _nomes(resultado: dict) -> list:
+    return sorted(Path(item["destinos"][0]["destino"]).name for item in resultado["resultados"])
+
+
+def test_bitmaps():
+    """Testa a conversão entre listas de itens e bitmaps."""
+    itens = [0, 3, 8, 9, 1000, 70000]
+    bitmap = bitmap_de_itens(itens)
+
+    assert contar_bits(bitmap) == len(itens)
+    assert itens_do_bitmap(bitmap) == itens
+    assert itens_do_bitmap(bitmap, limite=3) == [0, 3, 8]
+    assert itens_do_bitmap(bitmap, limite=0) == []
+    assert itens_do_bitmap(bitmap & bitmap_de_itens([9, 70000, 5])) == [9, 70000]
+    assert itens_do_bitmap(0) == [] and bitmap_de_itens([]) == 0
+
+    print("✅ test_bitmaps passou")
+
+
+def test_buscar_categorias_e_nome():
+    """Testa consultas por categorias (AND), trecho do nome e combinações."""
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            for nome in ("Riddim_Bass_01", "Bass_Growl_Dub", "Deep_Bass", "Soft_Pad", "Growl_Lead"):
+                (Path(origem) / f"{nome}.fxp").write_bytes(nome.encode())
+            _organizar_com_catalogo(origem, destino)
+
+            with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                bass_dubstep = catalogo.buscar(["Bass", "Dubstep"])
+                assert bass_dubstep["total"] == 2
+                assert _nomes(bass_dubstep) == ["Bass_Growl_Dub.fxp", "Riddim_Bass_01.fxp"]
+                assert len(bass_dubstep["resultados"][0]["destinos"]) == 2, "Um destino por categoria"
+
+                assert catalogo.buscar(["Bass"])["total"] == 4, "Growl_Lead também é Bass (growl)"
+                assert catalogo.buscar(["Bass"], limite=1)["total"] == 4
+                assert len(catalogo.buscar(["Bass"], limite=1)["resultados"]) == 1
+                assert catalogo.buscar(["Inexistente"])["total"] == 0
+
+                # Trecho do nome: cada termo dentro de alguma palavra do nome
+                assert _nomes(catalogo.buscar(nome="growl")) == ["Bass_Growl_Dub.fxp", "Growl_Lead.fxp"]
+                assert _nomes(catalogo.buscar(nome="GRO lea")) == ["Growl_Lead.fxp"]
+                assert catalogo.buscar(nome="xyz")["total"] == 0
+
+                # Combinação nome + categoria
+                assert _nomes(catalogo.buscar(["Dubstep"], "growl")) == ["Bass_Growl_Dub.fxp"]
+                assert _nomes(catalogo.buscar(["Lead", "Bass"], "growl")) == ["Growl_Lead.fxp"]
+
+                try:
+                    catalogo.buscar()
+                    assert False, "Consulta vazia deveria falhar"
+                except ValueError:
+                    pass
+
+    print("✅ test_buscar_categorias_e_nome passou")
+
+
+def test_indice_incremental_igual_reconstruido():
+    """Testa que o índice atualizado a cada execução equivale ao reconstruído do zero."""
+    with tempfile.TemporaryDirectory() as destino:
+        with tempfile.TemporaryDirectory() as origem1:
+            with tempfile.TemporaryDirectory() as origem2:
+                (Path(origem1) / "Bass_A.fxp").write_bytes(b"a")
+                (Path(origem1) / "Pad_B.fxp").write_bytes(b"b")
+                (Path(origem2) / "Bass_Pad_C.fxp").write_bytes(b"c")
+                (Path(origem2) / "Copia_Bass_A.fxp").write_bytes(b"a")  # Mesmo conteúdo, outra execução
+
+                _organizar_com_catalogo(origem1, destino)
+                _organizar_com_catalogo(origem2, destino)
+
+                with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                    consultas = [(["Bass"], None), (["Pad"], None), (["Bass", "Pad"], None), ([], "bass")]
+                    antes = [catalogo.buscar(categorias, nome) for categorias, nome in consultas]
+                    catalogo.reindexar()
+                    depois = [catalogo.buscar(categorias, nome) for categorias, nome in consultas]
+
+                    assert [r["total"] for r in antes] == [2, 2, 1, 2]
+                    assert [_nomes(r) for r in antes] == [_nomes(r) for r in depois]
+
+    print("✅ test_indice_incremental_igual_reconstruido passou")
+
+
+def test_indice_apos_remover_e_mover():
+    """Testa que remoções e movimentações no destino saem do índice ('consultar -c' e por nome)."""
+    from src.analise_nomes import agrupar_em_subpastas
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            for nome in ("Riddim_Bass_01", "Deep_Bass", "Soft_Pad"):
+                (Path(origem) / f"{nome}.fxp").write_bytes(nome.encode())
+            _organizar_com_catalogo(origem, destino)
+
+            with CatalogoBiblioteca.para_destino(destino) as catalogo:
+                assert catalogo.buscar(["Bass"])["total"] == 2
+
+                # Remoção: o bit da categoria e as palavras do nome saem
+                apagado = Path(destino) / "Bass" / "Deep_Bass.fxp"
+                apagado.unlink()
+                catalogo.remover_destino(str(apagado))
+
+                # Renomeado: busca pelo nome novo, não pelo antigo
+                antigo, novo = Path(destino) / "Pad" / "Soft_Pad.fxp", Path(destino) / "Pad" / "Warm_Pad.fxp"
+                antigo.rename(novo)
+                catalogo.mover_destino(str(antigo), str(novo))
+                assert _nomes(catalogo.buscar(nome="warm")) == ["Warm_Pad.fxp"]
+                assert catalogo.buscar(nome="soft")["total"] == 0
+                assert catalogo.buscar(["Pad"])["total"] == 1
+
+                # Agrupado em subpasta: mesmo nome, caminho novo
+                agrupar_em_subpastas(destino, [{"categoria": "Bass", "grupos": [
+                    {"rotulo": "Riddim", "arquivos": ["Riddim_Bass_01.fxp"]}
+                ]}], catalogo)
+                destinos = [d["destino"] for d in catalogo.buscar(["Bass"], "riddim")["resultados"][0]["destinos"]]
+                assert str(Path(destino) / "Bass" / "Riddim" / "Riddim_Bass_01.fxp") in destinos
+
+                incremental = [catalogo.buscar(["Bass"]), catalogo.buscar(nome="bass"), catalogo.buscar(nome="pad")]
+                catalogo.reindexar()
+                reconstruido = [catalogo.buscar(["Bass"]), catalogo.buscar(nome="bass"), catalogo.buscar(nome="pad")]
+                assert incremental == reconstruido
+
+            saida = Path(origem) / "consulta.json"
+            codigo = executar_cli(["consultar", "-d", destino, "-c", "Bass", "--formato", "json", "--saida", str(saida)])
+            assert codigo == SAIDA_OK
+            resultado = json.loads(saida.read_text(encoding="utf-8"))
+            assert resultado["total"] == 1 == len(resultado["resultados"]), "Removido não conta no total"
+            assert executar_cli(["consultar", "-d", destino, "-n", "deep", "--formato", "json",
+                                 "--saida", str(saida)]) == SAIDA_OK
+            assert json.loads(saida.read_text(encoding="utf-8"))["total"] == 0
+
+    print("✅ test_indice_apos_remover_e_mover passou")
+
+
+def test_cli_consultar():
+    """Testa o subcomando 'consultar' (json e texto) e a validação dos argumentos."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            (Path(origem) / "Riddim_Bass_01.fxp").write_bytes(b"riddim")
+            (Path(origem) / "Soft_Pad.fxp").write_bytes(b"pad")
+            assert executar_cli(["organizar", "-o", origem, "-d", destino, "--modo", "copiar",
+                                 "--formato", "json", "--saida", os.devnull]) == SAIDA_OK
+
+            saida = Path(origem) / "consulta.json"
+            codigo = executar_cli([
+                "consultar", "-d", destino, "-c", "Bass", "-c", "Dubstep",
+                "--digest", hashlib.md5(b"pad").hexdigest(), "--formato", "json", "--saida", str(saida)
+            ])
+            assert codigo == SAIDA_OK
+            resultado = json.loads(saida.read_text(encoding="utf-8"))
+            assert resultado["total"] == 1
+            assert resultado["resultados"][0]["digest"] == hashlib.md5(b"riddim").hexdigest()
+            assert resultado["digest"]["preset"]["nome"] == "Soft_Pad.fxp"
+            assert "tempo_ms" in resultado
+
+            saida_texto = Path(origem) / "consulta.txt"
+            assert executar_cli(["consultar", "-d", destino, "-n", "soft", "--saida", str(saida_texto)]) == SAIDA_OK
+            assert "Soft_Pad.fxp" in saida_texto.read_text(encoding="utf-8")
+
+            for argumentos in (["consultar", "-d", destino],
+                               ["consultar", "-d", origem, "-c", "Bass"],
+                               ["consultar", "-d", destino, "--digest", "xyz"]):
+                try:
+                    executar_cli(argumentos)
+                    assert False, f"Deveria rejeitar {argumentos}"
+                except SystemExit as e:
+                    assert e.code == 2
+
+    print("✅ test_cli_consultar passou")
+
+
+def executar_testes_indice_busca():
+    """Executa todos os testes do índice de busca."""
+    print("\n🔎 TESTES DO ÍNDICE DE BUSCA")
+    print("─" * 40)
+
+    testes = [
+        test_bitmaps,
+        test_buscar_categorias_e_nome,
+        test_indice_incremental_igual_reconstruido,
+        test_indice_apos_remover_e_mover,
+        test_cli_consultar,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_indice_busca()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
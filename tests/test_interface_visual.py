@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Módulo de Interface Visual - Serum Preset Organizer
+==============================================================
+Testes para o reporter de progresso com taxa limitada.
+"""
+
+import sys
+import os
+import io
+import time
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.interface_visual import ReporterProgresso
+
+
+def test_reporter_inativo_fora_de_tty():
+    """Testa que o reporter não desenha nada quando o stream não é um terminal."""
+    stream = io.StringIO()  # isatty() == False
+    
+    with ReporterProgresso(100, stream=stream) as reporter:
+        for i in range(1, 101):
+            reporter.atualizar(i)
+    
+    assert not reporter.ativo
+    assert stream.getvalue() == "", "Nada deveria ser escrito fora de um TTY"
+    assert reporter.contador == 100
+    
+    print("✅ test_reporter_inativo_fora_de_tty passou")
+
+
+def test_reporter_limita_taxa_de_desenho():
+    """Testa que o reporter desenha no máximo N vezes por segundo, mesmo com muitas atualizações."""
+    stream = io.StringIO()
+    total = 100000
+    
+    with ReporterProgresso(total, max_por_segundo=20, stream=stream, ativo=True) as reporter:
+        inicio = time.time()
+        for i in range(1, total + 1):
+            reporter.atualizar(i)
+        time.sleep(0.12)
+        duracao = time.time() - inicio
+    
+    # Desenhos do timer + o desenho final
+    assert reporter.desenhos <= int(duracao * 20) + 2, f"Desenhos demais: {reporter.desenhos}"
+    assert stream.getvalue().endswith(f"({total}/{total})"), "O estado final deve ser desenhado"
+    
+    print("✅ test_reporter_limita_taxa_de_desenho passou")
+
+
+def executar_testes_interface_visual():
+    """Executa todos os testes da interface visual."""
+    print("\n🎨 TESTES DA INTERFACE VISUAL")
+    print("─" * 40)
+    
+    testes = [
+        test_reporter_inativo_fora_de_tty,
+        test_reporter_limita_taxa_de_desenho,
+    ]
+    
+    passou = 0
+    falhou = 0
+    
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+    
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_interface_visual()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
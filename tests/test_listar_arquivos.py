@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Listador de Arquivos - Serum Preset Organizer
+========================================================
+Testes para o scan com scandir, a ordenação externa e as colunas extras.
+"""
+
+import sys
+import os
+import hashlib
+import random
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.listar_arquivos import (
+    OrdenacaoExterna,
+    desescapar_nome,
+    escapar_nome,
+    exportar_lista,
+    ler_previa,
+    listar_arquivos_pasta,
+    salvar_lista,
+)
+
+
+def _criar_pasta(raiz: Path):
+    """Presets em subpastas, um arquivo que não é preset e uma extensão maiúscula."""
+    (raiz / "Pack A" / "Sub").mkdir(parents=True)
+    (raiz / "Pack B").mkdir()
+    (raiz / "Pack A" / "Lead 01.fxp").write_bytes(b"lead")
+    (raiz / "Pack A" / "Sub" / "Bass 02.FXP").write_bytes(b"bass bass")
+    (raiz / "Pack B" / "Pad.serumpreset").write_bytes(b"pad")
+    (raiz / "Pack B" / "leia-me.txt").write_bytes(b"texto")
+
+
+def _corpo(arquivo: str) -> list:
+    """Linhas da lista sem o cabeçalho."""
+    with open(arquivo, encoding="utf-8") as f:
+        return [linha.rstrip("\n") for linha in f if linha.strip() and not linha.startswith("#")]
+
+
+def test_ordenacao_externa():
+    """Testa que a ordenação em blocos (inclusive em várias passadas) equivale a sorted()."""
+    import utils.listar_arquivos as listar
+
+    rng = random.Random(7)
+    linhas = [f"{rng.choice(['Lead', 'bass', 'Pad', 'Ünico', 'Zeta'])} {rng.randint(0, 999)}.fxp"
+              for _ in range(5000)]
+
+    with OrdenacaoExterna(linhas_por_bloco=5000) as ordenacao:
+        ordenacao.extend(linhas)
+        assert list(ordenacao.ordenadas()) == sorted(linhas) and ordenacao.blocos == 0, "Cabe em memória"
+
+    limite = listar.LIMITE_INTERCALACAO
+    listar.LIMITE_INTERCALACAO = 4
+    try:
+        with tempfile.TemporaryDirectory() as pasta:
+            with OrdenacaoExterna(linhas_por_bloco=300, pasta_temporaria=pasta) as ordenacao:
+                ordenacao.extend(linhas)
+                assert ordenacao.blocos == 16 and ordenacao.total == 5000
+                assert list(ordenacao.ordenadas()) == sorted(linhas)
+            assert os.listdir(pasta) == [], "Blocos temporários apagados"
+    finally:
+        listar.LIMITE_INTERCALACAO = limite
+
+    print("✅ test_ordenacao_externa passou")
+
+
+def test_exportar_lista():
+    """Testa a lista em fluxo: filtro, ordem, cabeçalho e equivalência com listar_arquivos_pasta."""
+    with tempfile.TemporaryDirectory() as raiz:
+        _criar_pasta(Path(raiz) / "origem")
+        origem = str(Path(raiz) / "origem")
+        saida = os.path.join(raiz, "lista.txt")
+
+        resultado = exportar_lista(origem, saida, ['.fxp', '.serumpreset'], linhas_por_bloco=1)
+        assert resultado["total"] == 3 and resultado["blocos"] == 3
+        nomes = ["Bass 02.FXP", "Lead 01.fxp", "Pad.serumpreset"]
+        assert _corpo(saida) == nomes
+        assert "# Total: 3 arquivos\n" in open(saida, encoding="utf-8").read()
+        assert listar_arquivos_pasta(origem, ['.FXP', '.serumpreset']) == nomes
+        assert ler_previa(saida, 2) == nomes[:2]
+
+        # Sem filtro, todos os arquivos; mesmo formato de salvar_lista
+        exportar_lista(origem, saida)
+        copia = salvar_lista(listar_arquivos_pasta(origem), origem, os.path.join(raiz, "copia.txt"))
+        assert _corpo(saida) == _corpo(copia) and len(_corpo(saida)) == 4
+
+        for invalido in ((os.path.join(raiz, "nao_existe"), ()), (origem, ("dono",))):
+            try:
+                exportar_lista(invalido[0], saida, colunas=invalido[1])
+            except (FileNotFoundError, ValueError):
+                continue
+            raise AssertionError(f"aceitou {invalido}")
+
+    print("✅ test_exportar_lista passou")
+
+
+def test_colunas_e_testar_categorizacao():
+    """Testa as colunas tamanho/mtime/md5 e que testar_categorizacao lê só o nome."""
+    from utils.testar_categorizacao import testar_lista_arquivos
+
+    with tempfile.TemporaryDirectory() as raiz:
+        _criar_pasta(Path(raiz) / "origem")
+        origem = Path(raiz) / "origem"
+        saida = os.path.join(raiz, "lista.txt")
+
+        exportar_lista(str(origem), saida, ['.fxp'], colunas=("md5", "tamanho"))
+        assert "# Colunas: nome\ttamanho\tmd5\n" in open(saida, encoding="utf-8").read(), "Ordem fixa"
+        linhas = [linha.split("\t") for linha in _corpo(saida)]
+        assert linhas == [
+            ["Bass 02.FXP", "9", hashlib.md5(b"bass bass").hexdigest()],
+            ["Lead 01.fxp", "4", hashlib.md5(b"lead").hexdigest()],
+        ]
+
+        (origem / "Qwzx 7.fxp").write_bytes(b"?")
+        exportar_lista(str(origem), saida, ['.fxp'], colunas=("mtime",))
+        assert all(len(linha.split("\t")[1]) == 19 for linha in _corpo(saida)), "AAAA-MM-DDTHH:MM:SS"
+
+        # Nomes escapados e não decodificáveis: testar_categorizacao lê o nome original
+        estranhos = []
+        for nome in (b"Qw\xffzx_caf\\e.fxp", b"Qwzx\t8.fxp"):
+            try:
+                (origem / os.fsdecode(nome)).write_bytes(b"?")
+                estranhos.append(os.fsdecode(nome))
+            except (OSError, UnicodeError):
+                continue  # Sistema de arquivos não aceita o nome
+        
+        exportar_lista(str(origem), saida, ['.fxp'], colunas=("mtime",))
+        with open(saida, encoding="utf-8", errors="surrogateescape") as f:
+            listados = [linha.split("\t", 1)[0] for linha in f.read().splitlines()
+                        if linha and not linha.startswith("#")]
+        assert sorted(desescapar_nome(nome) for nome in listados) == \
+            sorted(["Bass 02.FXP", "Lead 01.fxp", "Qwzx 7.fxp", *estranhos]), "Ida e volta pelo escape"
+        
+        # testar_categorizacao ignora as colunas: o não categorizado sai só com o nome
+        testar_lista_arquivos(saida)
+        with open(saida.replace(".txt", "_uncategorized.txt"), encoding="utf-8", errors="surrogateescape") as f:
+            nao_categorizados = [linha for linha in f.read().splitlines() if linha and not linha.startswith("#")]
+        assert sorted(map(desescapar_nome, nao_categorizados)) == sorted(["Qwzx 7.fxp", *estranhos])
+
+    print("✅ test_colunas_e_testar_categorizacao passou")
+
+
+def test_nomes_com_tabulacao_e_quebra_de_linha():
+    """Testa que nomes com tabulação, quebra de linha e barra invertida ocupam uma linha, escapados."""
+    with tempfile.TemporaryDirectory() as raiz:
+        origem = Path(raiz) / "origem"
+        origem.mkdir()
+        nomes = ["Bass\tSub.fxp", "Lead\nPad.fxp", "Pluck\\t.fxp", "Zeta.fxp"]
+        try:
+            for nome in nomes:
+                (origem / nome).write_bytes(b"x")
+        except OSError:
+            print("⚠️ test_nomes_com_tabulacao_e_quebra_de_linha ignorado (sistema de arquivos não aceita os nomes)")
+            return
+        saida = os.path.join(raiz, "lista.txt")
+
+        resultado = exportar_lista(str(origem), saida, colunas=("tamanho",), linhas_por_bloco=2)
+        esperado = ["Bass\\tSub.fxp\t1", "Lead\\nPad.fxp\t1", "Pluck\\\\t.fxp\t1", "Zeta.fxp\t1"]
+        assert resultado["total"] == 4 and _corpo(saida) == esperado
+        assert [escapar_nome(nome) for nome in sorted(nomes)] == [linha.split("\t")[0] for linha in esperado]
+        assert _corpo(salvar_lista(sorted(nomes), str(origem), os.path.join(raiz, "copia.txt"))) == \
+            [linha.split("\t")[0] for linha in esperado], "salvar_lista escapa igual"
+
+    print("✅ test_nomes_com_tabulacao_e_quebra_de_linha passou")
+
+
+def executar_testes_listar_arquivos():
+    """Executa todos os testes do listador de arquivos."""
+    print("\n📋 TESTES DO LISTADOR DE ARQUIVOS")
+    print("─" * 40)
+
+    testes = [
+        test_ordenacao_externa,
+        test_exportar_lista,
+        test_colunas_e_testar_categorizacao,
+        test_nomes_com_tabulacao_e_quebra_de_linha,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_listar_arquivos()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
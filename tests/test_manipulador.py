@@ -340,6 +340,275 @@ def test_multiplas_origens():
     print("✅ test_multiplas_origens passou")
 
 
+def test_metricas_por_etapa():
+    """Testa que a organização registra tempo/contagem por etapa e bytes lidos/escritos."""
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            origem_path = Path(origem)
+            (origem_path / "Deep_Bass.fxp").write_bytes(b"b" * 100)
+            (origem_path / "Bright_Lead.fxp").write_bytes(b"l" * 50)
+            (origem_path / "Copia_Bass.fxp").write_bytes(b"b" * 100)  # Duplicata
+            
+            stats = organizar_presets(origem, destino)
+            metricas = stats["metricas"]
+            etapas = metricas["etapas"]
+            
+            assert etapas["scan"]["contagem"] == 1
+            assert etapas["hash"]["contagem"] == 3, "Um hash por arquivo de origem"
+            assert etapas["copia"]["contagem"] == 2, "A duplicata não é copiada"
+            assert etapas["classificacao"]["contagem"] == 2
+            assert metricas["bytes_lidos"] == 250 + 150  # hash de todos + leitura das cópias
+            assert metricas["bytes_escritos"] == 150
+            assert all(valores["tempo_s"] >= 0 for valores in etapas.values())
+            
+    print("✅ test_metricas_por_etapa passou")
+
+
+def test_organizar_async_equivale_ao_sincrono():
+    """Testa que o motor assíncrono produz o mesmo resultado do síncrono."""
+    import asyncio
+    from src.manipulador_arquivos import organizar_presets_async
+    
+    def criar_origem(pasta: Path):
+        for i in range(20):
+            (pasta / f"Bass_{i:02d}.fxp").write_bytes(f"bass{i % 12}".encode())  # 8 duplicatas
+        (pasta / "sub").mkdir()
+        # Colisão de nome com um preset sem duplicata: sempre acontece, seja qual
+        # for a cópia de cada duplicata que termine primeiro
+        (pasta / "sub" / "Bass_08.fxp").write_bytes(b"outro conteudo")
+        (pasta / "Lead_Pad.fxp").write_bytes(b"multi")
+        (pasta / "Sem_Nome.fxp").write_bytes(b"nada")
+    
+    resultados = []
+    with tempfile.TemporaryDirectory() as origem:
+        criar_origem(Path(origem))
+        for motor in ("sincrono", "async", "async_leitura_unica"):
+            with tempfile.TemporaryDirectory() as destino:
+                if motor.startswith("async"):
+                    stats = asyncio.run(organizar_presets_async(
+                        origem, destino, modo_mover=False, concorrencia=4,
+                        leitura_unica=motor.endswith("leitura_unica")
+                    ))
+                else:
+                    stats = organizar_presets(origem, destino, modo_mover=False)
+                # Qual cópia de uma duplicata vence depende da ordem de conclusão,
+                # então compara o conteúdo de cada pasta e não os nomes
+                arquivos = sorted(
+                    (arquivo.parent.name, arquivo.read_bytes())
+                    for arquivo in Path(destino).rglob("*.fxp")
+                )
+                resultados.append((stats, arquivos))
+    
+    (sincrono, arquivos_sincrono), (assincrono, arquivos_async), (leitura_unica, arquivos_leitura_unica) = resultados
+    for chave in ("total_arquivos_origem", "total_copias_realizadas",
+                  "total_duplicatas_ignoradas", "total_multi_categoria", "por_categoria"):
+        assert assincrono[chave] == sincrono[chave], f"{chave} difere entre os motores"
+        assert leitura_unica[chave] == sincrono[chave], f"{chave} difere com leitura única"
+    assert assincrono["total_duplicatas_ignoradas"] == 8
+    assert not assincrono["erros"] and not leitura_unica["erros"]
+    assert arquivos_async == arquivos_sincrono, "Mesmo conteúdo em cada pasta de categoria"
+    assert arquivos_leitura_unica == arquivos_sincrono
+    assert ("Bass", b"outro conteudo") in arquivos_async, "A colisão de nome não sobrescreve"
+    assert assincrono["metricas"]["etapas"]["hash"]["contagem"] == 24, "Um por arquivo e um pela colisão"
+    
+    print("✅ test_organizar_async_equivale_ao_sincrono passou")
+
+
+def test_multiplas_origens_com_concorrencia():
+    """Testa múltiplas origens pelo motor assíncrono (duplicatas entre pastas)."""
+    from src.manipulador_arquivos import organizar_presets_multiplas_origens
+    
+    with tempfile.TemporaryDirectory() as destino:
+        with tempfile.TemporaryDirectory() as origem1:
+            with tempfile.TemporaryDirectory() as origem2:
+                (Path(origem1) / "Bass_A.fxp").write_bytes(b"bass")
+                (Path(origem2) / "Bass_B.fxp").write_bytes(b"bass")  # Mesmo conteúdo
+                (Path(origem2) / "Pad_C.fxp").write_bytes(b"pad")
+                
+                stats = organizar_presets_multiplas_origens(
+                    [origem1, origem2], destino, modo_mover=False, concorrencia=2
+                )
+                
+                assert stats["total_arquivos_origem"] == 3
+                assert stats["total_duplicatas_ignoradas"] == 1
+                assert stats["total_copias_realizadas"] == 2
+                assert (Path(destino) / "Bass" / "Bass_A.fxp").exists()
+                assert not (Path(destino) / "Bass" / "Bass_B.fxp").exists()
+    
+    print("✅ test_multiplas_origens_com_concorrencia passou")
+
+
+def test_multiplas_origens_em_paralelo():
+    """Testa origens em paralelo: o coordenador copia cada conteúdo uma vez entre as origens."""
+    from src.manipulador_arquivos import organizar_presets_multiplas_origens
+    
+    with tempfile.TemporaryDirectory() as base:
+        origens = []
+        for indice in range(3):
+            origem = Path(base) / f"origem{indice}"
+            origem.mkdir()
+            for numero in range(15):
+                # O mesmo conteúdo aparece nas três origens com nomes diferentes
+                (origem / f"Bass_{indice}_{numero:02d}.fxp").write_bytes(f"bass{numero}".encode())
+            (origem / f"Pad_{indice}.fxp").write_bytes(f"pad{indice}".encode())
+            origens.append(str(origem))
+        
+        for leitura_unica in (False, True):
+            with tempfile.TemporaryDirectory() as destino:
+                pastas_vistas = []
+                stats = organizar_presets_multiplas_origens(
+                    origens, destino, modo_mover=False, origens_paralelas=True,
+                    leitura_unica=leitura_unica,
+                    callback_pasta=lambda pasta, idx, total: pastas_vistas.append(pasta)
+                )
+                
+                assert stats["total_arquivos_origem"] == 48
+                assert stats["total_copias_realizadas"] == 18, "15 Bass + 3 Pad, uma vez cada"
+                assert stats["total_duplicatas_ignoradas"] == 30
+                assert not stats["erros"]
+                assert stats["pastas_processadas"] == origens, "Resultado na ordem das origens"
+                assert sorted(pastas_vistas) == origens
+                assert len(list((Path(destino) / "Bass").iterdir())) == 15
+                etapa_hash = "hash_copia" if leitura_unica else "hash"
+                assert stats["metricas"]["etapas"][etapa_hash]["contagem"] == 48
+                assert len(stats["_hashes"]) == 18
+                assert not (Path(destino) / ".serum_parcial").exists()
+        
+        try:
+            organizar_presets_multiplas_origens(origens, base, origens_paralelas=True, concorrencia=2)
+            assert False, "Deveria rejeitar os dois modos juntos"
+        except ValueError:
+            pass
+    
+    print("✅ test_multiplas_origens_em_paralelo passou")
+
+
+def test_copiar_conteudo_com_e_sem_metadados():
+    """Testa o motor de cópia (kernel e fallback) e a opção de metadados."""
+    import errno
+    import src.manipulador_arquivos as manipulador
+    
+    with tempfile.TemporaryDirectory() as pasta:
+        pasta_path = Path(pasta)
+        origem = pasta_path / "Bass.fxp"
+        conteudo = os.urandom(3 * 1024 * 1024 + 7)  # Mais de um bloco do fallback
+        origem.write_bytes(conteudo)
+        os.utime(origem, (1_000_000_000, 1_000_000_000))
+        
+        metodo = manipulador.copiar_conteudo(origem, pasta_path / "com.fxp")
+        assert (pasta_path / "com.fxp").read_bytes() == conteudo
+        assert (pasta_path / "com.fxp").stat().st_mtime == 1_000_000_000, "copystat deve manter a data"
+        assert metodo in ("copy_file_range", "sendfile", "python")
+        
+        manipulador.copiar_conteudo(origem, pasta_path / "sem.fxp", preservar_metadados=False)
+        assert (pasta_path / "sem.fxp").read_bytes() == conteudo
+        assert (pasta_path / "sem.fxp").stat().st_mtime != 1_000_000_000
+        
+        # Sem suporte no kernel: cai para a cópia em Python
+        def sem_suporte(*args):
+            raise OSError(errno.ENOSYS, "sem suporte")
+        
+        metodos_originais = manipulador._METODOS_KERNEL
+        manipulador._METODOS_KERNEL = [("falso", sem_suporte)]
+        try:
+            metodo = manipulador.copiar_conteudo(origem, pasta_path / "fallback.fxp")
+        finally:
+            manipulador._METODOS_KERNEL = metodos_originais
+        assert metodo == "python"
+        assert (pasta_path / "fallback.fxp").read_bytes() == conteudo
+    
+    print("✅ test_copiar_conteudo_com_e_sem_metadados passou")
+
+
+def test_leitura_unica():
+    """Testa que a leitura única lê cada origem uma vez e não deixa temporários."""
+    from src.manipulador_arquivos import PASTA_TEMPORARIA
+    
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            origem_path = Path(origem)
+            destino_path = Path(destino)
+            (origem_path / "Deep_Bass.fxp").write_bytes(b"b" * 100)
+            (origem_path / "Bright_Lead.fxp").write_bytes(b"l" * 50)
+            (origem_path / "Copia_Bass.fxp").write_bytes(b"b" * 100)  # Duplicata
+            
+            # Colisão de nome com conteúdo diferente já no destino
+            (destino_path / "Bass").mkdir()
+            (destino_path / "Bass" / "Deep_Bass.fxp").write_bytes(b"x" * 30)
+            
+            stats = organizar_presets(origem, destino, modo_mover=False, leitura_unica=True)
+            metricas = stats["metricas"]
+            
+            assert stats["total_copias_realizadas"] == 2
+            assert stats["total_duplicatas_ignoradas"] == 1
+            assert (destino_path / "Bass" / "Deep_Bass_1.fxp").read_bytes() == b"b" * 100
+            assert (destino_path / "Bass" / "Deep_Bass.fxp").read_bytes() == b"x" * 30
+            assert (destino_path / "Lead" / "Bright_Lead.fxp").exists()
+            assert not (destino_path / PASTA_TEMPORARIA).exists(), "Temporários devem ser removidos"
+            
+            # Cada origem é lida uma vez (250) + o arquivo do destino na colisão (30)
+            assert metricas["bytes_lidos"] == 250 + 30
+            assert metricas["etapas"]["hash_copia"]["contagem"] == 3
+            assert metricas["etapas"]["hash"]["contagem"] == 1, "Só o destino da colisão é relido"
+    
+    print("✅ test_leitura_unica passou")
+
+
+def test_leitura_unica_varias_categorias():
+    """Testa que, com leitura única, as categorias extras copiam da primeira colocação e não da origem."""
+    import src.manipulador_arquivos as manipulador
+    
+    copiar_original = manipulador.copiar_conteudo
+    fontes = []
+    
+    def copiar_registrando(origem, destino, preservar_metadados=True):
+        fontes.append(Path(origem))
+        return copiar_original(origem, destino, preservar_metadados)
+    
+    manipulador.copiar_conteudo = copiar_registrando
+    try:
+        with tempfile.TemporaryDirectory() as origem:
+            with tempfile.TemporaryDirectory() as destino:
+                (Path(origem) / "Lead_Pad_Bass.fxp").write_bytes(b"m" * 40)
+                stats = organizar_presets(origem, destino, modo_mover=False, leitura_unica=True)
+                
+                assert stats["total_multi_categoria"] == 1 and not stats["erros"]
+                colocados = sorted(Path(destino).rglob("Lead_Pad_Bass.fxp"))
+                assert len(colocados) == 3 and all(c.read_bytes() == b"m" * 40 for c in colocados)
+                assert len(fontes) == 2, "A primeira categoria é o temporário renomeado"
+                assert Path(origem) / "Lead_Pad_Bass.fxp" not in fontes, "A origem não é relida"
+                assert len(set(fontes)) == 1 and fontes[0] in colocados
+    finally:
+        manipulador.copiar_conteudo = copiar_original
+    
+    print("✅ test_leitura_unica_varias_categorias passou")
+
+
+def test_hash_arquivos_pequenos_grandes_e_mmap():
+    """Testa que os caminhos de leitura (buffer único, blocos e mmap) geram o mesmo MD5."""
+    import hashlib
+    import src.manipulador_arquivos as manipulador
+    
+    tamanhos = [0, 1, 5 * 1024, manipulador.TAMANHO_BUFFER_LEITURA, manipulador.TAMANHO_BUFFER_LEITURA * 3 + 17]
+    with tempfile.TemporaryDirectory() as pasta:
+        for tamanho in tamanhos:
+            arquivo = Path(pasta) / f"preset_{tamanho}.fxp"
+            conteudo = os.urandom(tamanho)
+            arquivo.write_bytes(conteudo)
+            esperado = hashlib.md5(conteudo).hexdigest()
+            
+            assert manipulador.calcular_hash_arquivo(arquivo) == esperado, f"Leitura com buffer ({tamanho} bytes)"
+            
+            limite_original = manipulador.LIMITE_MMAP
+            manipulador.LIMITE_MMAP = 1  # Força o caminho com mmap
+            try:
+                assert manipulador.calcular_hash_arquivo(arquivo) == esperado, f"Leitura com mmap ({tamanho} bytes)"
+            finally:
+                manipulador.LIMITE_MMAP = limite_original
+    
+    print("✅ test_hash_arquivos_pequenos_grandes_e_mmap passou")
+
+
 def executar_testes_manipulador():
     """Executa todos os testes do manipulador de arquivos."""
     print("\n📁 TESTES DO MANIPULADOR DE ARQUIVOS")
@@ -355,6 +624,14 @@ def executar_testes_manipulador():
         test_reverificacao_move_para_categoria_correta,
         test_nao_cria_duplicatas_em_reverificacao,
         test_multiplas_origens,
+        test_metricas_por_etapa,
+        test_organizar_async_equivale_ao_sincrono,
+        test_multiplas_origens_com_concorrencia,
+        test_multiplas_origens_em_paralelo,
+        test_copiar_conteudo_com_e_sem_metadados,
+        test_leitura_unica,
+        test_leitura_unica_varias_categorias,
+        test_hash_arquivos_pequenos_grandes_e_mmap,
     ]
     
     passou = 0
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da Memória Limitada - Serum Preset Organizer
+====================================================
+Testes para o registro em disco, a fila de trabalho, os registros em NDJSON,
+o teto de RSS e a paridade da organização com e sem o modo.
+"""
+
+import sys
+import os
+import asyncio
+import hashlib
+import json
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.manipulador_arquivos import (
+    organizar_presets,
+    organizar_presets_async,
+    organizar_presets_multiplas_origens,
+)
+from src.memoria_limitada import (
+    PASTA_TRABALHO,
+    ControleMemoria,
+    FilaEmDisco,
+    LimiteMemoriaExcedido,
+    medir_rss,
+    pasta_trabalho_padrao,
+)
+from src.registro_hashes import RegistroHashesDisco, obter_registro
+
+
+def _criar_origens(raiz: Path) -> list:
+    """
+    Duas origens com presets em várias categorias e duplicatas dentro e entre elas.
+
+    As cópias do mesmo conteúdo têm o mesmo nome: nos motores concorrentes,
+    qual delas é colocada depende de quem termina o hash primeiro.
+    """
+    origem1, origem2 = raiz / "origem1", raiz / "origem2"
+    (origem1 / "sub").mkdir(parents=True)
+    origem2.mkdir()
+    (origem1 / "Lead Bass.fxp").write_bytes(b"lead bass")
+    (origem1 / "sub" / "Copia Pad.fxp").write_bytes(b"pad")
+    (origem1 / "Copia Pad.fxp").write_bytes(b"pad")
+    (origem1 / "Random 1.fxp").write_bytes(b"random")
+    (origem2 / "Copia Pad.fxp").write_bytes(b"pad")
+    (origem2 / "Pluck.fxp").write_bytes(b"pluck")
+    return [str(origem1), str(origem2)]
+
+
+def _arvore(pasta: str) -> dict:
+    """Conteúdo do destino (sem pastas ocultas) para comparar execuções."""
+    return {
+        str(arquivo.relative_to(pasta)): arquivo.read_bytes()
+        for arquivo in Path(pasta).rglob("*.fxp")
+        if not any(parte.startswith(".") for parte in arquivo.relative_to(pasta).parts)
+    }
+
+
+def test_registro_em_disco():
+    """Testa o RegistroHashesDisco: interface de dicionário, registro atômico e iteração em páginas."""
+    with tempfile.TemporaryDirectory() as pasta:
+        registro = RegistroHashesDisco(os.path.join(pasta, "hashes.db"))
+        digests = [hashlib.md5(str(numero).encode()).digest() for numero in range(2500)]
+        for numero, digest in enumerate(digests):
+            assert registro.registrar_se_ausente(digest, f"/destino/Bass/{numero}.fxp") is None
+        assert registro.registrar_se_ausente(digests[7], "/outro.fxp") == "/destino/Bass/7.fxp"
+        assert len(registro) == 2500
+        assert sorted(registro) == sorted(digests), "Iteração completa, em várias páginas"
+
+        # Chave hexadecimal, atribuição e remoção como no RegistroHashes
+        assert digests[0].hex() in registro and registro[digests[0].hex()] == "/destino/Bass/0.fxp"
+        registro[digests[0]] = "/destino/Lead/0.fxp"
+        assert registro[digests[0]] == "/destino/Lead/0.fxp"
+        del registro[digests[1]]
+        assert digests[1] not in registro and len(registro) == 2499
+        try:
+            registro[digests[1]]
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("chave removida ainda existe")
+
+        assert obter_registro(registro) is registro
+        registro.liberar()
+        uso = registro.uso_memoria()
+        assert uso["entradas"] == 2499 and uso["bytes_disco"] > 0
+        registro.fechar()
+        assert registro.uso_memoria() == uso, "Fechado, informa os valores do fechamento"
+
+    print("✅ test_registro_em_disco passou")
+
+
+def test_fila_registros_e_teto():
+    """Testa a fila em disco, os registros em NDJSON e o teto de RSS."""
+    with tempfile.TemporaryDirectory() as pasta:
+        fila = FilaEmDisco(os.path.join(pasta, "fila.bin"))
+        caminhos = [Path("/a/Lead.fxp"), Path("/b/com\nquebra.fxp"), Path("/c/Pé Grave.fxp")]
+        fila.extend(caminhos)
+        assert len(fila) == 3 and list(fila) == caminhos
+        assert list(fila) == caminhos, "Pode ser percorrida de novo"
+        fila.fechar()
+        assert not os.path.exists(fila.caminho)
+
+        arquivo_registros = os.path.join(pasta, "registros.ndjson")
+        trabalho = pasta_trabalho_padrao(pasta)
+        memoria = ControleMemoria(str(trabalho), limite_mb=1_000_000, arquivo_registros=arquivo_registros,
+                                  intervalo=10)
+        memoria.registros.append({"origem": "/a/Lead.fxp", "categorias": ["Lead"], "multi": False})
+        assert list(memoria.registros) == [{"origem": "/a/Lead.fxp", "categorias": ["Lead"], "multi": False}]
+
+        # Mede no primeiro arquivo e depois a cada `intervalo`
+        for _ in range(21):
+            memoria.verificar()
+        assert memoria.verificacoes == 3 and memoria.liberacoes == 0
+        assert medir_rss() is None or memoria.pico_rss > 0
+
+        if medir_rss() is not None:
+            memoria.limite_bytes = 1  # Impossível: libera e interrompe
+            try:
+                memoria.verificar(forcar=True)
+            except LimiteMemoriaExcedido as erro:
+                assert erro.limite == 1 and erro.rss > 1
+            else:
+                raise AssertionError("teto não foi aplicado")
+            assert memoria.liberacoes == 1 and memoria.para_dict()["excedido"]
+
+        memoria.fechar()
+        assert not trabalho.exists()
+        assert Path(arquivo_registros).read_text(encoding="utf-8").count("\n") == 1, "Registros mantidos"
+        assert memoria.para_dict()["registros"] == 1
+
+    print("✅ test_fila_registros_e_teto passou")
+
+
+def test_paridade_dos_motores():
+    """Testa que cada motor organiza igual com e sem memória limitada."""
+    motores = {
+        "sequencial": lambda origens, destino, **kw: organizar_presets_multiplas_origens(origens, destino, **kw),
+        "async": lambda origens, destino, **kw: organizar_presets_multiplas_origens(
+            origens, destino, concorrencia=4, **kw),
+        "paralelo": lambda origens, destino, **kw: organizar_presets_multiplas_origens(
+            origens, destino, origens_paralelas=True, **kw),
+    }
+    for nome, motor in motores.items():
+        with tempfile.TemporaryDirectory() as raiz:
+            origens = _criar_origens(Path(raiz))
+            normal = motor(origens, os.path.join(raiz, "normal"), modo_mover=False)
+
+            destino = os.path.join(raiz, "limitado")
+            with ControleMemoria(str(pasta_trabalho_padrao(destino)), limite_mb=1_000_000) as memoria:
+                limitado = motor(origens, destino, modo_mover=False, memoria=memoria)
+                assert limitado["_hashes"] is memoria.registro
+                assert len(limitado["arquivos_processados"]) == len(normal["arquivos_processados"]) == 4, nome
+                assert sorted(Path(registro["origem"]).name for registro in limitado["arquivos_processados"]) == \
+                    sorted(Path(registro["origem"]).name for registro in normal["arquivos_processados"]), nome
+                assert len(memoria.registro) == len(normal["_hashes"])
+                assert memoria.verificacoes >= 1
+                assert not list(memoria.pasta_trabalho.glob("fila_*.bin")), f"{nome}: fila de trabalho não apagada"
+
+            for campo in ("total_arquivos_origem", "total_copias_realizadas", "total_duplicatas_ignoradas",
+                          "por_categoria"):
+                assert limitado[campo] == normal[campo], (nome, campo)
+            assert _arvore(destino) == _arvore(os.path.join(raiz, "normal")), nome
+            assert not (Path(destino) / PASTA_TRABALHO).exists()
+
+    # Uma origem, motor assíncrono direto, e ordem física recusada
+    with tempfile.TemporaryDirectory() as raiz:
+        origem = _criar_origens(Path(raiz))[0]
+        destino = os.path.join(raiz, "destino")
+        with ControleMemoria(str(pasta_trabalho_padrao(destino))) as memoria:
+            estatisticas = asyncio.run(organizar_presets_async(origem, destino, memoria=memoria, modo_mover=False))
+            assert estatisticas["total_duplicatas_ignoradas"] == 1 and not estatisticas["erros"]
+            try:
+                organizar_presets(origem, destino, memoria=memoria, ordem="inode")
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("ordem inode aceita com memória limitada")
+
+    print("✅ test_paridade_dos_motores passou")
+
+
+def test_cli_memoria_maxima():
+    """Testa --memoria-maxima e --registros na CLI, a interrupção pelo teto e os argumentos inválidos."""
+    from src.cli import executar_cli, SAIDA_OK, SAIDA_COM_ERROS
+
+    with tempfile.TemporaryDirectory() as raiz:
+        origens = _criar_origens(Path(raiz))
+        destino = os.path.join(raiz, "destino")
+        saida = Path(raiz) / "resumo.json"
+        registros = Path(raiz) / "registros.ndjson"
+        codigo = executar_cli([
+            "organizar", "-o", origens[0], "-o", origens[1], "-d", destino, "--modo", "copiar",
+            "--memoria-maxima", "1000000", "--registros", str(registros),
+            "--formato", "json", "--saida", str(saida)
+        ])
+        assert codigo == SAIDA_OK
+        resumo = json.loads(saida.read_text(encoding="utf-8"))
+        assert resumo["memoria"]["registros"] == 4 and not resumo["memoria"]["excedido"]
+        assert resumo["registro_hashes"]["entradas"] == 4
+        assert len(registros.read_text(encoding="utf-8").splitlines()) == 4
+        assert not (Path(destino) / PASTA_TRABALHO).exists()
+
+        if medir_rss() is not None:
+            codigo = executar_cli([
+                "organizar", "-o", origens[0], "-d", os.path.join(raiz, "outro"), "--modo", "copiar",
+                "--memoria-maxima", "0.001", "--formato", "json", "--saida", str(saida)
+            ])
+            assert codigo == SAIDA_COM_ERROS
+            resultado = json.loads(saida.read_text(encoding="utf-8"))
+            assert resultado["evento"] == "interrompido" and resultado["memoria"]["excedido"]
+            assert not (Path(raiz) / "outro" / PASTA_TRABALHO).exists()
+
+        for argumentos in (["--registros", str(registros)],
+                           ["--memoria-maxima", "512", "--similares"],
+                           ["--memoria-maxima", "512", "--ordem", "inode"],
+                           ["--memoria-maxima", "512", "--indexar-destino"],
+                           ["--memoria-maxima", "0"]):
+            try:
+                executar_cli(["organizar", "-o", origens[0], "-d", destino, *argumentos])
+            except SystemExit as erro:
+                assert erro.code == 2
+            else:
+                raise AssertionError(f"aceitou {argumentos}")
+
+    print("✅ test_cli_memoria_maxima passou")
+
+
+def executar_testes_memoria_limitada():
+    """Executa todos os testes da memória limitada."""
+    print("\n🧠 TESTES DA MEMÓRIA LIMITADA")
+    print("─" * 40)
+
+    testes = [
+        test_registro_em_disco,
+        test_fila_registros_e_teto,
+        test_paridade_dos_motores,
+        test_cli_memoria_maxima,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_memoria_limitada()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da Ordem Física - Serum Preset Organizer
+================================================
+Testes para a ordenação por inode / primeiro extent e a opção --ordem.
+"""
+
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ordem_fisica import ORDENS, ordenar_arquivos, primeiro_extent
+from src.metricas import MetricasExecucao
+
+
+def _criar_presets(pasta: Path, quantidade: int = 30) -> list:
+    """Cria presets em várias subpastas, em ordem embaralhada."""
+    arquivos = []
+    for indice in range(quantidade):
+        subpasta = pasta / f"pack_{(indice * 7) % 5}"
+        subpasta.mkdir(exist_ok=True)
+        arquivo = subpasta / f"Bass_{indice:02d}.fxp"
+        arquivo.write_bytes(f"bass {indice}".encode() * 100)
+        arquivos.append(arquivo)
+    return arquivos
+
+
+def test_ordenar_por_inode_e_extent():
+    """Testa que as ordens são permutações do scan e que 'inode' segue st_ino."""
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivos = _criar_presets(Path(pasta))
+        scan = list(reversed(arquivos))
+        metricas = MetricasExecucao()
+
+        assert ordenar_arquivos(scan, "scan") is scan, "scan não reordena"
+
+        por_inode = ordenar_arquivos(scan, "inode", metricas)
+        assert [os.stat(a).st_ino for a in por_inode] == sorted(os.stat(a).st_ino for a in scan)
+
+        por_extent = ordenar_arquivos(scan, "extent", metricas)
+        assert sorted(por_extent) == sorted(scan)
+        assert metricas.para_dict()["etapas"]["ordenacao"]["contagem"] == 2
+
+        # Arquivo sumido entre o scan e a ordenação: não quebra (o erro aparece no hash)
+        assert len(ordenar_arquivos(scan + [Path(pasta) / "sumiu.fxp"], "extent")) == len(scan) + 1
+
+        try:
+            ordenar_arquivos(scan, "aleatoria")
+            assert False, "Deveria rejeitar ordem inválida"
+        except ValueError:
+            pass
+
+    print("✅ test_ordenar_por_inode_e_extent passou")
+
+
+def test_primeiro_extent():
+    """Testa o FIEMAP: arquivo vazio e inexistente não têm endereço físico."""
+    with tempfile.TemporaryDirectory() as pasta:
+        vazio = Path(pasta) / "Vazio.fxp"
+        vazio.write_bytes(b"")
+        assert primeiro_extent(vazio) is None
+        assert primeiro_extent(Path(pasta) / "nao_existe.fxp") is None
+
+        cheio = Path(pasta) / "Cheio.fxp"
+        cheio.write_bytes(b"x" * 65536)
+        os.sync()
+        fisico = primeiro_extent(cheio)
+        assert fisico is None or fisico >= 0, "Sem suporte (tmpfs, Windows) retorna None"
+
+    print("✅ test_primeiro_extent passou")
+
+
+def test_organizar_com_ordem():
+    """Testa que a ordem não muda o resultado da organização (motores e CLI)."""
+    from src.manipulador_arquivos import organizar_presets
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem:
+        _criar_presets(Path(origem), 12)
+        (Path(origem) / "Copia_Bass.fxp").write_bytes(b"bass 3" * 100)  # Duplicata
+
+        resultados = {}
+        for ordem in ORDENS:
+            with tempfile.TemporaryDirectory() as destino:
+                stats = organizar_presets(origem, destino, modo_mover=False, ordem=ordem)
+                resultados[ordem] = (stats["total_copias_realizadas"], stats["total_duplicatas_ignoradas"])
+        assert set(resultados.values()) == {(12, 1)}, resultados
+
+        with tempfile.TemporaryDirectory() as destino:
+            saida = Path(origem) / "resumo.json"
+            codigo = executar_cli([
+                "organizar", "-o", origem, "-d", destino, "--modo", "copiar", "--ordem", "inode",
+                "--sem-catalogo", "--formato", "json", "--saida", str(saida)
+            ])
+            assert codigo == SAIDA_OK
+            resumo = json.loads(saida.read_text(encoding="utf-8"))
+            assert resumo["estatisticas"]["total_copias_realizadas"] == 12
+            assert resumo["estatisticas"]["metricas"]["etapas"]["ordenacao"]["contagem"] == 1
+
+    print("✅ test_organizar_com_ordem passou")
+
+
+def executar_testes_ordem_fisica():
+    """Executa todos os testes da ordem física."""
+    print("\n🧭 TESTES DE ORDEM FÍSICA")
+    print("─" * 40)
+
+    testes = [
+        test_ordenar_por_inode_e_extent,
+        test_primeiro_extent,
+        test_organizar_com_ordem,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_ordem_fisica()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Testes da Reclassificação - Serum Preset Organizer
+===================================================
+Testes para o plano mínimo (rename, vínculo, cópia, remoção) ao mudar as regras de categoria.
+"""
+
+import sys
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.armazem import ArmazemConteudo
+from src.catalogo import CatalogoBiblioteca, caminho_catalogo
+from src.config import MAPA_CATEGORIAS
+from src.manipulador_arquivos import calcular_digest_arquivo, organizar_presets
+from src.metricas import MetricasExecucao
+from src.reclassificacao import reclassificar_destino
+
+
+@contextmanager
+def _keyword(categoria: str, keyword: str):
+    """Acrescenta uma keyword a uma categoria enquanto o bloco executa."""
+    MAPA_CATEGORIAS[categoria].append(keyword)
+    try:
+        yield
+    finally:
+        MAPA_CATEGORIAS[categoria].remove(keyword)
+
+
+def _criar_origem(pasta: Path):
+    """Um preset sem categoria, um em Bass e um que não muda."""
+    (pasta / "Zorp Thing.fxp").write_bytes(b"zorp" * 100)
+    (pasta / "Zorp Bass.fxp").write_bytes(b"zbass" * 100)
+    (pasta / "Soft Pad.fxp").write_bytes(b"pad" * 100)
+
+
+def test_plano_e_aplicacao():
+    """Testa o relatório por regra, a simulação e a aplicação (rename e cópia)."""
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_origem(Path(origem))
+        organizar_presets(origem, destino, modo_mover=False)
+        assert (Path(destino) / "Uncategorized" / "Zorp Thing.fxp").exists()
+
+        with _keyword("Lead", "zorp"):
+            metricas = MetricasExecucao()
+            plano = reclassificar_destino(destino, metricas=metricas)
+            assert plano["presets"] == 3 and plano["alterados"] == 2
+            assert plano["por_acao"] == {"mover": 1, "vincular": 0, "copiar": 1, "remover": 0}
+            regras = {(regra["mudanca"], regra["categoria"], regra["regra"]): regra["presets"]
+                      for regra in plano["por_regra"]}
+            assert regras == {("+", "Lead", "zorp"): 2, ("-", "Uncategorized", None): 1}
+            assert metricas.para_dict()["etapas"]["classificacao"]["contagem"] == 1
+            # Simulação não toca em nada
+            assert (Path(destino) / "Uncategorized" / "Zorp Thing.fxp").exists()
+            assert not (Path(destino) / "Lead").exists()
+
+            plano = reclassificar_destino(destino, aplicar=True)
+            assert plano["aplicacao"]["aplicadas"]["mover"] == 1 and not plano["aplicacao"]["erros"]
+            assert (Path(destino) / "Lead" / "Zorp Thing.fxp").read_bytes() == b"zorp" * 100
+            assert not (Path(destino) / "Uncategorized" / "Zorp Thing.fxp").exists()
+            assert (Path(destino) / "Lead" / "Zorp Bass.fxp").read_bytes() == b"zbass" * 100
+            assert (Path(destino) / "Bass" / "Zorp Bass.fxp").exists()
+
+            # Aplicado uma vez, não há mais nada a fazer
+            assert reclassificar_destino(destino)["alterados"] == 0
+
+        # Regra desfeita: volta para o lugar, e a cópia em Lead é apagada
+        plano = reclassificar_destino(destino, aplicar=True)
+        assert plano["por_acao"]["mover"] == 1 and plano["por_acao"]["remover"] == 1
+        assert (Path(destino) / "Uncategorized" / "Zorp Thing.fxp").exists()
+        assert not list((Path(destino) / "Lead").iterdir())
+
+    print("✅ test_plano_e_aplicacao passou")
+
+
+def test_colisao_e_pasta_manual():
+    """Testa colisão de nome com outro conteúdo e que pastas feitas à mão não são tocadas."""
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_origem(Path(origem))
+        organizar_presets(origem, destino, modo_mover=False)
+        (Path(destino) / "Lead").mkdir()
+        (Path(destino) / "Lead" / "Zorp Thing.fxp").write_bytes(b"outro")
+        (Path(destino) / "Favoritos").mkdir()
+        (Path(destino) / "Favoritos" / "Zorp Fav.fxp").write_bytes(b"fav")
+
+        with _keyword("Lead", "zorp"):
+            plano = reclassificar_destino(destino, aplicar=True)
+            assert plano["presets"] == 4, "Favoritos fica de fora"
+            assert (Path(destino) / "Lead" / "Zorp Thing.fxp").read_bytes() == b"outro"
+            assert (Path(destino) / "Lead" / "Zorp Thing_1.fxp").read_bytes() == b"zorp" * 100
+            assert (Path(destino) / "Favoritos" / "Zorp Fav.fxp").exists()
+
+            plano = reclassificar_destino(destino, extras=["Favoritos"])
+            assert [operacao["origem"] for operacao in plano["operacoes"]] == [
+                os.path.join(os.path.abspath(destino), "Favoritos", "Zorp Fav.fxp")
+            ]
+
+    print("✅ test_colisao_e_pasta_manual passou")
+
+
+def test_cli_armazem_e_catalogo():
+    """Testa reclassificar pela CLI com armazém (vínculos) e inventário do catálogo."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        _criar_origem(Path(origem))
+        organizar_presets(origem, destino, modo_mover=False, armazem=ArmazemConteudo(destino))
+        with CatalogoBiblioteca.para_destino(destino) as catalogo:
+            catalogo.iniciar_execucao([origem], destino, False)
+            for arquivo in Path(destino).glob("*/*.fxp"):
+                catalogo.registrar_arquivo(
+                    Path(origem) / arquivo.name, calcular_digest_arquivo(arquivo), arquivo.stat().st_size,
+                    [(arquivo.parent.name, arquivo, False, False)],
+                )
+            catalogo.finalizar_execucao()
+
+        saida = Path(origem) / "plano.json"
+        with _keyword("Lead", "zorp"):
+            codigo = executar_cli([
+                "reclassificar", "-d", destino, "--do-catalogo", "--aplicar",
+                "--formato", "json", "--saida", str(saida)
+            ])
+        assert codigo == SAIDA_OK
+        resultado = json.loads(saida.read_text(encoding="utf-8"))
+        assert resultado["por_acao"]["vincular"] == 1 and resultado["por_acao"]["mover"] == 1
+        assert resultado["metricas"]["bytes_escritos"] == 0, "Vínculo, não cópia"
+
+        objeto = ArmazemConteudo(destino).caminho_objeto(calcular_digest_arquivo(Path(origem) / "Zorp Bass.fxp"))
+        assert os.path.samefile(Path(destino) / "Lead" / "Zorp Bass.fxp", objeto)
+
+        with CatalogoBiblioteca(str(caminho_catalogo(destino))) as catalogo:
+            encontrados = catalogo.buscar(["Lead"])
+            assert encontrados["total"] == 2
+            destinos = {linha[0] for linha in catalogo.listar_colocacoes()}
+            assert str(Path(destino) / "Lead" / "Zorp Thing.fxp") in destinos
+            assert str(Path(destino) / "Uncategorized" / "Zorp Thing.fxp") not in destinos
+
+        # Relatório em texto (simulação)
+        codigo = executar_cli(["reclassificar", "-d", destino, "--saida", str(saida)])
+        assert codigo == SAIDA_OK
+        texto = saida.read_text(encoding="utf-8")
+        assert "2 de 3 preset(s) mudam de categoria" in texto and "Simulação" in texto
+
+    print("✅ test_cli_armazem_e_catalogo passou")
+
+
+def executar_testes_reclassificacao():
+    """Executa todos os testes da reclassificação."""
+    print("\n🔀 TESTES DA RECLASSIFICAÇÃO")
+    print("─" * 40)
+
+    testes = [
+        test_plano_e_aplicacao,
+        test_colisao_e_pasta_manual,
+        test_cli_armazem_e_catalogo,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_reclassificacao()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
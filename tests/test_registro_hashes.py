@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Testes do Registro de Hashes - Serum Preset Organizer
+======================================================
+Testes para o registro de deduplicação compartilhado entre origens e threads.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.registro_hashes import RegistroHashes, obter_registro
+
+
+def test_registro_como_dicionario():
+    """Testa a interface de mapeamento e o relatório de memória."""
+    registro = RegistroHashes({"a" * 32: "/destino/Bass/A.fxp"})
+    registro["b" * 32] = "/destino/Lead/B.fxp"
+
+    assert len(registro) == 2
+    assert "a" * 32 in registro
+    assert registro.get("c" * 32) is None
+    assert sorted(registro) == [bytes.fromhex("a" * 32), bytes.fromhex("b" * 32)], "Iteração devolve digests"
+
+    uso = registro.uso_memoria()
+    assert uso["entradas"] == 2
+    assert uso["bytes"] > 0 and uso["bytes_por_entrada"] > 0
+
+    # Registro é usado por referência; dict é copiado
+    assert obter_registro(registro) is registro
+    original = {"a" * 32: "x"}
+    copia = obter_registro(original)
+    copia["b" * 32] = "y"
+    assert "b" * 32 not in original
+
+    print("✅ test_registro_como_dicionario passou")
+
+
+def test_registro_compacto():
+    """Testa chaves em digest/hex, reconstrução dos caminhos e economia de memória."""
+    import hashlib
+    import random
+
+    registro = RegistroHashes()
+    referencia = {}
+    gerador = random.Random(7)
+    pastas = [os.path.join("/biblioteca", "Organizado", categoria) for categoria in ("Bass", "Lead", "Pad")]
+
+    for numero in range(2000):
+        digest = hashlib.md5(str(numero).encode()).digest()
+        destino = os.path.join(gerador.choice(pastas), f"Preset_{numero:05d}_çã.fxp")
+        registro[digest] = destino
+        referencia[digest.hex()] = destino
+
+    assert len(registro) == 2000
+    for hash_hex, destino in referencia.items():
+        assert registro[hash_hex] == destino, "Hash hex e digest devem achar o mesmo caminho"
+        assert registro[bytes.fromhex(hash_hex)] == destino
+    assert registro.registrar_se_ausente(next(iter(referencia)), "/outro") == referencia[next(iter(referencia))]
+
+    uso = registro.uso_memoria()
+    assert uso["pastas"] == 3, "Pastas repetidas são guardadas uma vez"
+    uso_dict_hex = sys.getsizeof(referencia) + sum(
+        sys.getsizeof(chave) + sys.getsizeof(valor) for chave, valor in referencia.items()
+    )
+    assert uso["bytes"] < uso_dict_hex * 0.7, "Registro compacto deve ocupar bem menos que dict hex -> caminho"
+
+    print("✅ test_registro_compacto passou")
+
+
+def test_registrar_se_ausente_entre_threads():
+    """Testa que só um trabalhador registra cada hash, mesmo em paralelo."""
+    registro = RegistroHashes()
+    vencedores = []
+    barreira = threading.Barrier(8)
+
+    def trabalhador(indice: int):
+        barreira.wait()
+        for numero in range(200):
+            if registro.registrar_se_ausente(f"{numero:032x}", f"t{indice}") is None:
+                vencedores.append(numero)
+
+    threads = [threading.Thread(target=trabalhador, args=(indice,)) for indice in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(registro) == 200
+    assert sorted(vencedores) == list(range(200)), "Cada hash deve ter exatamente um vencedor"
+
+    print("✅ test_registrar_se_ausente_entre_threads passou")
+
+
+def test_registro_compartilhado_entre_origens():
+    """Testa que múltiplas origens usam o mesmo registro, sem cópias por origem."""
+    from src.manipulador_arquivos import organizar_presets, organizar_presets_multiplas_origens
+
+    with tempfile.TemporaryDirectory() as destino:
+        with tempfile.TemporaryDirectory() as origem1:
+            with tempfile.TemporaryDirectory() as origem2:
+                (Path(origem1) / "Bass_A.fxp").write_bytes(b"bass")
+                (Path(origem2) / "Bass_B.fxp").write_bytes(b"bass")
+                (Path(origem2) / "Pad_C.fxp").write_bytes(b"pad")
+
+                stats = organizar_presets_multiplas_origens([origem1, origem2], destino, modo_mover=False)
+                registro = stats["_hashes"]
+
+                assert isinstance(registro, RegistroHashes)
+                assert len(registro) == 2
+                for stats_pasta in stats["estatisticas_por_pasta"].values():
+                    assert stats_pasta["_hashes"] is registro, "Todas as origens devem compartilhar o registro"
+
+                # Uma nova execução com o mesmo registro reconhece tudo como duplicata
+                stats_nova = organizar_presets(origem2, destino, modo_mover=False, hashes_existentes=registro)
+                assert stats_nova["total_duplicatas_ignoradas"] == 2
+
+    print("✅ test_registro_compartilhado_entre_origens passou")
+
+
+def executar_testes_registro_hashes():
+    """Executa todos os testes do registro de hashes."""
+    print("\n🗂️  TESTES DO REGISTRO DE HASHES")
+    print("─" * 40)
+
+    testes = [
+        test_registro_como_dicionario,
+        test_registro_compacto,
+        test_registrar_se_ausente_entre_threads,
+        test_registro_compartilhado_entre_origens,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_registro_hashes()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
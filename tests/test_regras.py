@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Testes das Regras Externas - Serum Preset Organizer
+====================================================
+Testes para o arquivo de regras (JSON/TOML), a validação e a recarga a quente.
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import CATEGORIA_PADRAO, MAPA_CATEGORIAS
+from src.manipulador_arquivos import organizar_presets
+from src.reclassificacao import reclassificar_destino
+from src.regras import (
+    RegrasCompiladas,
+    RegrasRecarregaveis,
+    montar_regras,
+    regras_padrao,
+    tomllib,
+)
+
+
+def _gravar(caminho: Path, dados: dict, avancar_mtime: float = 0):
+    """Grava um arquivo de regras JSON (avancar_mtime garante mtime diferente)."""
+    caminho.write_text(json.dumps(dados), encoding="utf-8")
+    if avancar_mtime:
+        momento = time.time() + avancar_mtime
+        os.utime(caminho, (momento, momento))
+
+
+def test_mesclar_e_substituir():
+    """Testa as regras acrescentadas às de config.py, a substituição e o TOML."""
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = Path(pasta) / "regras.json"
+        _gravar(arquivo, {"categorias": {"Lead": ["zorp"], "Riser": ["uplifter", "rs"]}, "keywords_curtas": ["RS"]})
+        regras = RegrasCompiladas.de_arquivo(str(arquivo))
+        assert regras.determinar_categorias("Zorp 01.fxp") == ["Lead"]
+        assert regras.determinar_categorias("RS Big 01.fxp") == ["Riser"]
+        assert regras.determinar_categorias("Cars.fxp") == [CATEGORIA_PADRAO], "rs é curta"
+        assert regras.determinar_categorias("Soft Pad.fxp") == ["Pad"], "Regras de config.py continuam"
+        assert regras.categorias()[-2:] == ["Riser", CATEGORIA_PADRAO]
+        assert regras.explicar_categoria("RS Big 01.fxp", "Riser") == "rs"
+        assert "zorp" not in MAPA_CATEGORIAS["Lead"], "config.py não é alterado"
+
+        _gravar(arquivo, {"categorias": {"Riser": ["uplifter"]}, "substituir": True})
+        regras = RegrasCompiladas.de_arquivo(str(arquivo))
+        assert regras.determinar_categorias("Soft Pad.fxp") == [CATEGORIA_PADRAO]
+        assert regras.determinar_categorias("Noite Azul.fxp") == [CATEGORIA_PADRAO], "Sem palavras em português"
+        assert regras.categorias() == ["Riser", CATEGORIA_PADRAO]
+
+        # Mesmo conteúdo, mesma assinatura; padrão é o conjunto de config.py
+        assert RegrasCompiladas.de_arquivo(str(arquivo)).assinatura == regras.assinatura
+        assert RegrasCompiladas(montar_regras({})).assinatura == RegrasCompiladas(regras_padrao()).assinatura
+
+        if tomllib is not None:
+            arquivo_toml = Path(pasta) / "regras.toml"
+            arquivo_toml.write_text(
+                'termos_genero = ["zorp wave"]\n\n[categorias]\nRiser = ["uplifter"]\n', encoding="utf-8"
+            )
+            regras = RegrasCompiladas.de_arquivo(str(arquivo_toml))
+            assert regras.determinar_categorias("Zorp Wave Uplifter.fxp") == ["Riser"]
+            assert regras.determinar_categorias("Zorp Wave Pad.fxp") == ["Pad"]
+
+    print("✅ test_mesclar_e_substituir passou")
+
+
+def test_validacao():
+    """Testa que arquivos inválidos são recusados com ValueError."""
+    invalidos = [
+        {"categoria": {}},                              # Chave desconhecida
+        {"categorias": ["Lead"]},                       # Não é um mapa
+        {"categorias": {"Lead": "zorp"}},               # Keywords não são lista
+        {"categorias": {"../Fora": ["x"]}},             # Nome de pasta inválido
+        {"keywords_curtas": [1]},
+        {"substituir": "sim"},
+        {"padroes_customizados": ["(aberto"]},          # Regex inválido
+    ]
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = Path(pasta) / "regras.json"
+        for dados in invalidos:
+            _gravar(arquivo, dados)
+            try:
+                RegrasCompiladas.de_arquivo(str(arquivo))
+            except ValueError:
+                continue
+            raise AssertionError(f"aceitou {dados}")
+
+        for nome, conteudo in (("regras.json", "{sem aspas}"), ("regras.json", "[]"), ("regras.yaml", "{}")):
+            (Path(pasta) / nome).write_text(conteudo, encoding="utf-8")
+            try:
+                RegrasCompiladas.de_arquivo(str(Path(pasta) / nome))
+            except ValueError:
+                continue
+            raise AssertionError(f"aceitou {nome}: {conteudo}")
+
+    print("✅ test_validacao passou")
+
+
+def test_recarga_a_quente():
+    """Testa a recarga pelo mtime, o memo por assinatura e que um arquivo inválido não troca as regras."""
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = Path(pasta) / "regras.json"
+        _gravar(arquivo, {"categorias": {"Lead": ["zorp"]}})
+        regras = RegrasRecarregaveis(str(arquivo))
+        assert regras.determinar_categorias("Zorp.fxp") == ["Lead"]
+        assert regras.verificar() is False, "Arquivo não mudou"
+
+        assinatura = regras.atual.assinatura
+        _gravar(arquivo, {"categorias": {"Bass": ["zorp"]}}, avancar_mtime=10)
+        assert regras.verificar() is True
+        assert regras.atual.assinatura != assinatura
+        assert regras.determinar_categorias("Zorp.fxp") == ["Bass"], "Memo descartado com a assinatura"
+
+        # Arquivo quebrado: as regras anteriores continuam e o erro é registrado
+        arquivo.write_text("{quebrado", encoding="utf-8")
+        os.utime(arquivo, (time.time() + 20, time.time() + 20))
+        assert regras.verificar() is False
+        assert regras.determinar_categorias("Zorp.fxp") == ["Bass"]
+        assert len(regras.erros) == 1 and regras.recarregamentos == 1
+
+        # Mesmo conteúdo de novo (só o mtime muda): nada a trocar
+        _gravar(arquivo, {"categorias": {"Bass": ["zorp"]}}, avancar_mtime=30)
+        assert regras.verificar() is False
+
+        # Thread de vigia
+        with RegrasRecarregaveis(str(arquivo), intervalo=0.02) as vigiadas:
+            _gravar(arquivo, {"categorias": {"Pad": ["zorp"]}}, avancar_mtime=40)
+            limite = time.time() + 5
+            while vigiadas.recarregamentos == 0 and time.time() < limite:
+                time.sleep(0.02)
+            assert vigiadas.determinar_categorias("Zorp.fxp") == ["Pad"]
+        assert vigiadas._vigia is None
+        assert vigiadas.para_dict()["recarregamentos"] == 1
+
+    print("✅ test_recarga_a_quente passou")
+
+
+def test_organizar_e_reclassificar_com_regras():
+    """Testa organizar_presets, reclassificar e a CLI com um arquivo de regras."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        (Path(origem) / "Zorp Thing.fxp").write_bytes(b"zorp" * 100)
+        (Path(origem) / "Soft Pad.fxp").write_bytes(b"pad" * 100)
+        arquivo = Path(origem) / "regras.json"
+        _gravar(arquivo, {"categorias": {"Zorps": ["zorp"]}})
+
+        regras = RegrasRecarregaveis(str(arquivo))
+        organizar_presets(origem, destino, modo_mover=False, classificador=regras.determinar_categorias)
+        assert (Path(destino) / "Zorps" / "Zorp Thing.fxp").exists()
+        assert (Path(destino) / "Pad" / "Soft Pad.fxp").exists()
+
+        # Sem o arquivo, a categoria nova volta para Uncategorized; com ele, nada muda
+        assert reclassificar_destino(destino, regras=regras.atual)["alterados"] == 0
+        plano = reclassificar_destino(destino)
+        assert plano["alterados"] == 0, "Zorps não é uma categoria de config.py"
+        plano = reclassificar_destino(destino, extras=["Zorps"])
+        assert plano["alterados"] == 1
+
+        _gravar(arquivo, {"categorias": {"Lead": ["zorp"]}, "substituir": True}, avancar_mtime=10)
+        saida = Path(origem) / "plano.json"
+        codigo = executar_cli([
+            "reclassificar", "-d", destino, "--regras", str(arquivo), "--incluir-pasta", "Zorps",
+            "--formato", "json", "--saida", str(saida)
+        ])
+        assert codigo == SAIDA_OK
+        resultado = json.loads(saida.read_text(encoding="utf-8"))
+        assert resultado["alterados"] == 2, "Zorps -> Lead e Pad -> Uncategorized"
+        assert resultado["regras"]["assinatura"] == RegrasCompiladas.de_arquivo(str(arquivo)).assinatura
+
+    with tempfile.TemporaryDirectory() as origem, tempfile.TemporaryDirectory() as destino:
+        (Path(origem) / "Zorp Thing.fxp").write_bytes(b"zorp" * 100)
+        arquivo = Path(origem) / "regras.json"
+        _gravar(arquivo, {"categorias": {"Zorps": ["zorp"]}})
+        saida = Path(origem) / "resumo.json"
+        codigo = executar_cli([
+            "organizar", "-o", origem, "-d", destino, "--regras", str(arquivo),
+            "--vigiar-regras", "0.05", "--formato", "json", "--saida", str(saida)
+        ])
+        assert codigo == SAIDA_OK
+        resumo = json.loads(saida.read_text(encoding="utf-8"))
+        assert resumo["regras"]["arquivo"] == str(arquivo) and not resumo["regras"]["erros"]
+        assert (Path(destino) / "Zorps" / "Zorp Thing.fxp").exists()
+
+        # Arquivo inválido ou --vigiar-regras sem --regras: erro de argumento (saída 2)
+        arquivo.write_text("{quebrado", encoding="utf-8")
+        for argumentos in (["--regras", str(arquivo)], ["--vigiar-regras"]):
+            try:
+                executar_cli(["organizar", "-o", origem, "-d", destino, *argumentos])
+            except SystemExit as saida_erro:
+                assert saida_erro.code == 2
+            else:
+                raise AssertionError(f"aceitou {argumentos}")
+
+    print("✅ test_organizar_e_reclassificar_com_regras passou")
+
+
+def executar_testes_regras():
+    """Executa todos os testes das regras externas."""
+    print("\n📜 TESTES DAS REGRAS EXTERNAS")
+    print("─" * 40)
+
+    testes = [
+        test_mesclar_e_substituir,
+        test_validacao,
+        test_recarga_a_quente,
+        test_organizar_e_reclassificar_com_regras,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_regras()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Testes de Similaridade - Serum Preset Organizer
+================================================
+Testes para os esboços MinHash, o agrupamento por LSH e o relatório de quase-duplicatas.
+"""
+
+import sys
+import os
+import io
+import json
+import random
+import tempfile
+import contextlib
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.similaridade import (
+    NUM_HASHES,
+    UniaoBusca,
+    agrupar_similares,
+    esboco_minhash,
+    similaridade_estimada,
+)
+
+
+def _conteudo(semente: int, tamanho: int = 16384) -> bytes:
+    rng = random.Random(semente)
+    return bytes(rng.getrandbits(8) for _ in range(tamanho))
+
+
+def _ajustar(dados: bytes, posicoes: list) -> bytes:
+    """Simula um knob ajustado: troca alguns bytes do preset."""
+    alterado = bytearray(dados)
+    for posicao in posicoes:
+        alterado[posicao] ^= 0xFF
+    return bytes(alterado)
+
+
+def test_esboco_minhash():
+    """Testa que o esboço é determinístico e reflete a semelhança do conteúdo."""
+    base = _conteudo(1)
+    esboco = esboco_minhash(base)
+
+    assert len(esboco) == NUM_HASHES
+    assert esboco == esboco_minhash(base), "Esboço deve ser determinístico"
+    assert similaridade_estimada(esboco, esboco_minhash(_ajustar(base, [100, 9000]))) >= 0.9
+    assert similaridade_estimada(esboco, esboco_minhash(_conteudo(2))) <= 0.1
+
+    # Presets menores que o esboço (compartimentos vazios) continuam comparáveis
+    pequeno = _conteudo(3, tamanho=640)
+    assert len(esboco_minhash(pequeno)) == NUM_HASHES
+    assert similaridade_estimada(esboco_minhash(pequeno), esboco_minhash(pequeno)) == 1.0
+    assert esboco_minhash(b"") == (0,) * NUM_HASHES
+
+    print("✅ test_esboco_minhash passou")
+
+
+def test_uniao_busca():
+    """Testa a união transitiva e a listagem dos grupos."""
+    uniao = UniaoBusca()
+    uniao.unir("a", "b")
+    uniao.unir("c", "d")
+    uniao.unir("b", "d")
+    uniao.encontrar("sozinho")
+
+    grupos = uniao.grupos()
+    assert len(grupos) == 1
+    assert sorted(grupos[0]) == ["a", "b", "c", "d"]
+
+    print("✅ test_uniao_busca passou")
+
+
+def test_agrupar_similares():
+    """Testa que o LSH agrupa as variações e separa conteúdos diferentes."""
+    base_a = _conteudo(10)
+    base_b = _conteudo(20)
+    esbocos = {
+        "a": esboco_minhash(base_a),
+        "a_renomeado": esboco_minhash(_ajustar(base_a, [40])),
+        "a_knob": esboco_minhash(_ajustar(base_a, [5000, 5001])),
+        "b": esboco_minhash(base_b),
+        "b_knob": esboco_minhash(_ajustar(base_b, [12000])),
+    }
+    for semente in range(30, 60):
+        esbocos[f"outro_{semente}"] = esboco_minhash(_conteudo(semente))
+
+    grupos = [sorted(grupo) for grupo in agrupar_similares(esbocos)]
+    assert grupos == [["a", "a_knob", "a_renomeado"], ["b", "b_knob"]], grupos
+
+    print("✅ test_agrupar_similares passou")
+
+
+def test_quase_duplicatas_no_relatorio():
+    """Testa --similares na CLI: grupos no resumo JSON, etapa medida e relatório em texto."""
+    from src.cli import executar_cli, SAIDA_OK
+
+    with tempfile.TemporaryDirectory() as origem:
+        with tempfile.TemporaryDirectory() as destino:
+            base = _conteudo(7)
+            (Path(origem) / "Growl_Bass.fxp").write_bytes(base)
+            (Path(origem) / "Growl_Bass_v2.fxp").write_bytes(_ajustar(base, [2048]))
+            (Path(origem) / "Soft_Pad.fxp").write_bytes(_conteudo(8))
+
+            saida = Path(origem) / "resumo.json"
+            codigo = executar_cli([
+                "organizar", "-o", origem, "-d", destino, "--modo", "copiar",
+                "--formato", "json", "--saida", str(saida), "--similares", "--sem-catalogo"
+            ])
+            assert codigo == SAIDA_OK
+            resumo = json.loads(saida.read_text(encoding="utf-8"))
+
+            grupos = resumo["estatisticas"]["quase_duplicatas"]
+            assert len(grupos) == 1
+            assert [Path(arquivo).name for arquivo in grupos[0]["arquivos"]] == ["Growl_Bass.fxp", "Growl_Bass_v2.fxp"]
+            assert grupos[0]["similaridade_minima"] >= 0.8
+            assert resumo["estatisticas"]["metricas"]["etapas"]["similaridade"]["contagem"] == 1
+
+            # Relatório em texto
+            from src.interface_visual import exibir_resultado_final
+            texto = io.StringIO()
+            with contextlib.redirect_stdout(texto):
+                exibir_resultado_final(resumo["estatisticas"], 1.0, destino)
+            assert "QUASE-DUPLICATAS" in texto.getvalue()
+            assert os.path.join("Bass", "Growl_Bass_v2.fxp") in texto.getvalue()
+
+            # Sem a opção, a etapa não roda
+            with tempfile.TemporaryDirectory() as outro_destino:
+                executar_cli([
+                    "organizar", "-o", origem, "-d", outro_destino, "--modo", "copiar",
+                    "--formato", "json", "--saida", str(saida), "--sem-catalogo"
+                ])
+                assert "quase_duplicatas" not in json.loads(saida.read_text(encoding="utf-8"))["estatisticas"]
+
+    print("✅ test_quase_duplicatas_no_relatorio passou")
+
+
+def executar_testes_similaridade():
+    """Executa todos os testes de similaridade."""
+    print("\n🧬 TESTES DE SIMILARIDADE")
+    print("─" * 40)
+
+    testes = [
+        test_esboco_minhash,
+        test_uniao_busca,
+        test_agrupar_similares,
+        test_quase_duplicatas_no_relatorio,
+    ]
+
+    passou = 0
+    falhou = 0
+
+    for teste in testes:
+        try:
+            teste()
+            passou += 1
+        except AssertionError as e:
+            print(f"❌ {teste.__name__} FALHOU: {e}")
+            falhou += 1
+        except Exception as e:
+            print(f"❌ {teste.__name__} ERRO: {e}")
+            falhou += 1
+
+    return passou, falhou
+
+
+if __name__ == "__main__":
+    passou, falhou = executar_testes_similaridade()
+    print(f"\n📊 Resultado: {passou} passaram, {falhou} falharam")
@@ -4,121 +4,388 @@ Utilitário para listar todos os arquivos de uma pasta
 ======================================================
 Gera um arquivo .txt com todos os nomes de arquivos encontrados.
 Útil para testar e analisar quais arquivos precisam de tratamento.
+
+A listagem é feita em fluxo, para pastas com milhões de arquivos em
+máquinas pequenas: o scan usa os.scandir, a ordenação é externa (blocos
+ordenados gravados em arquivos temporários e depois intercalados) e a
+escrita é bufferizada. A memória fica limitada pelo tamanho do bloco, não
+pelo número de arquivos.
+
+Opcionalmente cada linha traz colunas separadas por tabulação depois do
+nome (tamanho, mtime, md5); testar_categorizacao.py usa só o nome.
+
+Uma linha por arquivo: nos nomes, barra invertida, tabulação e quebras de
+linha são escapadas como \\\\, \\t, \\r e \\n (veja escapar_nome), para que
+um nome estranho não vire duas linhas nem desloque as colunas.
+
+USO:
+    python utils/listar_arquivos.py                     # Interativo
+    python utils/listar_arquivos.py PASTA --presets --colunas tamanho,mtime,md5 --saida lista.txt
 """
 
+import argparse
+import heapq
+import itertools
 import os
-from pathlib import Path
+import re
+import sys
+import tempfile
 from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+# Adiciona diretório pai ao path para importar módulos
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.manipulador_arquivos import calcular_hash_arquivo
+
+
+# Colunas opcionais, na ordem em que aparecem na linha
+COLUNAS_DISPONIVEIS = ("tamanho", "mtime", "md5")
+
+# Linhas ordenadas em memória antes de irem para um arquivo temporário
+LINHAS_POR_BLOCO = 200_000
+
+# Arquivos temporários intercalados de uma vez (acima disso, em várias passadas)
+LIMITE_INTERCALACAO = 64
+
+# Buffer de escrita/leitura dos arquivos de lista
+_BUFFER = 1024 * 1024
+
+# Caracteres do nome que quebrariam o formato (linha por arquivo, colunas por tabulação)
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\r": "\\r", "\n": "\\n"})
+_ESCAPE = re.compile(r"\\([\\trn])")
+_DESESCAPES = {"\\": "\\", "t": "\t", "r": "\r", "n": "\n"}
+
+
+def percorrer_arquivos(pasta: str, extensoes: Optional[Iterable[str]] = None) -> Iterator[os.DirEntry]:
+    """
+    Percorre os arquivos de uma pasta recursivamente com os.scandir.
+
+    Args:
+        pasta: Caminho da pasta
+        extensoes: Extensões para filtrar (ex: ['.fxp', '.serumpreset']); None lista todos
+
+    Yields:
+        os.DirEntry de cada arquivo (o stat já vem do scandir na maioria dos sistemas)
+    """
+    filtro = {ext.lower() for ext in extensoes} if extensoes else None
+    pendentes = [pasta]
+    while pendentes:
+        atual = pendentes.pop()
+        try:
+            with os.scandir(atual) as entradas:
+                for entrada in entradas:
+                    # Links para pastas não são seguidos (evita ciclos)
+                    if entrada.is_dir(follow_symlinks=False):
+                        pendentes.append(entrada.path)
+                    elif entrada.is_file() and (
+                        filtro is None or os.path.splitext(entrada.name)[1].lower() in filtro
+                    ):
+                        yield entrada
+        except (PermissionError, FileNotFoundError):
+            continue
+
+
+def escapar_nome(nome: str) -> str:
+    """Nome com \\, tabulação e quebras de linha escapados (\\\\, \\t, \\r, \\n); os demais ficam iguais."""
+    return nome.translate(_ESCAPES)
+
+
+def desescapar_nome(nome: str) -> str:
+    """Inverso de escapar_nome: o nome original a partir do que está na lista."""
+    return _ESCAPE.sub(lambda achado: _DESESCAPES[achado.group(1)], nome)
+
+
+def formatar_linha(entrada: os.DirEntry, colunas: Sequence[str] = ()) -> str:
+    """Nome do arquivo (escapado com escapar_nome) seguido das colunas pedidas, separadas por tabulação."""
+    if not colunas:
+        return escapar_nome(entrada.name)
+    campos = [escapar_nome(entrada.name)]
+    info = entrada.stat() if "tamanho" in colunas or "mtime" in colunas else None
+    for coluna in colunas:
+        if coluna == "tamanho":
+            campos.append(str(info.st_size))
+        elif coluna == "mtime":
+            campos.append(datetime.fromtimestamp(info.st_mtime).isoformat(timespec="seconds"))
+        elif coluna == "md5":
+            try:
+                campos.append(calcular_hash_arquivo(Path(entrada.path)))
+            except OSError:
+                campos.append("-")
+    return "\t".join(campos)
+
+
+class OrdenacaoExterna:
+    """
+    Ordena linhas de texto com memória limitada.
+
+    Até `linhas_por_bloco` linhas ficam em memória; cada bloco cheio é
+    ordenado e gravado num arquivo temporário, e ordenadas() intercala os
+    blocos com heapq.merge. Se tudo couber num bloco, nada vai para o disco.
+
+    Uso:
+        with OrdenacaoExterna() as ordenacao:
+            ordenacao.extend(linhas)
+            for linha in ordenacao.ordenadas():
+                ...
+    """
+
+    def __init__(self, linhas_por_bloco: int = LINHAS_POR_BLOCO, pasta_temporaria: Optional[str] = None):
+        """
+        Args:
+            linhas_por_bloco: Linhas ordenadas em memória por bloco
+            pasta_temporaria: Onde gravar os blocos (padrão: a do sistema)
+        """
+        self.linhas_por_bloco = max(1, linhas_por_bloco)
+        self.total = 0
+        self._pasta = tempfile.TemporaryDirectory(prefix="listagem_", dir=pasta_temporaria)
+        self._bloco: List[str] = []
+        self._blocos: List[str] = []
+        self._numeros = itertools.count(1)
+
+    @property
+    def blocos(self) -> int:
+        """Blocos gravados em disco até agora."""
+        return len(self._blocos)
+
+    def append(self, linha: str):
+        self._bloco.append(linha)
+        self.total += 1
+        if len(self._bloco) >= self.linhas_por_bloco:
+            self._gravar_bloco(sorted(self._bloco))
+            self._bloco = []
+
+    def extend(self, linhas: Iterable[str]):
+        for linha in linhas:
+            self.append(linha)
+
+    def _gravar_bloco(self, linhas: Iterable[str]):
+        caminho = os.path.join(self._pasta.name, f"bloco_{next(self._numeros)}.txt")
+        with open(caminho, "w", encoding="utf-8", errors="surrogateescape", newline="\n",
+                  buffering=_BUFFER) as arquivo:
+            for linha in linhas:
+                arquivo.write(linha)
+                arquivo.write("\n")
+        self._blocos.append(caminho)
+
+    def _ler_bloco(self, caminho: str) -> Iterator[str]:
+        with open(caminho, encoding="utf-8", errors="surrogateescape", newline="\n",
+                  buffering=_BUFFER) as arquivo:
+            for linha in arquivo:
+                yield linha[:-1]
+        os.remove(caminho)
+
+    def ordenadas(self) -> Iterator[str]:
+        """Todas as linhas recebidas, em ordem (chame depois de terminar de adicionar)."""
+        if not self._blocos:
+            yield from sorted(self._bloco)
+            return
+        if self._bloco:
+            self._gravar_bloco(sorted(self._bloco))
+            self._bloco = []
+        # Muitos blocos: intercala em grupos até caberem numa passada
+        while len(self._blocos) > LIMITE_INTERCALACAO:
+            grupo, self._blocos = self._blocos[:LIMITE_INTERCALACAO], self._blocos[LIMITE_INTERCALACAO:]
+            self._gravar_bloco(heapq.merge(*(self._ler_bloco(caminho) for caminho in grupo)))
+        blocos, self._blocos = self._blocos, []
+        yield from heapq.merge(*(self._ler_bloco(caminho) for caminho in blocos))
+
+    def fechar(self):
+        """Apaga os arquivos temporários."""
+        self._pasta.cleanup()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+        return False
+
+
+def _escrever_cabecalho(arquivo, pasta_origem: str, total: int, colunas: Sequence[str] = ()):
+    arquivo.write(f"# Lista de arquivos\n")
+    arquivo.write(f"# Pasta: {pasta_origem}\n")
+    arquivo.write(f"# Total: {total} arquivos\n")
+    arquivo.write(f"# Data: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
+    if colunas:
+        arquivo.write("# Colunas: " + "\t".join(["nome", *colunas]) + "\n")
+    arquivo.write(f"# {'=' * 60}\n\n")
+
+
+def _nome_saida_padrao() -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"lista_arquivos_{timestamp}.txt"
+
+
+def exportar_lista(
+    pasta: str,
+    arquivo_saida: Optional[str] = None,
+    extensoes: Optional[Iterable[str]] = None,
+    colunas: Sequence[str] = (),
+    linhas_por_bloco: int = LINHAS_POR_BLOCO,
+    pasta_temporaria: Optional[str] = None
+) -> dict:
+    """
+    Lista uma pasta direto para um arquivo .txt ordenado, com memória limitada.
+
+    Args:
+        pasta: Caminho da pasta
+        arquivo_saida: Arquivo de saída (padrão: lista_arquivos_<data>.txt)
+        extensoes: Extensões para filtrar; None lista todos
+        colunas: Colunas extras de COLUNAS_DISPONIVEIS (ex: ("tamanho", "md5"))
+        linhas_por_bloco: Linhas ordenadas em memória por vez
+        pasta_temporaria: Onde gravar os blocos da ordenação
+
+    Returns:
+        Dict com arquivo (saída), total e blocos (gravados em disco)
+
+    Raises:
+        FileNotFoundError: A pasta não existe
+        ValueError: Coluna desconhecida
+    """
+    desconhecidas = [coluna for coluna in colunas if coluna not in COLUNAS_DISPONIVEIS]
+    if desconhecidas:
+        raise ValueError(f"colunas desconhecidas: {', '.join(desconhecidas)}")
+    if not os.path.isdir(pasta):
+        raise FileNotFoundError(f"Pasta não encontrada: {pasta}")
+    colunas = [coluna for coluna in COLUNAS_DISPONIVEIS if coluna in colunas]
+    arquivo_saida = arquivo_saida or _nome_saida_padrao()
+
+    with OrdenacaoExterna(linhas_por_bloco, pasta_temporaria) as ordenacao:
+        ordenacao.extend(formatar_linha(entrada, colunas) for entrada in percorrer_arquivos(pasta, extensoes))
+        blocos = ordenacao.blocos
+        # O total já é conhecido antes da intercalação: o cabeçalho continua no topo
+        with open(arquivo_saida, "w", encoding="utf-8", errors="surrogateescape", buffering=_BUFFER) as f:
+            _escrever_cabecalho(f, pasta, ordenacao.total, colunas)
+            for linha in ordenacao.ordenadas():
+                f.write(linha)
+                f.write("\n")
+        return {"arquivo": arquivo_saida, "total": ordenacao.total, "blocos": blocos}
 
 
 def listar_arquivos_pasta(pasta: str, extensoes: list = None) -> list:
     """
     Lista todos os arquivos em uma pasta recursivamente.
-    
+
     Args:
         pasta: Caminho da pasta
         extensoes: Lista de extensões para filtrar (ex: ['.fxp', '.serumpreset'])
                    Se None, lista todos os arquivos
-    
+
     Returns:
-        Lista de nomes de arquivos
+        Lista de nomes de arquivos (para pastas grandes, use exportar_lista)
     """
-    arquivos = []
-    pasta_path = Path(pasta)
-    
-    if not pasta_path.exists():
+    if not Path(pasta).exists():
         print(f"❌ Pasta não encontrada: {pasta}")
         return []
-    
-    for arquivo in pasta_path.rglob('*'):
-        if arquivo.is_file():
-            if extensoes:
-                if arquivo.suffix.lower() in [ext.lower() for ext in extensoes]:
-                    arquivos.append(arquivo.name)
-            else:
-                arquivos.append(arquivo.name)
-    
-    return sorted(arquivos)
+
+    return sorted(entrada.name for entrada in percorrer_arquivos(pasta, extensoes))
 
 
 def salvar_lista(arquivos: list, pasta_origem: str, arquivo_saida: str = None):
     """
     Salva a lista de arquivos em um arquivo .txt
-    
+
     Args:
-        arquivos: Lista de nomes de arquivos
+        arquivos: Lista de nomes de arquivos (escapados aqui com escapar_nome, como em exportar_lista)
         pasta_origem: Pasta que foi escaneada (para referência)
         arquivo_saida: Nome do arquivo de saída (opcional)
     """
     if arquivo_saida is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        arquivo_saida = f"lista_arquivos_{timestamp}.txt"
-    
-    with open(arquivo_saida, 'w', encoding='utf-8') as f:
-        f.write(f"# Lista de arquivos\n")
-        f.write(f"# Pasta: {pasta_origem}\n")
-        f.write(f"# Total: {len(arquivos)} arquivos\n")
-        f.write(f"# Data: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}\n")
-        f.write(f"# {'=' * 60}\n\n")
-        
-        for arquivo in arquivos:
-            f.write(f"{arquivo}\n")
-    
+        arquivo_saida = _nome_saida_padrao()
+
+    with open(arquivo_saida, 'w', encoding='utf-8', errors='surrogateescape', buffering=_BUFFER) as f:
+        _escrever_cabecalho(f, pasta_origem, len(arquivos))
+        f.writelines(f"{escapar_nome(arquivo)}\n" for arquivo in arquivos)
+
     return arquivo_saida
 
 
+def ler_previa(arquivo_lista: str, quantidade: int = 20) -> List[str]:
+    """Primeiras linhas de uma lista gerada (sem o cabeçalho)."""
+    previa = []
+    with open(arquivo_lista, encoding="utf-8", errors="surrogateescape") as f:
+        for linha in f:
+            if linha.strip() and not linha.startswith("#"):
+                previa.append(linha.rstrip("\n"))
+                if len(previa) >= quantidade:
+                    break
+    return previa
+
+
+def _executar(pasta: str, extensoes, colunas=(), arquivo_saida: str = None):
+    """Gera a lista e mostra o resultado e a prévia."""
+    print(f"\n  🔍 Escaneando pasta...")
+    try:
+        resultado = exportar_lista(pasta, arquivo_saida, extensoes, colunas)
+    except FileNotFoundError as erro:
+        print(f"  ❌ {erro}")
+        return
+
+    if not resultado["total"]:
+        os.remove(resultado["arquivo"])
+        print("  ⚠️ Nenhum arquivo encontrado!")
+        return
+
+    print(f"  ✅ Encontrados {resultado['total']} arquivos")
+    print(f"\n  📄 Lista salva em: {os.path.abspath(resultado['arquivo'])}")
+
+    # Mostra prévia
+    print(f"\n  📋 Prévia (primeiros 20 arquivos):")
+    print("  " + "-" * 50)
+    for i, linha in enumerate(ler_previa(resultado["arquivo"]), 1):
+        print(f"  {i:3}. {linha}")
+
+    if resultado["total"] > 20:
+        print(f"  ... e mais {resultado['total'] - 20} arquivos")
+
+    print("\n  ✅ Concluído!\n")
+
+
 def main():
+    if len(sys.argv) > 1:
+        parser = argparse.ArgumentParser(description="Exporta a lista de arquivos de uma pasta (ordenada)")
+        parser.add_argument("pasta", help="Pasta a listar")
+        parser.add_argument("--presets", action="store_true", help="Apenas .fxp e .serumpreset")
+        parser.add_argument("--colunas", default="",
+                            help=f"Colunas extras separadas por vírgula: {', '.join(COLUNAS_DISPONIVEIS)}")
+        parser.add_argument("--saida", default=None, help="Arquivo de saída")
+        args = parser.parse_args()
+        colunas = [coluna.strip() for coluna in args.colunas.split(",") if coluna.strip()]
+        invalidas = [coluna for coluna in colunas if coluna not in COLUNAS_DISPONIVEIS]
+        if invalidas:
+            parser.error(f"colunas desconhecidas: {', '.join(invalidas)}")
+        extensoes = ['.fxp', '.serumpreset'] if args.presets else None
+        _executar(args.pasta, extensoes, colunas, args.saida)
+        return
+
     print("\n" + "=" * 60)
     print("  📋 LISTADOR DE ARQUIVOS")
     print("=" * 60)
-    
+
     # Solicita pasta
     print("\n  Digite o caminho da pasta:")
     pasta = input("  > ").strip().strip('"').strip("'")
-    
+
     if not pasta:
         print("  ❌ Caminho não pode estar vazio.")
         return
-    
+
     # Pergunta se quer filtrar por extensão
     print("\n  Filtrar por extensões de preset? (.fxp, .serumpreset)")
     print("  [S] Sim - apenas presets")
     print("  [N] Não - todos os arquivos")
     filtrar = input("  > ").strip().lower()
-    
+
     extensoes = None
     if filtrar in ['s', 'sim', 'y', 'yes']:
         extensoes = ['.fxp', '.serumpreset']
         print("  ✅ Filtrando apenas arquivos .fxp e .serumpreset")
     else:
         print("  ✅ Listando todos os arquivos")
-    
-    # Lista arquivos
-    print(f"\n  🔍 Escaneando pasta...")
-    arquivos = listar_arquivos_pasta(pasta, extensoes)
-    
-    if not arquivos:
-        print("  ⚠️ Nenhum arquivo encontrado!")
-        return
-    
-    print(f"  ✅ Encontrados {len(arquivos)} arquivos")
-    
-    # Salva em arquivo
-    arquivo_saida = salvar_lista(arquivos, pasta)
-    caminho_completo = os.path.abspath(arquivo_saida)
-    
-    print(f"\n  📄 Lista salva em: {caminho_completo}")
-    
-    # Mostra prévia
-    print(f"\n  📋 Prévia (primeiros 20 arquivos):")
-    print("  " + "-" * 50)
-    for i, arquivo in enumerate(arquivos[:20], 1):
-        print(f"  {i:3}. {arquivo}")
-    
-    if len(arquivos) > 20:
-        print(f"  ... e mais {len(arquivos) - 20} arquivos")
-    
-    print("\n  ✅ Concluído!\n")
+
+    _executar(pasta, extensoes)
 
 
 if __name__ == "__main__":
@@ -17,6 +17,22 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from tests.test_categorizador import executar_testes_categorizador
 from tests.test_manipulador import executar_testes_manipulador
+from tests.test_cli import executar_testes_cli
+from tests.test_interface_visual import executar_testes_interface_visual
+from tests.test_registro_hashes import executar_testes_registro_hashes
+from tests.test_catalogo import executar_testes_catalogo
+from tests.test_indice_busca import executar_testes_indice_busca
+from tests.test_similaridade import executar_testes_similaridade
+from tests.test_analise_nomes import executar_testes_analise_nomes
+from tests.test_agendador_io import executar_testes_agendador_io
+from tests.test_ordem_fisica import executar_testes_ordem_fisica
+from tests.test_armazem import executar_testes_armazem
+from tests.test_indexador_destino import executar_testes_indexador_destino
+from tests.test_reclassificacao import executar_testes_reclassificacao
+from tests.test_classificador_tokens import executar_testes_classificador_tokens
+from tests.test_regras import executar_testes_regras
+from tests.test_memoria_limitada import executar_testes_memoria_limitada
+from tests.test_listar_arquivos import executar_testes_listar_arquivos
 
 
 def main():
@@ -39,6 +55,86 @@ def main():
     total_passou += passou
     total_falhou += falhou
     
+    # Testes da linha de comando
+    passou, falhou = executar_testes_cli()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes da interface visual
+    passou, falhou = executar_testes_interface_visual()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do registro de hashes
+    passou, falhou = executar_testes_registro_hashes()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do catálogo
+    passou, falhou = executar_testes_catalogo()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do índice de busca
+    passou, falhou = executar_testes_indice_busca()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes de similaridade
+    passou, falhou = executar_testes_similaridade()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes de análise de nomes
+    passou, falhou = executar_testes_analise_nomes()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do agendador de I/O
+    passou, falhou = executar_testes_agendador_io()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes da ordem física
+    passou, falhou = executar_testes_ordem_fisica()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do armazém de conteúdo
+    passou, falhou = executar_testes_armazem()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do indexador do destino
+    passou, falhou = executar_testes_indexador_destino()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes da reclassificação
+    passou, falhou = executar_testes_reclassificacao()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do classificador por tokens
+    passou, falhou = executar_testes_classificador_tokens()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes das regras externas
+    passou, falhou = executar_testes_regras()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes da memória limitada
+    passou, falhou = executar_testes_memoria_limitada()
+    total_passou += passou
+    total_falhou += falhou
+    
+    # Testes do listador de arquivos
+    passou, falhou = executar_testes_listar_arquivos()
+    total_passou += passou
+    total_falhou += falhou
+    
     # Resultado final
     print("\n" + "=" * 60)
     print(f"📊 RESULTADO FINAL: {total_passou}/{total_passou + total_falhou} testes passaram")
@@ -13,6 +13,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.categorizador import identificar_categorias
 from src.config import CATEGORIA_PADRAO
+from utils.listar_arquivos import desescapar_nome, escapar_nome
+
+
+def _para_exibir(nome: str) -> str:
+    """Nome imprimível: escapado e com bytes não decodificáveis trocados por �."""
+    return escapar_nome(nome).encode('utf-8', 'surrogateescape').decode('utf-8', 'replace')
 
 
 def testar_lista_arquivos(caminho_lista: str):
@@ -26,12 +32,15 @@ def testar_lista_arquivos(caminho_lista: str):
         print(f"❌ Arquivo não encontrado: {caminho_lista}")
         return
     
-    # Lê os arquivos
-    with open(caminho_lista, 'r', encoding='utf-8') as f:
+    # Lê os arquivos (nomes não decodificáveis vêm como em listar_arquivos.py)
+    with open(caminho_lista, 'r', encoding='utf-8', errors='surrogateescape') as f:
         linhas = f.readlines()
     
-    # Filtra apenas nomes de arquivo (ignora comentários e linhas vazias)
-    arquivos = [l.strip() for l in linhas if l.strip() and not l.startswith('#')]
+    # Filtra apenas nomes de arquivo (ignora comentários, linhas vazias e as
+    # colunas extras de listar_arquivos.py, separadas por tabulação) e desfaz
+    # o escape de \\, tabulação e quebras de linha dos nomes
+    arquivos = [desescapar_nome(l.split('\t', 1)[0].strip())
+                for l in linhas if l.strip() and not l.startswith('#')]
     
     print(f"\n{'='*70}")
     print(f"  📋 TESTE DE CATEGORIZAÇÃO")
@@ -81,7 +90,7 @@ def testar_lista_arquivos(caminho_lista: str):
         print(f"\n📋 ARQUIVOS NÃO CATEGORIZADOS ({len(uncategorized)}):")
         print("-" * 50)
         for i, arq in enumerate(uncategorized[:50], 1):
-            print(f"  {i:3}. {arq}")
+            print(f"  {i:3}. {_para_exibir(arq)}")
         if len(uncategorized) > 50:
             print(f"  ... e mais {len(uncategorized) - 50}")
     
@@ -91,7 +100,8 @@ def testar_lista_arquivos(caminho_lista: str):
         print("-" * 50)
         for arq, cats in multi_categoria[:15]:
             cats_str = ", ".join(cats)
-            nome = arq if len(arq) <= 40 else arq[:37] + "..."
+            nome = _para_exibir(arq)
+            nome = nome if len(nome) <= 40 else nome[:37] + "..."
             print(f"  {nome:42} → {cats_str}")
         if len(multi_categoria) > 15:
             print(f"  ... e mais {len(multi_categoria) - 15}")
@@ -99,11 +109,11 @@ def testar_lista_arquivos(caminho_lista: str):
     # Salva uncategorized em arquivo
     if uncategorized:
         arquivo_saida = caminho_lista.replace('.txt', '_uncategorized.txt')
-        with open(arquivo_saida, 'w', encoding='utf-8') as f:
+        with open(arquivo_saida, 'w', encoding='utf-8', errors='surrogateescape') as f:
             f.write(f"# Arquivos não categorizados\n")
             f.write(f"# Total: {len(uncategorized)}\n\n")
             for arq in uncategorized:
-                f.write(f"{arq}\n")
+                f.write(f"{escapar_nome(arq)}\n")
         print(f"\n💾 Lista de não categorizados salva em: {arquivo_saida}")
 
 